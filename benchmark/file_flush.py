@@ -0,0 +1,149 @@
+"""
+Role: File-writing variant comparing vectored and joined buffer flushes.
+Used By:
+ - Operators checking the memory and latency cost of large `SyncFileHandler` flushes.
+Depends On:
+ - hydra_logger
+ - multiprocessing
+ - resource
+ - time
+Notes:
+ - `writev`: buffered chunks go to `os.writev` in IOV_MAX slices (default).
+ - `join`: the same handler with writev disabled, so each flush first builds
+   one joined copy of the buffer, as before vectored flushes.
+ - Each variant runs in a freshly spawned interpreter, so its peak RSS is not
+   inflated by the other; both pay the same import baseline.
+ - Run from repository root: `python3 -m benchmark.file_flush --buffer-lines 50000`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+from typing import Optional
+
+from benchmark.dev_logging import get_logger
+from hydra_logger.handlers.file_handler import SyncFileHandler
+from hydra_logger.types.records import LogRecord
+from hydra_logger.utils import slo_metrics, vectored_write
+
+_logger = get_logger(__name__)
+
+VARIANTS = ("writev", "join")
+
+
+def _peak_rss_kb() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:
+        return None
+    return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def measure_variant(
+    variant: str,
+    path: str,
+    flushes: int = 20,
+    buffer_lines: int = 50_000,
+    line_bytes: int = 200,
+) -> dict:
+    """Fill the buffer `flushes` times and time each flush in this process."""
+    if variant not in VARIANTS:
+        raise ValueError(f"variant must be one of {VARIANTS}")
+    if flushes <= 0 or buffer_lines <= 0:
+        raise ValueError("flushes and buffer_lines must be > 0")
+    vectored_write.HAS_WRITEV = variant == "writev" and hasattr(os, "writev")
+    # One more than a cycle, so only the timed flush() writes the buffer.
+    handler = SyncFileHandler(
+        path, buffer_size=buffer_lines + 1, flush_interval=float("inf")
+    )
+    record = LogRecord(
+        level_name="INFO", level=20, message="x" * max(1, line_bytes - 16)
+    )
+    latencies = []
+    try:
+        for _ in range(flushes):
+            for _ in range(buffer_lines):
+                handler.emit(record)
+            started = time.perf_counter()
+            handler.flush()
+            latencies.append((time.perf_counter() - started) * 1000.0)
+        bytes_written = handler.get_stats()["total_bytes_written"]
+    finally:
+        handler.close()
+    latencies.sort()
+    return {
+        "variant": variant,
+        "flushes": flushes,
+        "buffer_lines": buffer_lines,
+        "bytes_written": bytes_written,
+        "peak_rss_kb": _peak_rss_kb(),
+        "flush_ms_p50": round(slo_metrics.percentile(latencies, 50.0), 3),
+        "flush_ms_p99": round(slo_metrics.percentile(latencies, 99.0), 3),
+        "flush_ms_max": round(latencies[-1], 3),
+    }
+
+
+def run_file_flush(
+    flushes: int = 20,
+    buffer_lines: int = 50_000,
+    line_bytes: int = 200,
+    variants: tuple[str, ...] = VARIANTS,
+    isolate: bool = True,
+) -> dict:
+    """Measure every variant, each in its own spawned process when `isolate`."""
+    results = []
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory(prefix="hydra_flush_") as tmp_dir:
+        for variant in variants:
+            path = os.path.join(tmp_dir, f"{variant}.log")
+            args = (variant, path, flushes, buffer_lines, line_bytes)
+            try:
+                if isolate:
+                    with context.Pool(1) as pool:
+                        results.append(pool.apply(measure_variant, args))
+                else:
+                    results.append(measure_variant(*args))
+            except Exception:
+                _logger.exception("File flush run failed for variant=%s", variant)
+                raise
+    return {
+        "flushes": flushes,
+        "buffer_lines": buffer_lines,
+        "line_bytes": line_bytes,
+        "iov_max": vectored_write.IOV_MAX,
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--flushes", type=int, default=20)
+    parser.add_argument("--buffer-lines", type=int, default=50_000)
+    parser.add_argument("--line-bytes", type=int, default=200)
+    parser.add_argument(
+        "--variants", nargs="+", choices=VARIANTS, default=list(VARIANTS)
+    )
+    parser.add_argument(
+        "--no-isolate",
+        action="store_true",
+        help="run variants in this process (peak RSS is then shared)",
+    )
+    args = parser.parse_args(argv)
+    summary = run_file_flush(
+        args.flushes,
+        args.buffer_lines,
+        args.line_bytes,
+        tuple(args.variants),
+        isolate=not args.no_isolate,
+    )
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
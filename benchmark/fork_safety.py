@@ -0,0 +1,160 @@
+"""
+Role: Prefork stress check for duplicated or lost log lines across `os.fork`.
+Used By:
+ - Operators validating handlers before running under gunicorn/uWSGI/Celery prefork.
+Depends On:
+ - hydra_logger
+ - os
+ - time
+Notes:
+ - The parent keeps unflushed lines buffered while it forks N workers; each worker
+   logs its own lines and exits. Every line must appear exactly once in the file.
+ - Run from repository root: `python3 -m benchmark.fork_safety --workers 8`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from collections import Counter
+from typing import Optional
+
+from benchmark.dev_logging import get_logger
+from hydra_logger.handlers.file_handler import SyncFileHandler
+from hydra_logger.types.records import LogRecord
+
+_logger = get_logger(__name__)
+
+
+def _emit(handler: SyncFileHandler, message: str) -> None:
+    handler.emit(LogRecord(level=20, level_name="INFO", message=message))
+
+
+def _run_worker(handler: SyncFileHandler, worker: int, lines: int) -> None:
+    """Child body: log `lines` lines, close, and exit without parent cleanup."""
+    code = 0
+    try:
+        for i in range(lines):
+            _emit(handler, f"worker-{worker}-{i}")
+        handler.close()
+    except Exception:
+        code = 1
+    finally:
+        os._exit(code)
+
+
+def _wait_for_children(pids: list[int], timeout: float) -> tuple[int, int]:
+    """Reap children until `timeout`; return `(failed, stalled)` counts."""
+    deadline = time.monotonic() + timeout
+    pending = set(pids)
+    failed = 0
+    while pending and time.monotonic() < deadline:
+        for pid in list(pending):
+            done, status = os.waitpid(pid, os.WNOHANG)
+            if done:
+                pending.discard(pid)
+                if os.waitstatus_to_exitcode(status) != 0:
+                    failed += 1
+        if pending:
+            time.sleep(0.005)
+    for pid in pending:
+        os.kill(pid, 9)
+        os.waitpid(pid, 0)
+    return failed, len(pending)
+
+
+def run_fork_safety(
+    workers: int = 8,
+    lines_per_worker: int = 1000,
+    parent_lines: int = 500,
+    timeout: float = 30.0,
+    path: Optional[str] = None,
+) -> dict:
+    """Fork `workers` children while the parent holds buffered lines."""
+    if not hasattr(os, "fork"):
+        raise RuntimeError("os.fork is not available on this platform")
+    if workers <= 0 or lines_per_worker <= 0:
+        raise ValueError("workers and lines_per_worker must be > 0")
+
+    owns_dir = path is None
+    tmp_dir = tempfile.mkdtemp(prefix="hydra_fork_") if owns_dir else None
+    log_path = path or os.path.join(tmp_dir or "", "fork_safety.log")
+    # Buffer everything in the parent so each fork inherits pending lines.
+    total_parent = parent_lines * workers
+    handler = SyncFileHandler(
+        filename=log_path,
+        buffer_size=total_parent + 1,
+        flush_interval=3600.0,
+    )
+    start = time.perf_counter()
+    pids: list[int] = []
+    try:
+        for worker in range(workers):
+            for i in range(parent_lines):
+                _emit(handler, f"parent-{worker}-{i}")
+            pid = os.fork()
+            if pid == 0:
+                _run_worker(handler, worker, lines_per_worker)
+            pids.append(pid)
+        failed, stalled = _wait_for_children(pids, timeout)
+    finally:
+        handler.close()
+    elapsed = time.perf_counter() - start
+
+    with open(log_path, encoding="utf-8") as fh:
+        counts = Counter(line.rstrip("\n").rsplit(" ", 1)[-1] for line in fh)
+    expected = {f"parent-{w}-{i}" for w in range(workers) for i in range(parent_lines)}
+    expected |= {
+        f"worker-{w}-{i}" for w in range(workers) for i in range(lines_per_worker)
+    }
+    duplicated = sum(1 for key in expected if counts[key] > 1)
+    missing = sum(1 for key in expected if counts[key] == 0)
+    if duplicated or missing or failed or stalled:
+        _logger.warning(
+            "Fork safety check failed: duplicated=%s missing=%s failed=%s stalled=%s",
+            duplicated,
+            missing,
+            failed,
+            stalled,
+        )
+    if owns_dir:
+        os.remove(log_path)
+        os.rmdir(tmp_dir or "")
+    return {
+        "workers": workers,
+        "lines_per_worker": lines_per_worker,
+        "parent_lines": total_parent,
+        "expected_lines": len(expected),
+        "duplicated": duplicated,
+        "missing": missing,
+        "failed_workers": failed,
+        "stalled_workers": stalled,
+        "elapsed_seconds": round(elapsed, 4),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--lines", type=int, default=1000)
+    parser.add_argument("--parent-lines", type=int, default=500)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args(argv)
+    summary = run_fork_safety(
+        args.workers, args.lines, args.parent_lines, timeout=args.timeout
+    )
+    print(json.dumps(summary, indent=2))
+    clean = not (
+        summary["duplicated"]
+        or summary["missing"]
+        or summary["failed_workers"]
+        or summary["stalled_workers"]
+    )
+    return 0 if clean else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,136 @@
+"""
+Role: Idle-cost benchmark: event-loop wakeups and CPU per second with zero traffic.
+Used By:
+ - Operators checking that async loggers park instead of polling when quiet.
+Depends On:
+ - asyncio
+ - hydra_logger
+ - selectors
+ - time
+Notes:
+ - Each run owns a `SelectorEventLoop` whose selector counts `select()` calls;
+   one call is one loop iteration, so the count is the number of wakeups.
+ - After one warm-up record starts the workers, nothing is logged for the
+   measured window. `baseline` runs the same window with no logger at all.
+ - Run from repository root: `python3 -m benchmark.idle_wakeups --seconds 2`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import selectors
+import tempfile
+import time
+from typing import Optional
+
+from benchmark.dev_logging import get_logger
+from hydra_logger import create_logger
+from hydra_logger.config.models import LogDestination, LoggingConfig, LogLayer
+
+_logger = get_logger(__name__)
+
+MODES = ("baseline", "task", "queue", "enqueue")
+
+
+class _CountingSelector(selectors.DefaultSelector):  # type: ignore[misc,valid-type]
+    """Default selector that counts how often the loop polls it."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def select(self, timeout: Optional[float] = None):  # type: ignore[override]
+        self.calls += 1
+        return super().select(timeout)
+
+
+def _config(path: str, mode: str) -> LoggingConfig:
+    return LoggingConfig(
+        layers={
+            "default": LogLayer(
+                level="INFO",
+                destinations=[
+                    LogDestination(type="async_file", path=path, format="plain-text")
+                ],
+            )
+        },
+        extensions={"async_runtime": {"mode": mode}},
+    )
+
+
+async def _measure(
+    mode: str, path: str, seconds: float, selector: _CountingSelector
+) -> dict:
+    logger = None
+    if mode != "baseline":
+        logger = create_logger(_config(path, mode), logger_type="async")
+        await logger.log_async("INFO", "warm-up")
+    # Let workers finish the warm-up record and settle into their idle state.
+    await asyncio.sleep(0.1)
+
+    wakeups = selector.calls
+    cpu = time.process_time()
+    start = time.perf_counter()
+    await asyncio.sleep(seconds)
+    elapsed = time.perf_counter() - start
+    cpu = time.process_time() - cpu
+    wakeups = selector.calls - wakeups
+
+    if logger is not None:
+        await logger.aclose()
+    return {
+        "mode": mode,
+        "idle_seconds": round(elapsed, 4),
+        "wakeups": wakeups,
+        "wakeups_per_second": round(wakeups / elapsed, 1) if elapsed > 0 else 0.0,
+        "cpu_seconds": round(cpu, 6),
+        "cpu_percent": round(100.0 * cpu / elapsed, 3) if elapsed > 0 else 0.0,
+    }
+
+
+def run_mode(mode: str, seconds: float, directory: str) -> dict:
+    """Measure one async runtime mode on a private event loop."""
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of {MODES}")
+    selector = _CountingSelector()
+    loop = asyncio.SelectorEventLoop(selector)
+    try:
+        path = os.path.join(directory, f"idle_{mode}.log")
+        return loop.run_until_complete(_measure(mode, path, seconds, selector))
+    finally:
+        loop.close()
+
+
+def run_idle_wakeups(
+    seconds: float = 2.0,
+    modes: tuple[str, ...] = MODES,
+    directory: Optional[str] = None,
+) -> dict:
+    """Measure idle wakeups and CPU for every requested mode."""
+    if seconds <= 0:
+        raise ValueError("seconds must be > 0")
+    results = []
+    with tempfile.TemporaryDirectory(prefix="hydra_idle_") as tmp_dir:
+        for mode in modes:
+            try:
+                results.append(run_mode(mode, seconds, directory or tmp_dir))
+            except Exception:
+                _logger.exception("Idle wakeup run failed for mode=%s", mode)
+                raise
+    return {"seconds": seconds, "results": results}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    args = parser.parse_args(argv)
+    print(json.dumps(run_idle_wakeups(args.seconds, tuple(args.modes)), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -216,6 +216,8 @@ def validate_result_invariants(results: dict[str, Any]) -> list[str]:
         # Async logger can expose split-throughput reporting:
         # - task_fanout_* mirrors legacy individual path
         # - logger_core_* measures direct async logger-core path
+        # - batch_* measures one staged log_batch call (see batch_stage_seconds)
+        # - enqueue_* measures the task-free ring path (producer side)
         if key == "async_logger":
             if "task_fanout_messages_per_second" in section:
                 _validate_rate(
@@ -233,6 +235,22 @@ def validate_result_invariants(results: dict[str, Any]) -> list[str]:
                     label="async_logger.logger_core_messages_per_second",
                     violations=violations,
                 )
+            if "batch_messages_per_second" in section:
+                _validate_rate(
+                    numerator=total,
+                    duration=float(section.get("batch_duration", 0)),
+                    reported_rate=float(section.get("batch_messages_per_second", 0)),
+                    label="async_logger.batch_messages_per_second",
+                    violations=violations,
+                )
+            if "enqueue_messages_per_second" in section:
+                _validate_rate(
+                    numerator=total,
+                    duration=float(section.get("enqueue_duration", 0)),
+                    reported_rate=float(section.get("enqueue_messages_per_second", 0)),
+                    label="async_logger.enqueue_messages_per_second",
+                    violations=violations,
+                )
 
     composite = results.get("composite_logger", {})
     if isinstance(composite, dict):
@@ -361,4 +379,19 @@ def validate_result_invariants(results: dict[str, Any]) -> list[str]:
                     violations=violations,
                 )
 
+    thread_submission = results.get("thread_submission", {})
+    if isinstance(thread_submission, dict):
+        scaling = thread_submission.get("scaling", {})
+        if isinstance(scaling, dict):
+            for key, row in scaling.items():
+                if not isinstance(row, dict):
+                    continue
+                _validate_rate(
+                    numerator=float(row.get("total_messages", 0)),
+                    duration=float(row.get("total_duration", 0)),
+                    reported_rate=float(row.get("total_messages_per_second", 0)),
+                    label=f"thread_submission.scaling.{key}.total_messages_per_second",
+                    violations=violations,
+                )
+
     return violations
@@ -0,0 +1,197 @@
+"""
+Role: Scaling benchmark for N processes logging to one file, direct vs multiprocess.
+Used By:
+ - Operators sizing the multiprocess runtime (shared ring + single writer process).
+Depends On:
+ - hydra_logger
+ - os
+ - time
+Notes:
+ - `direct`: every forked worker opens its own `SyncLogger` on the same path.
+ - `multiprocess`: workers inherit one `MultiprocessLogger`; a single writer owns
+   the file. Elapsed time includes the writer draining the ring on close.
+ - Run from repository root: `python3 -m benchmark.multiprocess_scaling --max-processes 8`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from collections import Counter
+from typing import Any, Optional
+
+from benchmark.dev_logging import get_logger
+from hydra_logger import create_logger
+from hydra_logger.config.models import LogDestination, LoggingConfig, LogLayer
+
+_logger = get_logger(__name__)
+
+MODES = ("direct", "multiprocess")
+
+
+def _config(path: str, overflow_policy: str = "drop_newest") -> LoggingConfig:
+    return LoggingConfig(
+        layers={
+            "default": LogLayer(
+                level="INFO",
+                destinations=[
+                    LogDestination(type="file", path=path, format="plain-text")
+                ],
+            )
+        },
+        extensions={
+            "multiprocess_runtime": {
+                "overflow_policy": overflow_policy,
+                "put_timeout_seconds": 1.0,
+            }
+        },
+    )
+
+
+def process_counts(max_processes: int) -> list[int]:
+    """Return 1, 2, 4, ... up to and including `max_processes`."""
+    if max_processes <= 0:
+        raise ValueError("max_processes must be > 0")
+    counts = []
+    n = 1
+    while n < max_processes:
+        counts.append(n)
+        n *= 2
+    counts.append(max_processes)
+    return counts
+
+
+def _worker(shared: Any, config: LoggingConfig, worker: int, records: int) -> None:
+    """Child body: log `records` lines and exit without parent cleanup."""
+    code = 0
+    try:
+        logger = shared or create_logger(config, name=f"direct-{worker}")
+        for i in range(records):
+            logger.info(f"p{worker}-{i}")
+        if shared is None:
+            logger.close()
+    except Exception:
+        code = 1
+    finally:
+        os._exit(code)
+
+
+def run_mode(
+    mode: str,
+    processes: int,
+    records: int,
+    directory: str,
+    overflow_policy: str = "drop_newest",
+) -> dict:
+    """Fork `processes` workers logging `records` lines each in `mode`."""
+    if mode not in MODES:
+        raise ValueError(f"mode must be one of {MODES}")
+    path = os.path.join(directory, f"{mode}_{processes}.log")
+    config = _config(path, overflow_policy)
+    start = time.perf_counter()
+    shared = (
+        create_logger(config, logger_type="multiprocess", name=f"scaling-{processes}")
+        if mode == "multiprocess"
+        else None
+    )
+    pids = []
+    for worker in range(processes):
+        pid = os.fork()
+        if pid == 0:
+            _worker(shared, config, worker, records)
+        pids.append(pid)
+    failed = 0
+    for pid in pids:
+        _, status = os.waitpid(pid, 0)
+        failed += os.waitstatus_to_exitcode(status) != 0
+    dropped = 0
+    if shared is not None:
+        dropped = shared.get_health_status()["multiprocess"]["ring"]["frames_dropped"]
+        shared.close()
+    elapsed = time.perf_counter() - start
+
+    with open(path, encoding="utf-8") as fh:
+        counts = Counter(line.rstrip("\n").rsplit(" ", 1)[-1] for line in fh)
+    expected = {f"p{w}-{i}" for w in range(processes) for i in range(records)}
+    intact = sum(1 for key in expected if counts[key] == 1)
+    corrupt = sum(n for key, n in counts.items() if key not in expected)
+    total = processes * records
+    return {
+        "mode": mode,
+        "processes": processes,
+        "records": total,
+        "elapsed_seconds": round(elapsed, 4),
+        "records_per_second": round(total / elapsed, 1) if elapsed > 0 else 0.0,
+        "intact_lines": intact,
+        "corrupt_lines": corrupt,
+        "dropped": dropped,
+        "failed_workers": failed,
+        "open_file_handles": processes if mode == "direct" else 1,
+    }
+
+
+def run_multiprocess_scaling(
+    max_processes: int = 8,
+    records: int = 10_000,
+    modes: tuple[str, ...] = MODES,
+    directory: Optional[str] = None,
+    overflow_policy: str = "drop_newest",
+) -> dict:
+    """Measure every mode at 1..`max_processes` processes."""
+    if not hasattr(os, "fork"):
+        raise RuntimeError("os.fork is not available on this platform")
+    if records <= 0:
+        raise ValueError("records must be > 0")
+    results = []
+    with tempfile.TemporaryDirectory(prefix="hydra_mp_") as tmp_dir:
+        for processes in process_counts(max_processes):
+            for mode in modes:
+                try:
+                    results.append(
+                        run_mode(
+                            mode,
+                            processes,
+                            records,
+                            directory or tmp_dir,
+                            overflow_policy,
+                        )
+                    )
+                except Exception:
+                    _logger.exception(
+                        "Scaling run failed for mode=%s processes=%s", mode, processes
+                    )
+                    raise
+    return {
+        "max_processes": max_processes,
+        "records": records,
+        "overflow_policy": overflow_policy,
+        "results": results,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-processes", type=int, default=8)
+    parser.add_argument("--records", type=int, default=10_000)
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument(
+        "--overflow-policy",
+        choices=("drop_newest", "block_with_timeout"),
+        default="drop_newest",
+    )
+    args = parser.parse_args(argv)
+    summary = run_multiprocess_scaling(
+        args.max_processes,
+        args.records,
+        tuple(args.modes),
+        overflow_policy=args.overflow_policy,
+    )
+    print(json.dumps(summary, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -74,6 +74,7 @@ from benchmark.reporting import build_output_payload, write_results_artifacts
 from benchmark.runners import (
     run_async_concurrent_suite,
     run_parallel_workers_suite,
+    run_thread_submission_suite,
 )
 from benchmark.workloads import build_batch_messages
 
@@ -243,6 +244,7 @@ class HydraLoggerBenchmark:  # pragma: no cover
             ("concurrent", "async", self.test_concurrent_logging, None),
             ("async_concurrent", "async", self.test_async_concurrent_suite, None),
             ("parallel_workers", "sync", self.test_parallel_workers_suite, None),
+            ("thread_submission", "async", self.test_thread_submission_suite, None),
             (
                 "advanced_concurrent",
                 "async",
@@ -1525,6 +1527,41 @@ class HydraLoggerBenchmark:  # pragma: no cover
         core_duration = core_end_time - core_start_time
         core_messages_per_second = message_count / core_duration
 
+        # Staged batch pipeline: one log_batch call reporting per-stage seconds
+        batch_messages = [
+            ("INFO", generate_realistic_message(i), {}) for i in range(message_count)
+        ]
+        batch_start_time = time.perf_counter()
+        batch_stats = await logger.log_batch(batch_messages)
+        batch_duration = time.perf_counter() - batch_start_time
+        batch_messages_per_second = message_count / batch_duration
+        batch_stage_seconds = dict((batch_stats or {}).get("stage_seconds", {}))
+
+        # Task-free enqueue path: logger.log() appends to a ring drained in batches
+        enqueue_name = f"{logger_name}_enqueue"
+        enqueue_config = perf_config.model_copy(
+            update={
+                "extensions": {
+                    "async_runtime": {
+                        "mode": "enqueue",
+                        "max_queue_size": max(10000, message_count),
+                    }
+                }
+            }
+        )
+        enqueue_logger = getAsyncLogger(enqueue_name, config=enqueue_config)
+        self._created_loggers.append(enqueue_logger)
+        self._logger_names.append(enqueue_name)
+        enqueue_start_time = time.perf_counter()
+        for i in range(message_count):
+            enqueue_logger.log("INFO", generate_realistic_message(i))
+        enqueue_duration = time.perf_counter() - enqueue_start_time
+        await enqueue_logger.aclose()
+        enqueue_drained_duration = time.perf_counter() - enqueue_start_time
+        enqueue_health = enqueue_logger.get_health_status()
+        enqueue_messages_per_second = message_count / enqueue_duration
+        enqueue_drained_messages_per_second = message_count / enqueue_drained_duration
+
         # Close logger after timing (cleanup doesn't affect performance measurement)
         # Standard: use aclose() first (standard async context manager protocol)
         # Fallback: use close_async() for backward compatibility
@@ -1543,6 +1580,18 @@ class HydraLoggerBenchmark:  # pragma: no cover
             "task_fanout_duration": duration,
             "logger_core_messages_per_second": core_messages_per_second,
             "logger_core_duration": core_duration,
+            "batch_messages_per_second": batch_messages_per_second,
+            "batch_duration": batch_duration,
+            "batch_stage_seconds": batch_stage_seconds,
+            "enqueue_messages_per_second": enqueue_messages_per_second,
+            "enqueue_duration": enqueue_duration,
+            "enqueue_drained_messages_per_second": enqueue_drained_messages_per_second,
+            "enqueue_drained_duration": enqueue_drained_duration,
+            "enqueue_dropped": enqueue_health.get("async_queue_dropped", 0),
+            "enqueue_queue_depth_max": enqueue_health.get("async_queue_depth_max", 0),
+            "enqueue_latency_avg_ms": enqueue_health.get(
+                "async_enqueue_latency_avg_ms", 0.0
+            ),
             "total_messages": message_count,
             "status": "COMPLETED",
         }
@@ -1551,6 +1600,18 @@ class HydraLoggerBenchmark:  # pragma: no cover
         print(f"   Duration: {duration:.3f}s")
         print(f"   Logger Core Async: {core_messages_per_second:,.0f} msg/s")
         print(f"   Logger Core Duration: {core_duration:.3f}s")
+        print(f"   Batch Pipeline: {batch_messages_per_second:,.0f} msg/s")
+        if batch_stage_seconds:
+            stages = ", ".join(
+                f"{stage} {seconds:.3f}s"
+                for stage, seconds in batch_stage_seconds.items()
+            )
+            print(f"   Batch Stages: {stages}")
+        print(f"   Task-free Enqueue: {enqueue_messages_per_second:,.0f} msg/s")
+        print(
+            f"   Task-free Enqueue (drained): "
+            f"{enqueue_drained_messages_per_second:,.0f} msg/s"
+        )
         print("   Async Logger: COMPLETED")
 
         return result
@@ -2829,6 +2890,52 @@ class HydraLoggerBenchmark:  # pragma: no cover
         print("   Parallel Workers Suite: COMPLETED")
         return result
 
+    async def test_thread_submission_suite(self) -> Dict[str, Any]:
+        """Executor threads feeding one loop-owned AsyncLogger (enqueue mode)."""
+        print("\nTesting Thread Submission Suite...")
+        matrix = list(self.test_config.get("suite_matrix_workers_tasks", [1, 2, 4, 8, 16, 32]))
+        messages_per_thread = int(self.test_config.get("suite_matrix_messages_per_worker", 1000))
+        perf_config = self._create_performance_config(logger_type="async")
+
+        def _create_logger(thread_count: int):
+            logger_name = f"thread_suite_{thread_count}_{id(self)}"
+            config = perf_config.model_copy(
+                update={
+                    "extensions": {
+                        "async_runtime": {
+                            "mode": "enqueue",
+                            "max_queue_size": max(10000, thread_count * messages_per_thread),
+                        }
+                    }
+                }
+            )
+            logger = getAsyncLogger(logger_name, config=config)
+            logger.bind_loop()
+            self._created_loggers.append(logger)
+            self._logger_names.append(logger_name)
+            return logger
+
+        async def _close_logger(logger) -> None:
+            await logger.aclose()
+
+        result = await run_thread_submission_suite(
+            matrix=matrix,
+            messages_per_thread=messages_per_thread,
+            create_logger=_create_logger,
+            close_async=_close_logger,
+            messages_per_second=self._messages_per_second,
+        )
+        scaling = result.get("scaling", {})
+        for thread_count in matrix:
+            row = scaling.get(str(thread_count), {})
+            print(
+                f"   {thread_count:2d} threads: {float(row.get('total_messages_per_second', 0.0)):>10,.0f} msg/s "
+                f"(submit {float(row.get('submit_messages_per_second', 0.0)):,.0f} msg/s, "
+                f"wakeups {row.get('loop_wakeups', 0)})"
+            )
+        print("   Thread Submission Suite: COMPLETED")
+        return result
+
     async def test_ultra_high_performance(self) -> Dict[str, Any]:
         """
         Test high performance scenarios.
@@ -3124,6 +3231,19 @@ class HydraLoggerBenchmark:  # pragma: no cover
                     f"Workers {int(worker_count):>2d}:             {row['total_messages_per_second']:>8,.0f} msg/s"
                 )
 
+        if "thread_submission" in self.results:
+            print("\nTHREAD SUBMISSION SUITE")
+            print("-" * 60)
+            thread_suite = self.results["thread_submission"]
+            print(f"Threads Matrix:           {thread_suite['workers_tasks']}")
+            print(
+                f"Messages per Thread:      {thread_suite['messages_per_worker']:>8,}"
+            )
+            for thread_count, row in thread_suite.get("scaling", {}).items():
+                print(
+                    f"Threads {int(thread_count):>2d}:             {row['total_messages_per_second']:>8,.0f} msg/s"
+                )
+
         # Performance summary
         print("\nPERFORMANCE SUMMARY")
         print("-" * 60)
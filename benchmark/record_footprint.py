@@ -0,0 +1,99 @@
+"""
+Role: Micro-benchmark for log record memory footprint and construction cost.
+Used By:
+ - Operators comparing `LogRecord` against `CompactLogRecord` before tuning queues.
+Depends On:
+ - hydra_logger
+ - time
+ - tracemalloc
+Notes:
+ - Reports bytes per retained record and nanoseconds per construction.
+ - Run from repository root: `python3 -m benchmark.record_footprint --count 100000`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from benchmark.dev_logging import get_logger
+from hydra_logger.types.records import CompactLogRecord, LogRecord
+
+_logger = get_logger(__name__)
+
+RecordFactory = Callable[[int], Any]
+
+
+def _build_dataclass_record(i: int) -> LogRecord:
+    return LogRecord(level_name="INFO", message="payload", level=20, line_number=i)
+
+
+def _build_compact_record(i: int) -> CompactLogRecord:
+    return CompactLogRecord(
+        level_name="INFO", message="payload", level=20, line_number=i
+    )
+
+
+RECORD_FACTORIES: dict[str, RecordFactory] = {
+    "LogRecord": _build_dataclass_record,
+    "CompactLogRecord": _build_compact_record,
+}
+
+
+def measure_bytes_per_record(factory: RecordFactory, count: int) -> float:
+    """Return traced bytes retained per record while `count` records are alive."""
+    if count <= 0:
+        raise ValueError("count must be > 0")
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        retained = [factory(i) for i in range(count)]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # Exclude the holding list itself from the per-record figure.
+    list_overhead = retained.__sizeof__()
+    return max(0.0, (after - before - list_overhead) / count)
+
+
+def measure_ns_per_construction(factory: RecordFactory, iterations: int) -> float:
+    """Return mean nanoseconds per record construction."""
+    if iterations <= 0:
+        raise ValueError("iterations must be > 0")
+    start = time.perf_counter_ns()
+    for i in range(iterations):
+        factory(i)
+    return (time.perf_counter_ns() - start) / iterations
+
+
+def run_record_footprint(count: int = 100_000, iterations: int = 200_000) -> dict:
+    """Measure every registered record type and return a JSON-friendly summary."""
+    results: dict[str, dict[str, float]] = {}
+    for name, factory in RECORD_FACTORIES.items():
+        try:
+            results[name] = {
+                "bytes_per_record": round(measure_bytes_per_record(factory, count), 1),
+                "ns_per_construction": round(
+                    measure_ns_per_construction(factory, iterations), 1
+                ),
+            }
+        except Exception:
+            _logger.exception("Record footprint measurement failed for %s", name)
+            raise
+    return {"count": count, "iterations": iterations, "results": results}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--iterations", type=int, default=200_000)
+    args = parser.parse_args(argv)
+    print(json.dumps(run_record_footprint(args.count, args.iterations), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -15,7 +15,7 @@ Notes:
 from __future__ import annotations
 
 import asyncio
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import time
 from typing import Any, Callable
 
@@ -188,3 +188,71 @@ def run_parallel_workers_suite(
         "scaling": scaling,
         "status": "COMPLETED",
     }
+
+
+async def run_thread_submission_suite(
+    *,
+    matrix: list[int],
+    messages_per_thread: int,
+    create_logger: Callable[[int], Any],
+    close_async: Callable[[Any], Any],
+    messages_per_second: Callable[[int, float], float],
+) -> dict[str, Any]:
+    """Run N foreign threads feeding one loop-owned async logger."""
+    scaling: dict[str, Any] = {}
+    loop = asyncio.get_running_loop()
+
+    for thread_count in matrix:
+        if thread_count <= 0:
+            _logger.error("Invalid thread_count in thread suite: %s", thread_count)
+            raise ValueError("thread_count must be >= 1")
+        logger = create_logger(thread_count)
+
+        def _thread(thread_id: int) -> None:
+            for i in range(messages_per_thread):
+                logger.log("INFO", "ThreadSuite thread=%s msg=%s", thread_id, i)
+
+        try:
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=thread_count) as executor:
+                await asyncio.gather(
+                    *[
+                        loop.run_in_executor(executor, _thread, thread_id)
+                        for thread_id in range(thread_count)
+                    ]
+                )
+            submit_duration = time.perf_counter() - start
+            await close_async(logger)
+            duration = time.perf_counter() - start
+            total_messages = thread_count * messages_per_thread
+            health = logger.get_health_status()
+        except Exception:
+            _logger.exception(
+                "Thread submission suite failed for thread_count=%s "
+                "messages_per_thread=%s",
+                thread_count,
+                messages_per_thread,
+            )
+            raise
+
+        scaling[str(thread_count)] = {
+            "total_messages": total_messages,
+            "total_duration": duration,
+            "total_messages_per_second": messages_per_second(total_messages, duration),
+            "submit_duration": submit_duration,
+            "submit_messages_per_second": messages_per_second(
+                total_messages, submit_duration
+            ),
+            "loop_wakeups": int(health.get("async_threadsafe_wakeups", 0)),
+            "dropped": int(health.get("async_threadsafe_dropped", 0)),
+            "threads": thread_count,
+            "messages_per_thread": messages_per_thread,
+        }
+
+    return {
+        "suite": "thread_submission",
+        "workers_tasks": matrix,
+        "messages_per_worker": messages_per_thread,
+        "scaling": scaling,
+        "status": "COMPLETED",
+    }
@@ -29,7 +29,12 @@ from .core.exceptions import (
 )
 
 # Logger Manager (Python logging style)
-from .core.logger_management import getAsyncLogger, getLogger, getSyncLogger
+from .core.logger_management import (
+    getAsyncLogger,
+    getLogger,
+    getMultiprocessLogger,
+    getSyncLogger,
+)
 
 # High-performance loggers
 from .factories.logger_factory import (
@@ -37,18 +42,20 @@ from .factories.logger_factory import (
     create_composite_async_logger,
     create_composite_logger,
     create_logger,
+    create_multiprocess_logger,
     create_sync_logger,
 )
 from .loggers.async_logger import AsyncLogger
 from .loggers.composite_logger import CompositeAsyncLogger, CompositeLogger
+from .loggers.multiprocess_logger import MultiprocessLogger
 
 # Main public API
 from .loggers.sync_logger import SyncLogger
-from .types.context import LogContext
+from .types.context import LogContext, log_context
 from .types.levels import LogLevel
 
 # Core types
-from .types.records import LogRecord
+from .types.records import CompactLogRecord, LogRecord
 from .utils.stderr_interceptor import (
     StderrInterceptor,
     start_stderr_interception,
@@ -62,16 +69,19 @@ __all__ = [
     "AsyncLogger",
     "CompositeLogger",
     "CompositeAsyncLogger",
+    "MultiprocessLogger",
     # Factory functions
     "create_logger",
     "create_sync_logger",
     "create_async_logger",
     "create_composite_logger",
     "create_composite_async_logger",
+    "create_multiprocess_logger",
     # Logger Manager (Python logging style)
     "getLogger",
     "getSyncLogger",
     "getAsyncLogger",
+    "getMultiprocessLogger",
     # Configuration
     "LoggingConfig",
     "LogDestination",
@@ -81,8 +91,10 @@ __all__ = [
     "clear_logging_config_cache",
     # Core types
     "LogRecord",
+    "CompactLogRecord",
     "LogLevel",
     "LogContext",
+    "log_context",
     # Exceptions
     "HydraLoggerError",
     "ConfigurationError",
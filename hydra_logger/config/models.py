@@ -164,6 +164,56 @@ class LogDestination(BaseModel):
         description="Maximum queue size for async handlers before dropping messages",
     )
 
+    # Per-destination isolation (bulkhead)
+    isolated: bool = Field(
+        default=False,
+        description=(
+            "Give this destination its own bounded queue and worker thread so a slow "
+            "sink cannot stall the caller or other destinations (sync loggers)."
+        ),
+    )
+    isolation_queue_size: int = Field(
+        default=1000,
+        ge=1,
+        description="For isolated destinations: maximum queued records.",
+    )
+    isolation_overflow_policy: Literal["drop_newest", "drop_oldest"] = Field(
+        default="drop_newest",
+        description="For isolated destinations: which record to drop when full.",
+    )
+    isolation_latency_budget: Optional[float] = Field(
+        default=None,
+        gt=0.0,
+        description=(
+            "For isolated destinations: records queued longer than this many "
+            "seconds are dropped instead of written."
+        ),
+    )
+
+    # Staleness bound for buffered sync console/file destinations
+    background_flush: bool = Field(
+        default=False,
+        description=(
+            "For sync console/file destinations: enforce the flush interval from a "
+            "shared background thread, even when no new records arrive."
+        ),
+    )
+    max_buffer_age: Optional[float] = Field(
+        default=None,
+        gt=0.0,
+        description=(
+            "For sync console/file destinations: flush once the oldest buffered "
+            "line is this many seconds old (implies background_flush)."
+        ),
+    )
+    durability: str = Field(
+        default="none",
+        description=(
+            "For file destinations: fdatasync policy, one of 'none', "
+            "'interval:<ms>', 'per_batch', or 'sync_on_level:<LEVEL>'."
+        ),
+    )
+
     # Extra parameters for handler-specific configuration
     extra: Optional[Dict[str, Any]] = Field(
         default=None, description="Extra parameters for handler configuration"
@@ -240,6 +290,14 @@ class LogDestination(BaseModel):
             raise ValueError(f"Invalid log format: {v}. Must be one of {valid_formats}")
         return v
 
+    @field_validator("durability")
+    @classmethod
+    def validate_durability(cls, v: str) -> str:
+        """Validate and normalize the file durability policy."""
+        from ..utils.durability import parse_durability
+
+        return parse_durability(v).spec
+
     @field_validator("retry_count")
     @classmethod
     def validate_retry_count(cls, v: Optional[int]) -> Optional[int]:
@@ -19,6 +19,7 @@ from ..formatters.base import BaseFormatter
 from ..handlers.base_handler import BaseHandler
 from ..types.levels import LogLevel, LogLevelManager
 from ..utils import internal_diagnostics as diagnostics
+from ..utils.fork_safety import register_fork_safe
 
 
 class LayerConfiguration:
@@ -69,6 +70,11 @@ class LayerManager:
         self._multi_layer_mode = False
         self._layer_count = 0
         self._default_layer_name = "default"
+        register_fork_safe(self)
+
+    def _after_fork_child(self) -> None:
+        """Replace the layer lock; a forking thread may have held it."""
+        self._lock = threading.RLock()
 
     def setup_layers(self, config_layers: Dict[str, Any]) -> None:
         """
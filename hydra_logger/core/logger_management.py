@@ -9,6 +9,7 @@ Depends On:
  - typing
 Notes:
  - Provides core runtime primitives for logger management.
+ - Registry locks are recreated in forked children; loggers stay registered.
 """
 
 import threading
@@ -21,6 +22,7 @@ from ..core.exceptions import HydraLoggerError
 
 # from pathlib import Path  # unused
 from ..factories.logger_factory import LoggerFactory
+from ..utils.fork_safety import register_fork_safe
 
 
 class LoggerManager:
@@ -33,6 +35,12 @@ class LoggerManager:
         self._factory = LoggerFactory()
         self._locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
         self._global_lock = threading.Lock()
+        register_fork_safe(self)
+
+    def _after_fork_child(self) -> None:
+        """Replace registry locks; a forking thread may have held one."""
+        self._locks = defaultdict(threading.Lock)
+        self._global_lock = threading.Lock()
 
     def getLogger(
         self,
@@ -199,3 +207,12 @@ def getAsyncLogger(
 ) -> Any:
     """Get or create an asynchronous logger by name."""
     return getLogger(name, config, "async", **kwargs)
+
+
+def getMultiprocessLogger(
+    name: Optional[str] = None,
+    config: Optional[Union[LoggingConfig, Dict[str, Any]]] = None,
+    **kwargs,
+) -> Any:
+    """Get or create a logger whose processes share one writer process."""
+    return getLogger(name, config, "multiprocess", **kwargs)
@@ -18,12 +18,16 @@ from ..config.configuration_templates import configuration_templates
 from ..config.models import LoggingConfig
 from ..loggers.async_logger import AsyncLogger
 from ..loggers.composite_logger import CompositeAsyncLogger, CompositeLogger
+from ..loggers.multiprocess_logger import MultiprocessLogger
 
 # Setup module removed - simplified architecture
 from ..loggers.sync_logger import SyncLogger
 
 _logger = logging.getLogger(__name__)
 
+# Extension sections that hold runtime options rather than extension instances.
+_RUNTIME_OPTION_SECTIONS = frozenset({"async_runtime", "multiprocess_runtime"})
+
 _CONFIG_LOADER_KWARGS = frozenset(
     {
         "strict_unknown_fields",
@@ -87,6 +91,8 @@ class LoggerFactory:
             return CompositeLogger(config=config, **kwargs)
         elif logger_type == "composite-async":
             return CompositeAsyncLogger(config=config, **kwargs)
+        elif logger_type == "multiprocess":
+            return MultiprocessLogger(config=config, **kwargs)
         else:
             raise ValueError(f"Unknown logger type: {logger_type}")
 
@@ -125,6 +131,15 @@ class LoggerFactory:
             self.create_logger(config=config, logger_type="composite-async", **kwargs),
         )
 
+    def create_multiprocess_logger(
+        self, config: Optional[Union[LoggingConfig, Dict[str, Any]]] = None, **kwargs
+    ) -> MultiprocessLogger:
+        """Create a logger that funnels all processes through one writer."""
+        return cast(
+            MultiprocessLogger,
+            self.create_logger(config=config, logger_type="multiprocess", **kwargs),
+        )
+
     def create_logger_with_template(
         self, template_name: str, logger_type: str = "sync", **kwargs
     ) -> Union[SyncLogger, AsyncLogger, CompositeLogger, CompositeAsyncLogger]:
@@ -181,6 +196,8 @@ class LoggerFactory:
 
             # Create extensions based on user config
             for extension_name, extension_config in config.extensions.items():
+                if extension_name in _RUNTIME_OPTION_SECTIONS:
+                    continue
                 enabled = extension_config.get("enabled", False)
                 extension_type = extension_config.get("type", extension_name)
 
@@ -306,6 +323,20 @@ def create_composite_async_logger(
     return logger_factory.create_composite_async_logger(config=config, **kwargs)
 
 
+def create_multiprocess_logger(
+    name_or_config: Optional[Union[str, LoggingConfig, Dict[str, Any]]] = None, **kwargs
+) -> MultiprocessLogger:
+    """Create a logger that funnels all processes through one writer."""
+    # Handle string name as first argument
+    if isinstance(name_or_config, str):
+        kwargs["name"] = name_or_config
+        config = None
+    else:
+        config = name_or_config
+
+    return logger_factory.create_multiprocess_logger(config=config, **kwargs)
+
+
 # Magic configuration convenience functions
 def create_default_logger(
     logger_type: str = "sync", **kwargs
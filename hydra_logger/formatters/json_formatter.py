@@ -9,6 +9,8 @@ Depends On:
  - typing
 Notes:
  - Defines output formatting behavior for json formatter.
+ - Bound `extra` fields (`logger.bind`) and ambient context are encoded once
+   and spliced in.
 """
 
 import json
@@ -16,7 +18,8 @@ import json
 # import time  # unused
 from typing import Any, Dict, Optional
 
-from ..types.records import LogRecord
+from ..types.context import AMBIENT_RECORD_FIELDS
+from ..types.records import BoundFields, LogRecord
 from ..utils.time_utility import TimestampConfig
 from .base import BaseFormatter
 
@@ -54,6 +57,8 @@ class JsonLinesFormatter(BaseFormatter):
 
         # Simplified formatter - no performance optimization
         self._format_func = self._format_default
+        # Cache key for encoded `BoundFields` fragments (encoder settings).
+        self._fragment_key = ("json_lines", ensure_ascii)
 
     def _get_timestamp_config(self):
         """
@@ -103,11 +108,41 @@ class JsonLinesFormatter(BaseFormatter):
         Returns:
             JSON string (one line per record)
         """
+        extra = record.extra
+        context = record.context
+        if (type(extra) is BoundFields and extra) or (
+            type(context) is BoundFields and context
+        ):
+            return self._format_with_bound_fields(record, extra, context)
+
         # Use pre-compiled encoder for better performance
         record_dict = self._create_record_dict(record)
         return self._encoder.encode(record_dict)
 
-    def _create_record_dict(self, record: LogRecord) -> Dict[str, Any]:
+    def _format_with_bound_fields(
+        self, record: LogRecord, extra: Any, context: Any
+    ) -> str:
+        """Splice cached encoded `BoundFields` fragments into the record JSON."""
+        record_dict = self._create_record_dict(record, include_structured=False)
+        parts = [self._encoder.encode(record_dict)[:-1]]
+        if extra:
+            parts.append(',"extra":')
+            parts.append(self._encode_fields(extra))
+        if context:
+            parts.append(',"context":')
+            parts.append(self._encode_fields(context))
+        parts.append("}")
+        return "".join(parts)
+
+    def _encode_fields(self, fields: Any) -> str:
+        """Encode structured fields, reusing the cached fragment when bound."""
+        if type(fields) is BoundFields:
+            return fields.encoded(self._fragment_key, self._encoder.encode)
+        return self._encoder.encode(fields)
+
+    def _create_record_dict(
+        self, record: LogRecord, include_structured: bool = True
+    ) -> Dict[str, Any]:
         """Create record dictionary with minimal overhead."""
         # Pre-format timestamp once to avoid repeated calls
         timestamp = self.format_timestamp(record)
@@ -125,6 +160,15 @@ class JsonLinesFormatter(BaseFormatter):
             "line_number": record.line_number if record.line_number else 0,
         }
 
+        # Correlation ids (set explicitly or from ambient `log_context`)
+        for name in AMBIENT_RECORD_FIELDS:
+            value = getattr(record, name, None)
+            if value is not None:
+                record_dict[name] = value
+
+        if not include_structured:
+            return record_dict
+
         # Add structured data fields
         if record.extra:
             record_dict["extra"] = record.extra
@@ -21,6 +21,7 @@ from .http_payload_encoders import (
     resolve_http_payload_encoder,
     unregister_http_payload_encoder,
 )
+from .isolated_handler import IsolatedHandler
 from .network_handler import (
     BaseNetworkHandler,
     DatagramHandler,
@@ -35,6 +36,7 @@ from .network_handler import (
 
 # StreamHandler removed - simplified handlers
 from .null_handler import NullHandler
+from .shared_ring_handler import SharedRingHandler
 from .rotating_handler import (
     HybridRotatingFileHandler,
     RotatingFileHandler,
@@ -80,4 +82,8 @@ __all__ = [
     "load_http_encoders_from_entry_points",
     # Utility handlers
     "NullHandler",
+    # Multiprocess runtime
+    "SharedRingHandler",
+    # Destination isolation
+    "IsolatedHandler",
 ]
@@ -9,14 +9,19 @@ Depends On:
  - typing
 Notes:
  - Implements log destination handling and I/O flow for base handler.
+ - Handlers register for fork hooks; `_after_fork_child` resets inherited state.
+ - `emit_batch` / `emit_batch_async` are optional batch entry points; the
+   defaults loop over `emit`, overrides format once and write once per batch.
 """
 
 import logging
+import weakref
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 from ..formatters.base import BaseFormatter
 from ..types.records import LogRecord
+from ..utils.fork_safety import register_fork_safe
 from ..utils.time_utility import TimestampConfig, TimestampFormat, TimestampPrecision
 
 _logger = logging.getLogger(__name__)
@@ -54,6 +59,11 @@ class BaseHandler(ABC):
         # Performance optimization: cache formatter name
         self._formatter_name: Optional[str] = None
 
+        # Weak callbacks notified when level/formatter change (emit plan rebuilds)
+        self._config_listeners: List[weakref.WeakMethod] = []
+
+        register_fork_safe(self)
+
     def format_timestamp(self, record: LogRecord) -> str:
         """
         Format timestamp from log record using configured timestamp format.
@@ -106,6 +116,7 @@ class BaseHandler(ABC):
                 self._formatter_name = "unknown"
         else:
             self._formatter_name = None
+        self._notify_config_changed()
 
     def setLevel(self, level: int) -> None:
         """
@@ -115,6 +126,33 @@ class BaseHandler(ABC):
             level: Minimum log level
         """
         self.level = level
+        self._notify_config_changed()
+
+    def add_config_listener(self, callback: Callable[[], None]) -> None:
+        """Register a bound method called after level or formatter changes."""
+        listeners = self.__dict__.setdefault("_config_listeners", [])
+        ref = weakref.WeakMethod(callback)
+        if ref not in listeners:
+            listeners.append(ref)
+
+    def _notify_config_changed(self) -> None:
+        """Invoke live config listeners and drop dead references."""
+        listeners = getattr(self, "_config_listeners", None)
+        if not listeners:
+            return
+        alive = []
+        for ref in listeners:
+            callback = ref()
+            if callback is None:
+                continue
+            alive.append(ref)
+            try:
+                callback()
+            except Exception:
+                _logger.exception(
+                    "Handler config listener failed for handler=%s", self.name
+                )
+        self._config_listeners = alive
 
     def isEnabledFor(self, level: int) -> bool:
         """
@@ -148,10 +186,33 @@ class BaseHandler(ABC):
         if self.isEnabledFor(record.level):
             self.emit(record)
 
+    def emit_batch(self, records: Sequence[LogRecord]) -> None:
+        """
+        Emit a batch of records in order, skipping those below the handler level.
+
+        Args:
+            records: Log records to emit
+        """
+        for record in records:
+            if self.isEnabledFor(record.level):
+                self.emit(record)
+
+    async def emit_batch_async(self, records: Sequence[LogRecord]) -> None:
+        """
+        Async batch entry point; defaults to `emit_batch`.
+
+        Args:
+            records: Log records to emit
+        """
+        self.emit_batch(records)
+
     def close(self) -> None:
         """Close the handler and cleanup resources."""
         self._closed = True
 
+    def _after_fork_child(self) -> None:
+        """Reset process-local state in a forked child (override per handler)."""
+
     def is_initialized(self) -> bool:
         """
         Check if handler is properly initialized.
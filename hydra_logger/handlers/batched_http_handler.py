@@ -6,6 +6,7 @@ Depends On:
  - hydra_logger.handlers.network_handler.HTTPHandler
 Notes:
  - Flushes on batch size or flush interval; mixed str/bytes payloads fall back to single posts.
+ - `emit_batch` composes every payload first and posts full batches directly.
 """
 
 from __future__ import annotations
@@ -14,7 +15,7 @@ import json
 import logging
 import threading
 import time
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, Dict, List, Optional, Sequence, Union, cast
 
 from ..types.records import LogRecord
 from .network_handler import HTTPHandler
@@ -89,6 +90,43 @@ class BatchedHTTPHandler(HTTPHandler):
             )
             self._handle_network_error(error)
 
+    def emit_batch(self, records: Sequence[LogRecord]) -> None:
+        """Compose a record batch and post it in `batch_size` NDJSON bodies."""
+        if not self._connect():
+            return
+        if self._session is None:
+            return
+
+        try:
+            payloads = [
+                self._compose_payload(record)
+                for record in records
+                if self.isEnabledFor(record.level)
+            ]
+            if not payloads:
+                return
+            now = time.monotonic()
+            with self._lock:
+                pending = self._buf + payloads
+                due = self._flush_interval > 0 and (
+                    now - self._last_flush >= self._flush_interval
+                )
+                if due:
+                    cut = len(pending)
+                else:
+                    cut = len(pending) - len(pending) % self._batch_size
+                self._buf = pending[cut:]
+                if cut:
+                    self._last_flush = now
+            for start in range(0, cut, self._batch_size):
+                self._flush_batch(pending[start : min(cut, start + self._batch_size)])
+        except Exception as error:
+            _logger.exception(
+                "Batched HTTP batch emit failed for url=%s",
+                self._safe_url_for_logs(self._url),
+            )
+            self._handle_network_error(error)
+
     def _flush_batch(self, batch: List[_Payload]) -> None:
         if not batch:
             return
@@ -128,6 +166,13 @@ class BatchedHTTPHandler(HTTPHandler):
             )
             self._handle_network_error(error)
 
+    def _after_fork_child(self) -> None:
+        """Drop the parent's pending batch; the parent still sends it."""
+        super()._after_fork_child()
+        self._buf = []
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
     def close(self) -> None:
         with self._lock:
             pending = self._buf
@@ -11,17 +11,23 @@ Depends On:
  - typing
 Notes:
  - Implements log destination handling and I/O flow for console handler.
+ - `SyncConsoleHandler` can register with the shared `BackgroundFlusher` so
+   buffered lines reach the stream within `flush_interval`/`max_buffer_age`
+   even when no further records arrive.
 """
 
 import asyncio
 import atexit
 import logging
+import math
 import sys
+import threading
 import time
-from typing import List, Optional, TextIO
+from typing import List, Optional, Sequence, TextIO
 
 from ..formatters.base import BaseFormatter
 from ..types.records import LogRecord
+from ..utils.background_flusher import get_background_flusher
 from .base_handler import BaseHandler
 
 _logger = logging.getLogger(__name__)
@@ -45,6 +51,8 @@ class SyncConsoleHandler(BaseHandler):
         buffer_size: int = 5000,  # PERFORMANCE: Larger default buffer (5K messages)
         flush_interval: float = 0.5,  # PERFORMANCE: Longer flush interval (0.5s)
         use_colors: bool = False,
+        background_flush: bool = False,
+        max_buffer_age: Optional[float] = None,
     ):
         """
         Initialize console handler.
@@ -55,6 +63,10 @@ class SyncConsoleHandler(BaseHandler):
             buffer_size: Buffer size for batching
             flush_interval: Flush interval in seconds
             use_colors: Whether to use colors (console only, off by default)
+            background_flush: Enforce `flush_interval` from the shared flusher
+                thread, even when no new records arrive
+            max_buffer_age: Longest time (seconds) a buffered line may wait;
+                implies `background_flush`
         """
         super().__init__()
         self._stream = stream or sys.stdout
@@ -66,6 +78,15 @@ class SyncConsoleHandler(BaseHandler):
         self._flush_interval = flush_interval
         self._buffer: List[str] = []
         self._last_flush = time.perf_counter()
+        # Guards the buffer and counters (emitters + flusher thread)
+        self._lock = threading.RLock()
+        self._oldest_buffered_at = 0.0
+        self._max_buffer_age = max_buffer_age
+        self._flusher = (
+            get_background_flusher()
+            if background_flush or max_buffer_age is not None
+            else None
+        )
 
         # Statistics
         self._messages_processed = 0
@@ -81,6 +102,8 @@ class SyncConsoleHandler(BaseHandler):
 
         # Register for automatic cleanup
         atexit.register(self._auto_cleanup)
+        if self._flusher is not None:
+            self._flusher.register(self)
 
     def _get_formatter(self):
         """Get the appropriate formatter (lazy initialization for performance)."""
@@ -111,52 +134,103 @@ class SyncConsoleHandler(BaseHandler):
         formatter = self._get_formatter()
         message = formatter.format(record)
 
-        # Add to buffer
-        self._buffer.append(message)
-        self._messages_processed += 1
+        with self._lock:
+            # Add to buffer
+            if not self._buffer:
+                self._oldest_buffered_at = time.perf_counter()
+                if self._flusher is not None:
+                    self._flusher.wake()
+            self._buffer.append(message)
+            self._messages_processed += 1
 
-        # PERFORMANCE: Batch even with colors (smaller batches for colors, but still batch)
-        # Colors can be batched - terminal will handle them correctly
-        current_time = time.perf_counter()
+            # PERFORMANCE: Batch even with colors (smaller batches for colors, but
+            # still batch). Colors can be batched - terminal will handle them
+            # correctly
+            current_time = time.perf_counter()
 
-        # Use smaller buffer for colors (for faster visual feedback), larger for
-        # plain text
-        effective_buffer_size = (
-            max(10, self._buffer_size // 10) if self._use_colors else self._buffer_size
-        )
-        effective_flush_interval = (
-            max(0.01, self._flush_interval / 5)
-            if self._use_colors
-            else self._flush_interval
-        )
+            # Use smaller buffer for colors (for faster visual feedback), larger
+            # for plain text
+            effective_buffer_size = (
+                max(10, self._buffer_size // 10)
+                if self._use_colors
+                else self._buffer_size
+            )
 
-        should_flush = (
-            len(self._buffer) >= effective_buffer_size
-            or (current_time - self._last_flush) >= effective_flush_interval
-        )
+            should_flush = (
+                len(self._buffer) >= effective_buffer_size
+                or (current_time - self._last_flush)
+                >= self._effective_flush_interval()
+            )
+
+            if should_flush:
+                self._flush_buffer()
+
+    def _effective_flush_interval(self) -> float:
+        """Colored output flushes five times as often for visual feedback."""
+        if self._use_colors:
+            return max(0.01, self._flush_interval / 5)
+        return self._flush_interval
+
+    def emit_batch(self, records: Sequence[LogRecord]) -> None:
+        """
+        Format a batch in one pass and flush it with a single stream write.
 
-        if should_flush:
+        Args:
+            records: Log records to emit
+        """
+        format_record = self._get_formatter().format
+        messages = [
+            format_record(record)
+            for record in records
+            if self.isEnabledFor(record.level)
+        ]
+        if not messages:
+            return
+        with self._lock:
+            self._buffer.extend(messages)
+            self._messages_processed += len(messages)
             self._flush_buffer()
 
     def _flush_buffer(self) -> None:
         """Flush buffer to stream efficiently."""
-        if not self._buffer:
-            return
-        if getattr(self._stream, "closed", False):
-            self._buffer.clear()
-            return
+        with self._lock:
+            if not self._buffer:
+                return
+            if getattr(self._stream, "closed", False):
+                self._buffer.clear()
+                return
 
-        # Join all messages with newlines and write in one operation
-        combined_message = "\n".join(self._buffer) + "\n"
-        self._stream.write(combined_message)
-        self._stream.flush()
+            # Join all messages with newlines and write in one operation
+            combined_message = "\n".join(self._buffer) + "\n"
+            self._stream.write(combined_message)
+            self._stream.flush()
 
-        # Update statistics
-        self._total_bytes_written += len(combined_message.encode("utf-8"))
-        self._last_flush = time.perf_counter()
+            # Update statistics
+            self._total_bytes_written += len(combined_message.encode("utf-8"))
+            self._last_flush = time.perf_counter()
 
-        # Clear buffer
-        self._buffer.clear()
+            # Clear buffer
+            self._buffer.clear()
+
+    def _flush_if_stale(self) -> float:
+        """Flush when a deadline passed; else seconds until the next one.
+
+        Called by the shared background flusher. Returns `inf` while the
+        buffer is empty and 0 right after a flush.
+        """
+        with self._lock:
+            if not self._buffer:
+                return math.inf
+            deadline = self._last_flush + self._effective_flush_interval()
+            if self._max_buffer_age is not None:
+                deadline = min(
+                    deadline, self._oldest_buffered_at + self._max_buffer_age
+                )
+            remaining = deadline - time.perf_counter()
+            if remaining > 0.0:
+                return remaining
+            self._flush_buffer()
+            return 0.0
 
     def _auto_cleanup(self) -> None:
         """Cleanup handler on exit."""
@@ -176,6 +250,8 @@ class SyncConsoleHandler(BaseHandler):
 
     def close(self) -> None:
         """Flush buffered lines before closing (Jupyter cells exit before process atexit)."""
+        if self._flusher is not None:
+            self._flusher.unregister(self)
         try:
             if hasattr(self, "_buffer") and self._buffer:
                 self._flush_buffer()
@@ -183,19 +259,27 @@ class SyncConsoleHandler(BaseHandler):
             _logger.exception("Sync console flush during close failed")
         super().close()
 
+    def _after_fork_child(self) -> None:
+        """Drop lines the parent buffered; the parent still flushes them."""
+        self._lock = threading.RLock()
+        self._buffer.clear()
+        self._last_flush = time.perf_counter()
+
     def get_stats(self) -> dict:
         """Get handler statistics."""
-        runtime = time.perf_counter() - self._start_time
-        return {
-            "messages_processed": self._messages_processed,
-            "total_bytes_written": self._total_bytes_written,
-            "runtime_seconds": runtime,
-            "messages_per_second": (
-                self._messages_processed / runtime if runtime > 0 else 0
-            ),
-            "buffer_size": len(self._buffer),
-            "use_colors": self._use_colors,
-        }
+        with self._lock:
+            runtime = time.perf_counter() - self._start_time
+            return {
+                "messages_processed": self._messages_processed,
+                "total_bytes_written": self._total_bytes_written,
+                "runtime_seconds": runtime,
+                "messages_per_second": (
+                    self._messages_processed / runtime if runtime > 0 else 0
+                ),
+                "buffer_size": len(self._buffer),
+                "use_colors": self._use_colors,
+                "background_flush": self._flusher is not None,
+            }
 
 
 class AsyncConsoleHandler(BaseHandler):
@@ -350,6 +434,52 @@ class AsyncConsoleHandler(BaseHandler):
                 # Flush buffer using non-blocking I/O
                 await self._flush_async_buffer()
 
+    def emit_batch(self, records: Sequence[LogRecord]) -> None:
+        """
+        Format a batch in one pass and write it to the stream in one call.
+
+        Args:
+            records: Log records to emit
+        """
+        format_record = self._get_formatter().format
+        messages = [
+            format_record(record)
+            for record in records
+            if self.isEnabledFor(record.level)
+        ]
+        if not messages:
+            return
+        combined_message = "\n".join(messages) + "\n"
+        try:
+            self._stream.write(combined_message)
+            self._stream.flush()
+            self._messages_processed += len(messages)
+            self._total_bytes_written += len(combined_message.encode("utf-8"))
+        except Exception:
+            # If console output fails, don't block the entire system
+            self._messages_dropped += len(messages)
+
+    async def emit_batch_async(self, records: Sequence[LogRecord]) -> None:
+        """
+        Format a batch in one pass and flush it with one executor write.
+
+        Args:
+            records: Log records to emit
+        """
+        format_record = self._get_formatter().format
+        messages = [
+            format_record(record)
+            for record in records
+            if self.isEnabledFor(record.level)
+        ]
+        if not messages:
+            return
+        async with self._async_buffer_lock:
+            # Lines buffered by emit_async() go out first to keep stream order.
+            self._async_buffer.extend(messages)
+            self._messages_processed += len(messages)
+            await self._flush_async_buffer()
+
     async def _flush_async_buffer(self) -> None:
         """Flush async buffer using non-blocking I/O."""
         if not self._async_buffer:
@@ -530,6 +660,16 @@ class AsyncConsoleHandler(BaseHandler):
         except Exception:
             _logger.exception("Async console auto cleanup failed")
 
+    def _after_fork_child(self) -> None:
+        """Drop parent's buffered lines; recreate loop primitives lazily."""
+        self._async_buffer.clear()
+        self._async_buffer_lock = asyncio.Lock()
+        self._message_queue = asyncio.Queue(maxsize=self._buffer_size * 2)
+        self._shutdown_event = asyncio.Event()
+        self._worker_task = None
+        self._running = False
+        self._executor = None
+
     async def aclose(self) -> None:
         """Close async handler and cleanup resources."""
         # PERFORMANCE: Flush any remaining buffered messages before closing
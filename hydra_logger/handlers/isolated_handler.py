@@ -0,0 +1,177 @@
+"""
+Role: Bulkhead wrapper giving one destination its own bounded queue and worker.
+Used By:
+ - `hydra_logger.loggers.sync_logger` when `LogDestination.isolated` is set.
+Depends On:
+ - hydra_logger
+Notes:
+ - `emit` only appends `(enqueued_at, record)` to a `BoundedWorker`; its daemon
+   thread hands drained runs to the wrapped handler's `emit_batch`, so a stuck
+   sink blocks its own worker and never the caller or sibling destinations.
+ - A full queue applies `drop_newest` or `drop_oldest`. With a latency budget,
+   records that waited longer than it are dropped as `expired` at dequeue.
+ - The worker starts on the first emit, so a forked child starts its own.
+"""
+
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..formatters.base import BaseFormatter
+from ..types.records import LogRecord
+from ..utils import slo_metrics
+from ..utils.bounded_worker import OVERFLOW_POLICIES, BoundedWorker
+from .base_handler import BaseHandler
+
+_logger = logging.getLogger(__name__)
+
+
+class IsolatedHandler(BaseHandler):
+    """Run a wrapped handler on its own bounded queue and worker thread."""
+
+    def __init__(
+        self,
+        handler: BaseHandler,
+        max_queue_size: int = 1000,
+        overflow_policy: str = "drop_newest",
+        latency_budget: Optional[float] = None,
+        batch_size: int = 128,
+        close_timeout: float = 5.0,
+    ):
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"overflow_policy must be one of {OVERFLOW_POLICIES}, "
+                f"got {overflow_policy!r}"
+            )
+        super().__init__(name=f"isolated:{handler.name}", level=handler.level)
+        self._handler = handler
+        self._max_queue_size = max(1, int(max_queue_size))
+        self._overflow_policy = overflow_policy
+        self._latency_budget = (
+            None if latency_budget is None else max(0.0, float(latency_budget))
+        )
+        self._batch_size = max(1, int(batch_size))
+        self._close_timeout = max(0.0, float(close_timeout))
+        self._reset_worker_state()
+
+    def _reset_worker_state(self) -> None:
+        self._worker = BoundedWorker(
+            self._write_batch,
+            max_size=self._max_queue_size,
+            batch_size=self._batch_size,
+            overflow_policy=self._overflow_policy,
+            name=f"hydra-logger-{self.name}",
+            drop_reason="destination_queue_full",
+            label=f"Destination queue for handler={self._handler.name}",
+        )
+        self._written = 0
+        self._expired = 0
+        self._write_errors = 0
+        self._writes = 0
+        self._write_seconds_total = 0.0
+        self._write_seconds_max = 0.0
+        self._write_seconds_last = 0.0
+
+    @property
+    def handler(self) -> BaseHandler:
+        """Wrapped destination handler."""
+        return self._handler
+
+    def setFormatter(self, formatter: BaseFormatter) -> None:
+        """Set the formatter on the wrapped handler."""
+        self._handler.setFormatter(formatter)
+        super().setFormatter(formatter)
+
+    def setLevel(self, level: int) -> None:
+        """Set the level on both the wrapper and the wrapped handler."""
+        self._handler.setLevel(level)
+        super().setLevel(level)
+
+    def emit(self, record: LogRecord) -> None:
+        """Queue `record` for the destination worker; never blocks on the sink."""
+        if not self._closed:
+            self._worker.submit((time.monotonic(), record))
+
+    def emit_batch(self, records: Sequence[LogRecord]) -> None:
+        """Queue the enabled records of a batch under one lock acquisition."""
+        if self._closed:
+            return
+        now = time.monotonic()
+        self._worker.submit_many(
+            (now, record) for record in records if self.isEnabledFor(record.level)
+        )
+
+    def _write_batch(self, batch: List[Tuple[float, LogRecord]]) -> None:
+        """Worker callback: drop expired records, then write the rest."""
+        budget = self._latency_budget
+        if budget is None:
+            records = [record for _, record in batch]
+        else:
+            deadline = time.monotonic() - budget
+            records = [record for queued, record in batch if queued >= deadline]
+        expired = len(batch) - len(records)
+        if expired:
+            self._expired += expired
+            slo_metrics.record_dropped_log("destination_latency_budget")
+        if not records:
+            return
+        started = time.monotonic()
+        try:
+            self._handler.emit_batch(records)
+        except Exception:
+            self._write_errors += 1
+            _logger.exception(
+                "Isolated write failed for handler type=%s",
+                type(self._handler).__name__,
+            )
+        else:
+            self._written += len(records)
+        elapsed = time.monotonic() - started
+        self._writes += 1
+        self._write_seconds_total += elapsed
+        self._write_seconds_last = elapsed
+        if elapsed > self._write_seconds_max:
+            self._write_seconds_max = elapsed
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued record has been handed to the destination."""
+        return self._worker.flush(timeout)
+
+    def close(self) -> None:
+        """Drain within `close_timeout`, then close the wrapped handler."""
+        if self._closed:
+            return
+        self._worker.stop(self._close_timeout)
+        try:
+            self._handler.close()
+        finally:
+            super().close()
+
+    def _after_fork_child(self) -> None:
+        """Forget the parent's queue and worker; the parent still drains them."""
+        self._reset_worker_state()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth, drops, and write latency for this destination."""
+        writes = self._writes
+        worker = self._worker.stats()
+        return {
+            "handler": type(self._handler).__name__,
+            "alive": worker["alive"],
+            "overflow_policy": self._overflow_policy,
+            "max_queue_size": self._max_queue_size,
+            "latency_budget_ms": (
+                None if self._latency_budget is None else self._latency_budget * 1000.0
+            ),
+            "depth": worker["depth"],
+            "depth_max": worker["depth_max"],
+            "written": self._written,
+            "dropped": worker["dropped"],
+            "expired": self._expired,
+            "write_errors": self._write_errors,
+            "write_latency_avg_ms": (
+                self._write_seconds_total / writes * 1000.0 if writes else 0.0
+            ),
+            "write_latency_max_ms": self._write_seconds_max * 1000.0,
+            "write_latency_last_ms": self._write_seconds_last * 1000.0,
+        }
@@ -347,6 +347,15 @@ class BaseNetworkHandler(BaseHandler):
         self._disconnect()
         super().close()
 
+    def _after_fork_child(self) -> None:
+        """Forget the parent's connection; the next emit reconnects lazily."""
+        # Never close/shutdown the shared socket here: that would tear down
+        # the parent's connection too.
+        self._connection = None
+        self._connected = False
+        self._retry_count = 0
+        self._last_retry = 0.0
+
 
 class HTTPHandler(BaseNetworkHandler):
     """HTTP-based network handler."""
@@ -541,6 +550,11 @@ class HTTPHandler(BaseNetworkHandler):
             self._session.close()
             self._session = None
 
+    def _after_fork_child(self) -> None:
+        """Drop the inherited session so pooled sockets are never shared."""
+        super()._after_fork_child()
+        self._session = None
+
 
 class WebSocketHandler(BaseNetworkHandler):
     """WebSocket-based network handler."""
@@ -704,6 +718,11 @@ class WebSocketHandler(BaseNetworkHandler):
                 _logger.debug("WebSocket close failed", exc_info=True)
             self._websocket = None
 
+    def _after_fork_child(self) -> None:
+        """Drop the inherited WebSocket without sending a close frame."""
+        super()._after_fork_child()
+        self._websocket = None
+
 
 class SocketHandler(BaseNetworkHandler):
     """Socket-based network handler."""
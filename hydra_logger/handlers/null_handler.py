@@ -8,6 +8,8 @@ Notes:
  - Implements log destination handling and I/O flow for null handler.
 """
 
+from typing import Sequence
+
 from ..types.records import LogRecord
 from .base_handler import BaseHandler
 
@@ -79,3 +81,21 @@ class NullHandler(BaseHandler):
         """
         # Do nothing - this is a null handler
         pass
+
+    def emit_batch(self, records: Sequence[LogRecord]) -> None:
+        """
+        Discard a batch of log records (no operation).
+
+        Args:
+            records: Log records to discard
+        """
+        pass
+
+    async def emit_batch_async(self, records: Sequence[LogRecord]) -> None:
+        """
+        Async batch emit method for null handler.
+
+        Args:
+            records: Log records to discard
+        """
+        pass
@@ -14,6 +14,11 @@ Depends On:
  - ...
 Notes:
  - Implements log destination handling and I/O flow for rotating handler.
+ - The active file is a raw unbuffered binary file. Lines are encoded once
+   into a list of bytes chunks and flushed with `os.writev` (`write_chunks`).
+ - `emit`, `emit_batch`, flushes, rotation, and close share one `RLock`, since
+   isolated-destination workers, the offload thread, and the background flusher
+   may call them concurrently. Records are formatted before taking it.
 """
 
 # pyright: reportAttributeAccessIssue=false, reportOptionalMemberAccess=false
@@ -25,18 +30,19 @@ import os
 import shutil
 import threading
 import time
-from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Deque, Dict, Optional, TextIO, cast
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Sequence, cast
 
 from hydra_logger.handlers.base_handler import BaseHandler
 from hydra_logger.types.enums import TimeUnit
 from hydra_logger.types.levels import LogLevel
 from hydra_logger.types.records import LogRecord
 from hydra_logger.utils.file_utility import FileUtility
+from hydra_logger.utils.fork_safety import discard_inherited_stream
 from hydra_logger.utils.time_utility import TimeUtility
+from hydra_logger.utils.vectored_write import write_chunks
 
 _logger = logging.getLogger(__name__)
 
@@ -98,7 +104,7 @@ class RotatingFileHandler(BaseHandler):
         super().__init__(name="rotating_file", level=LogLevel.NOTSET)
         self._filename = filename
         self._config = config or RotationConfig()
-        self._current_file: Optional[TextIO] = None
+        self._current_file: Optional[BinaryIO] = None
         self._lock = threading.RLock()
         self._rotation_count = 0
         self._last_rotation = 0.0
@@ -106,13 +112,11 @@ class RotatingFileHandler(BaseHandler):
         # Performance optimization: Enhanced buffering
         self._buffer_size = buffer_size
         self._flush_interval = flush_interval
-        self._buffer: Deque[Any] = deque(maxlen=buffer_size)
+        # Encoded lines awaiting one vectored write; `_buffered_bytes` is their size
+        self._buffer: List[bytes] = []
+        self._buffered_bytes = 0
         self._last_flush = time.time()
 
-        # Pre-allocate string buffer for better performance
-        self._string_buffer: list[str] = []
-        self._string_buffer_size = 0
-
         # Ensure directory exists
         log_dir = os.path.dirname(filename)
         if log_dir and not FileUtility.exists(log_dir):
@@ -138,7 +142,7 @@ class RotatingFileHandler(BaseHandler):
             if not FileUtility.is_writable(self._filename):
                 raise PermissionError(f"Cannot write to {self._filename}")
 
-            self._current_file = open(self._filename, "a", encoding="utf-8")
+            self._current_file = open(self._filename, "ab", buffering=0)
         except Exception as e:
             _logger.exception("Failed to initialize rotating log file: %s", e)
             raise
@@ -291,70 +295,109 @@ class RotatingFileHandler(BaseHandler):
         Args:
             record: Log record to emit
         """
-        # Check if rotation is needed
-        if self._should_rotate():
-            self._rotate_file()
+        # Format and encode once, outside the lock
+        message = self._format_record(record).encode("utf-8")
+
+        with self._lock:
+            # Check if rotation is needed
+            if self._should_rotate():
+                self._rotate_file()
+
+            # Add to buffer
+            self._buffer.append(message)
+            self._buffered_bytes += len(message)
+
+            # Check if we should flush
+            current_time = time.time()
+            should_flush = (
+                len(self._buffer) >= self._buffer_size
+                or (current_time - self._last_flush) >= self._flush_interval
+            )
+
+            if should_flush:
+                self._flush_buffer()
+
+    def emit_batch(self, records: Sequence[LogRecord]) -> None:
+        """
+        Format a batch in one pass and write it with a single call.
+
+        Rotation is checked once per batch, so a size limit can be overshot by
+        at most one batch.
+
+        Args:
+            records: Log records to emit
+        """
+        messages = [
+            self._format_record(record).encode("utf-8")
+            for record in records
+            if self.isEnabledFor(record.level)
+        ]
+        if not messages:
+            return
 
-        # Format message
+        with self._lock:
+            if self._should_rotate():
+                self._rotate_file()
+
+            # Lines already buffered by emit() go out first to keep file order.
+            self._flush_buffer()
+            if not self._current_file:
+                return
+            try:
+                write_chunks(self._current_file, messages)
+                self._last_flush = time.time()
+            except (OSError, ValueError):
+                _logger.debug(
+                    "Rotating file batch skipped due to closed or invalid handle"
+                )
+            except Exception as e:
+                _logger.exception("Rotating file batch write error: %s", e)
+
+    def _format_record(self, record: LogRecord) -> str:
+        """Format one record as a complete line for the rotating file."""
         if self.formatter:
             # Check if this is a streaming formatter that needs special handling
             if hasattr(self.formatter, "format_for_streaming"):
-                message = self.formatter.format_for_streaming(record)
-            else:
-                message = self.formatter.format(record)
-                # Add newline for non-streaming formatters, but CSV formatters handle
-                # their own
-                if not self._is_csv_formatter:
-                    message += "\n"
-        else:
-            message = f"{record.level_name}: {record.message}\n"
-
-        # Add to buffer
-        self._buffer.append(message)
-        self._string_buffer.append(message)
-        self._string_buffer_size += len(message)
-
-        # Check if we should flush
-        current_time = time.time()
-        should_flush = (
-            len(self._buffer) >= self._buffer_size
-            or (current_time - self._last_flush) >= self._flush_interval
-        )
-
-        if should_flush:
-            self._flush_buffer()
+                return self.formatter.format_for_streaming(record)
+            message = self.formatter.format(record)
+            # Add newline for non-streaming formatters, but CSV formatters handle
+            # their own
+            if not self._is_csv_formatter:
+                message += "\n"
+            return message
+        return f"{record.level_name}: {record.message}\n"
 
     def _flush_buffer(self) -> None:
         """Flush buffered messages to file."""
-        if not self._buffer or not self._current_file:
-            return
-
-        # Check if rotation is needed before flushing
-        if self._should_rotate():
-            self._rotate_file()
-
-        try:
-            # Check if file is closed
-            if hasattr(self._current_file, "closed") and self._current_file.closed:
+        with self._lock:
+            if not self._buffer or not self._current_file:
                 return
 
-            # Write all buffered messages at once - use string buffer for better
-            # performance
-            if self._string_buffer:
-                self._current_file.write("".join(self._string_buffer))
-                self._current_file.flush()
-
-            # Clear buffers and update flush time
-            self._buffer.clear()
-            self._string_buffer.clear()
-            self._string_buffer_size = 0
-            self._last_flush = time.time()
-
-        except (OSError, ValueError):
-            # File is closed or invalid, silently ignore
-            _logger.debug("Rotating file flush skipped due to closed or invalid handle")
-        except Exception as e:
-            _logger.exception("Rotating file buffer flush error: %s", e)
+            # Check if rotation is needed before flushing
+            if self._should_rotate():
+                self._rotate_file()
+
+            try:
+                # Check if file is closed
+                current = self._current_file
+                if hasattr(current, "closed") and current.closed:
+                    return
+
+                # Hand the buffered chunks to the kernel without joining them
+                write_chunks(self._current_file, self._buffer)
+
+                # Clear buffer and update flush time
+                self._buffer.clear()
+                self._buffered_bytes = 0
+                self._last_flush = time.time()
+
+            except (OSError, ValueError):
+                # File is closed or invalid, silently ignore
+                _logger.debug(
+                    "Rotating file flush skipped due to closed or invalid handle"
+                )
+            except Exception as e:
+                _logger.exception("Rotating file buffer flush error: %s", e)
 
     def force_flush(self) -> None:
         """Force flush any remaining buffered messages."""
@@ -384,31 +427,46 @@ class RotatingFileHandler(BaseHandler):
                             except TypeError:
                                 header_text = wh_call()
                             if isinstance(header_text, str) and header_text:
-                                self._current_file.write(header_text)
+                                self._current_file.write(header_text.encode("utf-8"))
                         elif hasattr(fmt, "format_headers") and hasattr(
                             fmt, "should_write_headers"
                         ):
                             # CSV formatters
                             if fmt.should_write_headers(self._filename):  # type: ignore[call-arg]
                                 header = fmt.format_headers() + "\n"
-                                self._current_file.write(header)
+                                self._current_file.write(header.encode("utf-8"))
                                 fmt.mark_headers_written(self._filename)  # type: ignore[call-arg]
                         self._header_written = True
 
-                self._current_file.write(message)
-                self._current_file.flush()
+                write_chunks(self._current_file, [message.encode("utf-8")])
             except Exception as e:
                 _logger.exception("Failed to write message to rotating file: %s", e)
 
+    def _after_fork_child(self) -> None:
+        """Drop parent's buffered lines and reopen the active file in the child."""
+        self._lock = threading.RLock()
+        self._buffer.clear()
+        self._buffered_bytes = 0
+        self._last_flush = time.time()
+        if self._current_file is None:
+            return
+        discard_inherited_stream(self._current_file)
+        try:
+            self._current_file = open(self._filename, "ab", buffering=0)
+        except Exception:
+            _logger.exception("Could not reopen %s after fork", self._filename)
+            self._current_file = None
+
     def close(self) -> None:
         """Close the handler."""
-        # Flush any remaining buffered messages
-        self.force_flush()
+        with self._lock:
+            # Flush any remaining buffered messages
+            self.force_flush()
 
-        super().close()
-        if self._current_file:
-            self._current_file.close()
-            self._current_file = None
+            super().close()
+            if self._current_file:
+                self._current_file.close()
+                self._current_file = None
 
     def get_rotation_stats(self) -> Dict[str, Any]:
         """
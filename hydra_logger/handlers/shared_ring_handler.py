@@ -0,0 +1,125 @@
+"""
+Role: Handler that serializes records into a shared ring for a writer process.
+Used By:
+ - `hydra_logger.loggers.multiprocess_logger` (every layer routes here in workers).
+Depends On:
+ - hydra_logger
+ - pickle
+Notes:
+ - Records cross the process boundary as a tuple of `CompactLogRecord.FIELDS`;
+   messages are rendered and extensions applied before serialization.
+ - A full ring either drops at once (`drop_newest`) or waits up to
+   `put_timeout` (`block_with_timeout`); drops are reported to `slo_metrics`.
+"""
+
+import logging
+import pickle
+from typing import Any, Dict
+
+from ..types.levels import LogLevel
+from ..types.records import CompactLogRecord, LogRecord
+from ..utils import slo_metrics
+from ..utils.shared_ring import SharedRingBuffer
+from .base_handler import BaseHandler
+
+_logger = logging.getLogger(__name__)
+
+OVERFLOW_POLICIES = ("drop_newest", "block_with_timeout")
+
+_FIELDS = CompactLogRecord.FIELDS
+_MAPPING_FIELDS = frozenset({"extra", "context"})
+_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+
+def _field_values(record: Any, stringify: bool = False) -> tuple:
+    values = []
+    for name in _FIELDS:
+        value = getattr(record, name, None)
+        if name in _MAPPING_FIELDS:
+            if not value:
+                value = None
+            elif stringify:
+                value = {key: repr(item) for key, item in value.items()}
+            else:
+                value = dict(value)
+        values.append(value)
+    return tuple(values)
+
+
+def encode_record(record: Any) -> bytes:
+    """Serialize a record into a ring frame payload."""
+    try:
+        return pickle.dumps(_field_values(record), _PROTOCOL)
+    except Exception:
+        # Unpicklable `extra`/`context` values travel as their repr.
+        return pickle.dumps(_field_values(record, stringify=True), _PROTOCOL)
+
+
+def decode_record(payload: bytes) -> CompactLogRecord:
+    """Rebuild a record from a ring frame payload."""
+    return CompactLogRecord(*pickle.loads(payload))
+
+
+class SharedRingHandler(BaseHandler):
+    """Producer side of the multiprocess runtime: one frame per record."""
+
+    def __init__(
+        self,
+        ring: SharedRingBuffer,
+        overflow_policy: str = "drop_newest",
+        put_timeout: float = 0.01,
+    ):
+        super().__init__(name="shared_ring", level=LogLevel.NOTSET)
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"overflow_policy must be one of {OVERFLOW_POLICIES}, "
+                f"got {overflow_policy!r}"
+            )
+        self._ring = ring
+        self._overflow_policy = overflow_policy
+        self._put_timeout = (
+            max(0.0, float(put_timeout))
+            if overflow_policy == "block_with_timeout"
+            else 0.0
+        )
+        self._enqueued = 0
+        self._dropped = 0
+
+    @property
+    def ring(self) -> SharedRingBuffer:
+        """Shared ring this handler writes into."""
+        return self._ring
+
+    def emit(self, record: LogRecord) -> None:
+        """Serialize `record` into the ring, dropping it if the ring stays full."""
+        if self._closed:
+            return
+        try:
+            payload = encode_record(record)
+        except Exception:
+            _logger.exception("Could not serialize record for the writer process")
+            self._record_drop("serialization_error")
+            return
+        if self._ring.put(payload, self._put_timeout):
+            self._enqueued += 1
+        else:
+            slo_metrics.record_queue_saturation("multiprocess_ring")
+            self._record_drop("multiprocess_ring_full")
+
+    def _record_drop(self, reason: str) -> None:
+        self._dropped += 1
+        slo_metrics.record_dropped_log(reason)
+
+    def _after_fork_child(self) -> None:
+        """Start per-process counters at zero; the ring itself stays shared."""
+        self._enqueued = 0
+        self._dropped = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-process enqueue/drop counts plus shared ring counters."""
+        return {
+            "overflow_policy": self._overflow_policy,
+            "enqueued": self._enqueued,
+            "dropped": self._dropped,
+            "ring": self._ring.stats(),
+        }
@@ -22,7 +22,9 @@ from ..types.records import (
 )
 from .async_logger import AsyncLogger
 from .base import BaseLogger, PerformanceProfiles
+from .bound_logger import BoundLogger
 from .composite_logger import CompositeAsyncLogger, CompositeLogger
+from .multiprocess_logger import MultiprocessLogger
 from .sync_logger import SyncLogger
 
 # No factory imports to avoid circular imports
@@ -42,11 +44,13 @@ __all__ = [
     # Base classes
     "BaseLogger",
     "PerformanceProfiles",
+    "BoundLogger",
     # Logger implementations
     "SyncLogger",
     "AsyncLogger",
     "CompositeLogger",
     "CompositeAsyncLogger",
+    "MultiprocessLogger",
     # Standardized record creation
     "RecordCreationStrategy",
     "get_record_creation_strategy",
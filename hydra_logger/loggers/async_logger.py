@@ -10,6 +10,18 @@ Depends On:
  - typing
 Notes:
  - Implements logger orchestration and routing for async logger.
+ - Queue workers and the enqueue drainer build records per payload but hand
+   each same-layer run to handlers via `emit_batch_async`.
+ - `log_batch` runs whole chunks through staged normalize, build, redact, and
+   dispatch passes and reports the seconds spent in each stage.
+ - Idle workers park on an event set by producers and by `aclose`; they never
+   poll with timeouts.
+ - Task mode may bound in-flight records with `AdmissionController` credits.
+ - Queue mode may use `PriorityLaneQueue` lanes plus `LoadShedder` floors.
+ - Offload mode only captures `(level, message, kwargs, args, ambient)` on the
+   caller's thread; an `OffloadThread` builds, redacts, formats, and writes.
+ - `LoopLagMonitor` (on by default in offload mode) probes scheduling delay
+   and is reported by `get_concurrency_info`.
 """
 
 # pyright: reportAttributeAccessIssue=false, reportOptionalMemberAccess=false
@@ -17,21 +29,52 @@ Notes:
 
 import asyncio
 import sys
+import threading
+from collections import deque
+from itertools import groupby
 from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union, cast
 
-from ..config.models import LogDestination, LoggingConfig
+from ..config.models import LogDestination, LoggingConfig, LogLayer
 from ..core.exceptions import HydraLoggerError
 from ..formatters.base import BaseFormatter
 from ..handlers.base_handler import BaseHandler
 from ..handlers.null_handler import NullHandler
-from ..types.levels import LogLevel
+from ..types.context import (
+    AmbientContext,
+    current_ambient_context,
+    use_ambient_context,
+)
+from ..types.levels import LogLevel, LogLevelManager
 from ..types.records import LogRecord
 from ..utils import internal_diagnostics as diagnostics
+from ..utils import slo_metrics
 from ..utils.destination_contracts import unsupported_destination_message
 from ..utils.reliability_lifecycle import handle_lifecycle_failure
 from ..utils.time_utility import TimeUtility
 from .base import BaseLogger
-from .pipeline import ExtensionProcessor, HandlerDispatcher, LayerRouter, RecordBuilder
+from .pipeline import (
+    AdmissionController,
+    ExtensionProcessor,
+    HandlerDispatcher,
+    LayerRouter,
+    LoadShedder,
+    LoopLagMonitor,
+    OffloadThread,
+    PriorityLaneQueue,
+    RecordBuilder,
+)
+from .pipeline.priority_lanes import PROTECTED_LEVEL
+
+# Stages of the `log_batch` pipeline, in order, as reported in `stage_seconds`.
+BATCH_STAGES = ("normalize", "build", "redact", "dispatch")
+BATCH_COUNTERS = ("records", "dispatched", "filtered", "failed")
+
+
+def _batch_stats() -> Dict[str, Any]:
+    """Zeroed `log_batch` result: record counters plus per-stage seconds."""
+    stats: Dict[str, Any] = dict.fromkeys(BATCH_COUNTERS, 0)
+    stats["stage_seconds"] = dict.fromkeys(BATCH_STAGES, 0.0)
+    return stats
 
 
 class AsyncLogger(BaseLogger):
@@ -98,9 +141,9 @@ class AsyncLogger(BaseLogger):
         self._shutdown_event = None
         self._writer_tasks = {}
 
-        self._concurrency_semaphore = None
         self._optimal_concurrency = None
-        self._overflow_queue = asyncio.Queue(maxsize=100000)  # Larger overflow queue
+        # Task-mode admission credits (opt-in via async_runtime.admission_policy)
+        self._admission: Optional[AdmissionController] = None
         self._overflow_worker_task = None
 
         # Optional queue runtime mode (opt-in via config.extensions.async_runtime)
@@ -108,14 +151,43 @@ class AsyncLogger(BaseLogger):
         self._async_queue_max_size = 10000
         self._async_queue_worker_count = 1
         self._async_queue_overflow_policy = "drop_newest"
+        self._priority_lanes = False
+        self._load_shedder: Optional[LoadShedder] = None
         self._async_queue_put_timeout = 0.01
         self._async_record_queue = None
+        self._async_queue_ready: Optional[asyncio.Event] = None
         self._async_worker_tasks = []
         self._async_queue_enqueued = 0
         self._async_queue_processed = 0
         self._async_queue_dropped = 0
         self._async_worker_last_error = None
 
+        # Task-free enqueue mode: sync put into a bounded deque, one batch drainer
+        self._use_enqueue_ring = False
+        self._enqueue_ring: deque = deque()
+        self._enqueue_batch_size = 256
+        self._enqueue_ready: Optional[asyncio.Event] = None
+        self._enqueue_drainer: Optional[asyncio.Task] = None
+        self._enqueue_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._enqueue_stopping = False
+        self._enqueue_depth_max = 0
+        # Cross-thread submissions into the same ring (coalesced loop wake-ups)
+        self._threadsafe_lock = threading.Lock()
+        self._threadsafe_wake_pending = False
+        self._threadsafe_submitted = 0
+        self._threadsafe_dropped = 0
+        self._threadsafe_wakeups = 0
+        self._enqueue_drained = 0
+        self._enqueue_latency_total = 0.0
+        self._enqueue_latency_max = 0.0
+
+        # Offload mode: one background thread does all record work and I/O
+        self._offload: Optional[OffloadThread] = None
+        self._lag_monitor: Optional[LoopLagMonitor] = None
+
+        # Guards runtime layer mutations
+        self._lock = threading.RLock()
+
         # Statistics
         self._log_count = 0
         self._start_time = TimeUtility.timestamp()
@@ -137,10 +209,14 @@ class AsyncLogger(BaseLogger):
         # Shared hot-path pipeline services
         self._record_builder = RecordBuilder(self)
         self._extension_processor = ExtensionProcessor(self)
+        self._handler_dispatcher = HandlerDispatcher()
         self._layer_router = LayerRouter(
-            self._layers, self._layer_handlers, self._handler_cache, self._layer_cache
+            self._layers,
+            self._layer_handlers,
+            self._handler_cache,
+            self._layer_cache,
+            dispatcher=self._handler_dispatcher,
         )
-        self._handler_dispatcher = HandlerDispatcher()
 
     def _setup_core_systems(self):
         """Setup core system integration."""
@@ -233,16 +309,10 @@ class AsyncLogger(BaseLogger):
             # Fallback if psutil not available
             return 100
 
-    def _ensure_concurrency_semaphore(self):
-        """Ensure concurrency semaphore is initialized with overflow handling."""
-        if self._concurrency_semaphore is None:
-            self._optimal_concurrency = self._get_optimal_concurrency()
-            self._concurrency_semaphore = asyncio.Semaphore(self._optimal_concurrency)
-
-            if self._overflow_worker_task is None:
-                self._overflow_worker_task = asyncio.create_task(
-                    self._overflow_worker()
-                )
+    def _ensure_overflow_worker(self) -> None:
+        """Start the worker that runs parked records as credits free up."""
+        if self._overflow_worker_task is None or self._overflow_worker_task.done():
+            self._overflow_worker_task = asyncio.create_task(self._overflow_worker())
 
     def _setup_from_config(self, config: Union[LoggingConfig, Dict[str, Any]]):
         """Setup logger from configuration."""
@@ -274,8 +344,12 @@ class AsyncLogger(BaseLogger):
             return
 
         mode = str(runtime.get("mode", "task")).lower()
+        self._use_enqueue_ring = mode == "enqueue"
+        offload = mode == "offload"
         queue_mode_enabled = bool(runtime.get("queue_mode", mode == "queue"))
-        self._use_async_queue = queue_mode_enabled
+        self._use_async_queue = (
+            queue_mode_enabled and not self._use_enqueue_ring and not offload
+        )
         self._async_queue_max_size = max(100, int(runtime.get("max_queue_size", 10000)))
         self._async_queue_worker_count = max(1, int(runtime.get("worker_count", 1)))
         self._async_queue_overflow_policy = str(
@@ -284,6 +358,39 @@ class AsyncLogger(BaseLogger):
         self._async_queue_put_timeout = max(
             0.001, float(runtime.get("put_timeout_seconds", 0.01))
         )
+        self._enqueue_batch_size = max(1, int(runtime.get("batch_size", 256)))
+        self._priority_lanes = self._use_async_queue and bool(
+            runtime.get("priority_lanes", False)
+        )
+        if self._priority_lanes and runtime.get("adaptive_shedding", False):
+            self._load_shedder = LoadShedder(
+                runtime.get("shed_watermarks"),
+                float(runtime.get("shed_hysteresis", 0.1)),
+            )
+
+        if offload:
+            self._offload = OffloadThread(
+                self._process_offloaded,
+                max_size=self._async_queue_max_size,
+                batch_size=self._enqueue_batch_size,
+                overflow_policy=self._async_queue_overflow_policy,
+            )
+        if runtime.get("loop_lag_monitor", offload):
+            self._lag_monitor = LoopLagMonitor(
+                float(runtime.get("loop_lag_interval_seconds", 0.5))
+            )
+
+        policy = runtime.get("admission_policy")
+        if policy and not (self._use_enqueue_ring or self._use_async_queue or offload):
+            self._optimal_concurrency = int(
+                runtime.get("max_in_flight") or self._get_optimal_concurrency()
+            )
+            self._admission = AdmissionController(
+                credits=self._optimal_concurrency,
+                policy=str(policy).lower(),
+                wait_timeout=float(runtime.get("admission_timeout_seconds", 0.01)),
+                overflow_size=int(runtime.get("overflow_queue_size", 10000)),
+            )
 
     def _setup_default_configuration(self):
         """Setup SIMPLIFIED configuration for performance."""
@@ -314,6 +421,44 @@ class AsyncLogger(BaseLogger):
                     self._layer_handlers[layer_name].append(handler)
                     self._handlers[id(handler)] = handler
 
+        self._layer_router.invalidate()
+
+    def add_layer(self, name: str, layer: LogLayer) -> None:
+        """Add or replace a layer at runtime and rebuild emit plans."""
+        handlers = []
+        for destination in layer.destinations:
+            handler = self._create_handler_from_destination(destination)
+            if handler:
+                handlers.append(handler)
+        with self._lock:
+            previous = self._layer_handlers.get(name, [])
+            self._layers[name] = layer
+            self._layer_handlers[name] = handlers
+            for handler in previous:
+                self._handlers.pop(id(handler), None)
+            for handler in handlers:
+                self._handlers[id(handler)] = handler
+            self._layer_router.invalidate()
+        self._close_detached_handlers(previous)
+
+    def remove_layer(self, name: str) -> None:
+        """Remove a runtime layer and rebuild emit plans."""
+        with self._lock:
+            self._layers.pop(name, None)
+            previous = self._layer_handlers.pop(name, [])
+            for handler in previous:
+                self._handlers.pop(id(handler), None)
+            self._layer_router.invalidate()
+        self._close_detached_handlers(previous)
+
+    def _close_detached_handlers(self, handlers: list) -> None:
+        """Close handlers detached by layer replacement or removal."""
+        for handler in handlers:
+            try:
+                handler.close()
+            except Exception as error:
+                self._report_lifecycle_failure("detached_handler_close", error)
+
     def _create_handler_from_destination(
         self, destination: LogDestination
     ) -> BaseHandler:
@@ -348,7 +493,10 @@ class AsyncLogger(BaseLogger):
                 destination.path or "", destination.format
             )
             handler = AsyncFileHandler(
-                filename=resolved_path, mode="a", encoding="utf-8"  # Append mode
+                filename=resolved_path,
+                mode="a",  # Append mode
+                encoding="utf-8",
+                durability=destination.durability,
             )
             # Set formatter for file
             formatter = self._create_formatter_for_destination(
@@ -489,7 +637,7 @@ class AsyncLogger(BaseLogger):
         fallback_handler = NullHandler()
         self._fallback_handler = fallback_handler
 
-    def log(self, level: Union[str, int], message: str, **kwargs):
+    def log(self, level: Union[str, int], message: str, *args: Any, **kwargs):
         """
         Log method with automatic async/sync detection.
 
@@ -498,7 +646,8 @@ class AsyncLogger(BaseLogger):
 
         Args:
             level: Log level (string or numeric)
-            message: Log message
+            message: Log message or `%`-style template (or zero-arg callable)
+            *args: Deferred template arguments, interpolated only when emitted
             **kwargs: Additional log record fields
         """
         # Fast path checks (minimal overhead)
@@ -506,46 +655,173 @@ class AsyncLogger(BaseLogger):
             return
 
         try:
+            if not self._passes_precheck(level, kwargs):
+                return None
+
             # Check if we're in an async context
             try:
                 loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+            if self._lag_monitor is not None and loop is not None:
+                self._watch_loop(loop)
+            if self._offload is not None:
+                # Any thread, loop or not: capture the payload and return.
+                self._submit_offload(level, message, kwargs, args)
+                return None
+            owner = self._enqueue_loop
+            if owner is not None and loop is not owner and not owner.is_closed():
+                # Another thread: hand the payload to the owning loop's drainer.
+                self._submit_threadsafe(owner, level, message, kwargs, args)
+                return None
+
+            try:
+                if loop is None:
+                    raise RuntimeError("no running event loop")
                 # We're in an async context - return coroutine
+                if self._use_enqueue_ring:
+                    self._enqueue_nowait(loop, level, message, kwargs, args)
+                    return None
                 if self._use_async_queue:
                     return loop.create_task(
-                        self._enqueue_for_async_workers(level, message, kwargs)
+                        self._enqueue_for_async_workers(level, message, kwargs, args)
                     )
-                return loop.create_task(self._log_async(level, message, **kwargs))
+                if self._admission is not None:
+                    return self._admit_nowait(loop, level, message, kwargs, args)
+                return loop.create_task(
+                    self._log_async(level, message, *args, **kwargs)
+                )
             except RuntimeError:
                 # No event loop - use synchronous fallback
-                self._log_sync(level, message, **kwargs)
+                self._log_sync(level, message, *args, **kwargs)
 
         except Exception as error:
             self._handle_internal_failure("log", error)
 
-    async def log_async(self, level: Union[str, int], message: str, **kwargs) -> None:
+    async def log_async(
+        self, level: Union[str, int], message: str, *args: Any, **kwargs
+    ) -> None:
         """
         Async log method for explicit async usage.
 
         Args:
             level: Log level (string or numeric)
-            message: Log message
+            message: Log message or `%`-style template (or zero-arg callable)
+            *args: Deferred template arguments, interpolated only when emitted
             **kwargs: Additional log record fields
         """
         if not self._initialized:
             return
 
         try:
+            if not self._passes_precheck(level, kwargs):
+                return
+            if self._lag_monitor is not None:
+                self._watch_loop(asyncio.get_running_loop())
+            if self._offload is not None:
+                self._submit_offload(level, message, kwargs, args)
+                return
+            if self._use_enqueue_ring:
+                self._enqueue_nowait(
+                    asyncio.get_running_loop(), level, message, kwargs, args
+                )
+                return
             if self._use_async_queue:
-                await self._enqueue_for_async_workers(level, message, kwargs)
+                await self._enqueue_for_async_workers(level, message, kwargs, args)
                 return
-            await self._log_async(level, message, **kwargs)
+            if self._admission is not None:
+                await self._admit_and_log(level, message, args, kwargs)
+                return
+            await self._log_async(level, message, *args, **kwargs)
         except Exception as error:
             self._handle_internal_failure("log_async", error)
 
+    def _admit_nowait(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        level: Union[str, int],
+        message: str,
+        kwargs: Dict[str, Any],
+        args: Tuple[Any, ...],
+    ) -> Optional[asyncio.Task]:
+        """Admit a record from a sync caller on the loop, which can never wait.
+
+        Without a free credit, `block` and `drop_newest` both drop the record
+        here; it is counted under `nowait_dropped` in the admission stats.
+        """
+        admission = cast(AdmissionController, self._admission)
+        if admission.try_acquire():
+            return loop.create_task(self._log_admitted(level, message, args, kwargs))
+        admission.saturated()
+        if admission.policy == "drop_lowest_priority":
+            self._park_record(level, message, args, kwargs)
+        else:
+            admission.drop_nowait()
+        return None
+
+    async def _admit_and_log(
+        self,
+        level: Union[str, int],
+        message: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> None:
+        """Take a credit per the admission policy, then log the record."""
+        admission = cast(AdmissionController, self._admission)
+        if not admission.try_acquire():
+            admission.saturated()
+            if admission.policy == "drop_lowest_priority":
+                self._park_record(level, message, args, kwargs)
+                return
+            timeout = None if admission.policy == "block" else admission.wait_timeout
+            if not await admission.acquire(timeout):
+                admission.drop("timeout")
+                return
+        await self._log_admitted(level, message, args, kwargs)
+
+    async def _log_admitted(
+        self,
+        level: Union[str, int],
+        message: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> None:
+        """Log a record that holds a credit and return the credit afterwards."""
+        try:
+            await self._log_async(level, message, *args, **kwargs)
+        finally:
+            cast(AdmissionController, self._admission).release()
+
+    def _park_record(
+        self,
+        level: Union[str, int],
+        message: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> None:
+        """Queue a record in the overflow lane for the overflow worker."""
+        payload = (level, message, args, kwargs, current_ambient_context())
+        priority = LogLevelManager.get_level(level)
+        if cast(AdmissionController, self._admission).park(priority, payload):
+            self._ensure_overflow_worker()
+
     async def _ensure_async_queue_workers(self) -> None:
         """Ensure queue and async worker tasks are initialized."""
         if self._async_record_queue is None:
-            self._async_record_queue = asyncio.Queue(maxsize=self._async_queue_max_size)
+            if self._priority_lanes:
+                self._async_record_queue = PriorityLaneQueue(
+                    self._async_queue_max_size,
+                    shed_same_lane=self._async_queue_overflow_policy == "drop_oldest",
+                )
+            else:
+                self._async_record_queue = asyncio.Queue(
+                    maxsize=self._async_queue_max_size
+                )
+        if self._async_queue_ready is None:
+            self._async_queue_ready = asyncio.Event()
+        if self._enqueue_loop is None or self._enqueue_loop.is_closed():
+            # Other threads submit to the loop that runs the queue workers.
+            self._enqueue_loop = asyncio.get_running_loop()
 
         alive_tasks = [task for task in self._async_worker_tasks if not task.done()]
         self._async_worker_tasks = alive_tasks
@@ -558,9 +834,18 @@ class AsyncLogger(BaseLogger):
             self._async_worker_tasks.append(task)
 
     async def _enqueue_for_async_workers(
-        self, level: Union[str, int], message: str, kwargs: Dict[str, Any]
+        self,
+        level: Union[str, int],
+        message: str,
+        kwargs: Dict[str, Any],
+        args: Tuple[Any, ...] = (),
+        ambient: Optional[AmbientContext] = None,
     ) -> bool:
-        """Enqueue log payload for queue-mode processing."""
+        """Enqueue log payload for queue-mode processing.
+
+        `ambient` carries a foreign thread's context snapshot; by default the
+        caller's current context is captured.
+        """
         self._raise_if_async_worker_failed()
         if self._closed:
             return False
@@ -569,21 +854,38 @@ class AsyncLogger(BaseLogger):
         if self._async_record_queue is None:
             return False
 
-        payload = (level, message, kwargs)
+        shedder = self._load_shedder
+        if shedder is not None and not shedder.admit(
+            kwargs.get("layer", "default"),
+            LogLevelManager.get_level(level),
+            self._async_record_queue.occupancy,
+        ):
+            self._async_record_queue.count_drop(level)
+            self._async_queue_dropped += 1
+            slo_metrics.record_dropped_log("async_queue_load_shed")
+            return False
+
+        # Capture the caller's ambient snapshot; workers run in their own context.
+        if ambient is None:
+            ambient = current_ambient_context()
+        payload = (level, message, kwargs, args, ambient)
         try:
             self._async_record_queue.put_nowait(payload)
             self._async_queue_enqueued += 1
+            self._wake_async_queue_workers()
             self._raise_if_async_worker_failed()
             return True
         except asyncio.QueueFull:
             policy = self._async_queue_overflow_policy
-            if policy == "drop_oldest":
+            # Priority lanes already shed what they could before refusing.
+            if policy == "drop_oldest" and not self._priority_lanes:
                 try:
                     self._async_record_queue.get_nowait()
                     self._async_record_queue.task_done()
                     self._async_queue_dropped += 1
                     self._async_record_queue.put_nowait(payload)
                     self._async_queue_enqueued += 1
+                    self._wake_async_queue_workers()
                     return True
                 except asyncio.QueueEmpty:
                     pass
@@ -596,6 +898,7 @@ class AsyncLogger(BaseLogger):
                         timeout=self._async_queue_put_timeout,
                     )
                     self._async_queue_enqueued += 1
+                    self._wake_async_queue_workers()
                     return True
                 except asyncio.TimeoutError:
                     pass
@@ -611,6 +914,278 @@ class AsyncLogger(BaseLogger):
                 )
             return False
 
+    def _enqueue_nowait(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        level: Union[str, int],
+        message: str,
+        kwargs: Dict[str, Any],
+        args: Tuple[Any, ...],
+    ) -> bool:
+        """Append a payload for the drainer without creating a task or coroutine."""
+        self._raise_if_async_worker_failed()
+        if self._closed:
+            return False
+        if self._enqueue_drainer is None or loop is not self._enqueue_loop:
+            self._start_enqueue_drainer(loop)
+
+        ring = self._enqueue_ring
+        depth = len(ring)
+        if depth >= self._async_queue_max_size:
+            if self._async_queue_overflow_policy != "drop_oldest":
+                self._note_enqueue_drop(depth)
+                return False
+            ring.popleft()
+            self._async_queue_dropped += 1
+            depth -= 1
+
+        ring.append(
+            (
+                level,
+                message,
+                kwargs,
+                args,
+                current_ambient_context(),
+                TimeUtility.perf_counter(),
+            )
+        )
+        self._async_queue_enqueued += 1
+        if depth >= self._enqueue_depth_max:
+            self._enqueue_depth_max = depth + 1
+        if depth == 0:
+            # Edge-triggered: the drainer only sleeps on an empty ring.
+            self._enqueue_ready.set()
+        return True
+
+    def bind_loop(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """Make `loop` (default: the running loop) own submissions from other threads.
+
+        Only needed when threads log before the loop itself has logged.
+        """
+        if not (self._use_enqueue_ring or self._use_async_queue):
+            raise HydraLoggerError(
+                "bind_loop requires async_runtime mode 'enqueue' or 'queue'"
+            )
+        self._enqueue_loop = loop or asyncio.get_running_loop()
+
+    def _submit_threadsafe(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        level: Union[str, int],
+        message: str,
+        kwargs: Dict[str, Any],
+        args: Tuple[Any, ...],
+    ) -> bool:
+        """Append from a foreign thread; wake the loop at most once per batch."""
+        self._raise_if_async_worker_failed()
+        if self._closed:
+            return False
+        payload = (
+            level,
+            message,
+            kwargs,
+            args,
+            current_ambient_context(),
+            TimeUtility.perf_counter(),
+        )
+        ring = self._enqueue_ring
+        with self._threadsafe_lock:
+            depth = len(ring)
+            if depth >= self._async_queue_max_size and not (
+                # The ring only hands off to the lanes, which never drop ERROR+.
+                self._priority_lanes
+                and LogLevelManager.get_level(level) >= PROTECTED_LEVEL
+            ):
+                if self._async_queue_overflow_policy != "drop_oldest":
+                    self._threadsafe_dropped += 1
+                    return False
+                try:
+                    ring.popleft()
+                except IndexError:
+                    pass
+                self._threadsafe_dropped += 1
+            ring.append(payload)
+            self._threadsafe_submitted += 1
+            wake = not self._threadsafe_wake_pending
+            self._threadsafe_wake_pending = True
+        if wake:
+            try:
+                loop.call_soon_threadsafe(self._wake_from_thread)
+            except RuntimeError:
+                # Owner loop closed; the payload waits for the next loop or aclose().
+                self._threadsafe_wake_pending = False
+        return True
+
+    def _wake_from_thread(self) -> None:
+        """Loop-side half of a cross-thread wake-up."""
+        with self._threadsafe_lock:
+            self._threadsafe_wake_pending = False
+        self._threadsafe_wakeups += 1
+        if self._closed or self._enqueue_stopping:
+            return
+        drainer = self._enqueue_drainer
+        loop = asyncio.get_running_loop()
+        if drainer is None or drainer.done() or self._enqueue_loop is not loop:
+            self._start_enqueue_drainer(loop)
+        else:
+            self._enqueue_ready.set()
+
+    def _note_enqueue_drop(self, depth: int) -> None:
+        """Count a rejected enqueue and warn periodically."""
+        self._async_queue_dropped += 1
+        if self._async_queue_dropped == 1 or self._async_queue_dropped % 100 == 0:
+            diagnostics.warning(
+                "Async logger queue full; dropped=%s queue_size=%s max=%s policy=%s",
+                self._async_queue_dropped,
+                depth,
+                self._async_queue_max_size,
+                self._async_queue_overflow_policy,
+            )
+
+    def _start_enqueue_drainer(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Bind the drainer to `loop`; a drainer from a finished loop is replaced."""
+        self._enqueue_loop = loop
+        self._enqueue_stopping = False
+        self._enqueue_ready = asyncio.Event()
+        if self._enqueue_ring:
+            self._enqueue_ready.set()
+        self._enqueue_drainer = loop.create_task(self._drain_enqueue_ring())
+
+    async def _drain_enqueue_ring(self) -> None:
+        """Single consumer: process enqueued payloads in batches."""
+        ring = self._enqueue_ring
+        ready = self._enqueue_ready
+        while True:
+            if not ring:
+                if self._enqueue_stopping or self._closed:
+                    return
+                ready.clear()
+                await ready.wait()
+                continue
+            await self._process_enqueued(min(len(ring), self._enqueue_batch_size))
+            # Yield once per batch so producers on this loop keep running.
+            await asyncio.sleep(0)
+
+    async def _process_enqueued(self, count: int) -> None:
+        """Build and emit up to `count` payloads from the head of the ring."""
+        ring = self._enqueue_ring
+        now = TimeUtility.perf_counter()
+        payloads = []
+        for _ in range(min(count, len(ring))):
+            payload = ring.popleft()
+            latency = now - payload[5]
+            self._enqueue_latency_total += latency
+            if latency > self._enqueue_latency_max:
+                self._enqueue_latency_max = latency
+            payloads.append(payload)
+        self._enqueue_drained += len(payloads)
+        if self._use_async_queue:
+            # Queue mode: foreign-thread payloads get the same lanes and
+            # load shedding as loop-side calls.
+            for level, message, kwargs, args, ambient, _ in payloads:
+                await self._enqueue_for_async_workers(
+                    level, message, kwargs, args, ambient
+                )
+            return
+        await self._emit_payload_batch(payloads, "enqueue_drainer")
+
+    async def _emit_payload_batch(self, payloads: List[Tuple], context: str) -> None:
+        """Build records for queued payloads and emit them as one handler batch."""
+        records = []
+        for level, message, payload_kwargs, *rest in payloads:
+            payload_args = rest[0] if rest else ()
+            ambient = rest[1] if len(rest) > 1 else None
+            try:
+                with use_ambient_context(ambient):
+                    record = self._build_record(
+                        level, message, payload_args, payload_kwargs or {}
+                    )
+                if record is not None:
+                    records.append(record)
+                self._async_queue_processed += 1
+            except Exception as error:
+                self._note_worker_failure(context, error)
+        if records:
+            await self._emit_record_batch(records)
+
+    async def _stop_enqueue_drainer(self, timeout: float = 2.0) -> None:
+        """Let the drainer empty the ring, then stop it."""
+        self._enqueue_stopping = True
+        drainer = self._enqueue_drainer
+        self._enqueue_drainer = None
+        self._enqueue_loop = None
+        if drainer is not None and drainer.get_loop() is asyncio.get_running_loop():
+            self._enqueue_ready.set()
+            try:
+                await asyncio.wait_for(asyncio.shield(drainer), timeout=timeout)
+            except asyncio.TimeoutError:
+                diagnostics.warning(
+                    "Async logger queue drain timed out; remaining=%s",
+                    len(self._enqueue_ring),
+                )
+                drainer.cancel()
+                return
+        if self._enqueue_ring:
+            # Late cross-thread payloads, or the drainer's loop is gone.
+            await self._process_enqueued(len(self._enqueue_ring))
+
+    def _watch_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start the lag probe on `loop` unless it already runs there."""
+        monitor = cast(LoopLagMonitor, self._lag_monitor)
+        if not monitor.running_on(loop) and not self._closed:
+            monitor.start(loop)
+
+    def _submit_offload(
+        self,
+        level: Union[str, int],
+        message: str,
+        kwargs: Dict[str, Any],
+        args: Tuple[Any, ...],
+    ) -> bool:
+        """Hand a minimal payload to the offload thread; no record work here."""
+        self._raise_if_async_worker_failed()
+        if self._closed:
+            return False
+        return cast(OffloadThread, self._offload).submit(
+            (level, message, kwargs, args, current_ambient_context())
+        )
+
+    def _process_offloaded(self, payloads: List[Tuple]) -> None:
+        """Offload-thread body: build, redact, format, and write one batch."""
+        create = self._record_builder.create
+        records = []
+        for level, message, kwargs, args, ambient in payloads:
+            try:
+                with use_ambient_context(ambient):
+                    records.append(create(level, message, *args, **kwargs))
+            except Exception as error:
+                self._note_worker_failure("offload_thread", error)
+        try:
+            self._extension_processor.apply_batch(
+                records, self._extension_manager, self._data_protection
+            )
+            router = self._layer_router
+            # Loop-bound handlers (AsyncFileHandler) write on this thread.
+            dispatch_batch = self._handler_dispatcher.dispatch_batch_threadsafe
+            for layer_name, group in groupby(
+                records, key=lambda record: getattr(record, "layer", "default")
+            ):
+                dispatch_batch(list(group), router.handlers_for_layer(layer_name))
+        except Exception as error:
+            self._note_worker_failure("offload_thread", error)
+            return
+        self._async_queue_processed += len(payloads)
+        self._log_count += len(records)
+
+    def _note_worker_failure(self, context: str, error: Exception) -> None:
+        """Record a background failure without raising into the worker."""
+        self._async_worker_last_error = error
+        try:
+            self._handle_internal_failure(context, error)
+        except HydraLoggerError:
+            # Surfaced to the next producer by _raise_if_async_worker_failed.
+            pass
+
     def _raise_if_async_worker_failed(self) -> None:
         """Surface background worker failures when strict reliability is enabled."""
         if not self._strict_reliability_mode:
@@ -621,36 +1196,48 @@ class AsyncLogger(BaseLogger):
         self._async_worker_last_error = None
         raise HydraLoggerError("Async queue worker failed") from error
 
+    def _wake_async_queue_workers(self) -> None:
+        """Wake queue-mode workers parked on an empty queue."""
+        if self._async_queue_ready is not None:
+            self._async_queue_ready.set()
+
     async def _async_queue_worker(self, worker_name: str) -> None:
-        """Worker that drains queue-mode payloads and emits records."""
+        """Worker that drains queue-mode payloads in batches and emits records."""
+        if self._async_queue_ready is None:
+            self._async_queue_ready = asyncio.Event()
+        ready = self._async_queue_ready
         while not self._closed:
-            try:
-                if self._async_record_queue is None:
-                    return
-                payload = await asyncio.wait_for(
-                    self._async_record_queue.get(), timeout=0.1
-                )
-            except asyncio.TimeoutError:
-                continue
-            except Exception:
+            queue = self._async_record_queue
+            if queue is None:
                 return
+            if queue.empty():
+                # Producers and `aclose` both set the event; no idle polling.
+                ready.clear()
+                await ready.wait()
+                continue
 
+            payloads = []
+            while len(payloads) < self._enqueue_batch_size and not queue.empty():
+                payloads.append(queue.get_nowait())
             try:
-                level, message, payload_kwargs = payload
-                await self._log_async(level, message, **(payload_kwargs or {}))
-                self._async_queue_processed += 1
-            except Exception as e:
-                self._async_worker_last_error = e
-                self._handle_internal_failure("async_queue_worker", e)
+                await self._emit_payload_batch(payloads, "async_queue_worker")
             finally:
-                if self._async_record_queue is not None:
-                    self._async_record_queue.task_done()
+                for _ in payloads:
+                    queue.task_done()
+            await asyncio.sleep(0)
 
-    def _log_sync(self, level: Union[str, int], message: str, **kwargs) -> None:
+    def _log_sync(
+        self, level: Union[str, int], message: str, *args: Any, **kwargs
+    ) -> None:
         """Synchronous fallback logging method - SIMPLIFIED."""
         try:
-            level = self._record_builder.normalize_level(level)
-            record = self._record_builder.create(level, message, **kwargs)
+            layer_name = kwargs.get("layer", "default")
+            level = self._record_builder.precheck(
+                level, layer_name, self._layer_router, self._default_level_name()
+            )
+            if level is None:
+                return
+            record = self._record_builder.create(level, message, *args, **kwargs)
             record = self._extension_processor.apply_data_protection(
                 record, self._data_protection
             )
@@ -660,9 +1247,9 @@ class AsyncLogger(BaseLogger):
                 self._data_protection,
             )
 
-            layer_name = getattr(record, "layer", "default")
-            handlers = self._get_handlers_for_layer(layer_name)
-            self._handler_dispatcher.dispatch_sync(record, handlers)
+            self._handler_dispatcher.run_sync_plan(
+                record, self._layer_router.sync_plan(layer_name, level)
+            )
 
             # Update statistics
             self._log_count += 1
@@ -714,11 +1301,18 @@ class AsyncLogger(BaseLogger):
             set_last_error=self._set_last_lifecycle_error,
         )
 
-    async def _log_async(self, level: Union[str, int], message: str, **kwargs) -> None:
+    async def _log_async(
+        self, level: Union[str, int], message: str, *args: Any, **kwargs
+    ) -> None:
         """Internal async logging method - SIMPLIFIED for reliability."""
         try:
-            level = self._record_builder.normalize_level(level)
-            record = self._record_builder.create(level, message, **kwargs)
+            layer_name = kwargs.get("layer", "default")
+            level = self._record_builder.precheck(
+                level, layer_name, self._layer_router, self._default_level_name()
+            )
+            if level is None:
+                return
+            record = self._record_builder.create(level, message, *args, **kwargs)
             record = self._extension_processor.apply_data_protection(
                 record, self._data_protection
             )
@@ -746,72 +1340,62 @@ class AsyncLogger(BaseLogger):
             raise HydraLoggerError(f"Failed to log message: {e}") from e
 
     async def _overflow_worker(self):
-        """Process overflow messages when semaphore is busy - FIXED VERSION."""
-        while not self._closed:
+        """Run parked records in arrival order as admission credits free up."""
+        admission = self._admission
+        while not self._closed and admission is not None:
             try:
-                # Process overflow messages with proper error handling
-                try:
-                    # Wait for message with timeout to avoid blocking
-                    record = await asyncio.wait_for(
-                        self._overflow_queue.get(), timeout=0.1
-                    )
-                except asyncio.TimeoutError:
-                    # No message available, continue
-                    continue
-                except Exception:
-                    # Queue might be closed, exit gracefully
-                    break
-
-                # Try to acquire semaphore (non-blocking)
-                if self._concurrency_semaphore and self._concurrency_semaphore.locked():
-                    # Still busy, put back in overflow queue
-                    try:
-                        self._overflow_queue.put_nowait(record)
-                    except asyncio.QueueFull:
-                        # Overflow queue full, drop message
-                        diagnostics.warning("Overflow queue full, dropping message")
-                        # Drop message to prevent memory leak
-                else:
-                    # Semaphore available, process message
-                    if self._concurrency_semaphore:
-                        async with self._concurrency_semaphore:
-                            try:
-                                # INTEGRATION: Monitor overflow message processing
-                                TimeUtility.perf_counter()
-                                await self._emit_to_handlers(record)
-
-                                self._log_count += 1
-                            finally:
-                                # Record processing completed
-                                pass
-                    else:
-                        # No semaphore, process directly
-                        try:
-                            await self._emit_to_handlers(record)
-                            self._log_count += 1
-                        finally:
-                            # Record processing completed
-                            pass
-
+                await admission.wait_parked()
+                await self._run_next_parked()
             except Exception:
                 # Silently handle errors to prevent StreamWriter issues
                 await asyncio.sleep(0.001)
 
+    async def _run_parked_records(self) -> None:
+        """Run every parked record now, alongside the overflow worker."""
+        admission = cast(AdmissionController, self._admission)
+        while admission.parked:
+            await self._run_next_parked()
+
+    async def _run_next_parked(self) -> None:
+        """Take a credit, then log the oldest parked record under it."""
+        admission = cast(AdmissionController, self._admission)
+        # Pop only once a credit is held so a cancelled wait loses nothing.
+        await admission.acquire(None)
+        payload = admission.pop_parked()
+        if payload is None:
+            admission.release()
+            return
+        level, message, args, kwargs, ambient = payload
+        try:
+            with use_ambient_context(ambient):
+                await self._log_async(level, message, *args, **kwargs)
+        except Exception as error:
+            self._handle_internal_failure("overflow_worker", error)
+        finally:
+            cast(AdmissionController, self._admission).release()
+
     async def log_batch(
         self, messages: List[Tuple[Union[str, int], str, Dict]], **kwargs
-    ) -> None:
+    ) -> Dict[str, Any]:
         """
-        Log multiple messages with HIGHLY OPTIMIZED batch processing.
+        Log multiple messages through the staged batch pipeline.
+
+        Each chunk is normalized, built, redacted, and dispatched as a whole;
+        handlers format and write each same-layer run once.
 
         Args:
             messages: List of tuples (level, message, extra_kwargs)
             **kwargs: Common kwargs for all messages
+
+        Returns:
+            Record counts plus cumulative seconds per stage (`stage_seconds`).
         """
         if not self._initialized:
             raise HydraLoggerError("Logger not initialized")
 
+        stats = _batch_stats()
         if not messages:
-            return
+            return stats
 
         try:
 
@@ -826,59 +1410,93 @@ class AsyncLogger(BaseLogger):
                     f"{optimal_chunk_size:,}",
                 )
 
+            stage_seconds = stats["stage_seconds"]
             for i in range(0, len(messages), optimal_chunk_size):
                 chunk = messages[i : i + optimal_chunk_size]
 
-                await self._process_chunk_optimized(chunk, **kwargs)
+                chunk_stats = await self._process_chunk_optimized(chunk, **kwargs)
+                for key in BATCH_COUNTERS:
+                    stats[key] += chunk_stats[key]
+                for stage, seconds in chunk_stats["stage_seconds"].items():
+                    stage_seconds[stage] += seconds
 
         except Exception as e:
             raise HydraLoggerError(f"Failed to log batch: {e}") from e
+        return stats
 
     async def _process_chunk_optimized(
         self, chunk: List[Tuple[Union[str, int], str, Dict]], **kwargs
-    ) -> None:
-        """Process a chunk of messages with minimal overhead - NO TASK CANCELLATION ISSUES."""
-
-        if len(chunk) <= 100:
-            # Sequential processing - no task management overhead
-            for level, message, extra_kwargs in chunk:
-                try:
-                    merged_kwargs = dict(kwargs) if kwargs else {}
-                    if extra_kwargs:
-                        merged_kwargs.update(extra_kwargs)
-                    await self._log_async(level, message, **merged_kwargs)
-                except Exception as e:
-                    diagnostics.warning("Message processing error: %s", e)
-                    continue
-        else:
-            # For larger chunks, use controlled concurrency with proper cleanup
-            concurrency = min(20, len(chunk) // 100)  # Conservative concurrency
-            concurrency = max(1, concurrency)  # At least 1
-
-            # Progress tracking (only for large chunks)
-            if len(chunk) > 1000:
-                diagnostics.info(
-                    "Processing %s messages with concurrency %s",
-                    f"{len(chunk):,}",
-                    concurrency,
-                )
-
-            # Process in smaller sub-chunks to avoid overwhelming the system
-            sub_chunk_size = max(50, len(chunk) // concurrency)
-
-            for i in range(0, len(chunk), sub_chunk_size):
-                sub_chunk = chunk[i : i + sub_chunk_size]
+    ) -> Dict[str, Any]:
+        """Run one chunk through the normalize, build, redact, and dispatch stages."""
+        # Progress tracking (only for large chunks)
+        if len(chunk) > 1000:
+            diagnostics.info("Processing %s messages as one batch", f"{len(chunk):,}")
+
+        stats = _batch_stats()
+        stats["records"] = len(chunk)
+
+        def _failed(error: Exception) -> None:
+            stats["failed"] += 1
+            diagnostics.warning("Message processing error: %s", error)
+
+        clock = TimeUtility.perf_counter
+        started = clock()
+        entries, stats["filtered"] = self._normalize_batch(chunk, kwargs, _failed)
+        normalized = clock()
+        records = self._record_builder.create_batch(entries, _failed)
+        built = clock()
+        self._extension_processor.apply_batch(
+            records, self._extension_manager, self._data_protection
+        )
+        redacted = clock()
+        if records:
+            await self._emit_record_batch(records)
+        dispatched = clock()
+
+        stats["dispatched"] = len(records)
+        stats["stage_seconds"].update(
+            normalize=normalized - started,
+            build=built - normalized,
+            redact=redacted - built,
+            dispatch=dispatched - redacted,
+        )
+        return stats
 
-                # Process sub-chunk sequentially (most reliable)
-                for level, message, extra_kwargs in sub_chunk:
-                    try:
-                        merged_kwargs = dict(kwargs) if kwargs else {}
-                        if extra_kwargs:
-                            merged_kwargs.update(extra_kwargs)
-                        await self._log_async(level, message, **merged_kwargs)
-                    except Exception as e:
-                        diagnostics.warning("Message processing error: %s", e)
-                        continue
+    def _normalize_batch(
+        self,
+        chunk: List[Tuple[Union[str, int], str, Dict]],
+        common: Dict[str, Any],
+        on_error: Callable[[Exception], None],
+    ) -> Tuple[List[Tuple[int, str, Dict[str, Any]]], int]:
+        """Merge kwargs and precheck levels, once per distinct (level, layer).
+
+        Returns the entries that pass plus the number filtered out. Items
+        without extra kwargs share the `common` mapping instead of a copy.
+        """
+        precheck = self._record_builder.precheck
+        router = self._layer_router
+        default_level = self._default_level_name()
+        verdicts: Dict[Tuple[Any, Any], Optional[int]] = {}
+        entries = []
+        filtered = 0
+        for level, message, extra_kwargs in chunk:
+            merged = {**common, **extra_kwargs} if extra_kwargs else common
+            key = (level, merged.get("layer", "default"))
+            try:
+                if key in verdicts:
+                    normalized = verdicts[key]
+                else:
+                    normalized = verdicts[key] = precheck(
+                        level, key[1], router, default_level
+                    )
+            except Exception as error:
+                on_error(error)
+                continue
+            if normalized is None:
+                filtered += 1
+                continue
+            entries.append((normalized, message, merged))
+        return entries, filtered
 
     async def log_concurrent(
         self,
@@ -1037,21 +1655,87 @@ class AsyncLogger(BaseLogger):
         # Plugin system removed - simplified architecture
         pass
 
+    def _build_record(
+        self,
+        level: Union[str, int],
+        message: str,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Optional[LogRecord]:
+        """Build a record with extensions applied, or None if filtered out."""
+        level = self._record_builder.precheck(
+            level,
+            kwargs.get("layer", "default"),
+            self._layer_router,
+            self._default_level_name(),
+        )
+        if level is None:
+            return None
+        record = self._record_builder.create(level, message, *args, **kwargs)
+        record = self._extension_processor.apply_data_protection(
+            record, self._data_protection
+        )
+        return self._extension_processor.apply_non_data_protection_extensions(
+            record,
+            self._extension_manager,
+            self._data_protection,
+        )
+
+    async def _emit_record_batch(self, records: List[LogRecord]) -> None:
+        """Emit built records, one handler batch per run of same-layer records."""
+        router = self._layer_router
+        dispatch_batch = self._handler_dispatcher.dispatch_batch_async
+        for layer_name, group in groupby(
+            records, key=lambda record: getattr(record, "layer", "default")
+        ):
+            await dispatch_batch(list(group), router.handlers_for_layer(layer_name))
+        self._log_count += len(records)
+
     async def _emit_to_handlers(self, record: LogRecord) -> None:
         """Emit record to all appropriate handlers for the layer."""
-        # Get handlers for the record's layer
+        # Compiled plan for the record's (layer, level)
         layer_name = getattr(record, "layer", "default")
-        handlers = self._get_handlers_for_layer(layer_name)
-        await self._handler_dispatcher.dispatch_async(record, handlers)
+        await self._handler_dispatcher.run_async_plan(
+            record, self._layer_router.async_plan(layer_name, record.level)
+        )
 
     def _get_handlers_for_layer(self, layer_name: str) -> list:
         """Get handlers for a specific layer with caching."""
         return self._layer_router.handlers_for_layer(layer_name)
 
+    def _default_level_name(self) -> str:
+        """Return configured default level name used for unknown layers."""
+        return self._config.default_level if self._config else "INFO"
+
+    def _passes_precheck(self, level: Union[str, int], kwargs: Dict[str, Any]) -> bool:
+        """Run layer/level pre-check before scheduling any record work."""
+        return (
+            self._record_builder.precheck(
+                level,
+                kwargs.get("layer", "default"),
+                self._layer_router,
+                self._default_level_name(),
+            )
+            is not None
+        )
+
+    def is_enabled_for(self, level: Union[str, int], layer: str = "default") -> bool:
+        """Check whether `level` would be emitted for `layer`.
+
+        Lets callers skip building expensive messages for filtered levels.
+        """
+        if not self._initialized or self._closed:
+            return False
+        try:
+            return self._passes_precheck(level, {"layer": layer})
+        except Exception as error:
+            self._handle_internal_failure("is_enabled_for", error)
+            return False
+
     # Convenience methods for different log levels
-    def debug(self, message: str, **kwargs):
+    def debug(self, message: str, *args: Any, **kwargs):
         """Log a debug message."""
-        result = self.log(LogLevel.DEBUG, message, **kwargs)
+        result = self.log(LogLevel.DEBUG, message, *args, **kwargs)
         if asyncio.iscoroutine(result):
             # Schedule the coroutine in the current event loop
             try:
@@ -1062,9 +1746,9 @@ class AsyncLogger(BaseLogger):
                 return result
         return result
 
-    def info(self, message: str, **kwargs):
+    def info(self, message: str, *args: Any, **kwargs):
         """Log an info message."""
-        result = self.log(LogLevel.INFO, message, **kwargs)
+        result = self.log(LogLevel.INFO, message, *args, **kwargs)
         if asyncio.iscoroutine(result):
             # Schedule the coroutine in the current event loop
             try:
@@ -1075,9 +1759,9 @@ class AsyncLogger(BaseLogger):
                 return result
         return result
 
-    def warning(self, message: str, **kwargs):
+    def warning(self, message: str, *args: Any, **kwargs):
         """Log a warning message."""
-        result = self.log(LogLevel.WARNING, message, **kwargs)
+        result = self.log(LogLevel.WARNING, message, *args, **kwargs)
         if asyncio.iscoroutine(result):
             # Schedule the coroutine in the current event loop
             try:
@@ -1088,9 +1772,9 @@ class AsyncLogger(BaseLogger):
                 return result
         return result
 
-    def error(self, message: str, **kwargs):
+    def error(self, message: str, *args: Any, **kwargs):
         """Log an error message."""
-        result = self.log(LogLevel.ERROR, message, **kwargs)
+        result = self.log(LogLevel.ERROR, message, *args, **kwargs)
         if asyncio.iscoroutine(result):
             # Schedule the coroutine in the current event loop
             try:
@@ -1101,9 +1785,9 @@ class AsyncLogger(BaseLogger):
                 return result
         return result
 
-    def critical(self, message: str, **kwargs):
+    def critical(self, message: str, *args: Any, **kwargs):
         """Log a critical message."""
-        result = self.log(LogLevel.CRITICAL, message, **kwargs)
+        result = self.log(LogLevel.CRITICAL, message, *args, **kwargs)
         if asyncio.iscoroutine(result):
             # Schedule the coroutine in the current event loop
             try:
@@ -1115,33 +1799,57 @@ class AsyncLogger(BaseLogger):
         return result
 
     # Async convenience methods for explicit async usage
-    async def debug_async(self, message: str, **kwargs) -> None:
+    async def debug_async(self, message: str, *args: Any, **kwargs) -> None:
         """Async log a debug message."""
-        await self.log_async(LogLevel.DEBUG, message, **kwargs)
+        await self.log_async(LogLevel.DEBUG, message, *args, **kwargs)
 
-    async def info_async(self, message: str, **kwargs) -> None:
+    async def info_async(self, message: str, *args: Any, **kwargs) -> None:
         """Async log an info message."""
-        await self.log_async(LogLevel.INFO, message, **kwargs)
+        await self.log_async(LogLevel.INFO, message, *args, **kwargs)
 
-    async def warning_async(self, message: str, **kwargs) -> None:
+    async def warning_async(self, message: str, *args: Any, **kwargs) -> None:
         """Async log a warning message."""
-        await self.log_async(LogLevel.WARNING, message, **kwargs)
+        await self.log_async(LogLevel.WARNING, message, *args, **kwargs)
 
-    async def error_async(self, message: str, **kwargs) -> None:
+    async def error_async(self, message: str, *args: Any, **kwargs) -> None:
         """Async log an error message."""
-        await self.log_async(LogLevel.ERROR, message, **kwargs)
+        await self.log_async(LogLevel.ERROR, message, *args, **kwargs)
 
-    async def critical_async(self, message: str, **kwargs) -> None:
+    async def critical_async(self, message: str, *args: Any, **kwargs) -> None:
         """Async log a critical message."""
-        await self.log_async(LogLevel.CRITICAL, message, **kwargs)
+        await self.log_async(LogLevel.CRITICAL, message, *args, **kwargs)
 
-    def warn(self, message: str, **kwargs) -> None:
+    def warn(self, message: str, *args: Any, **kwargs) -> None:
         """Alias for warning (compatibility)."""
-        return self.warning(message, **kwargs)
+        return self.warning(message, *args, **kwargs)
 
-    def fatal(self, message: str, **kwargs) -> None:
+    def fatal(self, message: str, *args: Any, **kwargs) -> None:
         """Alias for critical (compatibility)."""
-        return self.critical(message, **kwargs)
+        return self.critical(message, *args, **kwargs)
+
+    def _after_fork_child(self) -> None:
+        """Drop parent's queues and tasks; workers restart on the child's loop."""
+        self._lock = threading.RLock()
+        self._async_record_queue = None
+        self._async_queue_ready = None
+        self._async_worker_tasks = []
+        self._enqueue_ring = deque()
+        self._enqueue_ready = None
+        self._enqueue_drainer = None
+        self._enqueue_loop = None
+        self._threadsafe_lock = threading.Lock()
+        self._threadsafe_wake_pending = False
+        if self._admission is not None:
+            self._admission.reset()
+        if self._load_shedder is not None:
+            self._load_shedder.reset()
+        if self._offload is not None:
+            self._offload.reset()
+        if self._lag_monitor is not None:
+            self._lag_monitor.reset()
+        self._overflow_worker_task = None
+        self._writer_tasks = {}
+        self._shutdown_event = None
 
     def close(self):
         """Close the logger and cleanup resources - SIMPLIFIED VERSION."""
@@ -1158,6 +1866,15 @@ class AsyncLogger(BaseLogger):
                 if not task.done():
                     task.cancel()
             self._async_worker_tasks.clear()
+            if self._enqueue_drainer is not None and not self._enqueue_drainer.done():
+                self._enqueue_drainer.cancel()
+            self._enqueue_drainer = None
+            self._enqueue_loop = None
+            self._enqueue_ring.clear()
+            if self._offload is not None:
+                self._offload.stop(timeout=2.0)
+            if self._lag_monitor is not None:
+                self._lag_monitor.cancel()
             if self._async_record_queue is not None:
                 while not self._async_record_queue.empty():
                     try:
@@ -1186,10 +1903,6 @@ class AsyncLogger(BaseLogger):
                         error,
                     )
 
-            # Clean up concurrency resources
-            if hasattr(self, "_concurrency_semaphore"):
-                self._concurrency_semaphore = None
-
             # Clean up overflow worker
             if (
                 hasattr(self, "_overflow_worker_task")
@@ -1221,6 +1934,10 @@ class AsyncLogger(BaseLogger):
 
         self._close_completed = False
         try:
+            # The ring drains first: in queue mode it feeds the record queue.
+            if self._use_enqueue_ring or self._enqueue_drainer or self._enqueue_ring:
+                await self._stop_enqueue_drainer()
+
             # Drain queue-mode payloads before shutdown.
             if self._use_async_queue and self._async_record_queue is not None:
                 join_fn = getattr(self._async_record_queue, "join", None)
@@ -1233,10 +1950,29 @@ class AsyncLogger(BaseLogger):
                             self._async_record_queue.qsize(),
                         )
 
+            if self._offload is not None:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self._offload.stop, 2.0
+                )
+            if self._lag_monitor is not None:
+                await self._lag_monitor.stop()
+
+            if self._admission is not None and self._admission.parked:
+                try:
+                    await asyncio.wait_for(self._run_parked_records(), timeout=2.0)
+                except asyncio.TimeoutError:
+                    diagnostics.warning(
+                        "Async logger overflow drain timed out; remaining=%s",
+                        self._admission.parked,
+                    )
+
             # Mark as closed first
             self._closed = True
 
-            # Stop queue worker tasks.
+            # Stop queue worker tasks: wake parked workers, cancel stragglers.
+            self._wake_async_queue_workers()
+            if self._async_worker_tasks:
+                await asyncio.wait(self._async_worker_tasks, timeout=1.0)
             for task in self._async_worker_tasks:
                 if not task.done():
                     task.cancel()
@@ -1286,10 +2022,6 @@ class AsyncLogger(BaseLogger):
                         error,
                     )
 
-            # Clean up concurrency resources
-            if hasattr(self, "_concurrency_semaphore"):
-                self._concurrency_semaphore = None
-
             # Clean up overflow worker
             if (
                 hasattr(self, "_overflow_worker_task")
@@ -1316,6 +2048,13 @@ class AsyncLogger(BaseLogger):
             except HydraLoggerError:
                 raise
 
+    def _async_mode_name(self) -> str:
+        if self._offload is not None:
+            return "offload"
+        if self._use_enqueue_ring:
+            return "enqueue"
+        return "queue" if self._use_async_queue else "task"
+
     def get_health_status(self) -> Dict[str, Any]:
         """Get the health status of the logger."""
         health_status = {
@@ -1326,14 +2065,18 @@ class AsyncLogger(BaseLogger):
             "handler_count": len(self._handlers),
             "layer_count": len(self._layers),
             "swallowed_error_count": self._swallowed_error_count,
-            "async_mode": "queue" if self._use_async_queue else "task",
+            "async_mode": self._async_mode_name(),
             "async_queue_enqueued": self._async_queue_enqueued,
             "async_queue_processed": self._async_queue_processed,
             "async_queue_dropped": self._async_queue_dropped,
             "async_queue_size": (
-                self._async_record_queue.qsize()
-                if self._async_record_queue is not None
-                else 0
+                len(self._enqueue_ring)
+                if self._use_enqueue_ring
+                else (
+                    self._async_record_queue.qsize()
+                    if self._async_record_queue is not None
+                    else 0
+                )
             ),
             "async_queue_worker_count": len(
                 [task for task in self._async_worker_tasks if not task.done()]
@@ -1345,13 +2088,49 @@ class AsyncLogger(BaseLogger):
         if self._last_lifecycle_error is not None:
             health_status["last_lifecycle_error"] = self._last_lifecycle_error
 
-        # REAL ASYNC: Add concurrency information
-        if self._concurrency_semaphore:
+        if isinstance(self._async_record_queue, PriorityLaneQueue):
+            health_status["async_queue_lanes"] = self._async_record_queue.lane_stats()
+        if self._load_shedder is not None:
+            health_status["async_queue_shedding"] = self._load_shedder.stats()
+
+        if self._threadsafe_submitted or self._threadsafe_dropped:
+            health_status.update(
+                {
+                    "async_threadsafe_submitted": self._threadsafe_submitted,
+                    "async_threadsafe_dropped": self._threadsafe_dropped,
+                    "async_threadsafe_wakeups": self._threadsafe_wakeups,
+                }
+            )
+
+        if self._use_enqueue_ring:
+            drained = self._enqueue_drained
+            health_status.update(
+                {
+                    "async_queue_depth_max": self._enqueue_depth_max,
+                    "async_enqueue_latency_avg_ms": (
+                        self._enqueue_latency_total / drained * 1000.0
+                        if drained
+                        else 0.0
+                    ),
+                    "async_enqueue_latency_max_ms": self._enqueue_latency_max * 1000.0,
+                }
+            )
+
+        if self._admission is not None:
+            health_status["admission"] = self._admission.stats()
+        if self._offload is not None:
+            offload = self._offload.stats()
+            health_status["async_queue_size"] = offload["depth"]
+            health_status["async_queue_dropped"] = offload["dropped"]
+            health_status["async_offload"] = offload
+
+        # Task-mode admission credits (key names predate AdmissionController)
+        if self._admission is not None and not self._closed:
             health_status.update(
                 {
                     "concurrency_optimal": self._optimal_concurrency,
                     "concurrency_semaphore": "active",
-                    "concurrency_available": self._concurrency_semaphore._value,
+                    "concurrency_available": self._admission.stats()["available"],
                 }
             )
         else:
@@ -1435,28 +2214,36 @@ class AsyncLogger(BaseLogger):
         }
 
     def get_concurrency_info(self) -> Dict[str, Any]:
-        """Get detailed concurrency information."""
-        if not self._concurrency_semaphore:
+        """Get detailed concurrency information, plus offload and loop lag."""
+        info = self._get_admission_info()
+        if self._offload is not None:
+            info["offload"] = self._offload.stats()
+        if self._lag_monitor is not None:
+            info["loop_lag"] = self._lag_monitor.stats()
+        return info
+
+    def _get_admission_info(self) -> Dict[str, Any]:
+        """Task-mode admission credit usage and memory context."""
+        if self._admission is None:
             return {"status": "not_initialized"}
 
+        info: Dict[str, Any] = {
+            "optimal_concurrency": self._optimal_concurrency,
+            "admission": self._admission.stats(),
+        }
         try:
             import psutil
 
             memory = psutil.virtual_memory()
-            return {
-                "status": "active",
-                "optimal_concurrency": self._optimal_concurrency,
-                "semaphore_value": self._concurrency_semaphore._value,
-                "memory_available_mb": memory.available / 1024 / 1024,
-                "memory_percent": memory.percent,
-                "concurrency_reasoning": self._get_concurrency_reasoning(),
-            }
+            info.update(
+                status="active",
+                memory_available_mb=memory.available / 1024 / 1024,
+                memory_percent=memory.percent,
+                concurrency_reasoning=self._get_concurrency_reasoning(),
+            )
         except ImportError:
-            return {
-                "status": "active_no_psutil",
-                "optimal_concurrency": self._optimal_concurrency,
-                "semaphore_value": self._concurrency_semaphore._value,
-            }
+            info["status"] = "active_no_psutil"
+        return info
 
     def _get_concurrency_reasoning(self) -> str:
         """Get human-readable explanation of concurrency choice."""
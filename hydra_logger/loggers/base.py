@@ -19,7 +19,10 @@ from typing import Any, Dict, List, Optional, Union
 
 from ..config.models import LoggingConfig
 from ..core.exceptions import HydraLoggerError
+from ..types.context import ContextDetector
 from ..types.records import LogRecord, RecordCreationStrategy
+from ..utils.fork_safety import register_fork_safe
+from .bound_logger import BoundLogger
 
 
 # Performance profile constants for LogRecord creation
@@ -62,6 +65,8 @@ class BaseLogger(ABC):
         self._log_count = 0
         self._start_time = time.time()
 
+        register_fork_safe(self)
+
         # Initialize if config is provided
         if self._config:
             self._initialize_from_config(self._config)
@@ -249,6 +254,13 @@ class BaseLogger(ABC):
         """Get the health status of the logger."""
         pass
 
+    def _after_fork_child(self) -> None:
+        """Reset process-local runtime state in a forked child."""
+
+    def bind(self, **fields: Any) -> BoundLogger:
+        """Return a view that attaches frozen `fields` as `extra` on every call."""
+        return BoundLogger(self, fields)
+
     def initialize(self) -> None:
         """Initialize logger from current config when available."""
         if self._config is not None:
@@ -360,7 +372,7 @@ class BaseLogger(ABC):
             from ..types.records import get_record_creation_strategy
 
             self._record_creation_strategy = get_record_creation_strategy(
-                self._performance_profile
+                self._performance_profile, compact=True
             )
         except ImportError:
             # Fallback if record_creation module is not available
@@ -455,8 +467,12 @@ class BaseLogger(ABC):
                 if self._record_creation_strategy
                 else "fallback"
             ),
+            "record_type": (
+                getattr(self._record_creation_strategy, "record_cls", None) or LogRecord
+            ).__name__,
             "log_count": self._log_count,
             "uptime": time.time() - self._start_time,
+            "caller_cache": ContextDetector.get_cache_stats(),
         }
 
     def __enter__(self):
@@ -0,0 +1,97 @@
+"""
+Role: Lightweight logger views carrying pre-merged, frozen context fields.
+Used By:
+ - `hydra_logger.loggers.base.BaseLogger.bind`
+ - Request-scoped callers that log the same fields on every line.
+Depends On:
+ - hydra_logger
+ - typing
+Notes:
+ - A bound view shares the parent's handlers, layers, and lifecycle.
+ - Bound fields are frozen once into `BoundFields` and passed as `extra`
+   unchanged, so formatters can reuse their cached encoded fragment.
+"""
+
+from typing import Any, Callable, Mapping, Union
+
+from ..types.records import BoundFields
+
+
+def _forward(name: str) -> Callable[..., Any]:
+    """Build a level method that forwards to the parent with bound fields."""
+
+    def method(self: "BoundLogger", message: Any, *args: Any, **kwargs: Any) -> Any:
+        return getattr(self._logger, name)(message, *args, **self._with_fields(kwargs))
+
+    method.__name__ = name
+    method.__qualname__ = f"BoundLogger.{name}"
+    method.__doc__ = f"Forward `{name}` to the parent logger with bound fields."
+    return method
+
+
+class BoundLogger:
+    """Logger view that adds frozen `extra` fields to every call."""
+
+    __slots__ = ("_logger", "_fields")
+
+    def __init__(self, logger: Any, fields: Mapping[str, Any]) -> None:
+        self._logger = logger
+        self._fields = (
+            fields if isinstance(fields, BoundFields) else BoundFields(fields)
+        )
+
+    @property
+    def fields(self) -> BoundFields:
+        """Frozen fields attached to every record."""
+        return self._fields
+
+    @property
+    def parent(self) -> Any:
+        """Underlying logger that owns handlers and lifecycle."""
+        return self._logger
+
+    def bind(self, **fields: Any) -> "BoundLogger":
+        """Return a child view with `fields` layered over the current ones."""
+        return BoundLogger(self._logger, self._fields.merged(fields))
+
+    def _with_fields(self, kwargs: dict) -> dict:
+        """Attach bound fields as `extra`; per-call `extra` wins on conflicts."""
+        extra = kwargs.get("extra")
+        if extra:
+            merged = dict(self._fields)
+            merged.update(extra)
+            kwargs["extra"] = merged
+        else:
+            kwargs["extra"] = self._fields
+        return kwargs
+
+    def log(
+        self, level: Union[str, int], message: Any, *args: Any, **kwargs: Any
+    ) -> Any:
+        """Forward `log` to the parent logger with bound fields."""
+        return self._logger.log(level, message, *args, **self._with_fields(kwargs))
+
+    async def log_async(
+        self, level: Union[str, int], message: Any, *args: Any, **kwargs: Any
+    ) -> None:
+        """Forward `log_async` to the parent logger with bound fields."""
+        await self._logger.log_async(level, message, *args, **self._with_fields(kwargs))
+
+    debug = _forward("debug")
+    info = _forward("info")
+    warning = _forward("warning")
+    warn = _forward("warn")
+    error = _forward("error")
+    critical = _forward("critical")
+    fatal = _forward("fatal")
+    debug_async = _forward("debug_async")
+    info_async = _forward("info_async")
+    warning_async = _forward("warning_async")
+    error_async = _forward("error_async")
+    critical_async = _forward("critical_async")
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._logger, name)
+
+    def __repr__(self) -> str:
+        return f"BoundLogger({self._logger!r}, fields={dict(self._fields)!r})"
@@ -9,6 +9,8 @@ Depends On:
  - typing
 Notes:
  - Implements logger orchestration and routing for composite logger.
+ - Batch entry points hand whole batches to sync/async logger components and
+   to handler components exposing `emit_batch_async`.
 """
 
 # pyright: reportAttributeAccessIssue=false, reportOptionalMemberAccess=false
@@ -21,12 +23,14 @@ from typing import Any, Dict, List, Optional, Tuple, Union, cast
 from ..config.models import LogDestination, LoggingConfig, LogLayer
 from ..core.exceptions import HydraLoggerError
 from ..handlers.base_handler import BaseHandler
-from ..types.records import LogRecordFactory
+from ..types.records import LazyMessage, LogRecordFactory
 from ..utils import internal_diagnostics, slo_metrics
 from ..utils.reliability_lifecycle import handle_lifecycle_failure
 from ..utils.time_utility import TimeUtility
 from .base import BaseLogger
+from .async_logger import AsyncLogger
 from .pipeline import ComponentDispatcher
+from .sync_logger import SyncLogger
 
 _logger = logging.getLogger(__name__)
 
@@ -172,7 +176,7 @@ class CompositeLogger(BaseLogger):
                 return component
         return None
 
-    def log(self, level: Union[str, int], message: str, **kwargs) -> None:
+    def log(self, level: Union[str, int], message: str, *args: Any, **kwargs) -> None:
         """Log a message to all components."""
         if not self._initialized:
             raise HydraLoggerError("Logger not initialized")
@@ -181,11 +185,19 @@ class CompositeLogger(BaseLogger):
             raise HydraLoggerError("Logger is closed")
 
         self._component_dispatcher.dispatch_sync(
-            self.components, level, message, **kwargs
+            self.components, level, self._shared_message(message, args), **kwargs
         )
 
-    def debug(self, message: str, **kwargs) -> None:
+    @staticmethod
+    def _shared_message(message: Any, args: Tuple[Any, ...]) -> Any:
+        """Wrap deferred args once so all components share a single render."""
+        if args:
+            return LazyMessage(message, args)
+        return message
+
+    def debug(self, message: str, *args: Any, **kwargs) -> None:
         """Log a debug message to all components."""
+        message = self._shared_message(message, args)
         for component in self.components:
             try:
                 if hasattr(component, "debug"):
@@ -193,8 +205,9 @@ class CompositeLogger(BaseLogger):
             except Exception:
                 pass
 
-    def info(self, message: str, **kwargs) -> None:
+    def info(self, message: str, *args: Any, **kwargs) -> None:
         """Log an info message to all components."""
+        message = self._shared_message(message, args)
         for component in self.components:
             try:
                 if hasattr(component, "info"):
@@ -202,8 +215,9 @@ class CompositeLogger(BaseLogger):
             except Exception:
                 pass
 
-    def warning(self, message: str, **kwargs) -> None:
+    def warning(self, message: str, *args: Any, **kwargs) -> None:
         """Log a warning message to all components."""
+        message = self._shared_message(message, args)
         for component in self.components:
             try:
                 if hasattr(component, "warning"):
@@ -211,8 +225,9 @@ class CompositeLogger(BaseLogger):
             except Exception:
                 pass
 
-    def error(self, message: str, **kwargs) -> None:
+    def error(self, message: str, *args: Any, **kwargs) -> None:
         """Log an error message to all components."""
+        message = self._shared_message(message, args)
         for component in self.components:
             try:
                 if hasattr(component, "error"):
@@ -220,8 +235,9 @@ class CompositeLogger(BaseLogger):
             except Exception:
                 pass
 
-    def critical(self, message: str, **kwargs) -> None:
+    def critical(self, message: str, *args: Any, **kwargs) -> None:
         """Log a critical message to all components."""
+        message = self._shared_message(message, args)
         for component in self.components:
             try:
                 if hasattr(component, "critical"):
@@ -368,10 +384,14 @@ class CompositeLogger(BaseLogger):
                 payload = kwargs or {}
                 records.append(
                     LogRecordFactory.create_minimal(
-                        level_name=str(level),
+                        level_name=(
+                            self._get_level_name(level)
+                            if isinstance(level, int)
+                            else str(level)
+                        ),
                         message=message,
                         layer=payload.get("layer", "default"),
-                        level=int(level) if isinstance(level, int) else 20,
+                        level=self._get_level_int(level),
                         extra=payload.get("extra", {}),
                     )
                 )
@@ -379,6 +399,20 @@ class CompositeLogger(BaseLogger):
 
         records_cache: Optional[List[Any]] = None
         for component in self.components:
+            # Sync loggers take the whole batch and emit it per handler at once.
+            if isinstance(component, SyncLogger):
+                try:
+                    if records_cache is None:
+                        records_cache = _to_records()
+                    component.log_batch(records_cache)
+                except Exception:
+                    self._batch_dispatch_errors += 1
+                    _logger.exception(
+                        "Composite batch dispatch failed in component log_batch for type=%s",
+                        type(component).__name__,
+                    )
+                continue
+
             if hasattr(component, "log"):
                 for level, message, kwargs in messages:
                     try:
@@ -1045,7 +1079,16 @@ class CompositeAsyncLogger(BaseLogger):
             # Fast: Process all components sequentially for this chunk
             for component in self.components:
                 try:
-                    if hasattr(component, "emit_async"):
+                    if isinstance(component, AsyncLogger):
+                        # Async loggers build and batch-emit through their pipeline
+                        await component.log_batch(
+                            [(level, record.message, {}) for record in records],
+                            **kwargs,
+                        )
+                    elif hasattr(component, "emit_batch_async"):
+                        # Handlers format and write the whole chunk at once
+                        await component.emit_batch_async(records)
+                    elif hasattr(component, "emit_async"):
                         # Process all records for this component
                         for record in records:
                             await component.emit_async(record)
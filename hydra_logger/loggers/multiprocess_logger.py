@@ -0,0 +1,205 @@
+"""
+Role: Multi-process runtime: workers enqueue into a shared ring, one process writes.
+Used By:
+ - `hydra_logger.factories.logger_factory` (`logger_type="multiprocess"`).
+ - Prefork servers whose workers would otherwise each open the same files.
+Depends On:
+ - hydra_logger
+ - multiprocessing
+ - os
+Notes:
+ - The creating process owns a writer process that builds the real handlers
+   from the same `LoggingConfig`; forked workers inherit the ring and log into it.
+ - Filtering, record building, and extensions run in the worker; the writer
+   only dispatches each drained run of decoded records to its layer handlers.
+ - Options come from `config.extensions["multiprocess_runtime"]`.
+"""
+
+import atexit
+import logging
+import multiprocessing
+import os
+import signal
+from typing import Any, Dict, Optional, Union
+
+from ..config.models import LoggingConfig, LogLayer
+from ..core.exceptions import HydraLoggerError
+from ..handlers.shared_ring_handler import SharedRingHandler, decode_record
+from ..utils.shared_ring import SharedRingBuffer
+from .sync_logger import SyncLogger
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_MULTIPROCESS_RUNTIME: Dict[str, Any] = {
+    "ring_size_bytes": 4 * 1024 * 1024,
+    "overflow_policy": "drop_newest",
+    "put_timeout_seconds": 0.01,
+    "start_method": (
+        "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+    ),
+    "shutdown_timeout_seconds": 10.0,
+    "poll_interval_seconds": 0.1,
+}
+
+
+def _load_runtime_options(config: Optional[LoggingConfig]) -> Dict[str, Any]:
+    """Merge `extensions.multiprocess_runtime` over the defaults."""
+    options = dict(DEFAULT_MULTIPROCESS_RUNTIME)
+    extensions = getattr(config, "extensions", None) or {}
+    runtime = extensions.get("multiprocess_runtime", {})
+    if isinstance(runtime, dict):
+        options.update(
+            {
+                key: runtime[key]
+                for key in DEFAULT_MULTIPROCESS_RUNTIME
+                if key in runtime
+            }
+        )
+    options["ring_size_bytes"] = max(4096, int(options["ring_size_bytes"]))
+    options["overflow_policy"] = str(options["overflow_policy"]).lower()
+    options["put_timeout_seconds"] = max(0.0, float(options["put_timeout_seconds"]))
+    options["shutdown_timeout_seconds"] = float(options["shutdown_timeout_seconds"])
+    options["poll_interval_seconds"] = max(
+        0.001, float(options["poll_interval_seconds"])
+    )
+    return options
+
+
+def _run_writer(
+    ring: SharedRingBuffer,
+    config_data: Dict[str, Any],
+    logger_name: str,
+    owner_pid: int,
+    poll_interval: float,
+) -> None:
+    """Writer process body: own the real handlers and drain the ring."""
+    # The owner stops the writer explicitly so buffered lines are not lost on ^C.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    writer = SyncLogger(config=LoggingConfig(**config_data), name=logger_name)
+    try:
+        while True:
+            frames = ring.drain()
+            records = []
+            for payload in frames:
+                try:
+                    records.append(decode_record(payload))
+                except Exception:
+                    _logger.exception("Writer process could not decode a record")
+            writer.emit_records(records)
+            if frames:
+                continue
+            if ring.closed or os.getppid() != owner_pid:
+                break
+            ring.wait_readable(poll_interval)
+    finally:
+        writer.close()
+
+
+class MultiprocessLogger(SyncLogger):
+    """Sync logger whose processes share one writer process through a ring."""
+
+    def __init__(
+        self, config: Optional[Union[LoggingConfig, Dict[str, Any]]] = None, **kwargs
+    ):
+        """Create the ring, the per-process ring handler, and the writer process."""
+        if config is None:
+            from ..config.defaults import get_default_config
+
+            config = get_default_config()
+        elif isinstance(config, dict):
+            config = LoggingConfig(**config)
+        self._runtime = _load_runtime_options(config)
+        context = multiprocessing.get_context(self._runtime["start_method"])
+        self._ring = SharedRingBuffer(self._runtime["ring_size_bytes"], context)
+        self._ring_handler = SharedRingHandler(
+            self._ring,
+            overflow_policy=self._runtime["overflow_policy"],
+            put_timeout=self._runtime["put_timeout_seconds"],
+        )
+        self._owner_pid = os.getpid()
+        self._writer: Optional[Any] = None
+        super().__init__(config, **kwargs)
+
+        self._writer = context.Process(
+            target=_run_writer,
+            args=(
+                self._ring,
+                self._config.model_dump(),
+                self._name,
+                self._owner_pid,
+                self._runtime["poll_interval_seconds"],
+            ),
+            name=f"hydra-logger-writer-{self._name}",
+            daemon=True,
+        )
+        self._writer.start()
+        atexit.register(self._shutdown_writer)
+
+    def _setup_layers(self):
+        """Route every configured layer to the shared ring handler."""
+        self._handlers[id(self._ring_handler)] = self._ring_handler
+        layers = self._config.layers if self._config else {}
+        for layer_name, layer in layers.items():
+            self._layers[layer_name] = layer
+            self._layer_handlers[layer_name] = [self._ring_handler]
+        self._layer_handlers.setdefault("default", [self._ring_handler])
+
+    def add_layer(self, name: str, layer: LogLayer) -> None:
+        """Runtime layer changes would not reach the writer process."""
+        raise HydraLoggerError(
+            "Multiprocess loggers cannot change layers at runtime; "
+            "configure layers before the writer starts"
+        )
+
+    def remove_layer(self, name: str) -> None:
+        """Runtime layer changes would not reach the writer process."""
+        raise HydraLoggerError(
+            "Multiprocess loggers cannot change layers at runtime; "
+            "configure layers before the writer starts"
+        )
+
+    @property
+    def is_owner(self) -> bool:
+        """True in the process that started (and must stop) the writer."""
+        return os.getpid() == self._owner_pid
+
+    def _after_fork_child(self) -> None:
+        """Forked workers keep the ring but never manage the writer process."""
+        super()._after_fork_child()
+        self._writer = None
+
+    def _shutdown_writer(self) -> None:
+        """Close the ring and wait for the writer to drain it (owner only)."""
+        writer = self._writer
+        if writer is None or not self.is_owner:
+            return
+        self._writer = None
+        self._ring.close()
+        writer.join(self._runtime["shutdown_timeout_seconds"])
+        if writer.is_alive():
+            _logger.warning(
+                "Writer process %s did not drain within %ss; terminating",
+                writer.pid,
+                self._runtime["shutdown_timeout_seconds"],
+            )
+            writer.terminate()
+            writer.join(1.0)
+
+    def close(self):
+        """Close this process's view; the owner also drains and stops the writer."""
+        super().close()
+        self._shutdown_writer()
+        # The exit hook would otherwise keep this logger and its ring alive.
+        atexit.unregister(self._shutdown_writer)
+
+    def get_health_status(self) -> Dict[str, Any]:
+        """Sync health plus ring usage, drop counts, and writer liveness."""
+        health_status = super().get_health_status()
+        writer = self._writer
+        health_status["multiprocess"] = {
+            "owner": self.is_owner,
+            "writer_pid": writer.pid if writer is not None else None,
+            "writer_alive": writer.is_alive() if writer is not None else None,
+            **self._ring_handler.get_stats(),
+        }
+        return health_status
@@ -5,13 +5,19 @@ Used By:
 Depends On:
  - hydra_logger
 Notes:
- - Provides reusable record building, routing, extension processing, and dispatch.
+ - Provides reusable record building, routing, extension processing, dispatch,
+   admission control, queue-mode priority lanes, the offload thread, and the
+   event-loop lag monitor.
 """
 
+from .admission_controller import AdmissionController
 from .component_dispatcher import ComponentDispatcher
 from .extension_processor import ExtensionProcessor
 from .handler_dispatcher import HandlerDispatcher
 from .layer_router import LayerRouter
+from .loop_lag import LoopLagMonitor
+from .offload_thread import OffloadThread
+from .priority_lanes import LoadShedder, PriorityLaneQueue
 from .record_builder import RecordBuilder
 
 __all__ = [
@@ -20,4 +26,9 @@ __all__ = [
     "HandlerDispatcher",
     "ExtensionProcessor",
     "ComponentDispatcher",
+    "AdmissionController",
+    "PriorityLaneQueue",
+    "LoadShedder",
+    "OffloadThread",
+    "LoopLagMonitor",
 ]
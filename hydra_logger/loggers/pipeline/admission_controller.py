@@ -0,0 +1,203 @@
+"""
+Role: Credit-based admission control for async task-mode records.
+Used By:
+ - `hydra_logger.loggers.async_logger` (`async_runtime.admission_policy`).
+Depends On:
+ - asyncio
+ - hydra_logger
+Notes:
+ - One credit covers one record from admission until its handlers finish.
+ - When no credit is free the producer's policy decides: `block` waits,
+   `drop_newest` waits up to `wait_timeout` then drops, and
+   `drop_lowest_priority` parks the record in a bounded overflow lane that
+   evicts the lowest level first.
+ - The overflow lane exists only under `drop_lowest_priority`.
+ - A sync caller on the event loop cannot wait, so under `block` and
+   `drop_newest` it drops at once. Those drops are also counted as
+   `nowait_dropped`, and under `block` they log a warning.
+"""
+
+import asyncio
+import itertools
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from ...utils import slo_metrics
+
+_logger = logging.getLogger(__name__)
+
+ADMISSION_POLICIES = ("block", "drop_newest", "drop_lowest_priority")
+
+
+class AdmissionController:
+    """Bounded in-flight credits plus the saturation policy for producers."""
+
+    def __init__(
+        self,
+        credits: int,
+        policy: str = "drop_newest",
+        wait_timeout: float = 0.01,
+        overflow_size: int = 10000,
+        component: str = "async_logger",
+    ) -> None:
+        if policy not in ADMISSION_POLICIES:
+            raise ValueError(
+                f"admission_policy must be one of {ADMISSION_POLICIES}, got {policy!r}"
+            )
+        self._credits = max(1, int(credits))
+        self._policy = policy
+        self._wait_timeout = max(0.0, float(wait_timeout))
+        self._overflow_size = max(1, int(overflow_size))
+        self._component = component
+        self.reset()
+
+    def reset(self) -> None:
+        """Return every credit and forget parked records and loop-bound events."""
+        self._available = self._credits
+        self._released: Optional[asyncio.Event] = None
+        self._overflow_ready: Optional[asyncio.Event] = None
+        # Per-level FIFO lanes; serving picks the oldest head across levels.
+        self._overflow: Optional[Dict[int, Deque[Tuple[int, Any]]]] = (
+            {} if self._policy == "drop_lowest_priority" else None
+        )
+        self._parked = 0
+        self._sequence = itertools.count()
+        self._admitted = 0
+        self._waited = 0
+        self._saturated = 0
+        self._dropped = 0
+        self._nowait_dropped = 0
+        self._evicted = 0
+
+    @property
+    def policy(self) -> str:
+        """Saturation policy applied when no credit is free."""
+        return self._policy
+
+    @property
+    def wait_timeout(self) -> float:
+        """Bounded wait used by `drop_newest` before it drops."""
+        return self._wait_timeout
+
+    @property
+    def parked(self) -> int:
+        """Records waiting in the overflow lane."""
+        return self._parked
+
+    def try_acquire(self) -> bool:
+        """Take a credit without waiting."""
+        if self._available > 0:
+            self._available -= 1
+            self._admitted += 1
+            return True
+        return False
+
+    def release(self) -> None:
+        """Return a credit and wake producers waiting for one."""
+        if self._available < self._credits:
+            self._available += 1
+        if self._released is not None:
+            self._released.set()
+
+    async def acquire(self, timeout: Optional[float]) -> bool:
+        """Wait up to `timeout` seconds (forever when None) for a credit."""
+        if self.try_acquire():
+            return True
+        self._waited += 1
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        if self._released is None:
+            self._released = asyncio.Event()
+        released = self._released
+        while not self.try_acquire():
+            released.clear()
+            if deadline is None:
+                await released.wait()
+                continue
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            try:
+                await asyncio.wait_for(released.wait(), remaining)
+            except asyncio.TimeoutError:
+                return self.try_acquire()
+        return True
+
+    def saturated(self) -> None:
+        """Report that a producer found no free credit."""
+        self._saturated += 1
+        slo_metrics.record_queue_saturation(self._component)
+
+    def drop(self, reason: str) -> None:
+        """Count a record the policy refused."""
+        self._dropped += 1
+        slo_metrics.record_dropped_log(f"{self._component}_{reason}")
+
+    def drop_nowait(self) -> None:
+        """Count a record refused because its sync caller could not wait."""
+        self._nowait_dropped += 1
+        self.drop("nowait")
+        if self._policy == "block" and (
+            self._nowait_dropped == 1 or self._nowait_dropped % 100 == 0
+        ):
+            _logger.warning(
+                "admission_policy=block cannot wait for a sync log() on the event "
+                "loop; dropped %s such records (use log_async to wait)",
+                self._nowait_dropped,
+            )
+
+    def park(self, priority: int, payload: Any) -> bool:
+        """Queue `payload` for later; evict the lowest level when the lane is full."""
+        lanes = self._overflow
+        if lanes is None:
+            raise RuntimeError(
+                "overflow lane requires admission_policy=drop_lowest_priority"
+            )
+        if self._parked >= self._overflow_size:
+            lowest = min(level for level, lane in lanes.items() if lane)
+            if priority <= lowest:
+                self.drop("overflow_full")
+                return False
+            lanes[lowest].pop()
+            self._parked -= 1
+            self._evicted += 1
+            self.drop("evicted")
+        lanes.setdefault(priority, deque()).append((next(self._sequence), payload))
+        self._parked += 1
+        if self._overflow_ready is not None:
+            self._overflow_ready.set()
+        return True
+
+    async def wait_parked(self) -> None:
+        """Wait until the overflow lane holds at least one record."""
+        if self._overflow_ready is None:
+            self._overflow_ready = asyncio.Event()
+        ready = self._overflow_ready
+        while not self._parked:
+            ready.clear()
+            await ready.wait()
+
+    def pop_parked(self) -> Optional[Any]:
+        """Remove the oldest parked payload, or return None when the lane is empty."""
+        if not self._parked or self._overflow is None:
+            return None
+        lanes = (lane for lane in self._overflow.values() if lane)
+        lane = min(lanes, key=lambda queue: queue[0][0])
+        self._parked -= 1
+        return lane.popleft()[1]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a point-in-time copy of admission counters."""
+        return {
+            "policy": self._policy,
+            "credits": self._credits,
+            "available": self._available,
+            "admitted": self._admitted,
+            "waited": self._waited,
+            "saturated": self._saturated,
+            "dropped": self._dropped,
+            "nowait_dropped": self._nowait_dropped,
+            "evicted": self._evicted,
+            "parked": self._parked,
+        }
@@ -7,18 +7,45 @@ Depends On:
  - hydra_logger
 Notes:
  - Keeps extension handling isolated from logger orchestration flow.
+ - Message processing on lazy records is deferred until the message is rendered;
+   a deferred failure is still reported through the owner's reliability policy.
+ - A failed data-protection step replaces the message with `WITHHELD_MESSAGE`
+   rather than keeping the unredacted text.
+ - `apply_batch` resolves the enabled extensions once for a whole batch.
 """
 
 import logging
-from typing import Any, Optional
+from typing import Any, Callable, List, Optional, Tuple
 
 from ...core.exceptions import HydraLoggerError
 from ...extensions.extension_base import SecurityExtension
-from ...types.records import LogRecord
+from ...types.records import WITHHELD_MESSAGE, LogRecord
 
 _logger = logging.getLogger(__name__)
 
 
+def _process_message(
+    record: LogRecord, process: Any, on_error: Callable[[Exception, str], str]
+) -> None:
+    """Run `process` on the rendered message, deferring it for lazy records.
+
+    A deferred `process` runs on whichever thread first reads the message, so
+    its failure goes to `on_error`, whose return value replaces the message.
+    """
+    defer = getattr(record, "defer_message_transform", None)
+    if defer is not None:
+
+        def transform(text: str) -> str:
+            try:
+                return process(text)
+            except Exception as error:
+                return on_error(error, text)
+
+        if defer(transform):
+            return
+    record.message = process(record.message)
+
+
 class ExtensionProcessor:
     """Apply enabled extension processors to log records."""
 
@@ -29,27 +56,7 @@ class ExtensionProcessor:
     def apply_data_protection(self, record: LogRecord, data_protection) -> LogRecord:
         """Apply data-protection extension to record message when enabled."""
         if data_protection and data_protection.is_enabled():
-            try:
-                record.message = data_protection.process(record.message)
-                if record.context:
-                    record.context = data_protection.process(record.context)
-                if record.extra:
-                    record.extra = data_protection.process(record.extra)
-            except Exception as error:
-                if self._owner is not None and hasattr(
-                    self._owner, "_handle_internal_failure"
-                ):
-                    try:
-                        self._owner._handle_internal_failure(
-                            "extension_data_protection", error
-                        )
-                    except HydraLoggerError:
-                        raise
-                else:
-                    _logger.exception(
-                        "Data protection extension failed for type=%s",
-                        type(data_protection).__name__,
-                    )
+            self._protect(record, data_protection)
         return record
 
     def apply_non_data_protection_extensions(
@@ -62,8 +69,42 @@ class ExtensionProcessor:
         if extension_manager is None:
             return record
 
-        processing_order = extension_manager.get_processing_order()
-        for extension_name in processing_order:
+        for extension_name, extension in self._active_extensions(
+            extension_manager, data_protection_extension
+        ):
+            self._extend(record, extension_name, extension)
+        return record
+
+    def apply_batch(
+        self,
+        records: List[LogRecord],
+        extension_manager: Optional[Any],
+        data_protection: Optional[Any],
+    ) -> List[LogRecord]:
+        """Redact, then extend, a whole batch in place.
+
+        Enabled checks and the processing order are resolved once per batch
+        instead of once per record; each record sees the same steps in the
+        same order as the single-record methods.
+        """
+        if data_protection and data_protection.is_enabled():
+            for record in records:
+                self._protect(record, data_protection)
+        if extension_manager is not None:
+            for extension_name, extension in self._active_extensions(
+                extension_manager, data_protection
+            ):
+                for record in records:
+                    self._extend(record, extension_name, extension)
+        return records
+
+    @staticmethod
+    def _active_extensions(
+        extension_manager: Any, data_protection_extension: Optional[Any]
+    ) -> List[Tuple[str, Any]]:
+        """Enabled non-security extensions in the manager's processing order."""
+        active = []
+        for extension_name in extension_manager.get_processing_order():
             extension = extension_manager.get_extension(extension_name)
             if extension is None or not extension.is_enabled():
                 continue
@@ -71,26 +112,69 @@ class ExtensionProcessor:
                 continue
             if isinstance(extension, SecurityExtension):
                 continue
+            active.append((extension_name, extension))
+        return active
+
+    def _report(self, context: str, error: Exception, message: str, *args) -> None:
+        """Route an extension failure through the owner's reliability policy."""
+        if self._owner is not None and hasattr(self._owner, "_handle_internal_failure"):
             try:
-                record.message = extension.process(record.message)
-                if record.context:
-                    record.context = extension.process(record.context)
-                if record.extra:
-                    record.extra = extension.process(record.extra)
-            except Exception as error:
-                if self._owner is not None and hasattr(
-                    self._owner, "_handle_internal_failure"
-                ):
-                    try:
-                        self._owner._handle_internal_failure(
-                            f"extension_{extension_name}", error
-                        )
-                    except HydraLoggerError:
-                        raise
-                else:
-                    _logger.exception(
-                        "Extension processing failed for extension=%s type=%s",
-                        extension_name,
-                        type(extension).__name__,
-                    )
-        return record
+                self._owner._handle_internal_failure(context, error)
+            except HydraLoggerError:
+                raise
+        else:
+            _logger.exception(message, *args)
+
+    def _protect(self, record: LogRecord, data_protection: Any) -> None:
+        def withhold(error: Exception, text: str) -> str:
+            self._report_protection_failure(data_protection, error)
+            return WITHHELD_MESSAGE
+
+        redacted = False
+        try:
+            _process_message(record, data_protection.process, withhold)
+            redacted = True
+            if record.context:
+                record.context = data_protection.process(record.context)
+            if record.extra:
+                record.extra = data_protection.process(record.extra)
+        except Exception as error:
+            if not redacted:
+                # Never let the unredacted text through.
+                record.message = WITHHELD_MESSAGE
+            self._report_protection_failure(data_protection, error)
+
+    def _report_protection_failure(
+        self, data_protection: Any, error: Exception
+    ) -> None:
+        self._report(
+            "extension_data_protection",
+            error,
+            "Data protection extension failed for type=%s",
+            type(data_protection).__name__,
+        )
+
+    def _extend(self, record: LogRecord, extension_name: str, extension: Any) -> None:
+        def keep(error: Exception, text: str) -> str:
+            self._report_extension_failure(extension_name, extension, error)
+            return text
+
+        try:
+            _process_message(record, extension.process, keep)
+            if record.context:
+                record.context = extension.process(record.context)
+            if record.extra:
+                record.extra = extension.process(record.extra)
+        except Exception as error:
+            self._report_extension_failure(extension_name, extension, error)
+
+    def _report_extension_failure(
+        self, extension_name: str, extension: Any, error: Exception
+    ) -> None:
+        self._report(
+            f"extension_{extension_name}",
+            error,
+            "Extension processing failed for extension=%s type=%s",
+            extension_name,
+            type(extension).__name__,
+        )
@@ -9,16 +9,26 @@ Depends On:
  - typing
 Notes:
  - Centralizes resilient handler dispatch logic.
+ - Compiles immutable emit plans (bound callables pre-filtered by handler level).
+ - Batch dispatch hands whole record lists to `emit_batch` / `emit_batch_async`
+   and falls back to per-record dispatch for handlers without them.
+ - `dispatch_batch_threadsafe` serves threads off the event loop and prefers a
+   handler's `emit_batch_threadsafe`, which writes on the calling thread.
 """
 
 import asyncio
 import logging
-from typing import Any, Awaitable, Callable, Iterable
+from typing import Any, Awaitable, Callable, Iterable, Sequence, Tuple
 
+from ...handlers.base_handler import BaseHandler
+from ...handlers.null_handler import NullHandler
 from ...types.records import LogRecord
 
 _logger = logging.getLogger(__name__)
 
+SyncEmitPlan = Tuple[Tuple[Callable[[LogRecord], None], str], ...]
+AsyncEmitPlan = Tuple[Tuple[Callable[[LogRecord], Awaitable[None]], str], ...]
+
 
 class HandlerDispatcher:
     """Shared handler dispatch for logger runtimes."""
@@ -110,6 +120,76 @@ class HandlerDispatcher:
         self._async_dispatch_cache[handler_id] = (signature, _dispatch)
         return _dispatch
 
+    @staticmethod
+    def _accepts_level(handler: Any, level: int) -> bool:
+        """Return whether handler takes part in plans for `level`."""
+        if isinstance(handler, NullHandler):
+            return False
+        is_enabled_for = getattr(handler, "isEnabledFor", None)
+        if is_enabled_for is None:
+            return True
+        return bool(is_enabled_for(level))
+
+    def compile_sync_plan(self, handlers: Iterable[Any], level: int) -> SyncEmitPlan:
+        """Compile sync emit plan for handlers accepting `level`."""
+        plan = []
+        for handler in handlers:
+            try:
+                if not self._accepts_level(handler, level):
+                    continue
+                dispatch_fn = self._resolve_sync_dispatch(handler)
+                if dispatch_fn is None:
+                    continue
+                # Level is already filtered, so skip BaseHandler.handle's re-check.
+                if getattr(dispatch_fn, "__func__", None) is BaseHandler.handle:
+                    dispatch_fn = handler.emit
+                plan.append((dispatch_fn, type(handler).__name__))
+            except Exception:
+                _logger.exception(
+                    "Sync emit plan compilation failed for handler type=%s",
+                    type(handler).__name__,
+                )
+        return tuple(plan)
+
+    def compile_async_plan(self, handlers: Iterable[Any], level: int) -> AsyncEmitPlan:
+        """Compile async emit plan for handlers accepting `level`."""
+        plan = []
+        for handler in handlers:
+            try:
+                if not self._accepts_level(handler, level):
+                    continue
+                plan.append(
+                    (self._resolve_async_dispatch(handler), type(handler).__name__)
+                )
+            except Exception:
+                _logger.exception(
+                    "Async emit plan compilation failed for handler type=%s",
+                    type(handler).__name__,
+                )
+        return tuple(plan)
+
+    @staticmethod
+    def run_sync_plan(record: LogRecord, plan: SyncEmitPlan) -> None:
+        """Emit record through a compiled sync plan."""
+        for dispatch_fn, handler_type in plan:
+            try:
+                dispatch_fn(record)
+            except Exception:
+                _logger.exception(
+                    "Sync handler dispatch failed for handler type=%s", handler_type
+                )
+
+    @staticmethod
+    async def run_async_plan(record: LogRecord, plan: AsyncEmitPlan) -> None:
+        """Emit record through a compiled async plan."""
+        for dispatch_fn, handler_type in plan:
+            try:
+                await dispatch_fn(record)
+            except Exception:
+                _logger.exception(
+                    "Async handler dispatch failed for handler type=%s", handler_type
+                )
+
     def dispatch_sync(self, record: LogRecord, handlers: Iterable[Any]) -> None:
         """Dispatch record through synchronous handler path."""
         for handler in handlers:
@@ -134,3 +214,77 @@ class HandlerDispatcher:
                     "Async handler dispatch failed for handler type=%s",
                     type(handler).__name__,
                 )
+
+    @staticmethod
+    def _overrides(handler: Any, name: str) -> bool:
+        """Return whether `handler` replaces the BaseHandler default for `name`."""
+        method = getattr(type(handler), name, None)
+        return method is not None and method is not getattr(BaseHandler, name)
+
+    def dispatch_batch_sync(
+        self, records: Sequence[LogRecord], handlers: Iterable[Any]
+    ) -> None:
+        """Dispatch a record batch, one `emit_batch` call per handler."""
+        if not records:
+            return
+        for handler in handlers:
+            try:
+                emit_batch = getattr(handler, "emit_batch", None)
+                if emit_batch is not None:
+                    emit_batch(records)
+                    continue
+                dispatch_fn = self._resolve_sync_dispatch(handler)
+                if dispatch_fn is not None:
+                    for record in records:
+                        dispatch_fn(record)
+            except Exception:
+                _logger.exception(
+                    "Sync batch dispatch failed for handler type=%s",
+                    type(handler).__name__,
+                )
+
+    def dispatch_batch_threadsafe(
+        self, records: Sequence[LogRecord], handlers: Iterable[Any]
+    ) -> None:
+        """Dispatch a batch from a non-loop thread; loop-bound handlers write here."""
+        if not records:
+            return
+        others = []
+        for handler in handlers:
+            emit_direct = getattr(handler, "emit_batch_threadsafe", None)
+            if emit_direct is None:
+                others.append(handler)
+                continue
+            try:
+                emit_direct(records)
+            except Exception:
+                _logger.exception(
+                    "Thread-safe batch dispatch failed for handler type=%s",
+                    type(handler).__name__,
+                )
+        self.dispatch_batch_sync(records, others)
+
+    async def dispatch_batch_async(
+        self, records: Sequence[LogRecord], handlers: Iterable[Any]
+    ) -> None:
+        """Dispatch a record batch, preferring each handler's batch entry points."""
+        if not records:
+            return
+        for handler in handlers:
+            try:
+                # Handlers with a custom `emit_async` but no batch override keep
+                # their per-record async path.
+                if self._overrides(handler, "emit_batch_async"):
+                    await handler.emit_batch_async(records)
+                elif self._overrides(handler, "emit_batch"):
+                    handler.emit_batch(records)
+                else:
+                    dispatch_fn = self._resolve_async_dispatch(handler)
+                    for record in records:
+                        if self._accepts_level(handler, record.level):
+                            await dispatch_fn(record)
+            except Exception:
+                _logger.exception(
+                    "Async batch dispatch failed for handler type=%s",
+                    type(handler).__name__,
+                )
@@ -8,12 +8,16 @@ Depends On:
  - typing
 Notes:
  - Shares layer fallback and level-threshold checks across runtimes.
+ - Owns compiled per-(layer, level) emit plans and their invalidation.
 """
 
 import logging
-from typing import Any, Dict, List
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
 from ...types.levels import LogLevelManager
+from ...utils.fork_safety import register_fork_safe
+from .handler_dispatcher import AsyncEmitPlan, HandlerDispatcher, SyncEmitPlan
 
 _logger = logging.getLogger(__name__)
 
@@ -27,11 +31,22 @@ class LayerRouter:
         layer_handlers: Dict[str, List[Any]],
         handler_cache: Dict[str, List[Any]],
         layer_cache: Dict[str, int],
+        dispatcher: Optional[HandlerDispatcher] = None,
     ) -> None:
         self._layers = layers
         self._layer_handlers = layer_handlers
         self._handler_cache = handler_cache
         self._layer_cache = layer_cache
+        self._dispatcher = dispatcher or HandlerDispatcher()
+        self._plan_lock = threading.Lock()
+        self._plan_generation = 0
+        self._sync_plans: Dict[Tuple[str, int], SyncEmitPlan] = {}
+        self._async_plans: Dict[Tuple[str, int], AsyncEmitPlan] = {}
+        register_fork_safe(self)
+
+    def _after_fork_child(self) -> None:
+        """Replace the plan lock; a forking thread may have held it."""
+        self._plan_lock = threading.Lock()
 
     def handlers_for_layer(self, layer_name: str) -> List[Any]:
         """Return handlers for layer using default fallback."""
@@ -80,3 +95,55 @@ class LayerRouter:
     ) -> bool:
         """Check if level passes layer threshold."""
         return level >= self.layer_threshold(layer_name, default_level)
+
+    def is_enabled_for(
+        self, level: int, layer_name: Optional[str] = None, default_level: str = "INFO"
+    ) -> bool:
+        """Resolve layer and numeric level into an enabled/disabled answer."""
+        return self.is_level_enabled(layer_name or "default", level, default_level)
+
+    def invalidate(self) -> None:
+        """Drop cached routing state so plans rebuild on next use."""
+        with self._plan_lock:
+            self._plan_generation += 1
+            self._handler_cache.clear()
+            self._layer_cache.clear()
+            self._sync_plans = {}
+            self._async_plans = {}
+
+    def _watch_handlers(self, handlers: List[Any]) -> None:
+        """Subscribe to handler level/formatter changes."""
+        for handler in handlers:
+            add_listener = getattr(handler, "add_config_listener", None)
+            if add_listener is not None:
+                add_listener(self.invalidate)
+
+    def sync_plan(self, layer_name: str, level: int) -> SyncEmitPlan:
+        """Return compiled sync emit plan for `(layer_name, level)`."""
+        key = (layer_name, level)
+        plan = self._sync_plans.get(key)
+        if plan is not None:
+            return plan
+        generation = self._plan_generation
+        handlers = self.handlers_for_layer(layer_name)
+        self._watch_handlers(handlers)
+        plan = self._dispatcher.compile_sync_plan(handlers, level)
+        with self._plan_lock:
+            if generation == self._plan_generation:
+                self._sync_plans[key] = plan
+        return plan
+
+    def async_plan(self, layer_name: str, level: int) -> AsyncEmitPlan:
+        """Return compiled async emit plan for `(layer_name, level)`."""
+        key = (layer_name, level)
+        plan = self._async_plans.get(key)
+        if plan is not None:
+            return plan
+        generation = self._plan_generation
+        handlers = self.handlers_for_layer(layer_name)
+        self._watch_handlers(handlers)
+        plan = self._dispatcher.compile_async_plan(handlers, level)
+        with self._plan_lock:
+            if generation == self._plan_generation:
+                self._async_plans[key] = plan
+        return plan
@@ -0,0 +1,94 @@
+"""
+Role: Event-loop lag probe for async logger runtimes.
+Used By:
+ - `hydra_logger.loggers.async_logger` (`async_runtime.loop_lag_monitor`).
+Depends On:
+ - asyncio
+ - hydra_logger
+Notes:
+ - One task sleeps `interval` seconds and records how late it woke up; that
+   delay is time the loop spent running other callbacks.
+ - Percentiles cover the last `window` samples; count and max are lifetime.
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from ...utils.slo_metrics import percentile
+
+
+class LoopLagMonitor:
+    """Periodic scheduling-delay probe bound to one event loop."""
+
+    def __init__(self, interval: float = 0.5, window: int = 256) -> None:
+        self._interval = max(0.001, float(interval))
+        self._window = max(1, int(window))
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the probe task and samples (fresh state after fork)."""
+        self._task: Optional[asyncio.Task] = None
+        self._samples: Deque[float] = deque(maxlen=self._window)
+        self._count = 0
+        self._max = 0.0
+
+    def running_on(self, loop: asyncio.AbstractEventLoop) -> bool:
+        """True when the probe task is alive on `loop`."""
+        task = self._task
+        return task is not None and not task.done() and task.get_loop() is loop
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start probing `loop`; a probe left on another loop is replaced."""
+        if self.running_on(loop):
+            return
+        self.cancel()
+        self._task = loop.create_task(self._probe())
+
+    async def _probe(self) -> None:
+        loop = asyncio.get_running_loop()
+        interval = self._interval
+        while True:
+            started = loop.time()
+            await asyncio.sleep(interval)
+            self.record(loop.time() - started - interval)
+
+    def record(self, lag: float) -> None:
+        """Add one lag sample in seconds."""
+        lag = max(0.0, lag)
+        self._samples.append(lag)
+        self._count += 1
+        if lag > self._max:
+            self._max = lag
+
+    async def stop(self) -> None:
+        """Cancel the probe and wait for it when it runs on this loop."""
+        task, self._task = self._task, None
+        if task is None or task.done() or task.get_loop().is_closed():
+            return
+        task.cancel()
+        if task.get_loop() is asyncio.get_running_loop():
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def cancel(self) -> None:
+        """Cancel the probe without waiting (sync close path)."""
+        task, self._task = self._task, None
+        if task is not None and not task.done() and not task.get_loop().is_closed():
+            task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        """Lag summary in milliseconds."""
+        values = sorted(self._samples)
+        task = self._task
+        return {
+            "running": task is not None and not task.done(),
+            "interval_ms": self._interval * 1000.0,
+            "samples": self._count,
+            "last_ms": self._samples[-1] * 1000.0 if self._samples else 0.0,
+            "p50_ms": percentile(values, 50) * 1000.0,
+            "p99_ms": percentile(values, 99) * 1000.0,
+            "max_ms": self._max * 1000.0,
+        }
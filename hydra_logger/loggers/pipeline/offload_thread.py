@@ -0,0 +1,39 @@
+"""
+Role: Dedicated background thread that runs record work off the event loop.
+Used By:
+ - `hydra_logger.loggers.async_logger` (`async_runtime.mode = "offload"`).
+Depends On:
+ - hydra_logger
+Notes:
+ - Producers on any thread append a minimal payload tuple; buffering, overflow,
+   batching, and draining come from `hydra_logger.utils.bounded_worker`.
+ - The thread hands each drained run of up to `batch_size` payloads to
+   `process`, which does record building, redaction, formatting, and I/O.
+ - The thread starts on the first submit, so a forked child starts its own.
+"""
+
+from typing import Any, Callable, List
+
+from ...utils.bounded_worker import BoundedWorker
+
+
+class OffloadThread(BoundedWorker):
+    """Bounded payload buffer drained in batches by one daemon thread."""
+
+    def __init__(
+        self,
+        process: Callable[[List[Any]], None],
+        max_size: int = 10000,
+        batch_size: int = 256,
+        overflow_policy: str = "drop_newest",
+        name: str = "hydra-logger-offload",
+    ) -> None:
+        super().__init__(
+            process,
+            max_size=max_size,
+            batch_size=batch_size,
+            overflow_policy=overflow_policy,
+            name=name,
+            drop_reason="async_offload_full",
+            label="Offload buffer",
+        )
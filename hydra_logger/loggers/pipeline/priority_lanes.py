@@ -0,0 +1,187 @@
+"""
+Role: Severity lanes and adaptive load shedding for the async queue runtime.
+Used By:
+ - `hydra_logger.loggers.async_logger` (`async_runtime.priority_lanes`).
+Depends On:
+ - asyncio
+ - hydra_logger
+Notes:
+ - `PriorityLaneQueue` is a drop-in `asyncio.Queue` whose items are queue-mode
+   payloads `(level, message, ...)`; workers drain the highest lane first.
+ - `max_queue_size` bounds the lanes below ERROR only; ERROR and CRITICAL are
+   never dropped. A full queue sheds the oldest record of the lowest lane
+   below the incoming one before it refuses the incoming record.
+ - `LoadShedder` raises a per-layer level floor as occupancy crosses
+   watermarks and lowers it again once occupancy falls below them.
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, Deque, Dict, Mapping, Optional, Tuple
+
+from ...types.levels import LogLevel, LogLevelManager
+from ...utils import slo_metrics
+
+# Lane floors, highest first; a record goes to the first lane it reaches.
+LANE_LEVELS: Tuple[int, ...] = (
+    int(LogLevel.ERROR),
+    int(LogLevel.WARNING),
+    int(LogLevel.INFO),
+    int(LogLevel.DEBUG),
+    int(LogLevel.NOTSET),
+)
+PROTECTED_LEVEL = int(LogLevel.ERROR)
+
+DEFAULT_SHED_WATERMARKS: Dict[str, float] = {"INFO": 0.5, "WARNING": 0.8}
+
+
+def lane_for(level: Any) -> int:
+    """Return the lane floor for a level name or number."""
+    numeric = LogLevelManager.get_level(level)
+    for floor in LANE_LEVELS:
+        if numeric >= floor:
+            return floor
+    return LANE_LEVELS[-1]
+
+
+class PriorityLaneQueue(asyncio.Queue):
+    """Bounded multi-lane queue that sheds low-severity payloads first."""
+
+    def __init__(self, maxsize: int = 0, shed_same_lane: bool = False) -> None:
+        # `drop_oldest` may also shed from the incoming record's own lane.
+        self._shed_same_lane = shed_same_lane
+        self._admitting_protected = False
+        self._dropped: Dict[int, int] = {floor: 0 for floor in LANE_LEVELS}
+        super().__init__(maxsize)
+
+    def _init(self, maxsize: int) -> None:
+        self._lanes: Dict[int, Deque[Any]] = {floor: deque() for floor in LANE_LEVELS}
+        self._sheddable = 0
+
+    def _put(self, item: Any) -> None:
+        lane = lane_for(item[0])
+        self._lanes[lane].append(item)
+        if lane < PROTECTED_LEVEL:
+            self._sheddable += 1
+
+    def _get(self) -> Any:
+        for floor in LANE_LEVELS:
+            lane = self._lanes[floor]
+            if lane:
+                if floor < PROTECTED_LEVEL:
+                    self._sheddable -= 1
+                return lane.popleft()
+        raise asyncio.QueueEmpty
+
+    def qsize(self) -> int:
+        return sum(len(lane) for lane in self._lanes.values())
+
+    def empty(self) -> bool:
+        return not any(self._lanes.values())
+
+    def full(self) -> bool:
+        if self._admitting_protected or self._maxsize <= 0:
+            return False
+        return self._sheddable >= self._maxsize
+
+    @property
+    def occupancy(self) -> float:
+        """Fraction of the sheddable capacity in use."""
+        if self._maxsize <= 0:
+            return 0.0
+        return self._sheddable / self._maxsize
+
+    def put_nowait(self, item: Any) -> None:
+        lane = lane_for(item[0])
+        if lane >= PROTECTED_LEVEL:
+            self._admitting_protected = True
+            try:
+                super().put_nowait(item)
+            finally:
+                self._admitting_protected = False
+            return
+        if self.full() and not self._shed_below(lane):
+            self.count_drop(lane)
+            raise asyncio.QueueFull
+        super().put_nowait(item)
+
+    def _shed_below(self, lane: int) -> bool:
+        """Drop the oldest record of the lowest lane under `lane`."""
+        for floor in reversed(LANE_LEVELS):
+            if floor > lane or (floor == lane and not self._shed_same_lane):
+                return False
+            if self._lanes[floor]:
+                self._lanes[floor].popleft()
+                self._sheddable -= 1
+                self.count_drop(floor)
+                slo_metrics.record_dropped_log("async_queue_shed")
+                self.task_done()
+                return True
+        return False
+
+    def count_drop(self, level: Any) -> None:
+        """Count a record dropped for the lane that `level` belongs to."""
+        self._dropped[lane_for(level)] += 1
+
+    def lane_stats(self) -> Dict[str, Dict[str, int]]:
+        """Per-lane depth and drop counts keyed by lane level name."""
+        return {
+            LogLevelManager.get_name(floor): {
+                "depth": len(self._lanes[floor]),
+                "dropped": self._dropped[floor],
+            }
+            for floor in LANE_LEVELS
+        }
+
+
+class LoadShedder:
+    """Per-layer level floors driven by queue occupancy watermarks."""
+
+    def __init__(
+        self,
+        watermarks: Optional[Mapping[str, float]] = None,
+        hysteresis: float = 0.1,
+    ) -> None:
+        marks = []
+        for name, mark in (watermarks or DEFAULT_SHED_WATERMARKS).items():
+            level = LogLevelManager.get_level(name)
+            if level >= PROTECTED_LEVEL:
+                raise ValueError("shed_watermarks cannot shed ERROR or CRITICAL")
+            marks.append((float(mark), level))
+        self._marks = sorted(marks)
+        self._hysteresis = max(0.0, float(hysteresis))
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop every layer floor and shed count."""
+        self._floors: Dict[str, int] = {}
+        self._shed: Dict[str, int] = {}
+
+    def admit(self, layer: str, level: int, occupancy: float) -> bool:
+        """Update `layer`'s floor for `occupancy` and check `level` against it."""
+        current = self._floors.get(layer, 0)
+        floor = 0
+        for mark, mark_level in self._marks:
+            if occupancy >= mark or (
+                mark_level <= current and occupancy >= mark - self._hysteresis
+            ):
+                floor = max(floor, mark_level)
+        if floor != current:
+            if floor:
+                self._floors[layer] = floor
+            else:
+                self._floors.pop(layer, None)
+        if level >= floor:
+            return True
+        self._shed[layer] = self._shed.get(layer, 0) + 1
+        return False
+
+    def stats(self) -> Dict[str, Any]:
+        """Active per-layer floors and per-layer shed counts."""
+        return {
+            "floors": {
+                layer: LogLevelManager.get_name(floor)
+                for layer, floor in self._floors.items()
+            },
+            "shed": dict(self._shed),
+        }
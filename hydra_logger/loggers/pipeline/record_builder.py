@@ -8,17 +8,55 @@ Depends On:
  - typing
 Notes:
  - Wraps logger record creation to keep hot-path logic centralized.
+ - `precheck` gates on layer threshold before any record is built.
+ - Wraps deferred `%`-style args and zero-arg callables in `LazyMessage`.
+ - Bound `extra` (`BoundFields`) is static and passed through untouched.
+ - Ambient `log_context(...)` ids/context are copied from one shared snapshot.
+ - `create_batch` takes levels already normalized by `precheck`.
 """
 
 import logging
-from typing import Any, Dict, Union
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
+from ...types.context import (
+    AMBIENT_RECORD_FIELDS,
+    AmbientContext,
+    current_ambient_context,
+)
 from ...types.levels import LogLevelManager
-from ...types.records import LogRecord
+from ...types.records import BoundFields, LazyMessage, LogRecord, render_message
 
 _logger = logging.getLogger(__name__)
 
 
+def apply_ambient_context(record: LogRecord, ambient: AmbientContext) -> None:
+    """Copy a non-empty ambient snapshot onto `record`."""
+    for name, value in ambient.record_fields:
+        setattr(record, name, value)
+    context = ambient.context
+    if context:
+        record.context = {**context, **record.context} if record.context else context
+
+
+def resolve_extra(extra: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Call zero-arg callable `extra` values; return input unchanged if none."""
+    for value in extra.values():
+        if callable(value):
+            return {
+                key: (item() if callable(item) else item) for key, item in extra.items()
+            }
+    return extra
+
+
 class RecordBuilder:
     """Shared record builder for logger pipeline paths."""
 
@@ -35,13 +73,87 @@ class RecordBuilder:
             _logger.exception("Record level normalization failed for level=%r", level)
             raise
 
+    def precheck(
+        self,
+        level: Union[str, int],
+        layer_name: Optional[str],
+        router: Any,
+        default_level: str = "INFO",
+    ) -> Optional[int]:
+        """Return normalized level when enabled for layer, else `None`.
+
+        Runs before any record allocation so filtered calls stay cheap.
+        """
+        normalized = self.normalize_level(level)
+        if router.is_enabled_for(normalized, layer_name, default_level):
+            return normalized
+        return None
+
     def create(
-        self, level: Union[str, int], message: str, **kwargs: Dict[str, Any]
+        self, level: Union[str, int], message: Any, *args: Any, **kwargs: Any
     ) -> LogRecord:
-        """Create a `LogRecord` using logger's standardized strategy."""
+        """Create a `LogRecord` using logger's standardized strategy.
+
+        Deferred args/callables become a `LazyMessage` that compact records
+        render on first `message` access, i.e. once a handler formats them.
+        """
         try:
-            normalized = self.normalize_level(level)
-            return self._logger.create_log_record(normalized, message, **kwargs)
+            return self._build(
+                self.normalize_level(level),
+                message,
+                args,
+                kwargs,
+                current_ambient_context(),
+            )
         except Exception:
             _logger.exception("Record creation failed for message=%r", message)
             raise
+
+    def create_batch(
+        self,
+        entries: Iterable[Tuple[int, Any, Mapping[str, Any]]],
+        on_error: Callable[[Exception], None],
+    ) -> List[LogRecord]:
+        """Create records for pre-normalized `(level, message, kwargs)` entries.
+
+        The ambient context is read once for the batch and `kwargs` mappings
+        may be shared between entries. A failing entry goes to `on_error`.
+        """
+        ambient = current_ambient_context()
+        records = []
+        for level, message, kwargs in entries:
+            try:
+                records.append(self._build(level, message, (), kwargs, ambient))
+            except Exception as error:
+                on_error(error)
+        return records
+
+    def _build(
+        self,
+        normalized: int,
+        message: Any,
+        args: Tuple[Any, ...],
+        kwargs: Mapping[str, Any],
+        ambient: AmbientContext,
+    ) -> LogRecord:
+        lazy = args or callable(message)
+        if lazy and not (type(message) is LazyMessage and not args):
+            message = LazyMessage(message, args)
+        extra = kwargs.get("extra")
+        if extra and type(extra) is not BoundFields:
+            resolved = resolve_extra(extra)
+            if resolved is not extra:
+                kwargs = {**kwargs, "extra": resolved}
+        record = self._logger.create_log_record(normalized, message, **kwargs)
+        if ambient:
+            apply_ambient_context(record, ambient)
+        if kwargs:
+            # Explicit per-call ids win over ambient ones.
+            for name in AMBIENT_RECORD_FIELDS:
+                value = kwargs.get(name)
+                if value is not None:
+                    setattr(record, name, value)
+        if lazy and not hasattr(record, "defer_message_transform"):
+            # Record type without deferred-message support: render now.
+            record.message = render_message(message)
+        return record
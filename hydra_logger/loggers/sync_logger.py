@@ -9,6 +9,10 @@ Depends On:
  - typing
 Notes:
  - Implements logger orchestration and routing for sync logger.
+ - `log_batch` / `emit_records` hand each same-layer run of records to
+   handlers through `emit_batch`.
+ - Destinations with `isolated=True` are wrapped in `IsolatedHandler`, so each
+   gets its own queue and worker; their stats appear under `destinations`.
 """
 
 # pyright: reportAttributeAccessIssue=false, reportOptionalMemberAccess=false
@@ -16,12 +20,14 @@ Notes:
 
 import sys
 import threading
-from typing import Any, Dict, Literal, Optional, Union, cast
+from itertools import groupby
+from typing import Any, Dict, List, Literal, Optional, Sequence, Union, cast
 
-from ..config.models import LogDestination, LoggingConfig
+from ..config.models import LogDestination, LoggingConfig, LogLayer
 from ..core.exceptions import HydraLoggerError
 from ..handlers.base_handler import BaseHandler
 from ..handlers.console_handler import SyncConsoleHandler
+from ..handlers.isolated_handler import IsolatedHandler
 from ..handlers.null_handler import NullHandler
 from ..types.levels import LogLevel, LogLevelManager
 from ..types.records import LogRecord
@@ -136,10 +142,14 @@ class SyncLogger(BaseLogger):
         # Shared hot-path pipeline services
         self._record_builder = RecordBuilder(self)
         self._extension_processor = ExtensionProcessor(self)
+        self._handler_dispatcher = HandlerDispatcher()
         self._layer_router = LayerRouter(
-            self._layers, self._layer_handlers, self._handler_cache, self._layer_cache
+            self._layers,
+            self._layer_handlers,
+            self._handler_cache,
+            self._layer_cache,
+            dispatcher=self._handler_dispatcher,
         )
-        self._handler_dispatcher = HandlerDispatcher()
 
     def _setup_from_config(self, config: Union[LoggingConfig, Dict[str, Any]]):
         """Setup logger from configuration."""
@@ -294,6 +304,44 @@ class SyncLogger(BaseLogger):
                     self._layer_handlers[layer_name].append(handler)
                     self._handlers[id(handler)] = handler
 
+        self._layer_router.invalidate()
+
+    def add_layer(self, name: str, layer: LogLayer) -> None:
+        """Add or replace a layer at runtime and rebuild emit plans."""
+        handlers = []
+        for destination in layer.destinations:
+            handler = self._create_handler_from_destination(destination)
+            if handler:
+                handlers.append(handler)
+        with self._lock:
+            previous = self._layer_handlers.get(name, [])
+            self._layers[name] = layer
+            self._layer_handlers[name] = handlers
+            for handler in previous:
+                self._handlers.pop(id(handler), None)
+            for handler in handlers:
+                self._handlers[id(handler)] = handler
+            self._layer_router.invalidate()
+        self._close_detached_handlers(previous)
+
+    def remove_layer(self, name: str) -> None:
+        """Remove a runtime layer and rebuild emit plans."""
+        with self._lock:
+            self._layers.pop(name, None)
+            previous = self._layer_handlers.pop(name, [])
+            for handler in previous:
+                self._handlers.pop(id(handler), None)
+            self._layer_router.invalidate()
+        self._close_detached_handlers(previous)
+
+    def _close_detached_handlers(self, handlers: list) -> None:
+        """Close handlers detached by layer replacement or removal."""
+        for handler in handlers:
+            try:
+                handler.close()
+            except Exception as error:
+                self._report_lifecycle_failure("detached_handler_close", error)
+
     def _create_handler_from_destination(
         self, destination: LogDestination
     ) -> BaseHandler:
@@ -306,6 +354,8 @@ class SyncLogger(BaseLogger):
             handler = SyncConsoleHandler(
                 stream=sys.stdout,
                 use_colors=destination.use_colors,  # Use the actual value from destination
+                background_flush=destination.background_flush,
+                max_buffer_age=destination.max_buffer_age,
             )
             # Set formatter for console
             use_colors = destination.use_colors  # Use the actual value from destination
@@ -335,6 +385,9 @@ class SyncLogger(BaseLogger):
                 encoding="utf-8",
                 buffer_size=50000,  # Large buffer for performance
                 flush_interval=5.0,  # Less frequent flushes
+                background_flush=destination.background_flush,
+                max_buffer_age=destination.max_buffer_age,
+                durability=destination.durability,
             )
             # Set formatter for file
             formatter = self._create_formatter_for_destination(
@@ -367,6 +420,13 @@ class SyncLogger(BaseLogger):
             handler = NullHandler()
             self._report_unsupported_destination(destination)
 
+        if destination.isolated and not isinstance(handler, NullHandler):
+            handler = IsolatedHandler(
+                handler,
+                max_queue_size=destination.isolation_queue_size,
+                overflow_policy=destination.isolation_overflow_policy,
+                latency_budget=destination.isolation_latency_budget,
+            )
         return handler
 
     def _create_network_handler_from_destination(
@@ -513,18 +573,21 @@ class SyncLogger(BaseLogger):
             "critical": self._standard_log,
         }
 
-    def log(self, level: Union[str, int], message: str, **kwargs) -> None:
-        """Log method with minimal overhead."""
+    def log(self, level: Union[str, int], message: str, *args: Any, **kwargs) -> None:
+        """Log method with minimal overhead; `args` are interpolated lazily."""
         # Fast path checks (minimal overhead)
         if not self._initialized or self._closed:
             return
 
         try:
+            layer_name = kwargs.get("layer", "default")
+            level = self._record_builder.precheck(
+                level, layer_name, self._layer_router, self._default_level_name()
+            )
+            if level is None:
+                return
 
-            if isinstance(level, str):
-                level = self._record_builder.normalize_level(level)
-
-            record = self._record_builder.create(level, message, **kwargs)
+            record = self._record_builder.create(level, message, *args, **kwargs)
             record = self._extension_processor.apply_data_protection(
                 record, self._data_protection
             )
@@ -534,18 +597,71 @@ class SyncLogger(BaseLogger):
                 self._data_protection,
             )
 
-            layer_name = kwargs.get("layer", "default")
-            if not self._is_level_enabled_for_layer(layer_name, int(level)):
-                return
-
-            layer_handlers = self._get_handlers_for_layer(layer_name)
-            self._handler_dispatcher.dispatch_sync(record, layer_handlers)
+            self._handler_dispatcher.run_sync_plan(
+                record, self._layer_router.sync_plan(layer_name, level)
+            )
 
             # Record processing completed
 
         except Exception as error:
             self._handle_internal_failure("log", error)
 
+    def emit_record(self, record: LogRecord) -> None:
+        """Dispatch an already-built record to its layer's handlers."""
+        if not self._initialized or self._closed:
+            return
+        try:
+            layer_name = record.layer or "default"
+            self._handler_dispatcher.run_sync_plan(
+                record, self._layer_router.sync_plan(layer_name, record.level)
+            )
+        except Exception as error:
+            self._handle_internal_failure("emit_record", error)
+
+    def log_batch(self, records: List[LogRecord]) -> None:
+        """Filter and extend `records`, then emit them in per-layer batches."""
+        if not self._initialized or self._closed or not records:
+            return
+        ready = []
+        for record in records:
+            try:
+                level = self._record_builder.precheck(
+                    record.level,
+                    record.layer or "default",
+                    self._layer_router,
+                    self._default_level_name(),
+                )
+                if level is None:
+                    continue
+                record = self._extension_processor.apply_data_protection(
+                    record, self._data_protection
+                )
+                ready.append(
+                    self._extension_processor.apply_non_data_protection_extensions(
+                        record,
+                        self._extension_manager,
+                        self._data_protection,
+                    )
+                )
+            except Exception as error:
+                self._handle_internal_failure("log_batch", error)
+        self.emit_records(ready)
+
+    def emit_records(self, records: Sequence[LogRecord]) -> None:
+        """Dispatch already-built records, one handler batch per same-layer run."""
+        if not self._initialized or self._closed or not records:
+            return
+        try:
+            router = self._layer_router
+            for layer_name, group in groupby(
+                records, key=lambda record: record.layer or "default"
+            ):
+                self._handler_dispatcher.dispatch_batch_sync(
+                    list(group), router.handlers_for_layer(layer_name)
+                )
+        except Exception as error:
+            self._handle_internal_failure("emit_records", error)
+
     def _emit_to_handlers(self, record: LogRecord):
         """Emit record to appropriate handlers."""
         # Get layer from record or use default (optimized)
@@ -575,52 +691,74 @@ class SyncLogger(BaseLogger):
         default_level = self._config.default_level if self._config else "INFO"
         return self._layer_router.is_level_enabled(layer_name, level, default_level)
 
-    def _standard_log(self, level: str, message: str, **kwargs) -> None:
+    def _default_level_name(self) -> str:
+        """Return configured default level name used for unknown layers."""
+        return self._config.default_level if self._config else "INFO"
+
+    def is_enabled_for(self, level: Union[str, int], layer: str = "default") -> bool:
+        """Check whether `level` would be emitted for `layer`.
+
+        Lets callers skip building expensive messages for filtered levels.
+        """
+        if not self._initialized or self._closed:
+            return False
+        try:
+            return (
+                self._record_builder.precheck(
+                    level, layer, self._layer_router, self._default_level_name()
+                )
+                is not None
+            )
+        except Exception as error:
+            self._handle_internal_failure("is_enabled_for", error)
+            return False
+
+    def _standard_log(self, level: str, message: str, *args: Any, **kwargs) -> None:
         """Standard logging path with full features."""
-        self.log(level, message, **kwargs)
+        self.log(level, message, *args, **kwargs)
 
-    def debug(self, message: str, **kwargs) -> None:
+    def debug(self, message: str, *args: Any, **kwargs) -> None:
         """Log a debug message."""
         if self._log_methods and "debug" in self._log_methods:
-            self._log_methods["debug"]("DEBUG", message, **kwargs)
+            self._log_methods["debug"]("DEBUG", message, *args, **kwargs)
         else:
-            self.log(LogLevel.DEBUG, message, **kwargs)
+            self.log(LogLevel.DEBUG, message, *args, **kwargs)
 
-    def info(self, message: str, **kwargs) -> None:
+    def info(self, message: str, *args: Any, **kwargs) -> None:
         """Log an info message."""
         if self._log_methods and "info" in self._log_methods:
-            self._log_methods["info"]("INFO", message, **kwargs)
+            self._log_methods["info"]("INFO", message, *args, **kwargs)
         else:
-            self.log(LogLevel.INFO, message, **kwargs)
+            self.log(LogLevel.INFO, message, *args, **kwargs)
 
-    def warning(self, message: str, **kwargs) -> None:
+    def warning(self, message: str, *args: Any, **kwargs) -> None:
         """Log a warning message."""
         if self._log_methods and "warning" in self._log_methods:
-            self._log_methods["warning"]("WARNING", message, **kwargs)
+            self._log_methods["warning"]("WARNING", message, *args, **kwargs)
         else:
-            self.log(LogLevel.WARNING, message, **kwargs)
+            self.log(LogLevel.WARNING, message, *args, **kwargs)
 
-    def error(self, message: str, **kwargs) -> None:
+    def error(self, message: str, *args: Any, **kwargs) -> None:
         """Log an error message."""
         if self._log_methods and "error" in self._log_methods:
-            self._log_methods["error"]("ERROR", message, **kwargs)
+            self._log_methods["error"]("ERROR", message, *args, **kwargs)
         else:
-            self.log(LogLevel.ERROR, message, **kwargs)
+            self.log(LogLevel.ERROR, message, *args, **kwargs)
 
-    def critical(self, message: str, **kwargs) -> None:
+    def critical(self, message: str, *args: Any, **kwargs) -> None:
         """Log a critical message."""
         if self._log_methods and "critical" in self._log_methods:
-            self._log_methods["critical"]("CRITICAL", message, **kwargs)
+            self._log_methods["critical"]("CRITICAL", message, *args, **kwargs)
         else:
-            self.log(LogLevel.CRITICAL, message, **kwargs)
+            self.log(LogLevel.CRITICAL, message, *args, **kwargs)
 
-    def warn(self, message: str, **kwargs) -> None:
+    def warn(self, message: str, *args: Any, **kwargs) -> None:
         """Alias for warning (compatibility)."""
-        self.warning(message, **kwargs)
+        self.warning(message, *args, **kwargs)
 
-    def fatal(self, message: str, **kwargs) -> None:
+    def fatal(self, message: str, *args: Any, **kwargs) -> None:
         """Alias for critical (compatibility)."""
-        self.critical(message, **kwargs)
+        self.critical(message, *args, **kwargs)
 
     def _apply_security_processing(self, record: LogRecord) -> LogRecord:
         """Apply security processing to log record if security engine is available."""
@@ -653,6 +791,10 @@ class SyncLogger(BaseLogger):
         # Plugin system removed - simplified architecture
         pass
 
+    def _after_fork_child(self) -> None:
+        """Replace the mutation lock; a forking thread may have held it."""
+        self._lock = threading.RLock()
+
     def close(self):
         """Close the logger and cleanup resources."""
         if self._closed:
@@ -713,6 +855,15 @@ class SyncLogger(BaseLogger):
         if self._last_lifecycle_error is not None:
             health_status["last_lifecycle_error"] = self._last_lifecycle_error
 
+        destinations = {
+            f"{layer_name}[{index}]": handler.get_stats()
+            for layer_name, handlers in self._layer_handlers.items()
+            for index, handler in enumerate(handlers)
+            if isinstance(handler, IsolatedHandler)
+        }
+        if destinations:
+            health_status["destinations"] = destinations
+
         return health_status
 
     def update_security_level(self, level: str) -> None:
@@ -9,12 +9,14 @@ Notes:
 """
 
 from .context import (
+    AmbientContext,
     CallerInfo,
     ContextDetector,
     ContextManager,
     ContextType,
     LogContext,
     SystemInfo,
+    log_context,
 )
 
 # Metadata and Events modules removed - simplified architecture
@@ -55,17 +57,28 @@ from .levels import (
     get_level_name,
     is_valid_level,
 )
-from .records import LogRecord, LogRecordBatch
+from .records import (
+    BoundFields,
+    CompactLogRecord,
+    LazyMessage,
+    LogRecord,
+    LogRecordBatch,
+)
 
 # Handlers and Formatters types removed - simplified architecture
 
 __all__ = [
     # Core types
     "LogRecord",
+    "CompactLogRecord",
+    "LazyMessage",
+    "BoundFields",
     "LogRecordBatch",
     "LogLevel",
     "LogLevelManager",
     "LogContext",
+    "AmbientContext",
+    "log_context",
     # Enums
     "HandlerType",
     "FormatterType",
@@ -3,28 +3,43 @@ Role: Implements hydra_logger.types.context functionality for Hydra Logger.
 Used By:
  - Internal `hydra_logger` modules importing this component.
 Depends On:
+ - collections
+ - contextlib
  - contextvars
  - dataclasses
  - enum
- - inspect
+ - hydra_logger
  - os
+ - sys
  - threading
  - time
  - typing
 Notes:
  - Defines shared type contracts/constants for context.
+ - `log_context(...)` sets an immutable `AmbientContext` snapshot that
+   `RecordBuilder` copies onto records; one snapshot per context change.
+ - `ContextDetector` caches shared `CallerInfo` per call site `(f_code, f_lasti)` in an LRU.
 """
 
 import contextvars
 import logging
+import sys
 import threading
 import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, ClassVar, Dict, Optional
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, Iterator, Mapping, Optional
+
+from ..utils.fork_safety import register_fork_hook
+from .records import BoundFields
 
 _logger = logging.getLogger(__name__)
 
+_getframe = sys._getframe
+
 
 class ContextType(Enum):
     """Types of logging context."""
@@ -38,7 +53,7 @@ class ContextType(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+@dataclass(frozen=True)
 class CallerInfo:
     """Information about the calling code."""
 
@@ -51,6 +66,12 @@ class CallerInfo:
         return f"{self.filename}:{self.line_number} in {self.function_name}"
 
 
+_UNKNOWN_CALLER = CallerInfo(
+    filename="<unknown>", function_name="<unknown>", line_number=0
+)
+_ERROR_CALLER = CallerInfo(filename="<error>", function_name="<error>", line_number=0)
+
+
 @dataclass
 class SystemInfo:
     """System information for context."""
@@ -154,6 +175,87 @@ class LogContext:
         return (time.time() - self.last_accessed) < max_idle_seconds
 
 
+# Dedicated record fields populated from ambient context by `RecordBuilder`.
+AMBIENT_RECORD_FIELDS = ("request_id", "correlation_id", "user_id", "agent_id")
+
+
+class AmbientContext:
+    """Immutable snapshot of ambient log fields, built once per context change.
+
+    Dedicated record fields are pre-split into `record_fields` pairs; other keys
+    become a shared, frozen `context` mapping (`BoundFields`).
+    """
+
+    __slots__ = ("fields", "record_fields", "context")
+
+    def __init__(self, fields: Optional[Mapping[str, Any]] = None) -> None:
+        self.fields: Mapping[str, Any] = MappingProxyType(dict(fields or {}))
+        self.record_fields = tuple(
+            (name, self.fields[name])
+            for name in AMBIENT_RECORD_FIELDS
+            if self.fields.get(name) is not None
+        )
+        self.context = BoundFields(
+            (key, value)
+            for key, value in self.fields.items()
+            if key not in AMBIENT_RECORD_FIELDS
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.fields)
+
+    def merged(self, fields: Mapping[str, Any]) -> "AmbientContext":
+        """Return a new snapshot with `fields` layered on top (copy-on-write)."""
+        if not fields:
+            return self
+        combined = dict(self.fields)
+        combined.update(fields)
+        return AmbientContext(combined)
+
+    def __repr__(self) -> str:
+        return f"AmbientContext({dict(self.fields)!r})"
+
+
+EMPTY_AMBIENT_CONTEXT = AmbientContext()
+
+_ambient_var: contextvars.ContextVar[AmbientContext] = contextvars.ContextVar(
+    "hydra_logger_ambient_context", default=EMPTY_AMBIENT_CONTEXT
+)
+
+
+def current_ambient_context() -> AmbientContext:
+    """Return the ambient snapshot for the current thread/task."""
+    return _ambient_var.get()
+
+
+@contextmanager
+def log_context(**fields: Any) -> Iterator[AmbientContext]:
+    """Layer `fields` onto the ambient context for the enclosed block.
+
+    Backed by a ContextVar, so asyncio tasks created inside inherit a copy and
+    changes made inside a task never leak into siblings.
+    """
+    snapshot = _ambient_var.get().merged(fields)
+    token = _ambient_var.set(snapshot)
+    try:
+        yield snapshot
+    finally:
+        _ambient_var.reset(token)
+
+
+@contextmanager
+def use_ambient_context(snapshot: Optional[AmbientContext]) -> Iterator[None]:
+    """Re-enter a previously captured snapshot, e.g. in a queue worker."""
+    if snapshot is None:
+        yield
+        return
+    token = _ambient_var.set(snapshot)
+    try:
+        yield
+    finally:
+        _ambient_var.reset(token)
+
+
 class ContextManager:
     """Manages logging context throughout the system."""
 
@@ -184,6 +286,8 @@ class ContextManager:
         except RuntimeError:
             # Fall back to thread-local storage
             cls._thread_local.current_context = context
+        # Publish metadata as the ambient snapshot read by the record pipeline.
+        _ambient_var.set(AmbientContext(context.metadata))
 
     @classmethod
     def clear_current_context(cls) -> None:
@@ -195,6 +299,7 @@ class ContextManager:
             # Clear thread-local storage
             if hasattr(cls._thread_local, "current_context"):
                 delattr(cls._thread_local, "current_context")
+        _ambient_var.set(EMPTY_AMBIENT_CONTEXT)
 
     @classmethod
     def create_context(
@@ -223,72 +328,85 @@ class ContextManager:
 class ContextDetector:
     """Detects and extracts context information from the call stack."""
 
-    _cache: ClassVar[dict[str, CallerInfo]] = {}
+    # LRU keyed by call site `(f_code, f_lasti)`; values are shared CallerInfo.
+    _cache: ClassVar[OrderedDict[Any, CallerInfo]] = OrderedDict()
+    _cache_lock: ClassVar[threading.Lock] = threading.Lock()
     _cache_enabled = True
     _cache_size = 1000
+    _cache_hits = 0
+    _cache_misses = 0
+    _cache_evictions = 0
 
     @classmethod
     def get_caller_info(cls, depth: int = 2) -> CallerInfo:
         """Get information about the calling code."""
-        if not cls._cache_enabled:
+        if not cls._cache_enabled or depth < 1:
             return cls._get_caller_info_uncached(depth)
 
-        cache_key = f"{threading.get_ident()}:{depth}"
-        if cache_key in cls._cache:
-            return cls._cache[cache_key]
-
-        caller_info = cls._get_caller_info_uncached(depth)
-        cls._cache[cache_key] = caller_info
-
-        # Maintain cache size
-        if len(cls._cache) > cls._cache_size:
-            cls._clear_cache()
-
+        try:
+            # `depth` counts from `_get_caller_info_uncached`, one frame below.
+            frame = _getframe(depth - 1)
+            cache_key = (frame.f_code, frame.f_lasti)
+        except ValueError:
+            return _UNKNOWN_CALLER
+        except Exception:
+            _logger.exception("Caller info detection failed at depth=%s", depth)
+            return _ERROR_CALLER
+
+        with cls._cache_lock:
+            caller_info = cls._cache.get(cache_key)
+            if caller_info is not None:
+                cls._cache.move_to_end(cache_key)
+                cls._cache_hits += 1
+                return caller_info
+            cls._cache_misses += 1
+
+        caller_info = cls._describe_frame(frame, depth)
+        with cls._cache_lock:
+            # Another thread may have resolved the same call site meanwhile.
+            caller_info = cls._cache.setdefault(cache_key, caller_info)
+            cls._trim_cache(cls._cache_size)
         return caller_info
 
     @classmethod
     def _get_caller_info_uncached(cls, depth: int) -> CallerInfo:
         """Get caller info without caching."""
-        import inspect
-
         try:
-            frame = inspect.currentframe()
-            for _ in range(depth):
-                if frame is None:
-                    break
-                frame = frame.f_back
-
-            if frame is None:
-                return CallerInfo(
-                    filename="<unknown>", function_name="<unknown>", line_number=0
-                )
-
-            filename = frame.f_code.co_filename
-            function_name = frame.f_code.co_name
-            line_number = frame.f_lineno
-
-            # Extract module name if possible
-            module_name = None
-            if frame.f_globals and "__name__" in frame.f_globals:
-                module_name = frame.f_globals["__name__"]
+            frame = _getframe(depth)
+        except ValueError:
+            return _UNKNOWN_CALLER
+        except Exception:
+            _logger.exception("Caller info detection failed at depth=%s", depth)
+            return _ERROR_CALLER
+        return cls._describe_frame(frame, depth)
 
+    @staticmethod
+    def _describe_frame(frame: Any, depth: int) -> CallerInfo:
+        """Build CallerInfo for `frame`."""
+        try:
+            code = frame.f_code
             return CallerInfo(
-                filename=filename,
-                function_name=function_name,
-                line_number=line_number,
-                module_name=module_name,
+                filename=code.co_filename,
+                function_name=code.co_name,
+                line_number=frame.f_lineno,
+                module_name=(frame.f_globals or {}).get("__name__"),
             )
-
         except Exception:
             _logger.exception("Caller info detection failed at depth=%s", depth)
-            return CallerInfo(
-                filename="<error>", function_name="<error>", line_number=0
-            )
+            return _ERROR_CALLER
+
+    @classmethod
+    def _trim_cache(cls, size: int) -> None:
+        """Evict least recently used entries beyond `size` (lock held)."""
+        while len(cls._cache) > size:
+            cls._cache.popitem(last=False)
+            cls._cache_evictions += 1
 
     @classmethod
     def _clear_cache(cls) -> None:
         """Clear the caller info cache."""
-        cls._cache.clear()
+        with cls._cache_lock:
+            cls._cache.clear()
 
     @classmethod
     def disable_cache(cls) -> None:
@@ -303,10 +421,39 @@ class ContextDetector:
 
     @classmethod
     def set_cache_size(cls, size: int) -> None:
-        """Set the maximum cache size."""
-        cls._cache_size = size
-        if len(cls._cache) > size:
-            cls._clear_cache()
+        """Set the maximum cache size, evicting least recently used entries."""
+        with cls._cache_lock:
+            cls._cache_size = size
+            cls._trim_cache(size)
+
+    @classmethod
+    def get_cache_stats(cls) -> Dict[str, Any]:
+        """Get caller cache hit/miss/eviction counters."""
+        with cls._cache_lock:
+            return {
+                "enabled": cls._cache_enabled,
+                "size": len(cls._cache),
+                "max_size": cls._cache_size,
+                "hits": cls._cache_hits,
+                "misses": cls._cache_misses,
+                "evictions": cls._cache_evictions,
+            }
+
+    @classmethod
+    def reset_cache_stats(cls) -> None:
+        """Reset caller cache counters."""
+        with cls._cache_lock:
+            cls._cache_hits = 0
+            cls._cache_misses = 0
+            cls._cache_evictions = 0
+
+    @classmethod
+    def _after_fork_child(cls) -> None:
+        """Replace the cache lock; cached call sites stay valid in the child."""
+        cls._cache_lock = threading.Lock()
+
+
+register_fork_hook(ContextDetector._after_fork_child)
 
 
 # Convenience functions
@@ -346,6 +493,11 @@ __all__ = [
     "LogContext",
     "ContextManager",
     "ContextDetector",
+    "AmbientContext",
+    "AMBIENT_RECORD_FIELDS",
+    "current_ambient_context",
+    "log_context",
+    "use_ambient_context",
     "get_current_context",
     "set_current_context",
     "clear_current_context",
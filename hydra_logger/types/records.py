@@ -5,20 +5,40 @@ Used By:
 Depends On:
  - dataclasses
  - datetime
- - inspect
  - json
  - sys
  - time
  - typing
 Notes:
  - Defines shared type contracts/constants for records.
+ - `CompactLogRecord` is the slotted, validation-free record used by logger pipelines.
+ - `BoundFields` is the frozen `extra` mapping produced by `logger.bind()`.
+ - Lazy messages render once under `_RENDER_LOCK` with their deferred
+   transforms; a failed transform leaves `WITHHELD_MESSAGE`, never the raw text.
+ - Caller capture uses `sys._getframe` with per-code-object caches (no `f_locals`),
+   each an LRU bounded by `_CODE_CACHE_SIZE` so exec/eval/notebook code does not
+   accumulate.
 """
 
 import logging
+import sys
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 # import os  # unused
 
@@ -136,16 +156,413 @@ class LogRecord:
         return " ".join(parts)
 
 
+# =============================================================================
+# CALLER CAPTURE (code-object cached, no per-frame string work or f_locals)
+# =============================================================================
+
+_getframe = sys._getframe
+
+# Frames above `_capture_caller`: itself (0) and `create_with_auto_context` (1).
+_CAPTURE_BASE_DEPTH = 2
+_MAX_INTERNAL_FRAMES = 15
+
+# LRUs keyed by code object, each holding at most `_CODE_CACHE_SIZE` entries.
+_CODE_CACHE_SIZE = 1000
+_CODE_CACHE_LOCK = threading.Lock()
+# code object -> whether it belongs to the hydra_logger package
+_INTERNAL_CODE_CACHE: "OrderedDict[Any, bool]" = OrderedDict()
+# code object -> (file_name, qualified function name)
+_CODE_INFO_CACHE: "OrderedDict[Any, Tuple[Optional[str], str]]" = OrderedDict()
+# outermost internal (entry point) code object -> its depth below `_capture_caller`
+_ENTRY_DEPTHS: "OrderedDict[Any, int]" = OrderedDict()
+_CANDIDATE_DEPTHS: List[int] = []
+
+
+def _code_cache_get(cache: "OrderedDict[Any, Any]", code: Any) -> Any:
+    """Return the cached value for `code` (or None) and mark it recently used."""
+    value = cache.get(code)
+    if value is not None:
+        try:
+            cache.move_to_end(code)
+        except KeyError:
+            pass  # evicted by another thread meanwhile
+    return value
+
+
+def _code_cache_put(cache: "OrderedDict[Any, Any]", code: Any, value: Any) -> None:
+    """Store `value`, evicting least recently used entries beyond the bound."""
+    with _CODE_CACHE_LOCK:
+        cache[code] = value
+        while len(cache) > _CODE_CACHE_SIZE:
+            cache.popitem(last=False)
+
+
+def _is_internal_code(code: Any) -> bool:
+    """Return True for hydra_logger frames and frames without a filename."""
+    cached = _code_cache_get(_INTERNAL_CODE_CACHE, code)
+    if cached is not None:
+        return cached
+    full_filename = code.co_filename
+    if not full_filename:
+        internal = True
+    else:
+        # Skip only internal package frames, not repository root paths such as
+        # ".../hydra-logger/examples/...".
+        normalized = full_filename.replace("\\", "/").lower()
+        internal = "/hydra_logger/" in normalized or normalized.endswith(
+            "/hydra_logger"
+        )
+    _code_cache_put(_INTERNAL_CODE_CACHE, code, internal)
+    return internal
+
+
+def _describe_code(code: Any) -> Tuple[Optional[str], str]:
+    """Resolve (file_name, qualified function name) once per code object."""
+    info = _code_cache_get(_CODE_INFO_CACHE, code)
+    if info is None:
+        info = (
+            extract_filename(code.co_filename),
+            getattr(code, "co_qualname", None) or code.co_name,
+        )
+        _code_cache_put(_CODE_INFO_CACHE, code, info)
+    return info
+
+
+def _capture_caller() -> Optional[Tuple[Optional[str], str, int]]:
+    """Return (file_name, function_name, line_number) of the first user frame.
+
+    Fast path: jump with `sys._getframe(n)` to a depth learned for the entry
+    point's code object. Slow path (first call per entry point): walk outward
+    once with cached per-code classification and record that depth.
+    """
+    for depth in _CANDIDATE_DEPTHS:
+        try:
+            entry = _getframe(depth)
+        except ValueError:
+            continue
+        if _code_cache_get(_ENTRY_DEPTHS, entry.f_code) != depth:
+            continue
+        caller = entry.f_back
+        if caller is not None and not _is_internal_code(caller.f_code):
+            file_name, function_name = _describe_code(caller.f_code)
+            return file_name, function_name, caller.f_lineno
+
+    try:
+        frame = _getframe(_CAPTURE_BASE_DEPTH)
+    except ValueError:
+        # Called from the top of the stack; there is no caller to describe.
+        return None
+    depth = _CAPTURE_BASE_DEPTH
+    entry_code = None
+    entry_depth = 0
+    while frame is not None and depth < _CAPTURE_BASE_DEPTH + _MAX_INTERNAL_FRAMES:
+        try:
+            code = frame.f_code
+            if not _is_internal_code(code):
+                if entry_code is not None and entry_code not in _ENTRY_DEPTHS:
+                    _code_cache_put(_ENTRY_DEPTHS, entry_code, entry_depth)
+                    if entry_depth not in _CANDIDATE_DEPTHS:
+                        _CANDIDATE_DEPTHS.append(entry_depth)
+                file_name, function_name = _describe_code(code)
+                return file_name, function_name, frame.f_lineno
+            entry_code = code
+            entry_depth = depth
+        except AttributeError:
+            # Frame-like object without code information; skip it.
+            entry_code = None
+        frame = getattr(frame, "f_back", None)
+        depth += 1
+    return None
+
+
+class BoundFields(dict):
+    """Frozen `extra` mapping shared by bound loggers.
+
+    Values are treated as static, so formatters may cache an encoded fragment
+    per output style via `encoded()` instead of re-serializing every record.
+    """
+
+    __slots__ = ("_fragments",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._fragments: Dict[Any, str] = {}
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("BoundFields is immutable; use merged() instead")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (BoundFields, (dict(self),))
+
+    def merged(self, fields: Mapping[str, Any]) -> "BoundFields":
+        """Return new frozen fields with `fields` layered on top."""
+        if not fields:
+            return self
+        combined = dict(self)
+        combined.update(fields)
+        return BoundFields(combined)
+
+    def encoded(self, key: Any, encode: Callable[[Mapping[str, Any]], str]) -> str:
+        """Return `encode(self)`, computed once per `key`."""
+        fragment = self._fragments.get(key)
+        if fragment is None:
+            fragment = encode(self)
+            self._fragments[key] = fragment
+        return fragment
+
+
+def render_message(message: Any, args: Tuple[Any, ...] = ()) -> str:
+    """Render a deferred message: call zero-arg callables, then `%`-format args."""
+    if callable(message):
+        message = message()
+    if not args:
+        return message if isinstance(message, str) else str(message)
+    # stdlib-compatible: a single mapping argument feeds `%(name)s` templates
+    if len(args) == 1 and isinstance(args[0], Mapping) and args[0]:
+        args = args[0]  # type: ignore[assignment]
+    try:
+        return str(message) % args
+    except (TypeError, ValueError, KeyError):
+        _logger.exception("Deferred message formatting failed for message=%r", message)
+        return f"{message} {args!r}"
+
+
+class LazyMessage:
+    """Deferred message (template + args or zero-arg callable); renders once."""
+
+    __slots__ = ("_message", "_args", "_rendered")
+
+    def __init__(self, message: Any, args: Tuple[Any, ...] = ()) -> None:
+        self._message = message
+        self._args = args
+        self._rendered: Optional[str] = None
+
+    def __call__(self) -> str:
+        if self._rendered is None:
+            self._rendered = render_message(self._message, self._args)
+        return self._rendered
+
+    def __str__(self) -> str:
+        return self()
+
+    def __repr__(self) -> str:
+        return f"LazyMessage({self._message!r}, {self._args!r})"
+
+
+# `CompactLogRecord` fields stored as `_<name>` behind a property.
+_COMPACT_PROPERTY_FIELDS = frozenset({"message", "extra", "context"})
+
+# Serializes first renders of lazy messages (and their deferred transforms) so
+# records shared across handler threads never expose pre-transform text.
+_RENDER_LOCK = threading.RLock()
+
+# Stands in for a message whose redaction or deferred transform failed.
+WITHHELD_MESSAGE = "[message withheld: message transform failed]"
+
+
+class CompactLogRecord:
+    """
+    Slotted hot-path record exposing the same attributes and helpers as `LogRecord`.
+
+    No validation and no eager dict allocations: unset `extra`/`context` become
+    a fresh dict on first access. Pickles by field values, with the message
+    rendered.
+    A `LazyMessage` is rendered (and deferred transforms applied) on the first
+    `message` read, so records no handler formats are never interpolated.
+    """
+
+    FIELDS = (
+        "timestamp",
+        "level_name",
+        "layer",
+        "file_name",
+        "function_name",
+        "message",
+        "level",
+        "logger_name",
+        "line_number",
+        "filename",
+        "thread_id",
+        "process_id",
+        "agent_id",
+        "user_id",
+        "request_id",
+        "correlation_id",
+        "environment",
+        "event_id",
+        "device_id",
+        "extra",
+        "context",
+    )
+
+    # Properties over private slots; every other field is a plain slot.
+    __slots__ = tuple(
+        f"_{name}" if name in _COMPACT_PROPERTY_FIELDS else name for name in FIELDS
+    ) + ("_message_transforms",)
+
+    def __init__(
+        self,
+        timestamp: Optional[float] = None,
+        level_name: str = "INFO",
+        layer: str = "default",
+        file_name: Optional[str] = None,
+        function_name: Optional[str] = None,
+        message: str = "",
+        level: int = 20,
+        logger_name: str = "HydraLogger",
+        line_number: Optional[int] = None,
+        filename: Optional[str] = None,
+        thread_id: Optional[int] = None,
+        process_id: Optional[int] = None,
+        agent_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        request_id: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+        environment: Optional[str] = None,
+        event_id: Optional[str] = None,
+        device_id: Optional[str] = None,
+        extra: Optional[Mapping[str, Any]] = None,
+        context: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.level_name = level_name
+        self.layer = layer
+        self.file_name = file_name
+        self.function_name = function_name
+        self._message = message
+        self._message_transforms: Optional[List[Callable[[str], Any]]] = None
+        self.level = level
+        self.logger_name = logger_name
+        self.line_number = line_number
+        self.filename = filename
+        self.thread_id = thread_id
+        self.process_id = process_id
+        self.agent_id = agent_id
+        self.user_id = user_id
+        self.request_id = request_id
+        self.correlation_id = correlation_id
+        self.environment = environment
+        self.event_id = event_id
+        self.device_id = device_id
+        self._extra = extra
+        self._context = context
+
+    @property
+    def extra(self) -> Mapping[str, Any]:
+        """Extra fields; created as an empty dict on first access."""
+        extra = self._extra
+        if extra is None:
+            extra = self._extra = {}
+        return extra
+
+    @extra.setter
+    def extra(self, value: Optional[Mapping[str, Any]]) -> None:
+        self._extra = value
+
+    @property
+    def context(self) -> Mapping[str, Any]:
+        """Context fields; created as an empty dict on first access."""
+        context = self._context
+        if context is None:
+            context = self._context = {}
+        return context
+
+    @context.setter
+    def context(self, value: Optional[Mapping[str, Any]]) -> None:
+        self._context = value
+
+    @property
+    def message(self) -> str:
+        """Rendered message; renders a pending `LazyMessage` exactly once.
+
+        If a deferred transform raises, the message becomes `WITHHELD_MESSAGE`
+        and the error propagates to this first reader.
+        """
+        message = self._message
+        if type(message) is not LazyMessage:
+            return message
+        with _RENDER_LOCK:
+            message = self._message
+            if type(message) is not LazyMessage:
+                return message
+            transforms = self._message_transforms
+            self._message_transforms = None
+            try:
+                text = message()
+                for transform in transforms or ():
+                    text = transform(text)
+            except BaseException:
+                self._message = WITHHELD_MESSAGE
+                raise
+            self._message = text
+            return text
+
+    @message.setter
+    def message(self, value: Any) -> None:
+        if type(self._message) is not LazyMessage:
+            self._message = value
+            return
+        with _RENDER_LOCK:
+            self._message = value
+            self._message_transforms = None
+
+    def defer_message_transform(self, transform: Callable[[str], Any]) -> bool:
+        """Queue `transform` for the rendered message; False if already rendered."""
+        with _RENDER_LOCK:
+            if type(self._message) is not LazyMessage:
+                return False
+            if self._message_transforms is None:
+                self._message_transforms = []
+            self._message_transforms.append(transform)
+            return True
+
+    iso_timestamp = LogRecord.iso_timestamp
+    to_dict = LogRecord.to_dict
+    to_json = LogRecord.to_json
+    __str__ = LogRecord.__str__
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (CompactLogRecord, LogRecord)):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.FIELDS)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (CompactLogRecord, tuple(getattr(self, name) for name in self.FIELDS))
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactLogRecord(level_name={self.level_name!r}, "
+            f"layer={self.layer!r}, message={self.message!r})"
+        )
+
+
 # Factory for creating LogRecords with different performance profiles
 class LogRecordFactory:
     """Factory for creating LogRecords with different performance profiles."""
 
+    @staticmethod
+    def _resolve_extra(record_cls: Optional[Type[Any]], kwargs: Dict[str, Any]) -> Any:
+        """Return `extra` for the target record type without needless dicts."""
+        extra = kwargs.get("extra")
+        if extra is None and (record_cls is None or record_cls is LogRecord):
+            return {}
+        return extra
+
     @staticmethod
     def create_minimal(
-        level_name: str, message: str, layer: str = "default", **kwargs
+        level_name: str,
+        message: str,
+        layer: str = "default",
+        record_cls: Optional[Type[Any]] = None,
+        **kwargs,
     ) -> LogRecord:
         """Create minimal record for performance."""
-        return LogRecord(
+        return (record_cls or LogRecord)(
             timestamp=kwargs.get("timestamp", time.time()),
             level_name=level_name,
             layer=layer,
@@ -155,7 +572,7 @@ class LogRecordFactory:
             level=kwargs.get("level", 20),
             logger_name=kwargs.get("logger_name", "HydraLogger"),
             line_number=kwargs.get("line_number"),
-            extra=kwargs.get("extra", {}),
+            extra=LogRecordFactory._resolve_extra(record_cls, kwargs),
         )
 
     @staticmethod
@@ -166,6 +583,7 @@ class LogRecordFactory:
         file_name: Optional[str] = None,
         function_name: Optional[str] = None,
         line_number: Optional[int] = None,
+        record_cls: Optional[Type[Any]] = None,
         **kwargs,
     ) -> LogRecord:
         """Create record with context - balanced performance."""
@@ -173,7 +591,7 @@ class LogRecordFactory:
         if file_name:
             file_name = extract_filename(file_name)
 
-        return LogRecord(
+        return (record_cls or LogRecord)(
             timestamp=kwargs.get("timestamp", time.time()),
             level_name=level_name,
             layer=layer,
@@ -183,80 +601,33 @@ class LogRecordFactory:
             level=kwargs.get("level", 20),
             logger_name=kwargs.get("logger_name", "HydraLogger"),
             line_number=line_number,
-            extra=kwargs.get("extra", {}),
+            extra=LogRecordFactory._resolve_extra(record_cls, kwargs),
         )
 
     @staticmethod
     def create_with_auto_context(
-        level_name: str, message: str, layer: str = "default", **kwargs
+        level_name: str,
+        message: str,
+        layer: str = "default",
+        record_cls: Optional[Type[Any]] = None,
+        **kwargs,
     ) -> LogRecord:
-        """Create record with auto-detected context - slower but convenient."""
+        """Create record with auto-detected caller context (cached per code object)."""
         file_name = None
         function_name = None
         line_number = None
 
         try:
-            import inspect
-
-            frame = inspect.currentframe()
-            if not frame:
-                frame = None
-
-            # Start by skipping this method (create_with_auto_context)
-            if frame:
-                frame = frame.f_back
-
-            # Skip hydra-logger internal frames
-            # Stack typically: user_code -> logger.info -> logger.log ->
-            # create_log_record -> RecordCreationStrategy._create_with_auto_context ->
-            # create_with_auto_context
-            max_skips = 15  # Increased safety limit
-            skips = 0
-
-            while frame and skips < max_skips:
-                try:
-                    full_filename = frame.f_code.co_filename
-
-                    # FIX: Handle case where full_filename might be None or empty
-                    if not full_filename:
-                        frame = frame.f_back
-                        skips += 1
-                        continue
-
-                    # Skip only internal package frames, not repository root paths.
-                    # Example user code path may include ".../hydra-logger/..." and
-                    # must NOT be filtered out.
-                    normalized = full_filename.replace("\\", "/").lower()
-                    if "/hydra_logger/" in normalized or normalized.endswith(
-                        "/hydra_logger"
-                    ):
-                        # Still in hydra-logger, skip this frame
-                        frame = frame.f_back
-                        skips += 1
-                        continue
-                    else:
-                        # Found user's code!
-                        file_name = extract_filename(full_filename)
-                        line_number = frame.f_lineno
-                        function_name = LogRecordFactory._get_enhanced_function_name(
-                            frame
-                        )
-                        break
-                except (AttributeError, KeyError):
-                    # Frame might not have expected attributes, skip it
-                    frame = frame.f_back if frame is not None else None
-                    skips += 1
-                    continue
-
+            caller = _capture_caller()
+            if caller is not None:
+                file_name, function_name, line_number = caller
         except Exception:
-            # FIX: Log error instead of silently failing - helps debug frame inspection issues
-            # Silent failure - context is optional, but we should at least know if
-            # there's a problem
+            # Context is optional; log so frame-capture regressions stay visible.
             _logger.exception(
                 "Auto-context extraction failed; proceeding without caller info"
             )
 
-        return LogRecord(
+        return (record_cls or LogRecord)(
             timestamp=kwargs.get("timestamp", time.time()),
             level_name=level_name,
             layer=layer,
@@ -266,9 +637,18 @@ class LogRecordFactory:
             level=kwargs.get("level", 20),
             logger_name=kwargs.get("logger_name", "HydraLogger"),
             line_number=line_number,
-            extra=kwargs.get("extra", {}),
+            extra=LogRecordFactory._resolve_extra(record_cls, kwargs),
         )
 
+    @staticmethod
+    def clear_caller_cache() -> None:
+        """Drop cached code-object and entry-depth caller resolution state."""
+        with _CODE_CACHE_LOCK:
+            _INTERNAL_CODE_CACHE.clear()
+            _CODE_INFO_CACHE.clear()
+            _ENTRY_DEPTHS.clear()
+            _CANDIDATE_DEPTHS.clear()
+
     @staticmethod
     def _get_enhanced_function_name(frame) -> str:
         """
@@ -365,14 +745,16 @@ class RecordCreationStrategy:
     CONTEXT = "context"  # Balanced performance with context
     AUTO_CONTEXT = "auto_context"  # Convenience with auto-detected context
 
-    def __init__(self, strategy: str = MINIMAL):
+    def __init__(self, strategy: str = MINIMAL, record_cls: Optional[Type[Any]] = None):
         """
         Initialize the record creation strategy.
 
         Args:
             strategy: Creation strategy (minimal, context, auto_context)
+            record_cls: Record type to build (defaults to `LogRecord`)
         """
         self.strategy = strategy
+        self.record_cls = record_cls
         self._level_cache = {
             "DEBUG": 10,
             "INFO": 20,
@@ -413,12 +795,9 @@ class RecordCreationStrategy:
             level_name = str(level).upper()
             level_int = cast(int, self._level_cache.get(level_name, 20))
 
-        # Extract common fields
-        layer = kwargs.get("layer", "default")
-
-        # Remove layer from kwargs to avoid duplicate argument
-        kwargs_clean = kwargs.copy()
-        kwargs_clean.pop("layer", None)
+        # `**kwargs` is already a private dict, so pop layer in place (no copy)
+        layer = kwargs.pop("layer", "default")
+        kwargs_clean = kwargs
 
         # Choose creation method based on strategy
         if self.strategy == self.MINIMAL:
@@ -455,7 +834,11 @@ class RecordCreationStrategy:
             {"level": level_int, "logger_name": logger_name, "timestamp": time.time()}
         )
         return LogRecordFactory.create_minimal(
-            level_name=level_name, message=message, layer=layer, **kwargs
+            level_name=level_name,
+            message=message,
+            layer=layer,
+            record_cls=self.record_cls,
+            **kwargs,
         )
 
     def _create_with_context(
@@ -485,6 +868,7 @@ class RecordCreationStrategy:
             file_name=file_name,
             function_name=function_name,
             line_number=line_number,
+            record_cls=self.record_cls,
             **kwargs,
         )
 
@@ -504,7 +888,11 @@ class RecordCreationStrategy:
             {"level": level_int, "logger_name": logger_name, "timestamp": time.time()}
         )
         return LogRecordFactory.create_with_auto_context(
-            level_name=level_name, message=message, layer=layer, **kwargs
+            level_name=level_name,
+            message=message,
+            layer=layer,
+            record_cls=self.record_cls,
+            **kwargs,
         )
 
 
@@ -517,27 +905,37 @@ MINIMAL_STRATEGY = RecordCreationStrategy(RecordCreationStrategy.MINIMAL)
 CONTEXT_STRATEGY = RecordCreationStrategy(RecordCreationStrategy.CONTEXT)
 AUTO_CONTEXT_STRATEGY = RecordCreationStrategy(RecordCreationStrategy.AUTO_CONTEXT)
 
+# Compact (slotted) variants used by logger pipelines
+COMPACT_MINIMAL_STRATEGY = RecordCreationStrategy(
+    RecordCreationStrategy.MINIMAL, record_cls=CompactLogRecord
+)
+COMPACT_CONTEXT_STRATEGY = RecordCreationStrategy(
+    RecordCreationStrategy.CONTEXT, record_cls=CompactLogRecord
+)
+COMPACT_AUTO_CONTEXT_STRATEGY = RecordCreationStrategy(
+    RecordCreationStrategy.AUTO_CONTEXT, record_cls=CompactLogRecord
+)
+
 
 def get_record_creation_strategy(
-    performance_profile: str = "minimal",
+    performance_profile: str = "minimal", compact: bool = False
 ) -> RecordCreationStrategy:
     """
     Get a record creation strategy based on performance profile.
 
     Args:
         performance_profile: Performance profile (minimal, balanced, convenient)
+        compact: Build `CompactLogRecord` instead of `LogRecord`
 
     Returns:
         RecordCreationStrategy instance
     """
-    if performance_profile == "minimal":
-        return MINIMAL_STRATEGY
-    elif performance_profile == "balanced":
-        return CONTEXT_STRATEGY
+    if performance_profile == "balanced":
+        return COMPACT_CONTEXT_STRATEGY if compact else CONTEXT_STRATEGY
     elif performance_profile == "convenient":
-        return AUTO_CONTEXT_STRATEGY
+        return COMPACT_AUTO_CONTEXT_STRATEGY if compact else AUTO_CONTEXT_STRATEGY
     else:
-        return MINIMAL_STRATEGY
+        return COMPACT_MINIMAL_STRATEGY if compact else MINIMAL_STRATEGY
 
 
 def create_log_record(
@@ -0,0 +1,189 @@
+"""
+Role: Long-lived O_APPEND file descriptor with reopen-on-change detection.
+Used By:
+ - `hydra_logger.handlers.file_handler` (`AsyncFileHandler` batch writes).
+Depends On:
+ - os
+ - threading
+ - time
+Notes:
+ - The file is opened once and kept open; batches become one `os.write` each,
+   with no open/close/makedirs per batch.
+ - Every `check_interval` seconds the path is stat'ed. A different inode or a
+   missing path (external logrotate) triggers a reopen; a size below what was
+   already written is counted as a truncation (copytruncate). O_APPEND keeps
+   writing at the new end either way.
+ - A failed write closes the descriptor, reopens once, and retries only the
+   bytes not yet written.
+ - `truncate=True` truncates only on the first open, never on reopen.
+ - `datasync()` syncs a duplicate of the descriptor outside the lock, so
+   writers are not held up behind a slow `fdatasync`.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple, cast
+
+from .durability import fdatasync
+
+_OPEN_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+
+
+class AppendOnlyFile:
+    """Append-mode descriptor that survives rotation and transient errors."""
+
+    def __init__(
+        self,
+        path: str,
+        truncate: bool = False,
+        check_interval: float = 1.0,
+        permissions: int = 0o644,
+    ) -> None:
+        self._path = path
+        self._truncate = truncate
+        self._check_interval = max(0.0, float(check_interval))
+        self._permissions = permissions
+        self._lock = threading.Lock()
+        self._fd: Optional[int] = None
+        self._identity: Optional[Tuple[int, int]] = None
+        self._size_floor = 0
+        self._next_check = 0.0
+        self._opens = 0
+        self._reopens = 0
+        self._inode_changes = 0
+        self._truncations = 0
+        self._write_errors = 0
+        self._bytes_written = 0
+
+    @property
+    def path(self) -> str:
+        """Path the descriptor is (re)opened from."""
+        return self._path
+
+    @property
+    def is_open(self) -> bool:
+        """True while a descriptor is held."""
+        return self._fd is not None
+
+    def _open(self) -> int:
+        """Open under `self._lock`, creating parent directories once."""
+        directory = os.path.dirname(self._path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        flags = _OPEN_FLAGS
+        if self._truncate and self._opens == 0:
+            flags |= os.O_TRUNC
+        fd = os.open(self._path, flags, self._permissions)
+        stat = os.fstat(fd)
+        self._fd = fd
+        self._identity = (stat.st_dev, stat.st_ino)
+        self._size_floor = stat.st_size
+        self._next_check = time.monotonic() + self._check_interval
+        self._opens += 1
+        return fd
+
+    def _close_fd(self) -> None:
+        fd, self._fd = self._fd, None
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def _check_path(self, now: float) -> None:
+        """Reopen when the path now names another inode or was removed."""
+        self._next_check = now + self._check_interval
+        try:
+            stat = os.stat(self._path)
+        except FileNotFoundError:
+            self._inode_changes += 1
+            self._reopen_locked()
+            return
+        if (stat.st_dev, stat.st_ino) != self._identity:
+            self._inode_changes += 1
+            self._reopen_locked()
+        elif stat.st_size < self._size_floor:
+            self._truncations += 1
+            self._size_floor = stat.st_size
+        else:
+            self._size_floor = stat.st_size
+
+    def _reopen_locked(self) -> None:
+        self._close_fd()
+        self._reopens += 1
+        self._open()
+
+    def _write_all(self, fd: int, view: memoryview) -> Tuple[int, Optional[OSError]]:
+        """Write `view` until done or an error; returns bytes written and it."""
+        written = 0
+        while written < len(view):
+            try:
+                written += os.write(fd, view[written:])
+            except OSError as error:
+                return written, error
+        return written, None
+
+    def write(self, data: bytes) -> int:
+        """Append `data`; returns the number of bytes written."""
+        if not data:
+            return 0
+        with self._lock:
+            fd = self._fd
+            if fd is None:
+                fd = self._open()
+            elif self._check_interval == 0.0 or time.monotonic() >= self._next_check:
+                self._check_path(time.monotonic())
+                fd = self._fd
+            view = memoryview(data)
+            written, error = self._write_all(fd, view)
+            if error is not None:
+                # Retry only the unwritten tail so a partial write is not doubled.
+                self._write_errors += 1
+                self._reopen_locked()
+                _, error = self._write_all(cast(int, self._fd), view[written:])
+                if error is not None:
+                    raise error
+            self._size_floor += len(data)
+            self._bytes_written += len(data)
+        return len(data)
+
+    def datasync(self) -> None:
+        """`fdatasync` the open descriptor; a no-op while closed."""
+        with self._lock:
+            if self._fd is None:
+                return
+            fd = os.dup(self._fd)
+        try:
+            fdatasync(fd)
+        finally:
+            os.close(fd)
+
+    def reopen(self) -> None:
+        """Close now; the next write opens the path again (after rotation)."""
+        with self._lock:
+            if self._fd is not None:
+                self._close_fd()
+                self._reopens += 1
+
+    def close(self) -> None:
+        """Release the descriptor; a later write reopens it."""
+        with self._lock:
+            self._close_fd()
+
+    def detach_after_fork(self) -> None:
+        """Drop the inherited descriptor in a child without touching the file."""
+        self._lock = threading.Lock()
+        self._close_fd()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a point-in-time copy of descriptor counters."""
+        return {
+            "open": self._fd is not None,
+            "opens": self._opens,
+            "reopens": self._reopens,
+            "inode_changes": self._inode_changes,
+            "truncations": self._truncations,
+            "write_errors": self._write_errors,
+            "bytes_written": self._bytes_written,
+        }
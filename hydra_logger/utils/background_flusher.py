@@ -0,0 +1,117 @@
+"""
+Role: Shared background thread that bounds how long sync handlers buffer lines.
+Used By:
+ - `hydra_logger.handlers.file_handler` (`SyncFileHandler`).
+ - `hydra_logger.handlers.console_handler` (`SyncConsoleHandler`).
+Depends On:
+ - threading
+ - weakref
+Notes:
+ - Handlers opt in with `background_flush=True` (or a `max_buffer_age`) and are
+   tracked weakly. Each exposes `_flush_if_stale()`, which flushes when its
+   `flush_interval` or oldest-line age is exceeded and returns the seconds until
+   it next needs a look (0 right after flushing, `inf` while its buffer is
+   empty).
+ - The thread sleeps until the earliest deadline. Handlers wake it only when
+   their buffer goes from empty to non-empty, so a quiet service still writes
+   its last lines within the bound, and a busy one pays one notify per cycle.
+ - Forked children start their own thread lazily on the next wake-up.
+"""
+
+import logging
+import math
+import threading
+import weakref
+from typing import Any, Optional
+
+from .fork_safety import register_fork_hook
+
+_logger = logging.getLogger(__name__)
+
+
+class BackgroundFlusher:
+    """One daemon thread enforcing flush deadlines for registered handlers."""
+
+    def __init__(self) -> None:
+        self._handlers: "weakref.WeakSet[Any]" = weakref.WeakSet()
+        self._reset_thread_state()
+
+    def _reset_thread_state(self) -> None:
+        self._cond = threading.Condition(threading.Lock())
+        self._thread: Optional[threading.Thread] = None
+        self._woken = False
+        self._flushes = 0
+        self._errors = 0
+
+    def register(self, handler: Any) -> None:
+        """Track `handler` (weakly) until it is unregistered or collected."""
+        with self._cond:
+            self._handlers.add(handler)
+
+    def unregister(self, handler: Any) -> None:
+        """Stop tracking `handler`."""
+        with self._cond:
+            self._handlers.discard(handler)
+
+    def wake(self) -> None:
+        """Recompute deadlines now; starts the thread on first use."""
+        with self._cond:
+            self._woken = True
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="hydra-logger-flusher", daemon=True
+                )
+                self._thread.start()
+            else:
+                self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                handlers = list(self._handlers)
+            delay = math.inf
+            for handler in handlers:
+                try:
+                    remaining = handler._flush_if_stale()
+                except Exception:
+                    self._errors += 1
+                    _logger.exception(
+                        "Background flush failed for handler type=%s",
+                        type(handler).__name__,
+                    )
+                    continue
+                if remaining <= 0.0:
+                    self._flushes += 1
+                elif remaining < delay:
+                    delay = remaining
+            del handlers
+            with self._cond:
+                if not self._woken:
+                    self._cond.wait(None if math.isinf(delay) else delay)
+                self._woken = False
+
+    def stats(self) -> dict:
+        """Return a point-in-time copy of flusher counters."""
+        thread = self._thread
+        return {
+            "alive": thread is not None and thread.is_alive(),
+            "handlers": len(self._handlers),
+            "flushes": self._flushes,
+            "errors": self._errors,
+        }
+
+
+_flusher = BackgroundFlusher()
+
+
+def get_background_flusher() -> BackgroundFlusher:
+    """Return the process-wide flusher."""
+    return _flusher
+
+
+def _reset_after_fork() -> None:
+    """The parent's thread does not exist in the child; restart it lazily."""
+    _flusher._reset_thread_state()
+
+
+register_fork_hook(_reset_after_fork)
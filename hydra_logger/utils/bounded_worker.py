@@ -0,0 +1,182 @@
+"""
+Role: Bounded payload buffer drained in batches by one lazily started daemon thread.
+Used By:
+ - `hydra_logger.loggers.pipeline.offload_thread` (`OffloadThread`).
+ - `hydra_logger.handlers.isolated_handler` (`IsolatedHandler`).
+Depends On:
+ - threading
+ - hydra_logger
+Notes:
+ - Producers on any thread append under one lock; the thread is notified only
+   when the buffer goes from empty to non-empty.
+ - A full buffer applies `drop_newest` or `drop_oldest`, counts the drop under
+   `drop_reason` in SLO metrics, and warns on the first and every 100th drop.
+ - `process` receives each drained run of up to `batch_size` payloads; an
+   exception from it is logged and the thread keeps going.
+ - The thread starts on the first submit; call `reset` in a forked child.
+"""
+
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional
+
+from . import slo_metrics
+
+_logger = logging.getLogger(__name__)
+
+OVERFLOW_POLICIES = ("drop_newest", "drop_oldest")
+
+
+class BoundedWorker:
+    """Bounded payload buffer drained in batches by one daemon thread."""
+
+    def __init__(
+        self,
+        process: Callable[[List[Any]], None],
+        max_size: int = 10000,
+        batch_size: int = 256,
+        overflow_policy: str = "drop_newest",
+        name: str = "hydra-logger-worker",
+        drop_reason: str = "worker_queue_full",
+        label: Optional[str] = None,
+    ) -> None:
+        self._process = process
+        self._max_size = max(1, int(max_size))
+        self._batch_size = max(1, int(batch_size))
+        self._overflow_policy = overflow_policy
+        self._name = name
+        self._drop_reason = drop_reason
+        self._label = label or name
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the buffer, thread, and counters (fresh state after fork)."""
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+        self._idle = threading.Condition(self._lock)
+        self._buffer: Deque[Any] = deque()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._busy = False
+        self._submitted = 0
+        self._processed = 0
+        self._dropped = 0
+        self._batches = 0
+        self._depth_max = 0
+
+    @property
+    def max_size(self) -> int:
+        """Buffer capacity before the overflow policy applies."""
+        return self._max_size
+
+    def submit(self, payload: Any) -> bool:
+        """Buffer `payload` for the thread; False when it was dropped."""
+        with self._lock:
+            return self._put(payload)
+
+    def submit_many(self, payloads: Iterable[Any]) -> int:
+        """Buffer several payloads under one lock; return how many were kept."""
+        kept = 0
+        with self._lock:
+            for payload in payloads:
+                kept += self._put(payload)
+        return kept
+
+    def _put(self, payload: Any) -> bool:
+        """Append under `self._lock`, applying the overflow policy."""
+        if self._stopping:
+            return False
+        buffer = self._buffer
+        depth = len(buffer)
+        if depth >= self._max_size:
+            self._dropped += 1
+            slo_metrics.record_dropped_log(self._drop_reason)
+            if self._dropped == 1 or self._dropped % 100 == 0:
+                _logger.warning(
+                    "%s full; dropped=%s max=%s policy=%s",
+                    self._label,
+                    self._dropped,
+                    self._max_size,
+                    self._overflow_policy,
+                )
+            if self._overflow_policy != "drop_oldest":
+                return False
+            buffer.popleft()
+            depth -= 1
+        buffer.append(payload)
+        self._submitted += 1
+        if depth >= self._depth_max:
+            self._depth_max = depth + 1
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name=self._name, daemon=True
+            )
+            self._thread.start()
+        elif depth == 0:
+            self._ready.notify()
+        return True
+
+    def _run(self) -> None:
+        buffer = self._buffer
+        while True:
+            with self._lock:
+                while not buffer and not self._stopping:
+                    self._ready.wait()
+                if not buffer:
+                    self._idle.notify_all()
+                    return
+                count = min(len(buffer), self._batch_size)
+                batch = [buffer.popleft() for _ in range(count)]
+                self._busy = True
+            try:
+                self._process(batch)
+            except Exception:
+                _logger.exception("%s failed on a batch of %s", self._label, count)
+            with self._lock:
+                self._busy = False
+                self._processed += count
+                self._batches += 1
+                if not buffer:
+                    self._idle.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every buffered payload has been processed."""
+        with self._lock:
+            if self._thread is None:
+                return not self._buffer
+            return self._idle.wait_for(
+                lambda: not self._buffer and not self._busy, timeout
+            )
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """Drain the buffer and join the thread; False if it is still running."""
+        with self._lock:
+            self._stopping = True
+            self._ready.notify()
+            thread = self._thread
+        if thread is None or thread is threading.current_thread():
+            return True
+        thread.join(timeout)
+        if thread.is_alive():
+            _logger.warning(
+                "%s did not drain within %ss; remaining=%s",
+                self._label,
+                timeout,
+                len(self._buffer),
+            )
+            return False
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a point-in-time copy of worker counters."""
+        thread = self._thread
+        return {
+            "alive": thread is not None and thread.is_alive(),
+            "depth": len(self._buffer),
+            "depth_max": self._depth_max,
+            "submitted": self._submitted,
+            "processed": self._processed,
+            "dropped": self._dropped,
+            "batches": self._batches,
+        }
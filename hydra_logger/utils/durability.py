@@ -0,0 +1,195 @@
+"""
+Role: Durability policies and group-commit `fdatasync` for file handlers.
+Used By:
+ - `hydra_logger.handlers.file_handler` (`SyncFileHandler`, `AsyncFileHandler`).
+ - `hydra_logger.config.models` (`LogDestination.durability` validation).
+Depends On:
+ - os
+ - threading
+ - hydra_logger
+Notes:
+ - Policies: `none` (page cache only), `interval:<ms>` (dirty data is synced
+   at most <ms> after its first unsynced write, by the shared background
+   flusher thread), `per_batch` (every buffer write is synced before the
+   caller returns), `sync_on_level:<LEVEL>` (records at or above LEVEL flush
+   the buffer and wait for a sync).
+ - Group commit: each write takes a ticket; `commit(ticket)` waits until a
+   sync started after that write has finished. One caller runs `fdatasync`
+   while concurrent callers wait for it, and the next sync covers everything
+   they wrote meanwhile. Writes left unsynced after a sync (or a failed sync)
+   restart the interval and wake the flusher.
+ - Sync latency goes to `slo_metrics.record_flush_latency` under the
+   committer's name.
+"""
+
+import math
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from ..types.levels import LogLevelManager
+from . import slo_metrics
+from .background_flusher import get_background_flusher
+
+DURABILITY_MODES = ("none", "interval", "per_batch", "sync_on_level")
+
+fdatasync: Callable[[int], None] = getattr(os, "fdatasync", os.fsync)
+
+
+@dataclass(frozen=True)
+class DurabilityPolicy:
+    """Parsed `durability` setting for one file destination."""
+
+    mode: str = "none"
+    interval: float = 0.0
+    level: int = 0
+    spec: str = "none"
+
+    @property
+    def enabled(self) -> bool:
+        """True when the handler needs a `GroupCommitter`."""
+        return self.mode != "none"
+
+
+def parse_durability(spec: Optional[str]) -> DurabilityPolicy:
+    """Parse `none`, `interval:<ms>`, `per_batch`, or `sync_on_level:<LEVEL>`."""
+    text = (spec or "none").strip()
+    mode, _, arg = text.partition(":")
+    mode = mode.strip().lower()
+    arg = arg.strip()
+    if mode in ("none", "per_batch") and not arg:
+        return DurabilityPolicy(mode=mode, spec=mode)
+    if mode == "interval" and arg:
+        try:
+            milliseconds = float(arg)
+        except ValueError:
+            milliseconds = -1.0
+        if milliseconds > 0 and math.isfinite(milliseconds):
+            return DurabilityPolicy(
+                mode=mode, interval=milliseconds / 1000.0, spec=f"interval:{arg}"
+            )
+    if mode == "sync_on_level" and LogLevelManager.is_valid_level(arg):
+        return DurabilityPolicy(
+            mode=mode,
+            level=LogLevelManager.get_level(arg),
+            spec=f"sync_on_level:{arg.upper()}",
+        )
+    raise ValueError(
+        "durability must be 'none', 'per_batch', 'interval:<ms>' (ms > 0), or "
+        f"'sync_on_level:<LEVEL>', got {spec!r}"
+    )
+
+
+class GroupCommitter:
+    """Ticketed group commit of one file's `sync` calls."""
+
+    def __init__(
+        self,
+        sync: Callable[[], None],
+        name: str = "file_fsync",
+        interval: Optional[float] = None,
+    ) -> None:
+        self._sync = sync
+        self._name = name
+        self._interval = interval
+        self._reset_state()
+        if interval is not None:
+            get_background_flusher().register(self)
+
+    def _reset_state(self) -> None:
+        self._cond = threading.Condition(threading.Lock())
+        self._written = 0
+        self._synced = 0
+        self._syncing = False
+        self._dirty_since = 0.0
+        self._syncs = 0
+        self._commits = 0
+        self._errors = 0
+
+    def mark_written(self) -> int:
+        """Record a completed write; returns its ticket for `commit`."""
+        with self._cond:
+            clean = self._synced >= self._written
+            self._written += 1
+            ticket = self._written
+            if clean:
+                self._dirty_since = time.monotonic()
+        if clean and self._interval is not None:
+            get_background_flusher().wake()
+        return ticket
+
+    def pending_ticket(self) -> int:
+        """Ticket of the latest write, synced or not."""
+        return self._written
+
+    def commit(self, ticket: int) -> None:
+        """Return once every write up to `ticket` has been synced."""
+        samples = []
+        error: Optional[OSError] = None
+        with self._cond:
+            self._commits += 1
+            while self._synced < ticket:
+                if self._syncing:
+                    self._cond.wait()
+                    continue
+                self._syncing = True
+                target = self._written
+                self._cond.release()
+                started = time.perf_counter()
+                try:
+                    self._sync()
+                except OSError as exc:
+                    error = exc
+                finally:
+                    samples.append(time.perf_counter() - started)
+                    self._cond.acquire()
+                    self._syncing = False
+                    self._cond.notify_all()
+                if error is not None:
+                    self._errors += 1
+                    break
+                self._synced = max(self._synced, target)
+                self._syncs += 1
+            # Writes that landed during the sync saw a dirty committer and did
+            # not wake the flusher, so restart their interval here.
+            rearm = bool(samples) and self._written > self._synced
+            if rearm:
+                self._dirty_since = time.monotonic()
+        if rearm and self._interval is not None:
+            get_background_flusher().wake()
+        for elapsed in samples:
+            slo_metrics.record_flush_latency(self._name, elapsed)
+        if error is not None:
+            raise error
+
+    def _flush_if_stale(self) -> float:
+        """Background flusher hook: sync once the interval has passed."""
+        with self._cond:
+            if self._synced >= self._written or self._interval is None:
+                return math.inf
+            remaining = self._dirty_since + self._interval - time.monotonic()
+            ticket = self._written
+        if remaining > 0.0:
+            return remaining
+        self.commit(ticket)
+        return 0.0
+
+    def close(self) -> None:
+        """Stop interval syncs for this committer."""
+        if self._interval is not None:
+            get_background_flusher().unregister(self)
+
+    def reset_after_fork(self) -> None:
+        """Forget the parent's tickets and any sync it had in flight."""
+        self._reset_state()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a point-in-time copy of commit counters."""
+        return {
+            "syncs": self._syncs,
+            "commits": self._commits,
+            "sync_errors": self._errors,
+            "unsynced_writes": max(0, self._written - self._synced),
+        }
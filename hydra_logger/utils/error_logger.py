@@ -26,6 +26,8 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Dict, Optional, TextIO
 
+from .fork_safety import register_fork_hook
+
 
 class SafeErrorLogger:
     """
@@ -294,6 +296,11 @@ class SafeErrorLogger:
                 cls._error_file = None
             cls._initialized = False
 
+    @classmethod
+    def _after_fork_child(cls) -> None:
+        """Replace the class lock; every write is flushed, so the file is shared."""
+        cls._lock = threading.Lock()
+
 
 # Convenience function for easy access
 def log_error_safe(
@@ -333,3 +340,4 @@ def log_error_message(
 # Register cleanup on exit
 
 atexit.register(SafeErrorLogger.close)
+register_fork_hook(SafeErrorLogger._after_fork_child)
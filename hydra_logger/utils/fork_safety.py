@@ -0,0 +1,89 @@
+"""
+Role: Process fork hooks that reset inherited logging state in child processes.
+Used By:
+ - `hydra_logger.handlers` (buffers, locks, executors, file descriptors, sessions).
+ - `hydra_logger.loggers` runtimes and `hydra_logger.core.logger_management`.
+Depends On:
+ - logging
+ - os
+ - weakref
+Notes:
+ - One `os.register_at_fork(after_in_child=...)` hook walks a weak registry of
+   objects exposing `_after_fork_child()`; registration never keeps objects alive.
+ - Children drop the parent's pending buffers (the parent still owns and flushes
+   them), recreate locks/executors, and reconnect/reopen lazily.
+"""
+
+import logging
+import os
+import weakref
+from typing import Any, Callable, List
+
+_logger = logging.getLogger(__name__)
+
+_registry: "weakref.WeakSet[Any]" = weakref.WeakSet()
+_module_hooks: List[Callable[[], None]] = []
+_fork_generation = 0
+
+
+def register_fork_safe(obj: Any) -> None:
+    """Call `obj._after_fork_child()` in every forked child while `obj` lives."""
+    try:
+        _registry.add(obj)
+    except TypeError:
+        # Objects without weakref support cannot be tracked; nothing to reset.
+        _logger.debug("Fork registry skipped non-weakrefable %r", type(obj))
+
+
+def register_fork_hook(hook: Callable[[], None]) -> None:
+    """Call module-level `hook()` in every forked child (class-level state)."""
+    if hook not in _module_hooks:
+        _module_hooks.append(hook)
+
+
+def fork_generation() -> int:
+    """Return how many forks this process has been the child of."""
+    return _fork_generation
+
+
+def discard_inherited_stream(stream: Any) -> None:
+    """Redirect an inherited file object's fd to /dev/null.
+
+    The child must not flush bytes the parent buffered but has not written
+    yet. Pointing the descriptor at /dev/null makes any later flush/close of
+    the old object harmless without freeing the fd number for reuse.
+    """
+    if stream is None:
+        return
+    try:
+        fd = stream.fileno()
+    except Exception:
+        return
+    try:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        try:
+            os.dup2(devnull, fd)
+        finally:
+            os.close(devnull)
+    except OSError:
+        _logger.exception("Failed to detach inherited stream fd=%s after fork", fd)
+
+
+def _run_after_fork_child() -> None:
+    """Reset registered objects and module state in the child process."""
+    global _fork_generation
+    _fork_generation += 1
+    for hook in list(_module_hooks):
+        try:
+            hook()
+        except Exception:
+            _logger.exception("Fork child hook %r failed", hook)
+    for obj in list(_registry):
+        try:
+            obj._after_fork_child()
+        except Exception:
+            _logger.exception("Fork child reset failed for %s", type(obj).__name__)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_run_after_fork_child)
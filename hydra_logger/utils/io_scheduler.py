@@ -0,0 +1,228 @@
+"""
+Role: Process-wide file I/O scheduler shared by every async file handler.
+Used By:
+ - `hydra_logger.handlers.file_handler` (`AsyncFileHandler` write batches).
+Depends On:
+ - concurrent
+ - threading
+Notes:
+ - A small fixed pool of daemon threads serves all files, so thread count no
+   longer grows with the number of file destinations.
+ - Jobs are queued per file key. A file is owned by at most one thread at a
+   time, which keeps per-file order; ready files are served round-robin, one
+   turn each, so a busy file cannot starve the others.
+ - On its turn a file's pending jobs that share a write callable are merged
+   into one call (their message lists concatenated).
+ - Forked children drop the parent's scheduler and build their own lazily.
+"""
+
+import atexit
+import logging
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from .fork_safety import register_fork_hook
+
+_logger = logging.getLogger(__name__)
+
+WriteFn = Callable[[List[Any]], None]
+_Job = Tuple[List[Any], WriteFn, "Future[None]"]
+
+
+def default_io_workers() -> int:
+    """Pool size for the shared scheduler: one thread per core, at most 4."""
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+class FileIOScheduler:
+    """Fixed thread pool with per-file FIFO queues and fair round-robin."""
+
+    def __init__(self, max_workers: Optional[int] = None, max_jobs_per_turn: int = 64):
+        self._max_workers = max(1, int(max_workers or default_io_workers()))
+        self._max_jobs_per_turn = max(1, int(max_jobs_per_turn))
+        self._lock = threading.Lock()
+        self._ready_cond = threading.Condition(self._lock)
+        self._idle_cond = threading.Condition(self._lock)
+        self._pending: Dict[str, Deque[_Job]] = {}
+        self._ready: Deque[str] = deque()
+        self._active: Set[str] = set()
+        self._threads: List[threading.Thread] = []
+        self._idle_workers = 0
+        self._stopping = False
+        self._submitted = 0
+        self._writes = 0
+        self._coalesced = 0
+
+    @property
+    def max_workers(self) -> int:
+        """Upper bound on scheduler threads."""
+        return self._max_workers
+
+    def submit(self, key: str, messages: List[Any], write: WriteFn) -> "Future[None]":
+        """Queue `write(messages)` behind earlier jobs for the same file `key`."""
+        future: "Future[None]" = Future()
+        with self._lock:
+            if self._stopping:
+                raise RuntimeError("File I/O scheduler is shut down")
+            queue = self._pending.get(key)
+            if queue is None:
+                queue = self._pending[key] = deque()
+                if key not in self._active:
+                    self._ready.append(key)
+            queue.append((messages, write, future))
+            self._submitted += 1
+            if self._idle_workers:
+                self._ready_cond.notify()
+            elif len(self._threads) < self._max_workers:
+                thread = threading.Thread(
+                    target=self._run,
+                    name=f"hydra-logger-io-{len(self._threads) + 1}",
+                    daemon=True,
+                )
+                self._threads.append(thread)
+                thread.start()
+        return future
+
+    def _take_turn(self) -> Optional[Tuple[str, List[_Job]]]:
+        """Claim the next ready file and up to `max_jobs_per_turn` of its jobs."""
+        while not self._ready:
+            if self._stopping:
+                return None
+            self._idle_workers += 1
+            try:
+                self._ready_cond.wait()
+            finally:
+                self._idle_workers -= 1
+        key = self._ready.popleft()
+        queue = self._pending[key]
+        count = min(len(queue), self._max_jobs_per_turn)
+        jobs = [queue.popleft() for _ in range(count)]
+        if not queue:
+            del self._pending[key]
+        self._active.add(key)
+        return key, jobs
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                turn = self._take_turn()
+            if turn is None:
+                return
+            key, jobs = turn
+            self._execute(jobs)
+            with self._lock:
+                self._active.discard(key)
+                if key in self._pending:
+                    # More jobs arrived for this file; go to the back of the line.
+                    self._ready.append(key)
+                    self._ready_cond.notify()
+                elif not self._pending and not self._active:
+                    self._idle_cond.notify_all()
+
+    def _execute(self, jobs: List[_Job]) -> None:
+        """Run one file's jobs in order, merging runs that share a write callable."""
+        index = 0
+        while index < len(jobs):
+            messages, write, future = jobs[index]
+            merged = [future]
+            end = index + 1
+            while end < len(jobs) and jobs[end][1] == write:
+                if len(merged) == 1:
+                    messages = list(messages)
+                messages.extend(jobs[end][0])
+                merged.append(jobs[end][2])
+                end += 1
+            error: Optional[BaseException] = None
+            try:
+                write(messages)
+            except BaseException as exc:  # delivered to the awaiting handler
+                error = exc
+            for waiter in merged:
+                if not waiter.set_running_or_notify_cancel():
+                    continue
+                if error is None:
+                    waiter.set_result(None)
+                else:
+                    waiter.set_exception(error)
+            with self._lock:
+                self._writes += 1
+                self._coalesced += len(merged) - 1
+            index = end
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every submitted job has run."""
+        with self._lock:
+            return self._idle_cond.wait_for(
+                lambda: not self._pending and not self._active, timeout
+            )
+
+    def shutdown(self, timeout: Optional[float] = 5.0) -> None:
+        """Drain pending jobs, then stop the threads."""
+        self.drain(timeout)
+        with self._lock:
+            self._stopping = True
+            self._ready_cond.notify_all()
+            threads = list(self._threads)
+        for thread in threads:
+            if thread is not threading.current_thread():
+                thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a point-in-time copy of scheduler counters."""
+        with self._lock:
+            return {
+                "max_workers": self._max_workers,
+                "threads": len(self._threads),
+                "files_pending": len(self._pending),
+                "jobs_pending": sum(len(queue) for queue in self._pending.values()),
+                "submitted": self._submitted,
+                "writes": self._writes,
+                "coalesced": self._coalesced,
+            }
+
+
+_scheduler: Optional[FileIOScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_io_scheduler() -> FileIOScheduler:
+    """Return the process-wide scheduler, creating it on first use."""
+    global _scheduler
+    scheduler = _scheduler
+    if scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = FileIOScheduler()
+            scheduler = _scheduler
+    return scheduler
+
+
+def configure_io_scheduler(max_workers: Optional[int] = None) -> FileIOScheduler:
+    """Replace the process-wide scheduler; the previous one drains first."""
+    global _scheduler
+    with _scheduler_lock:
+        previous, _scheduler = _scheduler, FileIOScheduler(max_workers)
+        scheduler = _scheduler
+    if previous is not None:
+        previous.shutdown()
+    return scheduler
+
+
+def _shutdown_at_exit() -> None:
+    scheduler = _scheduler
+    if scheduler is not None:
+        scheduler.shutdown(timeout=2.0)
+
+
+def _reset_after_fork() -> None:
+    """The parent's threads do not exist in the child; start over lazily."""
+    global _scheduler, _scheduler_lock
+    _scheduler = None
+    _scheduler_lock = threading.Lock()
+
+
+atexit.register(_shutdown_at_exit)
+register_fork_hook(_reset_after_fork)
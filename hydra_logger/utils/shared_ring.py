@@ -0,0 +1,172 @@
+"""
+Role: Multi-producer, single-consumer byte ring in inherited shared memory.
+Used By:
+ - `hydra_logger.handlers.shared_ring_handler` (producers in worker processes).
+ - `hydra_logger.loggers.multiprocess_logger` (the single writer process).
+Depends On:
+ - ctypes
+ - multiprocessing
+ - struct
+ - time
+Notes:
+ - Frames are `<u32 length><payload>` and may wrap around the end of the buffer.
+ - Producers write under one cross-process lock; the consumer copies frames out
+   without holding it, since producers never touch the unread region.
+ - Wake-ups are edge-triggered: producers signal only on empty -> non-empty, and
+   the consumer signals space only when a producer is actually waiting.
+"""
+
+import ctypes
+import multiprocessing
+import struct
+import time
+from typing import Any, Dict, List, Optional
+
+_FRAME_HEADER = struct.Struct("<I")
+_HEADER_SIZE = _FRAME_HEADER.size
+
+# Slots in the shared metadata array.
+_HEAD = 0  # total bytes ever written
+_TAIL = 1  # total bytes ever consumed
+_DROPPED = 2  # frames rejected because the ring was full
+_WRITTEN = 3  # frames accepted
+_WAITERS = 4  # producers blocked waiting for space
+_CLOSED = 5  # set once the owner stops the consumer
+_META_SLOTS = 6
+
+
+class SharedRingBuffer:
+    """Bounded byte ring shared by forked or spawned processes."""
+
+    def __init__(self, capacity: int = 4 * 1024 * 1024, context: Any = None):
+        if capacity <= _HEADER_SIZE:
+            raise ValueError("capacity must be larger than one frame header")
+        ctx = context or multiprocessing.get_context()
+        self._capacity = int(capacity)
+        self._data = ctx.RawArray(ctypes.c_ubyte, self._capacity)
+        self._meta = ctx.RawArray(ctypes.c_uint64, _META_SLOTS)
+        self._lock = ctx.Lock()
+        self._readable = ctx.Event()
+        self._writable = ctx.Event()
+        self._view: Optional[memoryview] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_view"] = None
+        return state
+
+    @property
+    def capacity(self) -> int:
+        """Usable size of the ring in bytes."""
+        return self._capacity
+
+    @property
+    def closed(self) -> bool:
+        """Whether the owner has asked the consumer to stop."""
+        return bool(self._meta[_CLOSED])
+
+    def _buffer(self) -> memoryview:
+        view = self._view
+        if view is None:
+            view = self._view = memoryview(self._data).cast("B")
+        return view
+
+    def _copy_in(self, position: int, data: bytes) -> None:
+        view = self._buffer()
+        start = position % self._capacity
+        first = min(len(data), self._capacity - start)
+        view[start : start + first] = data[:first]
+        if first < len(data):
+            view[: len(data) - first] = data[first:]
+
+    def _copy_out(self, position: int, size: int) -> bytes:
+        view = self._buffer()
+        start = position % self._capacity
+        first = min(size, self._capacity - start)
+        if first == size:
+            return bytes(view[start : start + size])
+        return bytes(view[start:]) + bytes(view[: size - first])
+
+    def put(self, payload: bytes, timeout: float = 0.0) -> bool:
+        """Append one frame; wait up to `timeout` seconds for space, else drop."""
+        frame = _FRAME_HEADER.pack(len(payload)) + payload
+        size = len(frame)
+        meta = self._meta
+        if size > self._capacity:
+            with self._lock:
+                meta[_DROPPED] += 1
+            return False
+
+        deadline = time.monotonic() + timeout if timeout > 0 else 0.0
+        while True:
+            with self._lock:
+                head = meta[_HEAD]
+                tail = meta[_TAIL]
+                if meta[_CLOSED]:
+                    meta[_DROPPED] += 1
+                    return False
+                if self._capacity - (head - tail) >= size:
+                    self._copy_in(head, frame)
+                    meta[_HEAD] = head + size
+                    meta[_WRITTEN] += 1
+                    if head == tail:
+                        self._readable.set()
+                    return True
+                remaining = deadline - time.monotonic() if deadline else 0.0
+                if remaining <= 0:
+                    meta[_DROPPED] += 1
+                    return False
+                meta[_WAITERS] += 1
+                self._writable.clear()
+            try:
+                self._writable.wait(remaining)
+            finally:
+                with self._lock:
+                    meta[_WAITERS] -= 1
+
+    def drain(self) -> List[bytes]:
+        """Return every complete frame written so far (consumer only)."""
+        meta = self._meta
+        with self._lock:
+            head = meta[_HEAD]
+            tail = meta[_TAIL]
+            if head == tail:
+                self._readable.clear()
+                return []
+        raw = self._copy_out(tail, head - tail)
+        frames = []
+        offset = 0
+        end = len(raw)
+        while offset < end:
+            (length,) = _FRAME_HEADER.unpack_from(raw, offset)
+            offset += _HEADER_SIZE
+            frames.append(raw[offset : offset + length])
+            offset += length
+        with self._lock:
+            meta[_TAIL] = head
+            if meta[_WAITERS]:
+                self._writable.set()
+        return frames
+
+    def wait_readable(self, timeout: float) -> bool:
+        """Block until a producer signals new data or `timeout` elapses."""
+        return self._readable.wait(timeout)
+
+    def close(self) -> None:
+        """Mark the ring closed and wake the consumer and blocked producers."""
+        with self._lock:
+            self._meta[_CLOSED] = 1
+            self._readable.set()
+            self._writable.set()
+
+    def stats(self) -> Dict[str, int]:
+        """Return a point-in-time copy of ring counters."""
+        meta = self._meta
+        with self._lock:
+            return {
+                "capacity_bytes": self._capacity,
+                "used_bytes": int(meta[_HEAD] - meta[_TAIL]),
+                "frames_written": int(meta[_WRITTEN]),
+                "frames_dropped": int(meta[_DROPPED]),
+                "waiting_producers": int(meta[_WAITERS]),
+            }
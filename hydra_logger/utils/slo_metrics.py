@@ -8,6 +8,7 @@ Depends On:
  - typing
 Notes:
  - Counters are process-local; wire exporters in application code as needed.
+ - Forked children start from zero so parent counts are never reported twice.
 """
 
 import threading
@@ -15,6 +16,8 @@ import time
 from dataclasses import dataclass
 from typing import Dict, List
 
+from .fork_safety import register_fork_hook
+
 _lock = threading.Lock()
 
 
@@ -122,3 +125,13 @@ def flush_latency_percentiles() -> Dict[str, float]:
         "p99": percentile(values, 99),
         "count": float(len(values)),
     }
+
+
+def _after_fork_child() -> None:
+    """Give a forked child its own lock and zeroed counters."""
+    global _lock
+    _lock = threading.Lock()
+    reset_metrics()
+
+
+register_fork_hook(_after_fork_child)
@@ -0,0 +1,89 @@
+"""
+Role: Vectored (`os.writev`) writes of buffered byte chunks.
+Used By:
+ - `hydra_logger.handlers.file_handler` (`SyncFileHandler` flushes and batches).
+ - `hydra_logger.handlers.rotating_handler` (`RotatingFileHandler` flushes).
+Depends On:
+ - os
+Notes:
+ - Buffered lines go to the kernel as they are, in slices of at most
+   `IOV_MAX` chunks, so a flush never builds a joined copy of the buffer.
+ - `writev` may write fewer bytes than requested; the loop resumes from the
+   first unwritten byte, finishing a split chunk before the next slice.
+ - Where `os.writev` is missing, or the target has no usable descriptor, the
+   chunks are joined and written with a short-write loop instead.
+"""
+
+import os
+from typing import Any, Sequence
+
+HAS_WRITEV = hasattr(os, "writev")
+
+
+def _iov_max() -> int:
+    try:
+        value = os.sysconf("SC_IOV_MAX")
+    except (AttributeError, OSError, ValueError):
+        value = -1
+    return value if value > 0 else 1024
+
+
+IOV_MAX = _iov_max()
+
+
+def _write_view(fd: int, view: memoryview) -> int:
+    """`os.write` until `view` is exhausted; returns bytes written."""
+    total = 0
+    while view:
+        written = os.write(fd, view)
+        total += written
+        view = view[written:]
+    return total
+
+
+def writev_all(fd: int, chunks: Sequence[bytes]) -> int:
+    """Write every chunk to `fd` with `os.writev`; returns bytes written."""
+    total = 0
+    index = 0
+    count = len(chunks)
+    while index < count:
+        batch = chunks[index : index + IOV_MAX]
+        written = os.writev(fd, batch)
+        total += written
+        for chunk in batch:
+            size = len(chunk)
+            if written < size:
+                break
+            written -= size
+            index += 1
+        else:
+            continue
+        # Short write inside chunks[index]: finish it before the next slice.
+        total += _write_view(fd, memoryview(chunks[index])[written:])
+        index += 1
+    return total
+
+
+def _write_joined(file_obj: Any, chunks: Sequence[bytes]) -> int:
+    data = b"".join(chunks)
+    view = memoryview(data)
+    while view:
+        written = file_obj.write(view)
+        if written is None:
+            raise BlockingIOError("File write would block")
+        view = view[written:]
+    return len(data)
+
+
+def write_chunks(file_obj: Any, chunks: Sequence[bytes]) -> int:
+    """Write `chunks` to a raw binary file object, vectored when possible."""
+    if not chunks:
+        return 0
+    if HAS_WRITEV:
+        try:
+            fd = file_obj.fileno()
+        except (AttributeError, OSError, ValueError):
+            fd = -1
+        if fd >= 0:
+            return writev_all(fd, chunks)
+    return _write_joined(file_obj, chunks)
@@ -281,6 +281,8 @@ def test_validate_result_invariants_async_split_rates_and_dispatch_errors() -> N
             "task_fanout_messages_per_second": 999.0,
             "logger_core_duration": 2.0,
             "logger_core_messages_per_second": 999.0,
+            "enqueue_duration": 2.0,
+            "enqueue_messages_per_second": 999.0,
         },
         "composite_logger": {
             "total_messages": 100,
@@ -302,6 +304,9 @@ def test_validate_result_invariants_async_split_rates_and_dispatch_errors() -> N
     assert any(
         "async_logger.logger_core_messages_per_second" in item for item in violations
     )
+    assert any(
+        "async_logger.enqueue_messages_per_second" in item for item in violations
+    )
     assert any("composite_logger.batch_dispatch_errors" in item for item in violations)
 
 
@@ -0,0 +1,50 @@
+"""
+Role: Unit tests for the prefork duplication/stall benchmark.
+Used By:
+ - Pytest benchmark validation.
+Depends On:
+ - benchmark
+ - pytest
+Notes:
+ - Forks a handful of real workers with small line counts to stay fast.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from benchmark.fork_safety import main, run_fork_safety
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+
+
+def test_forked_workers_never_duplicate_parent_buffered_lines(tmp_path) -> None:
+    summary = run_fork_safety(
+        workers=4,
+        lines_per_worker=50,
+        parent_lines=20,
+        timeout=20.0,
+        path=str(tmp_path / "fork.log"),
+    )
+    assert summary["expected_lines"] == 4 * 50 + 4 * 20
+    assert summary["duplicated"] == 0
+    assert summary["missing"] == 0
+    assert summary["failed_workers"] == 0
+    assert summary["stalled_workers"] == 0
+
+
+def test_fork_safety_rejects_non_positive_sizes() -> None:
+    with pytest.raises(ValueError):
+        run_fork_safety(workers=0)
+    with pytest.raises(ValueError):
+        run_fork_safety(workers=1, lines_per_worker=0)
+
+
+def test_fork_safety_cli_reports_clean_run(capsys) -> None:
+    assert main(["--workers", "2", "--lines", "10", "--parent-lines", "5"]) == 0
+    printed = json.loads(capsys.readouterr().out)
+    assert printed["workers"] == 2
+    assert printed["duplicated"] == 0
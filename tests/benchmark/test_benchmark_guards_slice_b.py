@@ -358,6 +358,11 @@ def test_run_benchmark_returns_error_when_reliability_guard_fails(
         lambda: asyncio.sleep(0, result={"ok": True}),
     )
     monkeypatch.setattr(bench, "test_parallel_workers_suite", lambda: {"ok": True})
+    monkeypatch.setattr(
+        bench,
+        "test_thread_submission_suite",
+        lambda: asyncio.sleep(0, result={"ok": True}),
+    )
     monkeypatch.setattr(
         bench,
         "test_advanced_concurrent_logging",
@@ -0,0 +1,37 @@
+"""
+Role: Unit tests for the idle wakeup benchmark.
+Used By:
+ - Pytest benchmark validation.
+Depends On:
+ - benchmark
+ - pytest
+Notes:
+ - Uses short idle windows; the bound is loose so slow CI hosts still pass.
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from benchmark.idle_wakeups import main, run_mode
+
+
+@pytest.mark.parametrize("mode", ["queue", "enqueue"])
+def test_idle_async_logger_does_not_poll(tmp_path, mode: str) -> None:
+    result = run_mode(mode, 0.3, str(tmp_path))
+    assert result["mode"] == mode
+    # Timeout polling woke the loop hundreds of times per second.
+    assert result["wakeups_per_second"] < 50
+
+
+def test_run_mode_rejects_unknown_mode(tmp_path) -> None:
+    with pytest.raises(ValueError):
+        run_mode("threads", 0.1, str(tmp_path))
+
+
+def test_cli_reports_each_mode(capsys) -> None:
+    assert main(["--seconds", "0.05", "--modes", "baseline", "task"]) == 0
+    printed = json.loads(capsys.readouterr().out)
+    assert [r["mode"] for r in printed["results"]] == ["baseline", "task"]
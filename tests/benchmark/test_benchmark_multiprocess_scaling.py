@@ -0,0 +1,49 @@
+"""
+Role: Unit tests for the multiprocess scaling benchmark.
+Used By:
+ - Pytest benchmark validation.
+Depends On:
+ - benchmark
+ - pytest
+Notes:
+ - Forks two workers with tiny record counts so the check stays fast.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from benchmark.multiprocess_scaling import main, process_counts, run_mode
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+
+
+def test_process_counts_double_up_to_max() -> None:
+    assert process_counts(1) == [1]
+    assert process_counts(6) == [1, 2, 4, 6]
+    with pytest.raises(ValueError):
+        process_counts(0)
+
+
+@pytest.mark.parametrize("mode", ["direct", "multiprocess"])
+def test_run_mode_writes_every_line_once(tmp_path, mode: str) -> None:
+    result = run_mode(mode, 2, 50, str(tmp_path), "block_with_timeout")
+    assert result["records"] == 100
+    assert result["intact_lines"] == 100
+    assert result["corrupt_lines"] == 0
+    assert result["dropped"] == 0
+    assert result["failed_workers"] == 0
+
+
+def test_run_mode_rejects_unknown_mode(tmp_path) -> None:
+    with pytest.raises(ValueError):
+        run_mode("threads", 1, 1, str(tmp_path))
+
+
+def test_cli_reports_each_process_count(capsys) -> None:
+    assert main(["--max-processes", "2", "--records", "20"]) == 0
+    printed = json.loads(capsys.readouterr().out)
+    assert [r["processes"] for r in printed["results"]] == [1, 1, 2, 2]
@@ -0,0 +1,48 @@
+"""
+Role: Unit tests for the record footprint micro-benchmark.
+Used By:
+ - Pytest benchmark validation.
+Depends On:
+ - benchmark
+ - pytest
+Notes:
+ - Uses tiny counts so the check stays fast while still comparing record types.
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from benchmark.record_footprint import (
+    RECORD_FACTORIES,
+    main,
+    measure_bytes_per_record,
+    measure_ns_per_construction,
+    run_record_footprint,
+)
+
+
+def test_compact_record_uses_less_memory_than_dataclass_record() -> None:
+    dataclass_bytes = measure_bytes_per_record(RECORD_FACTORIES["LogRecord"], 2000)
+    compact_bytes = measure_bytes_per_record(RECORD_FACTORIES["CompactLogRecord"], 2000)
+    assert 0 < compact_bytes < dataclass_bytes
+
+
+def test_record_footprint_rejects_non_positive_sizes() -> None:
+    with pytest.raises(ValueError):
+        measure_bytes_per_record(RECORD_FACTORIES["LogRecord"], 0)
+    with pytest.raises(ValueError):
+        measure_ns_per_construction(RECORD_FACTORIES["LogRecord"], 0)
+
+
+def test_run_record_footprint_and_cli_report_all_record_types(capsys) -> None:
+    summary = run_record_footprint(count=200, iterations=200)
+    assert set(summary["results"]) == set(RECORD_FACTORIES)
+    for metrics in summary["results"].values():
+        assert metrics["ns_per_construction"] > 0
+
+    assert main(["--count", "100", "--iterations", "100"]) == 0
+    printed = json.loads(capsys.readouterr().out)
+    assert printed["count"] == 100
@@ -25,7 +25,11 @@ from benchmark.reporting import (
     build_output_payload,
     write_results_artifacts,
 )
-from benchmark.runners import run_async_concurrent_suite, run_parallel_workers_suite
+from benchmark.runners import (
+    run_async_concurrent_suite,
+    run_parallel_workers_suite,
+    run_thread_submission_suite,
+)
 
 
 def test_run_async_concurrent_suite_returns_expected_shape() -> None:
@@ -52,6 +56,57 @@ def test_run_async_concurrent_suite_returns_expected_shape() -> None:
     assert "2" in result["scaling"]
 
 
+def test_run_thread_submission_suite_feeds_one_loop_from_threads() -> None:
+    from hydra_logger.config.models import LogDestination, LoggingConfig, LogLayer
+    from hydra_logger.loggers.async_logger import AsyncLogger
+
+    config = LoggingConfig(
+        layers={
+            "default": LogLayer(
+                level="INFO", destinations=[LogDestination(type="null")]
+            )
+        },
+        extensions={"async_runtime": {"mode": "enqueue"}},
+    )
+
+    def _create(_count: int) -> AsyncLogger:
+        logger = AsyncLogger(config=config)
+        logger.bind_loop()
+        return logger
+
+    async def _run() -> dict:
+        return await run_thread_submission_suite(
+            matrix=[1, 3],
+            messages_per_thread=50,
+            create_logger=_create,
+            close_async=lambda logger: logger.aclose(),
+            messages_per_second=lambda total, duration: (
+                total / duration if duration > 0 else 0.0
+            ),
+        )
+
+    result = asyncio.run(_run())
+    assert result["suite"] == "thread_submission"
+    row = result["scaling"]["3"]
+    assert row["total_messages"] == 150
+    assert row["dropped"] == 0
+    assert 1 <= row["loop_wakeups"] <= 150
+
+
+def test_run_thread_submission_suite_rejects_non_positive_thread_count() -> None:
+    async def _run() -> dict:
+        return await run_thread_submission_suite(
+            matrix=[0],
+            messages_per_thread=1,
+            create_logger=lambda _count: None,
+            close_async=lambda _logger: asyncio.sleep(0),
+            messages_per_second=lambda total, duration: 0.0,
+        )
+
+    with pytest.raises(ValueError, match="thread_count must be >= 1"):
+        asyncio.run(_run())
+
+
 def test_run_parallel_workers_suite_uses_worker_results(monkeypatch, tmp_path) -> None:
     class _FakeFuture:
         def __init__(self, value: int) -> None:
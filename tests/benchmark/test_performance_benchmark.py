@@ -263,6 +263,11 @@ def test_run_benchmark_orchestrates_all_steps(tmp_path, monkeypatch) -> None:
         "test_parallel_workers_suite",
         lambda: order.append("parallel_suite") or {"ok": True},
     )
+    monkeypatch.setattr(
+        bench,
+        "test_thread_submission_suite",
+        lambda: order.append("thread_suite") or asyncio.sleep(0, result={"ok": True}),
+    )
     monkeypatch.setattr(
         bench,
         "test_ultra_high_performance",
@@ -284,9 +289,10 @@ def test_run_benchmark_orchestrates_all_steps(tmp_path, monkeypatch) -> None:
     assert "network_destination" in bench.results
     assert "async_concurrent" in bench.results
     assert "parallel_workers" in bench.results
+    assert "thread_submission" in bench.results
     assert "ultra_high_performance" in bench.results
     assert "output_matrix" in order
-    assert order.count("cleanup") == 15
+    assert order.count("cleanup") == 16
     assert order[-1] == "final_cleanup"
 
 
@@ -14,7 +14,7 @@ import pytest
 
 from hydra_logger.formatters.json_formatter import JsonLinesFormatter
 from hydra_logger.formatters.text_formatter import PlainTextFormatter
-from hydra_logger.types.records import LogRecord
+from hydra_logger.types.records import BoundFields, LogRecord
 from hydra_logger.utils.time_utility import TimestampFormat
 
 
@@ -132,3 +132,34 @@ def test_json_formatter_default_timestamp_config_uses_production_profile(
     monkeypatch.setenv("ENVIRONMENT", "production")
     formatter = JsonLinesFormatter()
     assert formatter.timestamp_config.format_type == TimestampFormat.RFC3339_MICRO
+
+
+def test_json_lines_formatter_reuses_encoded_bound_fields_fragment() -> None:
+    formatter = JsonLinesFormatter()
+    bound = BoundFields(request_id="r-1", host="node-1")
+    plain = _record()
+    plain.extra = dict(bound)
+    record = _record()
+    record.extra = bound
+
+    assert formatter.format(record) == formatter.format(plain)
+    assert bound._fragments == {
+        formatter._fragment_key: '{"request_id":"r-1","host":"node-1"}'
+    }
+
+    record.context = {}
+    plain.context = {}
+    assert json.loads(formatter.format(record)) == json.loads(formatter.format(plain))
+
+
+def test_json_lines_formatter_emits_correlation_ids_and_bound_context() -> None:
+    formatter = JsonLinesFormatter()
+    record = _record()
+    record.request_id = "r-1"
+    record.context = BoundFields(tenant="acme")
+
+    payload = json.loads(formatter.format(record))
+    assert payload["request_id"] == "r-1"
+    assert "correlation_id" not in payload
+    assert payload["extra"] == {"host": "node-1"}
+    assert payload["context"] == {"tenant": "acme"}
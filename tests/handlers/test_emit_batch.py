@@ -0,0 +1,156 @@
+"""
+Role: Tests for the handler batch emit protocol (`emit_batch` / `emit_batch_async`).
+Used By:
+ - Pytest discovery and CI.
+Depends On:
+ - hydra_logger
+Notes:
+ - Checks level filtering, ordering with already-buffered lines, and that each
+   overriding handler writes a batch in one stream/file call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from hydra_logger.handlers.base_handler import BaseHandler
+from hydra_logger.handlers.batched_http_handler import BatchedHTTPHandler
+from hydra_logger.handlers.console_handler import (
+    AsyncConsoleHandler,
+    SyncConsoleHandler,
+)
+from hydra_logger.handlers.file_handler import AsyncFileHandler, SyncFileHandler
+from hydra_logger.handlers.null_handler import NullHandler
+from hydra_logger.handlers.rotating_handler import SizeRotatingFileHandler
+from hydra_logger.types.records import LogRecord
+
+
+def _records(*messages: str, level: int = 20) -> list[LogRecord]:
+    name = "INFO" if level == 20 else "DEBUG"
+    return [LogRecord(level=level, level_name=name, message=m) for m in messages]
+
+
+class _CountingStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        return super().write(text)
+
+
+class _Collecting(BaseHandler):
+    def __init__(self) -> None:
+        super().__init__(name="collecting", level=20)
+        self.seen: list[str] = []
+
+    def emit(self, record: LogRecord) -> None:
+        self.seen.append(record.message)
+
+
+def test_base_handler_default_batch_filters_by_level() -> None:
+    handler = _Collecting()
+    batch = _records("a") + _records("dropped", level=10) + _records("b")
+    handler.emit_batch(batch)
+    asyncio.run(handler.emit_batch_async(_records("c")))
+    assert handler.seen == ["a", "b", "c"]
+
+
+def test_sync_file_handler_batch_keeps_order_after_buffered_lines(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "batch.log"
+    handler = SyncFileHandler(str(path), buffer_size=100, flush_interval=3600.0)
+    handler.emit(_records("first")[0])
+    handler.emit_batch(_records("second", "third"))
+    assert handler.get_stats()["messages_processed"] == 3
+    handler.close()
+    lines = [line.split()[-1] for line in path.read_text().splitlines()]
+    assert lines == ["first", "second", "third"]
+
+
+def test_async_file_handler_batch_writes_directly_without_loop(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "async_batch.log"
+    handler = AsyncFileHandler(str(path), use_threading=False)
+    handler.setLevel(20)
+    handler.emit_batch(_records("a", "b") + _records("skip", level=10))
+    handler.setLevel(10)
+    handler.emit_batch(_records("c", level=10))
+    assert handler._messages_processed == 3
+    assert path.read_text().count("\n") == 3
+
+
+def test_async_file_handler_batch_enqueues_when_workers_run(tmp_path: Path) -> None:
+    async def _run() -> None:
+        handler = AsyncFileHandler(
+            str(tmp_path / "queued.log"), use_threading=False, max_queue_size=2
+        )
+        handler.emit_batch(_records("a", "b", "c"))
+        assert handler._message_queue.qsize() == 2
+        assert handler._messages_dropped == 1
+        await handler.aclose()
+
+    asyncio.run(_run())
+
+
+def test_sync_console_handler_batch_is_one_write() -> None:
+    stream = _CountingStream()
+    handler = SyncConsoleHandler(stream=stream, use_colors=False, buffer_size=1000)
+    handler.emit_batch(_records("x", "y", "z"))
+    assert stream.writes == 1
+    assert stream.getvalue().count("\n") == 3
+
+
+def test_async_console_handler_batch_paths() -> None:
+    stream = _CountingStream()
+    handler = AsyncConsoleHandler(stream=stream, use_colors=False)
+    handler.emit_batch(_records("x", "y"))
+    assert stream.writes == 1
+
+    asyncio.run(handler.emit_batch_async(_records("p", "q", "r")))
+    assert stream.writes == 2
+    assert stream.getvalue().count("\n") == 5
+    assert handler._messages_processed == 5
+
+
+def test_rotating_handler_batch_writes_all_lines(tmp_path: Path) -> None:
+    path = tmp_path / "rot.log"
+    handler = SizeRotatingFileHandler(str(path), max_bytes=1_000_000)
+    handler.emit(_records("buffered")[0])
+    handler.emit_batch(_records("one", "two"))
+    handler.close()
+    content = path.read_text()
+    assert content.index("buffered") < content.index("one") < content.index("two")
+
+
+def test_null_handler_batch_is_noop() -> None:
+    handler = NullHandler()
+    handler.emit_batch(_records("a"))
+    asyncio.run(handler.emit_batch_async(_records("b")))
+
+
+def test_batched_http_handler_posts_full_batches_and_keeps_remainder() -> None:
+    session = MagicMock()
+    session.request.return_value = MagicMock()
+    handler = BatchedHTTPHandler(
+        "http://example.test/ingest",
+        connection_probe=False,
+        batch_size=2,
+        flush_interval=300.0,
+    )
+    handler._session = session
+    handler._connected = True
+    handler._connection = object()
+
+    handler.emit(_records("pending")[0])
+    handler.emit_batch(_records("a", "b", "c", "d"))
+    assert session.request.call_count == 2
+    assert len(handler._buf) == 1
+    handler.close()
+    assert session.request.call_count == 3
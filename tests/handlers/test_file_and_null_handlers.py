@@ -10,7 +10,6 @@ Notes:
 
 import asyncio
 import builtins
-import sys
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -25,6 +24,10 @@ from hydra_logger.handlers.null_handler import NullHandler
 from hydra_logger.types.records import LogRecord
 
 
+def _failing_write(*_a, **_k):  # type: ignore[no-untyped-def]
+    raise OSError("write fail")
+
+
 def test_sync_file_handler_writes_and_closes(tmp_path: Path) -> None:
     log_path = tmp_path / "app.log"
     handler = SyncFileHandler(
@@ -327,7 +330,7 @@ def test_sync_file_handler_uses_optimal_config_when_explicit_values_missing(
     handler.close()
 
 
-def test_sync_file_handler_set_formatter_reopen_failure_sets_invalid_handle(
+def test_sync_file_handler_buffers_encoded_bytes_without_reopen(
     monkeypatch, tmp_path: Path
 ) -> None:
     class BinaryFormatter:
@@ -339,21 +342,28 @@ def test_sync_file_handler_set_formatter_reopen_failure_sets_invalid_handle(
     original_open = builtins.open
     call_count = {"count": 0}
 
-    def _fake_open(*args, **kwargs):
+    def _counting_open(*args, **kwargs):
         call_count["count"] += 1
-        if call_count["count"] >= 2:
-            raise OSError("cannot reopen")
         return original_open(*args, **kwargs)
 
-    monkeypatch.setattr(builtins, "open", _fake_open)
-    handler = SyncFileHandler(filename=str(tmp_path / "reopen.log"))
+    monkeypatch.setattr(builtins, "open", _counting_open)
+    log_path = tmp_path / "bytes.log"
+    handler = SyncFileHandler(filename=str(log_path), buffer_size=10)
+    handler.emit(LogRecord(level=20, level_name="INFO", message="h\u00e9"))
     handler.setFormatter(BinaryFormatter())
-    assert handler._file_handle is None
+    handler.emit(LogRecord(level=20, level_name="INFO", message="ignored"))
+    assert call_count["count"] == 1
+    assert all(isinstance(chunk, bytes) for chunk in handler._buffer)
+    stats = handler.get_stats()
+    assert stats["buffered_bytes"] == stats["total_bytes_written"]
+    handler.close()
+    assert log_path.stat().st_size == stats["total_bytes_written"]
+    assert log_path.read_bytes().endswith("h\u00e9\n".encode("utf-8") + b"x")
 
 
 def test_sync_file_handler_flush_closed_and_invalid_handles(tmp_path: Path) -> None:
     handler = SyncFileHandler(filename=str(tmp_path / "flush.log"))
-    handler._buffer.append("abc\n")
+    handler._buffer.append(b"abc\n")
     handler._file_handle.close()
     closed_handle = SimpleNamespace(closed=True)
     handler._file_handle = closed_handle
@@ -910,35 +920,14 @@ def test_async_file_handler_bulk_write_paths_and_fallbacks(
         )
         await handler._bulk_write_to_disk_async([])  # early return
 
-        # Force ImportError path for aiofiles.
-        original_import = builtins.__import__
-
-        def _import_with_error(name, *args, **kwargs):
-            if name == "aiofiles":
-                raise ImportError("no aiofiles")
-            return original_import(name, *args, **kwargs)
-
-        monkeypatch.setattr(builtins, "__import__", _import_with_error)
         await handler._bulk_write_to_disk_async(["a\n"])
-        monkeypatch.setattr(builtins, "__import__", original_import)
-
-        # Force generic exception inside aiofiles context path.
-        class _BrokenAiofiles:
-            class _Ctx:
-                async def __aenter__(self):
-                    raise RuntimeError("open failed")
-
-                async def __aexit__(self, _et, _ev, _tb):
-                    return None
+        assert (tmp_path / "bulk.log").read_text() == "a\n"
 
-            def open(self, *_a, **_k):
-                return _BrokenAiofiles._Ctx()
-
-        monkeypatch.setitem(sys.modules, "aiofiles", _BrokenAiofiles())
+        # A failing descriptor write drops the batch.
+        monkeypatch.setattr(handler._append_file, "write", _failing_write)
         dropped_before = handler._messages_dropped
         await handler._bulk_write_to_disk_async(["b\n"])
         assert handler._messages_dropped > dropped_before
-        monkeypatch.delitem(sys.modules, "aiofiles", raising=False)
 
         # Cover _bulk_write_to_disk success and error branches.
         threaded = AsyncFileHandler(
@@ -967,36 +956,14 @@ def test_async_file_handler_flush_batch_and_emit_async_direct_write_paths(
         )
         await handler._flush_batch()  # empty buffer early return
 
-        # Force _flush_batch ImportError branch
         handler._message_buffer = ["line-a\n", "line-b\n"]
-        original_import = builtins.__import__
-
-        def _import_with_error(name, *args, **kwargs):
-            if name == "aiofiles":
-                raise ImportError("missing aiofiles")
-            return original_import(name, *args, **kwargs)
-
-        monkeypatch.setattr(builtins, "__import__", _import_with_error)
         await handler._flush_batch()
-        monkeypatch.setattr(builtins, "__import__", original_import)
-
-        # Force _flush_batch generic exception path via broken aiofiles.
-        class _BrokenAiofilesModule:
-            class _Ctx:
-                async def __aenter__(self):
-                    raise RuntimeError("ctx fail")
-
-                async def __aexit__(self, _et, _ev, _tb):
-                    return None
 
-            @staticmethod
-            def open(*_a, **_k):
-                return _BrokenAiofilesModule._Ctx()
-
-        monkeypatch.setitem(sys.modules, "aiofiles", _BrokenAiofilesModule())
+        # Force _flush_batch write failure.
+        monkeypatch.setattr(handler._append_file, "write", _failing_write)
         handler._message_buffer = ["line-c\n"]
         await handler._flush_batch()
-        monkeypatch.delitem(sys.modules, "aiofiles", raising=False)
+        assert handler._messages_dropped == 1
 
         # Cover emit_async direct-write binary and direct-write error branches.
         direct = AsyncFileHandler(
@@ -1020,11 +987,7 @@ def test_async_file_handler_flush_batch_and_emit_async_direct_write_paths(
             "_format_message",
             lambda _record: "text-path\n",
         )
-        monkeypatch.setattr(
-            builtins,
-            "open",
-            lambda *_a, **_k: (_ for _ in ()).throw(OSError("direct write fail")),
-        )
+        monkeypatch.setattr(direct._append_file, "write", _failing_write)
         dropped_before = direct._messages_dropped
         await direct.emit_async(
             LogRecord(level=20, level_name="INFO", message="ignored")
@@ -1104,11 +1067,7 @@ def test_async_file_handler_close_async_and_aclose_error_branches(
                 return len(self._messages)
 
         handler2._message_queue = QueueRemaining()
-        monkeypatch.setattr(
-            builtins,
-            "open",
-            lambda *_a, **_k: (_ for _ in ()).throw(OSError("final write fail")),
-        )
+        monkeypatch.setattr(handler2._append_file, "write", _failing_write)
         await handler2.aclose()
 
     asyncio.run(_run())
@@ -1160,11 +1119,7 @@ def test_async_file_handler_adaptive_helpers_and_threaded_paths(
             filename=str(tmp_path / "threaded-success.log"), use_threading=True
         )
         threaded._write_messages_threaded(["ok\n"])
-        monkeypatch.setattr(
-            file_module.os,
-            "makedirs",
-            lambda *_a, **_k: (_ for _ in ()).throw(OSError("mkdir fail")),
-        )
+        monkeypatch.setattr(threaded._append_file, "write", _failing_write)
         try:
             await threaded._write_messages_async(["bad\n"])
         except OSError:
@@ -1221,11 +1176,7 @@ def test_async_file_handler_optimize_adjust_sleep_flush_batch_and_emit_paths(
         assert handler._should_flush_batch() is True
 
         # _flush_batch outer exception branch
-        monkeypatch.setattr(
-            builtins,
-            "open",
-            lambda *_a, **_k: (_ for _ in ()).throw(OSError("batch fail")),
-        )
+        monkeypatch.setattr(handler._append_file, "write", _failing_write)
         handler._message_buffer = [b"\x01"]
         dropped_before = handler._messages_dropped
         await handler._flush_batch()
@@ -1462,23 +1413,13 @@ def test_async_file_handler_remaining_close_and_aclose_pending_paths(
             return False
 
     async def _run() -> None:
-        # close_async pending gather exception + thread pool cleanup
+        # close_async pending gather exception
         handler = AsyncFileHandler(
             filename=str(tmp_path / "close-remaining.log"), use_threading=False
         )
         pending = PendingTask()
         handler._worker_tasks = [pending]
 
-        class Pool:
-            def __init__(self) -> None:
-                self.shutdown_called = False
-
-            def shutdown(self, wait=True):
-                self.shutdown_called = True
-
-        pool = Pool()
-        handler._thread_pool = pool
-
         async def _wait_with_pending(*_a, **_k):
             return set(), [pending]
 
@@ -1489,7 +1430,6 @@ def test_async_file_handler_remaining_close_and_aclose_pending_paths(
         monkeypatch.setattr(asyncio, "gather", _gather_boom)
         await handler.close_async()
         assert pending.cancelled is True
-        assert pool.shutdown_called is True
         assert handler._running is False
         assert handler._worker_tasks == []
 
@@ -1561,39 +1501,15 @@ def test_async_file_handler_payload_helpers_and_direct_sync_error_path(
             filename=str(tmp_path / "payload.log"), use_threading=False
         )
 
-        # _combine_messages_payload empty and mixed-text/binary branches.
-        payload, is_binary = handler._combine_messages_payload([])
-        assert payload == ""
-        assert is_binary is False
-        payload, is_binary = handler._combine_messages_payload([b"a", "b"])
-        assert payload == b"ab"
-        assert is_binary is True
-
-        # _write_payload_async binary branch with aiofiles available.
-        writes = {"count": 0}
-
-        class _AioCtx:
-            async def __aenter__(self):
-                return self
-
-            async def __aexit__(self, _et, _ev, _tb):
-                return None
-
-            async def write(self, data):
-                writes["count"] += len(data)
-
-            async def flush(self):
-                return None
-
-        class _AioFiles:
-            @staticmethod
-            def open(*_a, **_k):
-                return _AioCtx()
+        # _combine_messages_payload encodes text once and joins bytes as-is.
+        assert handler._combine_messages_payload([]) == b""
+        assert handler._combine_messages_payload([b"a", "b\u00e9"]) == (
+            b"a" + "b\u00e9".encode("utf-8")
+        )
 
-        monkeypatch.setitem(sys.modules, "aiofiles", _AioFiles())
-        await handler._write_payload_async(b"xy", True)
-        assert writes["count"] == 2
-        monkeypatch.delitem(sys.modules, "aiofiles", raising=False)
+        # _write_payload_async goes through the descriptor.
+        await handler._write_payload_async(b"xy")
+        assert (tmp_path / "payload.log").read_bytes() == b"xy"
 
         # emit() direct sync-write error branch.
         monkeypatch.setattr(AsyncFileHandler, "_start_worker", lambda self: None)
@@ -0,0 +1,101 @@
+"""
+Role: Tests for per-destination isolation (`IsolatedHandler`).
+Used By:
+ - Pytest discovery and CI.
+Depends On:
+ - hydra_logger
+Notes:
+ - Checks that a stuck wrapped handler blocks only its own worker, plus the
+   overflow policies, latency budget expiry, and reported stats.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from hydra_logger.handlers.base_handler import BaseHandler
+from hydra_logger.handlers.isolated_handler import IsolatedHandler
+from hydra_logger.types.records import LogRecord
+
+
+def _record(message: str) -> LogRecord:
+    return LogRecord(level=20, level_name="INFO", message=message)
+
+
+class _GateHandler(BaseHandler):
+    def __init__(self) -> None:
+        super().__init__(name="gate")
+        self.gate = threading.Event()
+        self.taken = threading.Event()
+        self.written: list[str] = []
+        self.closed = False
+
+    def emit(self, record: LogRecord) -> None:
+        self.taken.set()
+        self.gate.wait(2.0)
+        self.written.append(record.message)
+
+    def close(self) -> None:
+        self.closed = True
+        super().close()
+
+
+def test_isolated_handler_does_not_block_caller_on_stuck_sink() -> None:
+    inner = _GateHandler()
+    handler = IsolatedHandler(inner, max_queue_size=2)
+    started = time.monotonic()
+    handler.emit(_record("a"))
+    assert inner.taken.wait(1.0)
+    for message in ("b", "c", "d"):
+        handler.emit(_record(message))
+    assert time.monotonic() - started < 0.5
+
+    stats = handler.get_stats()
+    assert (stats["depth"], stats["dropped"], stats["alive"]) == (2, 1, True)
+    inner.gate.set()
+    assert handler.flush(timeout=1.0) is True
+    handler.close()
+    assert inner.written == ["a", "b", "c"]
+    assert inner.closed is True
+    stats = handler.get_stats()
+    assert (stats["written"], stats["depth_max"]) == (3, 2)
+    assert stats["write_latency_max_ms"] > 0.0
+
+
+def test_isolated_handler_drop_oldest_and_latency_budget() -> None:
+    inner = _GateHandler()
+    handler = IsolatedHandler(
+        inner, max_queue_size=2, overflow_policy="drop_oldest", latency_budget=0.05
+    )
+    handler.emit(_record("a"))
+    assert inner.taken.wait(1.0)
+    handler.emit_batch([_record("b"), _record("c"), _record("d")])
+    time.sleep(0.1)
+    inner.gate.set()
+    assert handler.flush(timeout=1.0) is True
+    handler.emit(_record("e"))
+    handler.close()
+    assert inner.written == ["a", "e"]
+    stats = handler.get_stats()
+    assert (stats["dropped"], stats["expired"], stats["written"]) == (1, 2, 2)
+    with pytest.raises(ValueError):
+        IsolatedHandler(inner, overflow_policy="block")
+
+
+def test_isolated_handler_forwards_level_and_survives_write_errors() -> None:
+    class _Failing(BaseHandler):
+        def emit(self, record: LogRecord) -> None:
+            raise OSError("down")
+
+    inner = _Failing(name="failing", level=30)
+    handler = IsolatedHandler(inner)
+    assert handler.level == 30
+    handler.setLevel(10)
+    assert inner.level == 10
+    handler.emit(_record("x"))
+    assert handler.flush(timeout=1.0) is True
+    handler.close()
+    assert handler.get_stats()["write_errors"] == 1
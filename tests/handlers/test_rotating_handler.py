@@ -8,6 +8,8 @@ Notes:
  - Validates rotation triggering and factory mapping behavior.
 """
 
+import threading
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from types import SimpleNamespace
@@ -44,6 +46,44 @@ def test_size_rotating_handler_rotates_when_file_exceeds_limit(tmp_path: Path) -
     assert backups
 
 
+def test_rotating_handler_concurrent_emit_and_batch_write_each_line_once(
+    tmp_path: Path, monkeypatch
+) -> None:
+    real_write_chunks = rotating_module.write_chunks
+
+    def slow_write_chunks(file_obj, chunks):  # type: ignore[no-untyped-def]
+        written = real_write_chunks(file_obj, chunks)
+        time.sleep(0.001)
+        return written
+
+    monkeypatch.setattr(rotating_module, "write_chunks", slow_write_chunks)
+    log_file = tmp_path / "shared.log"
+    handler = SizeRotatingFileHandler(
+        filename=str(log_file), max_bytes=10**9, buffer_size=3, flush_interval=60.0
+    )
+
+    def producer(worker: int) -> None:
+        for index in range(20):
+            message = f"w{worker}-{index}"
+            if index % 2:
+                handler.emit_batch(
+                    [LogRecord(level=20, level_name="INFO", message=message)]
+                )
+            else:
+                handler.emit(LogRecord(level=20, level_name="INFO", message=message))
+
+    threads = [threading.Thread(target=producer, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    handler.close()
+    lines = log_file.read_text().splitlines()
+    assert sorted(lines) == sorted(
+        f"INFO: w{worker}-{index}" for worker in range(4) for index in range(20)
+    )
+
+
 def test_rotating_factory_creates_timed_handler_with_mapped_args(
     tmp_path: Path,
 ) -> None:
@@ -473,9 +513,8 @@ def test_rotating_flush_and_write_csv_and_error_paths(
 ) -> None:
     path = tmp_path / "flush.log"
     handler = _TestRotatingHandler(str(path))
-    handler._buffer.append("m")
-    handler._string_buffer.append("m")
-    handler._string_buffer_size = 1
+    handler._buffer.append(b"m")
+    handler._buffered_bytes = 1
 
     # Flush rotates when needed.
     monkeypatch.setattr(handler, "_should_rotate", lambda: True)
@@ -493,8 +532,7 @@ def test_rotating_flush_and_write_csv_and_error_paths(
         closed = True
 
     handler._current_file = _Closed()
-    handler._buffer.append("x")
-    handler._string_buffer.append("x")
+    handler._buffer.append(b"x")
     handler._flush_buffer()
 
     # Generic flush failure path.
@@ -508,8 +546,7 @@ def test_rotating_flush_and_write_csv_and_error_paths(
             return None
 
     handler._current_file = _BadWriter()
-    handler._buffer.append("x")
-    handler._string_buffer.append("x")
+    handler._buffer.append(b"x")
     with caplog.at_level("ERROR", logger="hydra_logger.handlers.rotating_handler"):
         handler._flush_buffer()
     assert "Rotating file buffer flush error" in caplog.text
@@ -652,12 +689,12 @@ def test_rotating_handler_remaining_emit_and_cleanup_branches(
     # format_for_streaming branch (no newline append)
     handler.setFormatter(StreamingFmt())
     handler.emit(LogRecord(level=20, level_name="INFO", message="x"))
-    assert handler._string_buffer[-1] == "stream-only"
+    assert handler._buffer[-1] == b"stream-only"
 
     # format branch + newline append for non-csv formatter
     handler.setFormatter(PlainFmt())
     handler.emit(LogRecord(level=20, level_name="INFO", message="x"))
-    assert handler._string_buffer[-1].endswith("\n")
+    assert handler._buffer[-1].endswith(b"\n")
 
     # OSError/ValueError debug path in flush.
     class _OSErrorWriter:
@@ -673,8 +710,7 @@ def test_rotating_handler_remaining_emit_and_cleanup_branches(
             return None
 
     handler._current_file = _OSErrorWriter()
-    handler._buffer.append("x")
-    handler._string_buffer.append("x")
+    handler._buffer.append(b"x")
     with caplog.at_level("DEBUG", logger="hydra_logger.handlers.rotating_handler"):
         handler._flush_buffer()
     assert "Rotating file flush skipped due to closed or invalid handle" in caplog.text
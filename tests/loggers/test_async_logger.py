@@ -14,13 +14,20 @@ from __future__ import annotations
 import asyncio
 import builtins
 import sys
+import threading
+import time
 import types
+from pathlib import Path
 
 import pytest
 
 from hydra_logger.config.models import LogDestination, LoggingConfig, LogLayer
 from hydra_logger.core.exceptions import HydraLoggerError
+from hydra_logger.handlers.base_handler import BaseHandler
+from hydra_logger.handlers.file_handler import AsyncFileHandler
 from hydra_logger.loggers.async_logger import AsyncLogger
+from hydra_logger.loggers.pipeline.admission_controller import AdmissionController
+from hydra_logger.types.context import log_context
 from hydra_logger.types.levels import LogLevel
 
 
@@ -32,6 +39,46 @@ def test_async_logger_sync_fallback_log_increments_count() -> None:
     assert logger.is_closed is True
 
 
+class _RecordingHandler:
+    def __init__(self) -> None:
+        self.messages = []
+
+    def handle(self, record) -> None:
+        self.messages.append(record.message)
+
+
+def test_async_logger_gates_layer_threshold_before_record_creation() -> None:
+    logger = AsyncLogger(
+        LoggingConfig(
+            layers={
+                "default": LogLayer(
+                    level="INFO",
+                    destinations=[LogDestination(type="null")],
+                )
+            }
+        )
+    )
+    logger._layer_handlers["default"] = [_RecordingHandler()]
+    logger._layer_router.invalidate()
+    built = []
+    original_create = logger._record_builder.create
+
+    def _tracking_create(level, message, *args, **kwargs):
+        built.append(message)
+        return original_create(level, message, *args, **kwargs)
+
+    logger._record_builder.create = _tracking_create  # type: ignore[method-assign]
+    assert logger.is_enabled_for("DEBUG") is False
+    assert logger.is_enabled_for(LogLevel.INFO) is True
+
+    logger._log_sync("DEBUG", "filtered sync")
+    asyncio.run(logger._log_async("DEBUG", "filtered async"))
+    logger.info("emitted sync")
+    assert built == ["emitted sync"]
+    assert logger.get_health_status()["log_count"] == 1
+    logger.close()
+
+
 def test_async_logger_explicit_async_log_and_aclose() -> None:
     logger = AsyncLogger()
     asyncio.run(logger.log_async("INFO", "async message"))
@@ -152,7 +199,6 @@ def test_async_logger_aliases_and_runtime_config_helpers() -> None:
     assert logger.get_configuration_summary()["status"] == "ok"
     assert logger._enable_security is True
     assert logger.get_pool_stats()["status"] == "deprecated"
-    logger._concurrency_semaphore = None
     assert logger.get_concurrency_info()["status"] == "not_initialized"
     logger.close()
 
@@ -226,9 +272,7 @@ def test_async_logger_log_async_raises_hydra_error_and_uses_fallback_handler() -
 def test_async_logger_get_concurrency_info_importerror_path(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    logger = AsyncLogger()
-    logger._optimal_concurrency = 7
-    logger._concurrency_semaphore = asyncio.Semaphore(3)
+    logger = _admission_logger("block", max_in_flight=3)
     real_import = builtins.__import__
 
     def guarded_import(name, globals=None, locals=None, fromlist=(), level=0):  # type: ignore[no-untyped-def]
@@ -239,22 +283,34 @@ def test_async_logger_get_concurrency_info_importerror_path(
     monkeypatch.setattr(builtins, "__import__", guarded_import)
     info = logger.get_concurrency_info()
     assert info["status"] == "active_no_psutil"
+    assert info["optimal_concurrency"] == 3
+    assert info["admission"]["available"] == 3
     logger.close()
 
 
+def _admission_logger(policy: str, **runtime) -> AsyncLogger:  # type: ignore[no-untyped-def]
+    return AsyncLogger(
+        LoggingConfig(
+            layers={
+                "default": LogLayer(
+                    level="DEBUG", destinations=[LogDestination(type="null")]
+                )
+            },
+            extensions={"async_runtime": {"admission_policy": policy, **runtime}},
+        )
+    )
+
+
 def test_async_logger_overflow_worker_processes_and_exits() -> None:
     async def _run() -> None:
-        logger = AsyncLogger()
-        logger._closed = False
-        logger._concurrency_semaphore = None
-        record = logger.create_log_record("INFO", "ovf-msg")
-        await logger._overflow_queue.put(record)
+        logger = _admission_logger("drop_lowest_priority")
 
         async def _emit(_record):  # type: ignore[no-untyped-def]
             logger._closed = True
 
         logger._emit_to_handlers = _emit  # type: ignore[assignment]
-        await asyncio.wait_for(logger._overflow_worker(), timeout=1.0)
+        logger._park_record("INFO", "ovf-msg", (), {})
+        await asyncio.wait_for(logger._overflow_worker_task, timeout=1.0)
         assert logger.get_health_status()["log_count"] >= 1
         await logger.aclose()
 
@@ -767,46 +823,26 @@ def test_async_logger_executes_non_data_extensions_in_deterministic_order() -> N
     asyncio.run(_run())
 
 
-def test_async_logger_ensure_concurrency_semaphore_starts_worker(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    logger = AsyncLogger()
-    task_marker = object()
-
-    def fake_create_task(_coro):  # type: ignore[no-untyped-def]
-        _coro.close()
-        return task_marker
-
-    monkeypatch.setattr(asyncio, "create_task", fake_create_task)
-    logger._ensure_concurrency_semaphore()
-    assert logger._concurrency_semaphore is not None
-    assert logger._optimal_concurrency is not None
-    assert logger._overflow_worker_task is task_marker
-    logger.close()
-
-
-def test_async_logger_overflow_worker_queuefull_path_logs_warning(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
+def test_async_logger_overflow_worker_waits_for_credit_before_popping() -> None:
     async def _run() -> None:
-        logger = AsyncLogger()
-        logger._closed = False
-        logger._concurrency_semaphore = asyncio.Semaphore(0)  # locked() -> True
-        record = logger.create_log_record("INFO", "ovf")
-        await logger._overflow_queue.put(record)
-        warnings = []
+        logger = _admission_logger("drop_lowest_priority", max_in_flight=1)
+        admission = logger._admission
+        assert admission is not None and admission.try_acquire()
+        emitted = []
 
-        def full_nowait(_rec):  # type: ignore[no-untyped-def]
+        async def _emit(rec):  # type: ignore[no-untyped-def]
+            emitted.append(rec.message)
             logger._closed = True
-            raise asyncio.QueueFull()
 
-        monkeypatch.setattr(logger._overflow_queue, "put_nowait", full_nowait)
-        monkeypatch.setattr(
-            "hydra_logger.loggers.async_logger.diagnostics.warning",
-            lambda msg: warnings.append(msg),
-        )
-        await asyncio.wait_for(logger._overflow_worker(), timeout=1.0)
-        assert warnings and "Overflow queue full" in warnings[0]
+        logger._emit_to_handlers = _emit  # type: ignore[assignment]
+        logger._park_record("INFO", "ovf", (), {})
+        await asyncio.sleep(0.01)
+        assert emitted == []
+        assert admission.parked == 1
+
+        admission.release()
+        await asyncio.wait_for(logger._overflow_worker_task, timeout=1.0)
+        assert emitted == ["ovf"]
         await logger.aclose()
 
     asyncio.run(_run())
@@ -819,20 +855,24 @@ def test_async_logger_process_chunk_small_path_handles_item_failures(
         logger = AsyncLogger()
         warnings = []
 
-        async def flaky_log(level, message, **kwargs):  # type: ignore[no-untyped-def]
+        create = logger.create_log_record
+
+        def flaky_create(level, message, **kwargs):  # type: ignore[no-untyped-def]
             if message == "bad":
                 raise RuntimeError("chunk-item-failed")
+            return create(level, message, **kwargs)
 
-        monkeypatch.setattr(logger, "_log_async", flaky_log)
+        monkeypatch.setattr(logger, "create_log_record", flaky_create)
         monkeypatch.setattr(
             "hydra_logger.loggers.async_logger.diagnostics.warning",
             lambda msg, err: warnings.append((msg, str(err))),
         )
 
-        await logger._process_chunk_optimized(
+        stats = await logger._process_chunk_optimized(
             [("INFO", "bad", {}), ("INFO", "good", {})]
         )
         assert warnings and "chunk-item-failed" in warnings[0][1]
+        assert (stats["failed"], stats["dispatched"]) == (1, 1)
         await logger.aclose()
 
     asyncio.run(_run())
@@ -845,10 +885,6 @@ def test_async_logger_process_chunk_large_path_logs_progress(
         logger = AsyncLogger()
         infos = []
 
-        async def ok_log(_level, _message, **_kwargs):  # type: ignore[no-untyped-def]
-            return None
-
-        monkeypatch.setattr(logger, "_log_async", ok_log)
         monkeypatch.setattr(
             "hydra_logger.loggers.async_logger.diagnostics.info",
             lambda *args: infos.append(args),
@@ -907,7 +943,7 @@ def test_async_logger_monitoring_toggle_and_concurrency_reasoning_paths(
     assert logger.get_configuration_summary()["status"] == "ok"
 
     logger._optimal_concurrency = 250
-    logger._concurrency_semaphore = asyncio.Semaphore(2)
+    logger._admission = AdmissionController(credits=2, policy="block")
     fake_psutil = types.SimpleNamespace(
         virtual_memory=lambda: types.SimpleNamespace(
             available=5000 * 1024 * 1024, percent=42
@@ -916,6 +952,8 @@ def test_async_logger_monitoring_toggle_and_concurrency_reasoning_paths(
     monkeypatch.setitem(sys.modules, "psutil", fake_psutil)
     info = logger.get_concurrency_info()
     assert info["status"] == "active"
+    assert info["admission"]["credits"] == 2
+    assert info["admission"]["policy"] == "block"
     assert "MB available" in logger._get_concurrency_reasoning()
 
     real_import = builtins.__import__
@@ -1018,7 +1056,8 @@ def test_async_logger_sync_convenience_methods_schedule_tasks_with_loop(
         logger.warning("w")
         logger.error("e")
         logger.critical("c")
-        assert len(created) == 5
+        # DEBUG is below the default INFO threshold and is gated before scheduling.
+        assert len(created) == 4
         await logger.aclose()
 
     asyncio.run(_run())
@@ -1210,48 +1249,39 @@ def test_async_logger_sync_and_async_internal_exception_swallow_paths() -> None:
     logger.close()
 
 
-def test_async_logger_overflow_worker_timeout_and_exception_paths(
+def test_async_logger_overflow_worker_order_and_exception_paths(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
     async def _run() -> None:
-        logger = AsyncLogger()
-        logger._closed = False
-        logger._concurrency_semaphore = asyncio.Semaphore(1)
-        record = logger.create_log_record("INFO", "ovf-timeout")
-        await logger._overflow_queue.put(record)
+        logger = _admission_logger("drop_lowest_priority", max_in_flight=1)
+        emitted = []
 
-        state = {"calls": 0}
-        original_wait_for = asyncio.wait_for
-
-        async def fake_wait_for(awaitable, *args, **kwargs):  # type: ignore[no-untyped-def]
-            state["calls"] += 1
-            if state["calls"] == 1:
-                awaitable.close()
-                raise asyncio.TimeoutError()
-            if state["calls"] == 2:
-                return await original_wait_for(awaitable, *args, **kwargs)
-            awaitable.close()
-            raise RuntimeError("queue-broken")
+        async def _emit(record):  # type: ignore[no-untyped-def]
+            emitted.append(record.message)
+            logger._closed = len(emitted) == 3
 
-        async def _emit(_record):  # type: ignore[no-untyped-def]
-            logger._closed = True
-
-        monkeypatch.setattr(asyncio, "wait_for", fake_wait_for)
         logger._emit_to_handlers = _emit  # type: ignore[assignment]
-        await original_wait_for(logger._overflow_worker(), timeout=1.0)
+        for index, level in enumerate(("ERROR", "DEBUG", "INFO")):
+            logger._park_record(level, f"ovf-{index}", (), {})
+        await asyncio.wait_for(logger._overflow_worker_task, timeout=1.0)
+        # Parked records run in arrival order whatever their level.
+        assert emitted == ["ovf-0", "ovf-1", "ovf-2"]
 
         # Outer exception sleep branch.
+        original_wait_for = asyncio.wait_for
         logger._closed = False
-        logger._overflow_queue = asyncio.Queue()
-        await logger._overflow_queue.put(logger.create_log_record("INFO", "ovf-outer"))
-        logger._concurrency_semaphore = object()  # type: ignore[assignment]
-        monkeypatch.setattr(asyncio, "wait_for", original_wait_for)
+        logger._park_record("INFO", "ovf-outer", (), {})
+
+        async def broken_run():  # type: ignore[no-untyped-def]
+            raise RuntimeError("overflow-broken")
+
         sleeps = []
 
         async def fake_sleep(seconds: float):  # type: ignore[no-untyped-def]
             sleeps.append(seconds)
             logger._closed = True
 
+        monkeypatch.setattr(logger, "_run_next_parked", broken_run)
         monkeypatch.setattr(asyncio, "sleep", fake_sleep)
         await original_wait_for(logger._overflow_worker(), timeout=1.0)
         assert sleeps
@@ -1338,11 +1368,11 @@ def test_async_logger_aclose_console_close_async_and_outer_exception() -> None:
 def test_async_logger_health_and_reasoning_remaining_branches(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    logger = AsyncLogger()
-    logger._optimal_concurrency = 500
-    logger._concurrency_semaphore = asyncio.Semaphore(4)
+    logger = _admission_logger("block", max_in_flight=4)
     health = logger.get_health_status()
+    assert health["concurrency_optimal"] == 4
     assert health["concurrency_available"] == 4
+    logger._optimal_concurrency = 500
 
     fake_psutil = types.SimpleNamespace(
         virtual_memory=lambda: types.SimpleNamespace(
@@ -1420,11 +1450,14 @@ def test_async_logger_process_chunk_large_branch_item_failure_warning(
         logger = AsyncLogger()
         warnings = []
 
-        async def flaky_log(_level, message, **_kwargs):  # type: ignore[no-untyped-def]
+        create = logger.create_log_record
+
+        def flaky_create(level, message, **kwargs):  # type: ignore[no-untyped-def]
             if message == "bad":
                 raise RuntimeError("large-item-fail")
+            return create(level, message, **kwargs)
 
-        monkeypatch.setattr(logger, "_log_async", flaky_log)
+        monkeypatch.setattr(logger, "create_log_record", flaky_create)
         monkeypatch.setattr(
             "hydra_logger.loggers.async_logger.diagnostics.warning",
             lambda msg, err: warnings.append((msg, str(err))),
@@ -1449,22 +1482,146 @@ def test_async_logger_close_cancels_overflow_worker_task_branch() -> None:
     asyncio.run(_run())
 
 
-def test_async_logger_overflow_worker_breaks_on_queue_exception(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
+def test_async_logger_overflow_worker_exits_without_admission() -> None:
     async def _run() -> None:
         logger = AsyncLogger()
         logger._closed = False
+        await asyncio.wait_for(logger._overflow_worker(), timeout=1.0)
+        await logger.aclose()
+
+    asyncio.run(_run())
 
-        async def broken_wait_for(_awaitable, *args, **kwargs):  # type: ignore[no-untyped-def]
-            _awaitable.close()
-            raise RuntimeError("queue-broken")
 
-        monkeypatch.setattr(asyncio, "wait_for", broken_wait_for)
-        await logger._overflow_worker()
+def test_async_logger_admission_block_waits_for_credit() -> None:
+    async def _run() -> None:
+        logger = _admission_logger("block", max_in_flight=1)
+        gate = asyncio.Event()
+        emitted = []
+
+        async def _emit(record):  # type: ignore[no-untyped-def]
+            await gate.wait()
+            emitted.append(record.message)
+
+        logger._emit_to_handlers = _emit  # type: ignore[assignment]
+        first = asyncio.create_task(logger.log_async("INFO", "first"))
+        second = asyncio.create_task(logger.log_async("INFO", "second"))
+        await asyncio.sleep(0.05)
+        assert not second.done()
+        gate.set()
+        await asyncio.gather(first, second)
+        assert emitted == ["first", "second"]
+        stats = logger.get_health_status()["admission"]
+        assert stats["saturated"] == 1 and stats["dropped"] == 0
+        assert stats["available"] == 1
+        await logger.aclose()
+
+    asyncio.run(_run())
+
+
+def test_async_logger_admission_block_counts_and_warns_on_sync_callers(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    async def _run() -> None:
+        logger = _admission_logger("block", max_in_flight=1)
+        gate = asyncio.Event()
+
+        async def _emit(_record):  # type: ignore[no-untyped-def]
+            await gate.wait()
+
+        logger._emit_to_handlers = _emit  # type: ignore[assignment]
+        held = logger.log("INFO", "held")
+        with caplog.at_level("WARNING"):
+            assert logger.log("INFO", "refused") is None
+            assert logger.log("INFO", "refused-again") is None
+        stats = logger.get_health_status()["admission"]
+        assert (stats["dropped"], stats["nowait_dropped"]) == (2, 2)
+        gate.set()
+        await held
         await logger.aclose()
 
     asyncio.run(_run())
+    warnings = [r for r in caplog.records if "admission_policy=block" in r.message]
+    assert len(warnings) == 1
+
+
+def test_async_logger_admission_drop_newest_bounded_wait_and_sync_callers(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    saturations = []
+    monkeypatch.setattr(
+        "hydra_logger.loggers.pipeline.admission_controller.slo_metrics."
+        "record_queue_saturation",
+        saturations.append,
+    )
+
+    async def _run() -> None:
+        logger = _admission_logger(
+            "drop_newest", max_in_flight=1, admission_timeout_seconds=0.01
+        )
+        gate = asyncio.Event()
+
+        async def _emit(_record):  # type: ignore[no-untyped-def]
+            await gate.wait()
+
+        logger._emit_to_handlers = _emit  # type: ignore[assignment]
+        held = logger.log("INFO", "held")
+        assert isinstance(held, asyncio.Task)
+        await logger.log_async("INFO", "times-out")
+        # Sync callers on the loop cannot wait for a credit.
+        assert logger.log("INFO", "refused") is None
+        stats = logger.get_health_status()["admission"]
+        assert stats["dropped"] == 2 and stats["waited"] == 1
+        assert stats["nowait_dropped"] == 1
+        gate.set()
+        await held
+        await logger.aclose()
+
+    asyncio.run(_run())
+    assert saturations == ["async_logger", "async_logger"]
+
+
+def test_async_logger_admission_drop_lowest_priority_evicts_and_drains_on_close() -> (
+    None
+):
+    async def _run() -> None:
+        logger = _admission_logger(
+            "drop_lowest_priority", max_in_flight=1, overflow_queue_size=2
+        )
+        gate = asyncio.Event()
+        emitted = []
+
+        async def _emit(record):  # type: ignore[no-untyped-def]
+            await gate.wait()
+            emitted.append(record.message)
+
+        logger._emit_to_handlers = _emit  # type: ignore[assignment]
+        held = logger.log("INFO", "held")
+        logger.log("DEBUG", "debug")
+        logger.log("WARNING", "warning")
+        logger.log("ERROR", "error")  # evicts the DEBUG record
+        logger.log("DEBUG", "late-debug")  # lowest level on a full lane
+        stats = logger.get_health_status()["admission"]
+        assert stats["parked"] == 2 and stats["evicted"] == 1
+        assert stats["dropped"] == 2
+
+        gate.set()
+        await held
+        await logger.aclose()
+        assert emitted == ["held", "warning", "error"]
+
+    asyncio.run(_run())
+
+
+def test_async_logger_admission_config_validation_and_modes() -> None:
+    with pytest.raises(ValueError):
+        _admission_logger("spill")
+    logger = _admission_logger("block", mode="queue")
+    assert logger._admission is None
+    logger.close()
+    logger = _admission_logger("block")
+    assert logger._admission is not None
+    assert logger._admission.stats()["credits"] == logger._get_optimal_concurrency()
+    logger.close()
 
 
 def test_async_logger_queue_mode_processes_messages() -> None:
@@ -1797,40 +1954,24 @@ def test_async_logger_worker_and_failure_warning_branches(
         logger._async_record_queue = None
         await logger._async_queue_worker("w-none")
 
-        # _async_queue_worker timeout continue branch.
+        # _async_queue_worker parks on an empty queue until woken.
         logger._async_record_queue = asyncio.Queue()
-        timeout_calls = {"n": 0}
-
-        async def _timeout_then_stop(_awaitable, *_a, **_k):
-            timeout_calls["n"] += 1
-            logger._closed = True
-            if hasattr(_awaitable, "close"):
-                _awaitable.close()
-            raise asyncio.TimeoutError()
-
-        monkeypatch.setattr(asyncio, "wait_for", _timeout_then_stop)
-        logger._closed = False
-        await logger._async_queue_worker("w-timeout")
-        assert timeout_calls["n"] >= 1
-
-        # _async_queue_worker generic exception return branch.
-        async def _generic_error(_awaitable, *_a, **_k):
-            if hasattr(_awaitable, "close"):
-                _awaitable.close()
-            raise RuntimeError("wait fail")
-
-        monkeypatch.setattr(asyncio, "wait_for", _generic_error)
+        logger._async_queue_ready = None
         logger._closed = False
-        await logger._async_queue_worker("w-error")
+        idle = asyncio.create_task(logger._async_queue_worker("w-idle"))
+        await asyncio.sleep(0.01)
+        assert not idle.done()
+        logger._closed = True
+        logger._wake_async_queue_workers()
+        await asyncio.wait_for(idle, timeout=1.0)
 
-        # _async_queue_worker _log_async exception branch.
+        # _async_queue_worker record build exception branch.
         logger._async_record_queue = asyncio.Queue()
         logger._closed = False
         await logger._async_record_queue.put(("INFO", "x", {}))
-        monkeypatch.setattr(asyncio, "wait_for", lambda awaitable, *_a, **_k: awaitable)
         monkeypatch.setattr(
             logger,
-            "_log_async",
+            "_build_record",
             lambda *_a, **_k: (_ for _ in ()).throw(RuntimeError("log fail")),
         )
         monkeypatch.setattr(
@@ -1864,10 +2005,11 @@ def test_async_logger_process_chunk_kwargs_merge_branches_and_debug_task_branch(
 
         seen_kwargs = []
 
-        async def _capture(_level, _message, **kwargs):  # type: ignore[no-untyped-def]
+        def _capture(_level, _message, **kwargs):  # type: ignore[no-untyped-def]
             seen_kwargs.append(kwargs)
+            raise RuntimeError("captured")
 
-        monkeypatch.setattr(logger, "_log_async", _capture)
+        monkeypatch.setattr(logger, "create_log_record", _capture)
         await logger._process_chunk_optimized([("INFO", "small", {"a": 1})], base=2)
         large = [("INFO", f"m{i}", {"x": i}) for i in range(1001)]
         await logger._process_chunk_optimized(large, base=3)
@@ -1930,3 +2072,448 @@ def test_async_logger_raise_if_worker_failed_returns_when_no_error() -> None:
     logger._async_worker_last_error = None
     logger._raise_if_async_worker_failed()
     logger.close()
+
+
+def test_async_logger_queue_mode_keeps_each_callers_ambient_context() -> None:
+    async def _run() -> None:
+        config = LoggingConfig(
+            default_level="INFO",
+            layers={
+                "default": LogLayer(
+                    level="INFO", destinations=[LogDestination(type="null")]
+                )
+            },
+            extensions={"async_runtime": {"mode": "queue", "worker_count": 1}},
+        )
+        logger = AsyncLogger(config=config)
+        seen = []
+
+        class _Handler:
+            def handle(self, record) -> None:  # type: ignore[no-untyped-def]
+                seen.append((record.message, record.request_id))
+
+        logger._layer_handlers["default"] = [_Handler()]
+        logger._layer_router.invalidate()
+
+        async def _request(request_id: str) -> None:
+            with log_context(request_id=request_id):
+                await logger.log_async("INFO", f"msg-{request_id}")
+
+        await asyncio.gather(_request("a"), _request("b"))
+        await logger.aclose()
+        assert sorted(seen) == [("msg-a", "a"), ("msg-b", "b")]
+
+    asyncio.run(_run())
+
+
+def _enqueue_config(**runtime) -> LoggingConfig:  # type: ignore[no-untyped-def]
+    return LoggingConfig(
+        default_level="INFO",
+        layers={
+            "default": LogLayer(
+                level="INFO", destinations=[LogDestination(type="null")]
+            )
+        },
+        extensions={"async_runtime": {"mode": "enqueue", **runtime}},
+    )
+
+
+def test_async_logger_enqueue_mode_creates_no_task_per_call(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def _run() -> None:
+        logger = AsyncLogger(config=_enqueue_config(batch_size=16))
+        seen = []
+
+        class _Handler:
+            def handle(self, record) -> None:  # type: ignore[no-untyped-def]
+                seen.append((record.message, record.request_id))
+
+        logger._layer_handlers["default"] = [_Handler()]
+        logger._layer_router.invalidate()
+
+        loop = asyncio.get_running_loop()
+        created = []
+        real_create_task = loop.create_task
+
+        def _counting_create_task(coro, **kwargs):  # type: ignore[no-untyped-def]
+            created.append(coro)
+            return real_create_task(coro, **kwargs)
+
+        monkeypatch.setattr(loop, "create_task", _counting_create_task)
+        for i in range(100):
+            with log_context(request_id=f"r{i}"):
+                assert logger.log("INFO", "m%s", i) is None
+        assert len(created) == 1  # the single drainer
+
+        health = logger.get_health_status()
+        assert health["async_mode"] == "enqueue"
+        assert health["async_queue_size"] == 100
+        assert health["async_queue_depth_max"] == 100
+
+        await logger.aclose()
+        assert seen == [(f"m{i}", f"r{i}") for i in range(100)]
+        health = logger.get_health_status()
+        assert health["async_queue_processed"] == 100
+        assert health["log_count"] == 100
+        assert health["async_enqueue_latency_max_ms"] >= 0.0
+
+    asyncio.run(_run())
+
+
+@pytest.mark.parametrize(
+    ("policy", "expected"), [("drop_newest", "m0"), ("drop_oldest", "m100")]
+)
+def test_async_logger_enqueue_mode_overflow_policies(
+    policy: str, expected: str
+) -> None:
+    async def _run() -> None:
+        logger = AsyncLogger(
+            config=_enqueue_config(max_queue_size=100, overflow_policy=policy)
+        )
+        seen = []
+
+        class _Handler:
+            def handle(self, record) -> None:  # type: ignore[no-untyped-def]
+                seen.append(record.message)
+
+        logger._layer_handlers["default"] = [_Handler()]
+        logger._layer_router.invalidate()
+        for i in range(101):
+            logger.log("INFO", f"m{i}")
+        assert logger.get_health_status()["async_queue_dropped"] == 1
+        await logger.aclose()
+        assert len(seen) == 100
+        assert expected in seen
+
+    asyncio.run(_run())
+
+
+def test_async_logger_enqueue_mode_rebinds_drainer_to_new_loop() -> None:
+    logger = AsyncLogger(config=_enqueue_config())
+
+    async def _produce() -> None:
+        await logger.log_async("INFO", "first-loop")
+
+    asyncio.run(_produce())
+    assert len(logger._enqueue_ring) <= 1
+
+    async def _finish() -> None:
+        await logger.log_async("INFO", "second-loop")
+        await logger.aclose()
+
+    asyncio.run(_finish())
+    assert logger.get_health_status()["async_queue_processed"] == 2
+
+
+def test_async_logger_foreign_threads_submit_to_owner_loop() -> None:
+    async def _run() -> None:
+        logger = AsyncLogger(config=_enqueue_config())
+        logger.bind_loop()
+        seen = []
+        handler_threads = set()
+
+        class _Handler:
+            def handle(self, record) -> None:  # type: ignore[no-untyped-def]
+                handler_threads.add(threading.get_ident())
+                seen.append(record.message)
+
+        logger._layer_handlers["default"] = [_Handler()]
+        logger._layer_router.invalidate()
+
+        def _produce(thread_id: int) -> None:
+            for i in range(200):
+                assert logger.log("INFO", f"t{thread_id}-{i}") is None
+
+        threads = [threading.Thread(target=_produce, args=(t,)) for t in range(4)]
+        for thread in threads:
+            thread.start()
+        loop = asyncio.get_running_loop()
+        for thread in threads:
+            await loop.run_in_executor(None, thread.join)
+        await asyncio.sleep(0)
+        await logger.aclose()
+
+        assert sorted(seen) == sorted(f"t{t}-{i}" for t in range(4) for i in range(200))
+        assert handler_threads == {threading.get_ident()}
+        health = logger.get_health_status()
+        assert health["async_threadsafe_submitted"] == 800
+        # Wake-ups are coalesced: never more than one per submission.
+        assert 1 <= health["async_threadsafe_wakeups"] <= 800
+
+    asyncio.run(_run())
+
+
+def test_async_logger_bind_loop_requires_queue_or_enqueue_mode() -> None:
+    async def _run() -> None:
+        logger = AsyncLogger()
+        with pytest.raises(HydraLoggerError, match="bind_loop"):
+            logger.bind_loop()
+        await logger.aclose()
+
+    asyncio.run(_run())
+
+
+def test_async_logger_thread_without_bound_loop_uses_sync_fallback() -> None:
+    logger = AsyncLogger(config=_enqueue_config())
+    worker = threading.Thread(target=logger.log, args=("INFO", "sync path"))
+    worker.start()
+    worker.join()
+    assert logger.get_health_status()["log_count"] == 1
+    logger.close()
+
+
+class _BatchHandler(BaseHandler):
+    def __init__(self) -> None:
+        super().__init__(name="batch", level=LogLevel.INFO)
+        self.batches: list = []
+
+    def emit(self, record) -> None:  # type: ignore[no-untyped-def]
+        self.batches.append([record.message])
+
+    async def emit_batch_async(self, records) -> None:  # type: ignore[no-untyped-def]
+        self.batches.append([record.message for record in records])
+
+
+def test_async_logger_log_batch_hands_one_batch_per_layer_run() -> None:
+    async def _run() -> None:
+        logger = AsyncLogger(_enqueue_config())
+        handler = _BatchHandler()
+        logger._layer_handlers["default"] = [handler]
+        logger._layer_router.invalidate()
+        await logger.log_batch(
+            [("INFO", "a", {}), ("DEBUG", "filtered", {}), ("WARNING", "b", {})]
+        )
+        assert handler.batches == [["a", "b"]]
+        assert logger.get_health_status()["log_count"] == 2
+        await logger.aclose()
+
+    asyncio.run(_run())
+
+
+def test_async_logger_log_batch_reports_stage_timings_and_counts() -> None:
+    async def _run() -> None:
+        logger = AsyncLogger(_enqueue_config())
+        handler = _BatchHandler()
+        logger._layer_handlers["default"] = [handler]
+        logger._layer_router.invalidate()
+        prechecks = []
+        precheck = logger._record_builder.precheck
+
+        def _counting_precheck(*args):  # type: ignore[no-untyped-def]
+            prechecks.append(args[:2])
+            return precheck(*args)
+
+        logger._record_builder.precheck = _counting_precheck  # type: ignore[method-assign]
+        messages = [("INFO", f"m{i}", {}) for i in range(250)]
+        messages += [("DEBUG", "filtered", {}), (object(), "bad", {})]
+        stats = await logger.log_batch(messages, layer="default")
+
+        assert {k: stats[k] for k in ("records", "dispatched", "filtered")} == {
+            "records": 252,
+            "dispatched": 250,
+            "filtered": 1,
+        }
+        assert stats["failed"] == 1
+        assert set(stats["stage_seconds"]) == {
+            "normalize",
+            "build",
+            "redact",
+            "dispatch",
+        }
+        assert all(seconds >= 0 for seconds in stats["stage_seconds"].values())
+        # One precheck per distinct (level, layer) per chunk of 100.
+        assert prechecks.count(("INFO", "default")) == 3
+        assert sum(len(batch) for batch in handler.batches) == 250
+        await logger.aclose()
+
+    asyncio.run(_run())
+
+
+def test_async_logger_enqueue_drainer_emits_ring_in_batches() -> None:
+    async def _run() -> None:
+        logger = AsyncLogger(config=_enqueue_config())
+        handler = _BatchHandler()
+        logger._layer_handlers["default"] = [handler]
+        logger._layer_router.invalidate()
+        for i in range(10):
+            logger.log("INFO", f"m{i}")
+        await logger.aclose()
+        assert [m for batch in handler.batches for m in batch] == [
+            f"m{i}" for i in range(10)
+        ]
+        assert len(handler.batches) < 10
+
+    asyncio.run(_run())
+
+
+def test_async_logger_priority_lanes_keep_errors_and_shed_by_layer() -> None:
+    async def _run() -> None:
+        logger = AsyncLogger(
+            LoggingConfig(
+                layers={
+                    "default": LogLayer(
+                        level="DEBUG", destinations=[LogDestination(type="null")]
+                    )
+                },
+                extensions={
+                    "async_runtime": {
+                        "mode": "queue",
+                        "max_queue_size": 100,
+                        "priority_lanes": True,
+                        "adaptive_shedding": True,
+                        "shed_watermarks": {"INFO": 0.5},
+                    }
+                },
+            )
+        )
+        emitted = []
+
+        async def _emit(records):  # type: ignore[no-untyped-def]
+            emitted.extend(record.level_name for record in records)
+
+        logger._emit_record_batch = _emit  # type: ignore[method-assign]
+        # Producers never yield to the worker, so the queue fills up.
+        for index in range(200):
+            await logger.log_async("DEBUG", f"d{index}")
+            await logger.log_async("ERROR", f"e{index}")
+        health = logger.get_health_status()
+        assert health["async_queue_lanes"]["ERROR"] == {"depth": 200, "dropped": 0}
+        assert health["async_queue_lanes"]["DEBUG"]["dropped"] == 150
+        assert health["async_queue_shedding"]["floors"] == {"default": "INFO"}
+        assert health["async_queue_dropped"] == 150
+
+        await logger.aclose()
+        assert emitted.count("ERROR") == 200
+        assert emitted.count("DEBUG") == 50
+
+    asyncio.run(_run())
+
+
+def test_async_logger_priority_lanes_protect_errors_from_foreign_threads() -> None:
+    async def _run() -> None:
+        logger = AsyncLogger(
+            LoggingConfig(
+                default_level="DEBUG",
+                layers={
+                    "default": LogLayer(
+                        level="DEBUG", destinations=[LogDestination(type="null")]
+                    )
+                },
+                extensions={
+                    "async_runtime": {
+                        "mode": "queue",
+                        "max_queue_size": 100,
+                        "priority_lanes": True,
+                        "adaptive_shedding": True,
+                        "shed_watermarks": {"INFO": 0.5},
+                    }
+                },
+            )
+        )
+        logger.bind_loop()
+        emitted = []
+
+        async def _emit(records):  # type: ignore[no-untyped-def]
+            emitted.extend(record.level_name for record in records)
+
+        logger._emit_record_batch = _emit  # type: ignore[method-assign]
+
+        def _produce() -> None:
+            for index in range(300):
+                logger.log("INFO", f"i{index}")
+                if index % 3 == 0:
+                    logger.log("ERROR", f"e{index}")
+
+        producers = [threading.Thread(target=_produce) for _ in range(2)]
+        for producer in producers:
+            producer.start()
+        # Joining blocks the loop, so every submission piles up in the ring.
+        for producer in producers:
+            producer.join()
+        await logger.aclose()
+
+        assert emitted.count("ERROR") == 200
+        assert emitted.count("INFO") < 600
+        health = logger.get_health_status()
+        assert health["async_queue_lanes"]["ERROR"]["dropped"] == 0
+
+    asyncio.run(_run())
+
+
+def test_async_logger_offload_mode_runs_record_work_on_offload_thread() -> None:
+    async def _run() -> None:
+        logger = AsyncLogger(
+            _enqueue_config(mode="offload", loop_lag_interval_seconds=0.01)
+        )
+        threads = []
+
+        class _ThreadHandler(_BatchHandler):
+            def emit_batch(self, records) -> None:  # type: ignore[no-untyped-def]
+                threads.append(threading.current_thread().name)
+                self.batches.append([record.message for record in records])
+
+        handler = _ThreadHandler()
+        logger._layer_handlers["default"] = [handler]
+        logger._layer_router.invalidate()
+        for index in range(5):
+            logger.info("m%s", index)
+        await logger.log_async("DEBUG", "filtered")
+        await logger.log_async("WARNING", "w")
+        await asyncio.sleep(0.03)
+
+        info = logger.get_concurrency_info()
+        assert info["loop_lag"]["running"] is True
+        assert info["loop_lag"]["samples"] >= 1
+        assert logger.get_health_status()["async_mode"] == "offload"
+
+        await logger.aclose()
+        assert [m for batch in handler.batches for m in batch] == [
+            "m0", "m1", "m2", "m3", "m4", "w"
+        ]
+        assert set(threads) == {"hydra-logger-offload"}
+        stats = logger.get_concurrency_info()["offload"]
+        assert (stats["processed"], stats["dropped"], stats["alive"]) == (6, 0, False)
+        assert logger.get_concurrency_info()["loop_lag"]["running"] is False
+
+    asyncio.run(_run())
+
+
+def test_async_logger_offload_mode_writes_real_file_without_the_loop(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "offload.log"
+
+    async def _run() -> None:
+        logger = AsyncLogger(
+            LoggingConfig(
+                default_level="INFO",
+                layers={
+                    "default": LogLayer(
+                        level="INFO",
+                        destinations=[
+                            LogDestination(
+                                type="file", path=str(path), format="plain-text"
+                            )
+                        ],
+                    )
+                },
+                extensions={
+                    "async_runtime": {"mode": "offload", "loop_lag_monitor": False}
+                },
+            )
+        )
+        handler = logger._layer_handlers["default"][0]
+        assert isinstance(handler, AsyncFileHandler)
+        logger.info("straight to disk")
+        # Block the loop: the line must arrive without the loop running again.
+        deadline = time.monotonic() + 1.0
+        while time.monotonic() < deadline and "straight to disk" not in (
+            path.read_text() if path.exists() else ""
+        ):
+            time.sleep(0.01)
+        assert "straight to disk" in path.read_text()
+        assert handler.get_stats()["queue_size"] == 0
+        await logger.aclose()
+
+    asyncio.run(_run())
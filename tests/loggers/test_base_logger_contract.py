@@ -100,6 +100,7 @@ def test_base_logger_performance_profile_stats_and_context_manager() -> None:
     assert logger.get_performance_profile() == "minimal"
     stats = logger.get_record_creation_stats()
     assert stats["performance_profile"] == "minimal"
+    assert {"hits", "misses", "evictions"} <= set(stats["caller_cache"])
 
     with logger as ctx:
         assert ctx is logger
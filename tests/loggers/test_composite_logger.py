@@ -1458,3 +1458,95 @@ def test_composite_async_aclose_component_prepare_exception_branch() -> None:
         assert logger._closed is True
 
     asyncio.run(_run())
+
+
+def test_composite_logger_shares_single_render_across_components() -> None:
+    from hydra_logger.loggers.sync_logger import SyncLogger
+
+    class Arg:
+        renders = 0
+
+        def __str__(self) -> str:
+            Arg.renders += 1
+            return "v"
+
+    class Handler:
+        def __init__(self) -> None:
+            self.messages = []
+
+        def handle(self, record) -> None:  # type: ignore[no-untyped-def]
+            self.messages.append(record.message)
+
+    components, handlers = [], []
+    for _ in range(2):
+        component = SyncLogger()
+        handler = Handler()
+        component._layer_handlers["default"] = [handler]
+        component._layer_router.invalidate()
+        components.append(component)
+        handlers.append(handler)
+
+    logger = CompositeLogger(components=components)
+    logger.info("value=%s", Arg())
+    logger.log("WARNING", "again=%s", Arg())
+    assert [h.messages for h in handlers] == [["value=v", "again=v"]] * 2
+    assert Arg.renders == 2
+    logger.close()
+
+
+def test_composite_logger_log_batch_hands_sync_logger_components_one_batch() -> None:
+    from hydra_logger.loggers.sync_logger import SyncLogger
+
+    batches = []
+
+    class BatchHandler:
+        def emit_batch(self, records) -> None:  # type: ignore[no-untyped-def]
+            batches.append([(r.level_name, r.message) for r in records])
+
+    component = SyncLogger()
+    component._layer_handlers["default"] = [BatchHandler()]
+    component._layer_router.invalidate()
+    logger = CompositeLogger(components=[component])
+    logger.log_batch([("INFO", "a", {}), ("ERROR", "b", {}), (10, "debug", {})])
+    assert batches == [[("INFO", "a"), ("ERROR", "b")]]
+    logger.close()
+
+
+def test_composite_async_logger_log_bulk_batches_handlers_and_async_loggers() -> None:
+    from hydra_logger.loggers.async_logger import AsyncLogger
+
+    async def _run() -> None:
+        class BatchComponent:
+            def __init__(self) -> None:
+                self.batches = []
+
+            async def emit_batch_async(self, records) -> None:  # type: ignore[no-untyped-def]
+                self.batches.append([r.message for r in records])
+
+        class Handler:
+            def __init__(self) -> None:
+                self.batches = []
+
+            async def emit_batch_async(self, records) -> None:  # type: ignore[no-untyped-def]
+                self.batches.append([r.message for r in records])
+
+        direct = BatchComponent()
+        inner = AsyncLogger(
+            LoggingConfig(
+                layers={
+                    "default": LogLayer(
+                        level="INFO", destinations=[LogDestination(type="null")]
+                    )
+                }
+            )
+        )
+        handler = Handler()
+        inner._layer_handlers["default"] = [handler]
+        inner._layer_router.invalidate()
+        logger = CompositeAsyncLogger(components=[direct, inner], use_direct_io=False)
+        await logger.log_bulk("INFO", ["a", 2, None])
+        assert direct.batches == [["a", "2"]]
+        assert handler.batches == [["a", "2"]]
+        await logger.aclose()
+
+    asyncio.run(_run())
@@ -0,0 +1,135 @@
+"""
+Role: Pytest coverage for the multiprocess (shared ring + writer process) runtime.
+Used By:
+ - Pytest discovery and local CI quality gates.
+Depends On:
+ - hydra_logger
+Notes:
+ - Forks real workers and starts real writer processes; counts stay small.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import weakref
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from hydra_logger import create_logger, getMultiprocessLogger
+from hydra_logger.core.logger_management import removeLogger
+from hydra_logger.config.models import LogDestination, LoggingConfig, LogLayer
+from hydra_logger.core.exceptions import HydraLoggerError
+from hydra_logger.loggers.multiprocess_logger import (
+    MultiprocessLogger,
+    _load_runtime_options,
+)
+
+requires_fork = pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+
+
+def _config(path: Path, **runtime) -> LoggingConfig:
+    return LoggingConfig(
+        layers={
+            "default": LogLayer(
+                level="INFO",
+                destinations=[
+                    LogDestination(type="file", path=str(path), format="plain-text")
+                ],
+            )
+        },
+        extensions={"multiprocess_runtime": runtime} if runtime else None,
+    )
+
+
+def _messages(path: Path) -> Counter:
+    lines = path.read_text(encoding="utf-8").splitlines()
+    return Counter(line.rsplit(" ", 1)[-1] for line in lines)
+
+
+@requires_fork
+def test_forked_workers_share_one_writer_without_duplicates(tmp_path: Path) -> None:
+    path = tmp_path / "app.log"
+    logger = create_logger(_config(path), logger_type="multiprocess", name="mp")
+    assert isinstance(logger, MultiprocessLogger)
+
+    pids = []
+    for worker in range(3):
+        pid = os.fork()
+        if pid == 0:
+            for i in range(200):
+                logger.info(f"w{worker}-{i}")
+            os._exit(0)
+        pids.append(pid)
+    for i in range(50):
+        logger.info(f"parent-{i}")
+    for pid in pids:
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+
+    health = logger.get_health_status()["multiprocess"]
+    assert health["owner"] is True
+    assert health["writer_alive"] is True
+    assert health["enqueued"] == 50
+    logger.close()
+
+    counts = _messages(path)
+    expected = {f"w{w}-{i}" for w in range(3) for i in range(200)}
+    expected |= {f"parent-{i}" for i in range(50)}
+    assert set(counts) == expected
+    assert set(counts.values()) == {1}
+
+
+def test_spawned_writer_and_level_filtering(tmp_path: Path) -> None:
+    path = tmp_path / "spawn.log"
+    logger = create_logger(
+        _config(path, start_method="spawn"), logger_type="multiprocess", name="mp"
+    )
+    logger.debug("filtered")
+    logger.warning("kept")
+    logger.close()
+    assert _messages(path) == Counter({"kept": 1})
+
+
+def test_runtime_options_merge_and_clamp() -> None:
+    config = LoggingConfig(
+        extensions={
+            "multiprocess_runtime": {
+                "ring_size_bytes": 10,
+                "overflow_policy": "BLOCK_WITH_TIMEOUT",
+                "put_timeout_seconds": -1,
+            }
+        }
+    )
+    options = _load_runtime_options(config)
+    assert options["ring_size_bytes"] == 4096
+    assert options["overflow_policy"] == "block_with_timeout"
+    assert options["put_timeout_seconds"] == 0.0
+    assert _load_runtime_options(None)["overflow_policy"] == "drop_newest"
+
+
+def test_multiprocess_logger_rejects_runtime_layer_changes(tmp_path: Path) -> None:
+    logger = getMultiprocessLogger("mp-layers", _config(tmp_path / "l.log"))
+    try:
+        with pytest.raises(HydraLoggerError):
+            logger.add_layer("extra", _config(tmp_path / "x.log").layers["default"])
+        with pytest.raises(HydraLoggerError):
+            logger.remove_layer("default")
+    finally:
+        logger.close()
+        removeLogger("mp-layers")
+    assert logger.get_health_status()["multiprocess"]["writer_pid"] is None
+
+
+def test_closed_multiprocess_logger_is_not_kept_alive_by_exit_hook(
+    tmp_path: Path,
+) -> None:
+    logger = MultiprocessLogger(_config(tmp_path / "gc.log"), name="mp-gc")
+    logger.info("done")
+    logger.close()
+    ref = weakref.ref(logger)
+    del logger
+    gc.collect()
+    assert ref() is None
@@ -10,6 +10,7 @@ Notes:
 """
 
 import asyncio
+import threading
 from types import SimpleNamespace
 
 import pytest
@@ -17,13 +18,21 @@ import pytest
 from hydra_logger.core.exceptions import HydraLoggerError
 from hydra_logger.extensions.extension_base import ExtensionBase, SecurityExtension
 from hydra_logger.extensions.extension_manager import ExtensionManager
+from hydra_logger.handlers.null_handler import NullHandler
 from hydra_logger.loggers.pipeline import (
+    AdmissionController,
     ComponentDispatcher,
     ExtensionProcessor,
     HandlerDispatcher,
+    LayerRouter,
+    LoadShedder,
+    LoopLagMonitor,
+    OffloadThread,
+    PriorityLaneQueue,
     RecordBuilder,
 )
 from hydra_logger.types.levels import LogLevelManager
+from hydra_logger.types.records import WITHHELD_MESSAGE, CompactLogRecord, LazyMessage
 
 
 class DummyLogger:
@@ -181,6 +190,41 @@ def test_record_builder_logs_and_raises_on_invalid_level(caplog) -> None:
     assert "Record level normalization failed for level=" in caplog.text
 
 
+def test_record_builder_precheck_gates_before_record_creation() -> None:
+    logger = DummyLogger()
+    builder = RecordBuilder(logger)
+    router = LayerRouter({"api": SimpleNamespace(level="WARNING")}, {}, {}, {})
+
+    assert builder.precheck("DEBUG", "api", router) is None
+    assert builder.precheck("ERROR", "api", router) == LogLevelManager.get_level(
+        "ERROR"
+    )
+    assert builder.precheck("DEBUG", None, router, "DEBUG") == 10
+    assert logger.calls == []
+
+
+def test_record_builder_create_batch_shares_kwargs_and_reports_failures() -> None:
+    logger = DummyLogger()
+    builder = RecordBuilder(logger)
+    common = {"layer": "api"}
+    errors = []
+
+    def create_log_record(level, message, **kwargs):  # type: ignore[no-untyped-def]
+        if message == "bad":
+            raise RuntimeError("bad entry")
+        return DummyLogger.create_log_record(logger, level, message, **kwargs)
+
+    logger.create_log_record = create_log_record  # type: ignore[method-assign]
+    records = builder.create_batch(
+        [(20, "a", common), (30, "bad", common), (40, "b", {"extra": {"n": 1}})],
+        errors.append,
+    )
+    assert [record["message"] for record in records] == ["a", "b"]
+    assert [str(error) for error in errors] == ["bad entry"]
+    assert logger.calls[0] == (20, "a", {"layer": "api"})
+    assert common == {"layer": "api"}
+
+
 def test_handler_dispatcher_sync_prefers_handle_then_tolerates_failure() -> None:
     dispatcher = HandlerDispatcher()
     first = HandleAndEmitHandler()
@@ -270,6 +314,69 @@ def test_handler_dispatcher_async_noop_handler_shape_and_token_fallback() -> Non
     )
 
 
+class BatchRecorder:
+    def __init__(self) -> None:
+        self.batches = []
+
+    def emit_batch(self, records) -> None:
+        self.batches.append(list(records))
+
+
+def test_handler_dispatcher_batch_sync_uses_emit_batch_or_per_record() -> None:
+    dispatcher = HandlerDispatcher()
+    batched = BatchRecorder()
+    per_record = HandleOnlyHandler()
+    records = [object(), object()]
+
+    dispatcher.dispatch_batch_sync(records, [batched, per_record])
+    dispatcher.dispatch_batch_sync([], [batched])
+
+    assert batched.batches == [records]
+    assert per_record.calls == 2
+
+
+class ThreadsafeRecorder(BatchRecorder):
+    def __init__(self) -> None:
+        super().__init__()
+        self.direct = []
+
+    def emit_batch_threadsafe(self, records) -> None:
+        self.direct.append(list(records))
+
+
+def test_handler_dispatcher_batch_threadsafe_prefers_direct_entry_point() -> None:
+    dispatcher = HandlerDispatcher()
+    loop_bound = ThreadsafeRecorder()
+    plain = BatchRecorder()
+    records = [object(), object()]
+
+    dispatcher.dispatch_batch_threadsafe(records, [loop_bound, plain])
+
+    assert loop_bound.direct == [records]
+    assert loop_bound.batches == []
+    assert plain.batches == [records]
+
+
+def test_handler_dispatcher_batch_async_prefers_batch_overrides(caplog) -> None:
+    dispatcher = HandlerDispatcher()
+    async_emit = AsyncEmitMethodHandler()
+    bad = FailingAsyncEmitMethodHandler()
+    null = NullHandler()
+    records = [SimpleNamespace(level=20), SimpleNamespace(level=20)]
+
+    with caplog.at_level(
+        "ERROR", logger="hydra_logger.loggers.pipeline.handler_dispatcher"
+    ):
+        asyncio.run(dispatcher.dispatch_batch_async(records, [async_emit, bad, null]))
+
+    # No batch override: the handler keeps its per-record emit path.
+    assert async_emit.calls == 2
+    assert (
+        "Async batch dispatch failed for handler type=FailingAsyncEmitMethodHandler"
+        in caplog.text
+    )
+
+
 def test_extension_processor_applies_enabled_protection_only() -> None:
     processor = ExtensionProcessor()
     record = SimpleNamespace(message="secret")
@@ -291,7 +398,7 @@ def test_extension_processor_swallows_extension_failures() -> None:
     protection = DummyDataProtection(enabled=True, should_fail=True)
 
     updated = processor.apply_data_protection(record, protection)
-    assert updated.message == "secret"
+    assert updated.message == WITHHELD_MESSAGE
     assert protection.calls == 1
 
 
@@ -347,7 +454,7 @@ def test_extension_processor_owner_handles_data_protection_failure_context() ->
     protection = DummyDataProtection(enabled=True, should_fail=True)
 
     updated = processor.apply_data_protection(record, protection)
-    assert updated.message == "secret"
+    assert updated.message == WITHHELD_MESSAGE
     assert owner.calls == [("extension_data_protection", "process failed")]
 
 
@@ -359,6 +466,22 @@ def test_extension_processor_reraises_hydra_error_from_owner() -> None:
 
     with pytest.raises(HydraLoggerError, match="strict failure"):
         processor.apply_data_protection(record, protection)
+    assert record.message == WITHHELD_MESSAGE
+
+
+def test_extension_processor_routes_deferred_redaction_failures() -> None:
+    owner = FailingOwner(raise_hydra_error=True)
+    processor = ExtensionProcessor(owner)
+    record = CompactLogRecord(message=LazyMessage("token=%s", ("abc",)))
+    processor.apply_data_protection(
+        record, DummyDataProtection(enabled=True, should_fail=True)
+    )
+    assert owner.calls == []
+
+    with pytest.raises(HydraLoggerError, match="strict failure"):
+        record.message
+    assert owner.calls == [("extension_data_protection", "process failed")]
+    assert record.message == WITHHELD_MESSAGE
 
 
 def test_extension_processor_applies_non_data_extensions_in_order() -> None:
@@ -393,6 +516,27 @@ def test_extension_processor_applies_non_data_extensions_in_order() -> None:
     assert updated.context["message"] == 'token="abc"'
 
 
+def test_extension_processor_apply_batch_matches_per_record_steps() -> None:
+    class SuffixExtension(ExtensionBase):
+        def process(self, data):  # type: ignore[no-untyped-def]
+            return f"{data}:S" if isinstance(data, str) else data
+
+    manager = ExtensionManager()
+    manager.register_extension_type("suffix", SuffixExtension)
+    manager.create_extension("suffix", "suffix", enabled=True)
+    protection = DummyDataProtection()
+    records = [
+        SimpleNamespace(message=f"m{i}", context=None, extra=None) for i in range(3)
+    ]
+    processed = ExtensionProcessor().apply_batch(records, manager, protection)
+    assert [record.message for record in processed] == [
+        "masked:m0:S",
+        "masked:m1:S",
+        "masked:m2:S",
+    ]
+    assert ExtensionProcessor().apply_batch(records, None, None) is records
+
+
 def test_extension_processor_non_data_extension_failure_uses_owner_policy() -> None:
     class FailingExtension(ExtensionBase):
         def process(self, _data):  # type: ignore[no-untyped-def]
@@ -549,3 +693,153 @@ def test_component_dispatcher_async_logs_component_failure(caplog) -> None:
         "Async component dispatch failed for component type=AsyncComponent"
         in caplog.text
     )
+
+
+def test_admission_controller_credits_and_bounded_wait() -> None:
+    async def _run() -> None:
+        admission = AdmissionController(credits=1, policy="drop_newest")
+        assert admission.try_acquire() is True
+        assert admission.try_acquire() is False
+        assert await admission.acquire(0.01) is False
+
+        waiter = asyncio.create_task(admission.acquire(None))
+        await asyncio.sleep(0)
+        admission.release()
+        assert await waiter is True
+        admission.release()
+        admission.release()  # never exceeds the credit count
+        assert admission.stats()["available"] == 1
+
+    asyncio.run(_run())
+
+
+def test_admission_controller_overflow_lane_order_and_eviction() -> None:
+    admission = AdmissionController(
+        credits=1, policy="drop_lowest_priority", overflow_size=2
+    )
+    assert admission.park(10, "debug") is True
+    assert admission.park(40, "error") is True
+    assert admission.park(10, "late-debug") is False
+    assert admission.park(30, "warning") is True
+    assert admission.stats()["evicted"] == 1
+    assert [admission.pop_parked(), admission.pop_parked()] == ["error", "warning"]
+    assert admission.pop_parked() is None
+
+
+def test_admission_controller_rejects_unknown_policy_and_lane_misuse() -> None:
+    with pytest.raises(ValueError):
+        AdmissionController(credits=1, policy="spill")
+    with pytest.raises(RuntimeError):
+        AdmissionController(credits=1, policy="block").park(20, "x")
+
+
+def test_priority_lane_queue_protects_errors_and_sheds_lowest_lane() -> None:
+    async def _run() -> None:
+        queue = PriorityLaneQueue(2)
+        queue.put_nowait(("DEBUG", "d"))
+        queue.put_nowait(("INFO", "i"))
+        queue.put_nowait(("WARNING", "w"))  # sheds the DEBUG payload
+        with pytest.raises(asyncio.QueueFull):
+            queue.put_nowait(("DEBUG", "late"))
+        for index in range(5):
+            queue.put_nowait(("ERROR", f"e{index}"))  # never bounded
+        assert queue.qsize() == 7 and queue.occupancy == 1.0
+
+        drained = [queue.get_nowait()[1] for _ in range(queue.qsize())]
+        assert drained == ["e0", "e1", "e2", "e3", "e4", "w", "i"]
+        assert queue.empty()
+        stats = queue.lane_stats()
+        assert stats["DEBUG"]["dropped"] == 2
+        assert stats["ERROR"]["dropped"] == 0
+        for _ in drained:
+            queue.task_done()
+        await asyncio.wait_for(queue.join(), timeout=1.0)
+
+    asyncio.run(_run())
+
+
+def test_priority_lane_queue_drop_oldest_sheds_own_lane() -> None:
+    queue = PriorityLaneQueue(1, shed_same_lane=True)
+    queue.put_nowait(("INFO", "old"))
+    queue.put_nowait(("INFO", "new"))
+    assert queue.get_nowait()[1] == "new"
+    assert queue.lane_stats()["INFO"]["dropped"] == 1
+
+
+def test_load_shedder_raises_and_restores_layer_floor_with_hysteresis() -> None:
+    shedder = LoadShedder({"INFO": 0.5, "WARNING": 0.8}, hysteresis=0.1)
+    assert shedder.admit("api", 10, 0.2) is True
+    assert shedder.admit("api", 10, 0.6) is False
+    assert shedder.admit("api", 20, 0.85) is False
+    assert shedder.admit("db", 10, 0.1) is True  # floors are per layer
+    assert shedder.stats()["floors"] == {"api": "WARNING"}
+    assert shedder.admit("api", 20, 0.75) is False  # held inside the band
+    assert shedder.admit("api", 20, 0.65) is True
+    assert shedder.admit("api", 10, 0.3) is True
+    assert shedder.stats() == {"floors": {}, "shed": {"api": 3}}
+    with pytest.raises(ValueError):
+        LoadShedder({"ERROR": 0.9})
+
+
+def test_offload_thread_batches_in_order_and_drains_on_stop() -> None:
+    batches = []
+    taken = threading.Event()
+    release = threading.Event()
+
+    def process(batch):  # type: ignore[no-untyped-def]
+        taken.set()
+        release.wait(1.0)
+        batches.append(list(batch))
+
+    offload = OffloadThread(process, max_size=3, batch_size=2)
+    assert offload.submit(0) is True
+    assert taken.wait(1.0)
+    assert [offload.submit(item) for item in (1, 2, 3, 4)] == [True] * 3 + [False]
+    release.set()
+    assert offload.flush(timeout=1.0) is True
+    assert offload.stop(timeout=1.0) is True
+    assert offload.submit(5) is False
+    assert batches == [[0], [1, 2], [3]]
+    stats = offload.stats()
+    assert (stats["alive"], stats["processed"], stats["dropped"]) == (False, 4, 1)
+    assert stats["depth_max"] == 3
+
+
+def test_offload_thread_survives_process_failures() -> None:
+    seen = []
+
+    def process(batch):  # type: ignore[no-untyped-def]
+        seen.extend(batch)
+        raise RuntimeError("boom")
+
+    offload = OffloadThread(process)
+    offload.submit("a")
+    assert offload.flush(timeout=1.0) is True
+    offload.submit("b")
+    assert offload.stop(timeout=1.0) is True
+    assert seen == ["a", "b"]
+
+
+def test_loop_lag_monitor_records_blocked_loop() -> None:
+    async def _run() -> None:
+        monitor = LoopLagMonitor(interval=0.01)
+        loop = asyncio.get_running_loop()
+        monitor.start(loop)
+        monitor.start(loop)
+        assert monitor.running_on(loop)
+        await asyncio.sleep(0.005)
+        time_block = loop.time() + 0.05
+        while loop.time() < time_block:
+            pass
+        await asyncio.sleep(0.03)
+        stats = monitor.stats()
+        assert stats["running"] is True
+        assert stats["samples"] >= 1
+        assert stats["max_ms"] >= 30.0
+        await monitor.stop()
+        assert monitor.stats()["running"] is False
+
+    asyncio.run(_run())
+    monitor = LoopLagMonitor()
+    monitor.record(-1.0)
+    assert monitor.stats()["max_ms"] == 0.0
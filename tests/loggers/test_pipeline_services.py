@@ -70,3 +70,39 @@ def test_layer_router_handles_handler_resolution_error(caplog) -> None:
 
     assert handlers == []
     assert "Layer handler resolution failed for layer=x" in caplog.text
+
+
+def test_layer_router_compiles_filtered_emit_plans_and_invalidates() -> None:
+    from hydra_logger.handlers.base_handler import BaseHandler
+    from hydra_logger.handlers.null_handler import NullHandler
+
+    class RecordingHandler(BaseHandler):
+        def __init__(self, level: int) -> None:
+            super().__init__("recording", level=level)
+            self.records = []
+
+        def emit(self, record) -> None:
+            self.records.append(record)
+
+    info_handler = RecordingHandler(20)
+    error_handler = RecordingHandler(40)
+    layer_handlers = {"default": [info_handler, error_handler, NullHandler()]}
+    router = LayerRouter({"default": DummyLayer("DEBUG")}, layer_handlers, {}, {})
+
+    info_plan = router.sync_plan("default", 20)
+    assert router.sync_plan("default", 20) is info_plan
+    assert [fn.__self__ for fn, _ in info_plan] == [info_handler]
+    assert len(router.sync_plan("default", 40)) == 2
+    assert len(router.async_plan("default", 40)) == 2
+
+    HandlerDispatcher.run_sync_plan("rec", info_plan)
+    assert info_handler.records == ["rec"]
+
+    error_handler.setLevel(10)
+    rebuilt = router.sync_plan("default", 20)
+    assert rebuilt is not info_plan
+    assert len(rebuilt) == 2
+
+    layer_handlers["default"] = []
+    router.invalidate()
+    assert router.sync_plan("default", 20) == ()
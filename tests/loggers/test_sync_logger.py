@@ -9,12 +9,17 @@ Notes:
 """
 
 import builtins
+import threading
+import time
+from pathlib import Path
 
 import pytest
 
 from hydra_logger.config.models import LogDestination, LoggingConfig, LogLayer
 from hydra_logger.core.exceptions import HydraLoggerError
 from hydra_logger.loggers.sync_logger import SyncLogger
+from hydra_logger.types.context import log_context
+from hydra_logger.types.records import BoundFields
 
 
 def test_sync_logger_filters_by_layer_level() -> None:
@@ -35,6 +40,66 @@ def test_sync_logger_filters_by_layer_level() -> None:
     assert logger.is_closed is True
 
 
+def test_sync_logger_is_enabled_for_skips_record_build_when_filtered() -> None:
+    config = LoggingConfig(
+        layers={
+            "default": LogLayer(
+                level="INFO",
+                destinations=[LogDestination(type="console", format="plain-text")],
+            ),
+            "audit": LogLayer(
+                level="ERROR",
+                destinations=[LogDestination(type="console", format="plain-text")],
+            ),
+        }
+    )
+    logger = SyncLogger(config=config)
+    assert logger.is_enabled_for("DEBUG") is False
+    assert logger.is_enabled_for("INFO") is True
+    assert logger.is_enabled_for(30, layer="audit") is False
+    assert logger.is_enabled_for("CRITICAL", layer="audit") is True
+
+    built = []
+    original_create = logger._record_builder.create
+
+    def _tracking_create(level, message, **kwargs):
+        built.append(message)
+        return original_create(level, message, **kwargs)
+
+    logger._record_builder.create = _tracking_create  # type: ignore[method-assign]
+    logger.debug("filtered debug")
+    logger.warning("filtered audit warning", layer="audit")
+    logger.error("emitted error", layer="audit")
+    assert built == ["emitted error"]
+    logger.close()
+    assert logger.is_enabled_for("CRITICAL") is False
+
+
+def test_sync_logger_add_and_remove_layer_rebuild_emit_plans() -> None:
+    logger = SyncLogger()
+    assert logger._layer_router.sync_plan("api", 20) == ()
+
+    logger.add_layer(
+        "api",
+        LogLayer(
+            level="INFO",
+            destinations=[LogDestination(type="console", format="plain-text")],
+        ),
+    )
+    plan = logger._layer_router.sync_plan("api", 20)
+    assert len(plan) == 1
+    assert logger._layer_router.sync_plan("api", 20) is plan
+
+    handler = logger._layer_handlers["api"][0]
+    handler.setLevel(40)
+    assert logger._layer_router.sync_plan("api", 20) == ()
+
+    logger.remove_layer("api")
+    assert "api" not in logger._layer_handlers
+    assert id(handler) not in logger._handlers
+    logger.close()
+
+
 def test_sync_logger_close_is_idempotent() -> None:
     logger = SyncLogger()
     logger.info("before close")
@@ -672,8 +737,8 @@ def test_sync_logger_executes_non_data_extensions_in_deterministic_order() -> No
     logger._extension_manager = manager
     logger._data_protection = manager.get_extension("data_protection")
     captured = {}
-    logger._handler_dispatcher.dispatch_sync = (
-        lambda rec, _handlers: captured.setdefault("message", rec.message)
+    logger._handler_dispatcher.run_sync_plan = lambda rec, _plan: captured.setdefault(
+        "message", rec.message
     )  # type: ignore[method-assign]
 
     logger.log("INFO", "token=abc")
@@ -714,3 +779,221 @@ def test_sync_logger_close_cleanup_hydraerror_branch() -> None:
     with pytest.raises(HydraLoggerError, match="close-policy"):
         logger.close()
     assert logger._closed is True
+
+
+class _CountingArg:
+    def __init__(self) -> None:
+        self.renders = 0
+
+    def __str__(self) -> str:
+        self.renders += 1
+        return "uid-7"
+
+
+class _MessageHandler:
+    def __init__(self) -> None:
+        self.messages = []
+
+    def handle(self, record) -> None:  # type: ignore[no-untyped-def]
+        self.messages.append(record.message)
+
+
+def test_sync_logger_defers_interpolation_until_handlers_read_message() -> None:
+    logger = SyncLogger(
+        config={
+            "enable_data_protection": True,
+            "layers": {
+                "default": {"level": "INFO", "destinations": [{"type": "null"}]}
+            },
+        }
+    )
+    first, second = _MessageHandler(), _MessageHandler()
+    logger._layer_handlers["default"] = [first, second]
+    logger._layer_router.invalidate()
+    arg = _CountingArg()
+
+    logger.debug("user %s filtered", arg)
+    assert arg.renders == 0
+
+    logger.info("user %s password=hunter2", arg, extra={"n": lambda: 3})
+    assert arg.renders == 1
+    assert first.messages == second.messages
+    assert "uid-7" in first.messages[0]
+    assert "hunter2" not in first.messages[0]
+
+    logger.info(lambda: "from callable")
+    assert first.messages[-1] == "from callable"
+    logger.close()
+
+
+class _ExtraHandler:
+    def __init__(self) -> None:
+        self.extras = []
+
+    def handle(self, record) -> None:  # type: ignore[no-untyped-def]
+        self.extras.append(record.extra)
+
+
+def test_sync_logger_bind_shares_handlers_and_freezes_fields() -> None:
+    logger = SyncLogger(
+        config={
+            "layers": {
+                "default": {"level": "INFO", "destinations": [{"type": "null"}]}
+            },
+        }
+    )
+    handler = _ExtraHandler()
+    logger._layer_handlers["default"] = [handler]
+    logger._layer_router.invalidate()
+
+    request_logger = logger.bind(request_id="r-1", user_id="u-1")
+    request_logger.info("first")
+    request_logger.info("second")
+    assert handler.extras[0] is handler.extras[1] is request_logger.fields
+    assert isinstance(handler.extras[0], BoundFields)
+
+    request_logger.info("override", extra={"user_id": "u-2", "step": 3})
+    assert handler.extras[-1] == {"request_id": "r-1", "user_id": "u-2", "step": 3}
+
+    child = request_logger.bind(span="s-1")
+    child.warning("child")
+    assert handler.extras[-1] == {"request_id": "r-1", "user_id": "u-1", "span": "s-1"}
+    assert dict(request_logger.fields) == {"request_id": "r-1", "user_id": "u-1"}
+
+    logger.info("plain")
+    assert handler.extras[-1] == {}
+    assert child.parent is logger and child.is_enabled_for("INFO")
+    with pytest.raises(TypeError):
+        child.fields["span"] = "mutated"  # type: ignore[index]
+    logger.close()
+
+
+def test_sync_logger_copies_ambient_log_context_onto_records() -> None:
+    logger = SyncLogger(
+        config={
+            "layers": {
+                "default": {"level": "INFO", "destinations": [{"type": "null"}]}
+            },
+        }
+    )
+    records = []
+
+    class _Handler:
+        def handle(self, record) -> None:  # type: ignore[no-untyped-def]
+            records.append(record)
+
+    logger._layer_handlers["default"] = [_Handler()]
+    logger._layer_router.invalidate()
+
+    with log_context(request_id="r-1", user_id="u-1", tenant="acme"):
+        logger.info("ambient")
+        logger.info("explicit", request_id="r-override")
+    logger.info("outside")
+
+    assert (records[0].request_id, records[0].user_id) == ("r-1", "u-1")
+    assert records[0].context == {"tenant": "acme"}
+    assert records[1].request_id == "r-override"
+    assert records[2].request_id is None and not records[2].context
+    logger.close()
+
+
+def test_sync_logger_log_batch_emits_one_batch_per_handler_and_layer_run() -> None:
+    logger = SyncLogger(
+        config={
+            "layers": {
+                "default": {"level": "INFO", "destinations": [{"type": "null"}]},
+                "api": {"level": "INFO", "destinations": [{"type": "null"}]},
+            },
+        }
+    )
+    batches = []
+
+    class _Handler:
+        def emit_batch(self, records) -> None:  # type: ignore[no-untyped-def]
+            batches.append([record.message for record in records])
+
+    logger._layer_handlers["default"] = [_Handler()]
+    logger._layer_handlers["api"] = [_Handler()]
+    logger._layer_router.invalidate()
+
+    records = [
+        logger.create_log_record("INFO", "a"),
+        logger.create_log_record("DEBUG", "filtered"),
+        logger.create_log_record("ERROR", "b"),
+        logger.create_log_record("INFO", "c", layer="api"),
+    ]
+    logger.log_batch(records)
+    assert batches == [["a", "b"], ["c"]]
+    logger.close()
+
+
+def test_sync_logger_isolated_destination_does_not_stall_siblings(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    logger = SyncLogger(
+        config=LoggingConfig(
+            base_log_dir=str(tmp_path),
+            layers={
+                "default": LogLayer(
+                    level="INFO",
+                    destinations=[
+                        LogDestination(type="file", path="app.log"),
+                        LogDestination(
+                            type="file",
+                            path="remote.log",
+                            isolated=True,
+                            isolation_queue_size=2,
+                        ),
+                    ],
+                )
+            },
+        )
+    )
+    direct, isolated = logger._layer_handlers["default"]
+    release = threading.Event()
+    slow_batches = []
+
+    def _stuck(records):  # type: ignore[no-untyped-def]
+        release.wait(2.0)
+        slow_batches.append([record.message for record in records])
+
+    isolated.handler.emit_batch = _stuck
+    direct_messages = []
+    direct.emit = lambda record: direct_messages.append(record.message)
+    logger._layer_router.invalidate()
+
+    started = time.monotonic()
+    for index in range(5):
+        logger.info(f"m{index}")
+    assert time.monotonic() - started < 0.5
+    assert direct_messages == [f"m{index}" for index in range(5)]
+
+    destination = logger.get_health_status()["destinations"]["default[1]"]
+    assert destination["handler"] == "SyncFileHandler"
+    assert destination["dropped"] >= 1
+    release.set()
+    logger.close()
+    assert sum(len(batch) for batch in slow_batches) == 5 - destination["dropped"]
+
+
+def test_sync_logger_max_buffer_age_flushes_quiet_file(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    logger = SyncLogger(
+        config=LoggingConfig(
+            base_log_dir=str(tmp_path),
+            layers={
+                "default": LogLayer(
+                    level="INFO",
+                    destinations=[
+                        LogDestination(type="file", path="app.log", max_buffer_age=0.05)
+                    ],
+                )
+            },
+        )
+    )
+    (handler,) = logger._layer_handlers["default"]
+    assert handler.get_stats()["background_flush"] is True
+    logger.info("only line")
+    deadline = time.monotonic() + 2.0
+    while handler.get_stats()["buffered_messages"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert handler.get_stats()["buffered_messages"] == 0
+    assert "only line" in Path(handler._filename).read_text()
+    logger.close()
@@ -8,6 +8,7 @@ Notes:
  - Validates test context behavior, edge cases, and regression safety.
 """
 
+from hydra_logger.types import context
 from hydra_logger.types.context import (
     CallerInfo,
     ContextDetector,
@@ -17,8 +18,10 @@ from hydra_logger.types.context import (
     SystemInfo,
     clear_current_context,
     create_context,
+    current_ambient_context,
     get_caller_info,
     get_current_context,
+    log_context,
     set_current_context,
 )
 
@@ -113,14 +116,14 @@ def test_context_manager_falls_back_to_thread_local_when_context_var_fails() ->
         ContextManager._context_var = original_context_var
 
 
+def _raise_frame_error(_depth=0):
+    raise RuntimeError("no frames")
+
+
 def test_context_detector_returns_error_caller_info_on_inspect_failure(
     monkeypatch,
 ) -> None:
-    import inspect
-
-    monkeypatch.setattr(
-        inspect, "currentframe", lambda: (_ for _ in ()).throw(Exception())
-    )
+    monkeypatch.setattr(context, "_getframe", _raise_frame_error)
     caller = ContextDetector.get_caller_info(depth=1)
     assert caller.filename == "<error>"
     assert caller.function_name == "<error>"
@@ -128,12 +131,8 @@ def test_context_detector_returns_error_caller_info_on_inspect_failure(
 
 
 def test_context_detector_logs_on_inspect_failure(monkeypatch, caplog) -> None:
-    import inspect
-
     ContextDetector.disable_cache()
-    monkeypatch.setattr(
-        inspect, "currentframe", lambda: (_ for _ in ()).throw(Exception())
-    )
+    monkeypatch.setattr(context, "_getframe", _raise_frame_error)
     with caplog.at_level("ERROR", logger="hydra_logger.types.context"):
         ContextDetector.get_caller_info(depth=1)
     assert "Caller info detection failed at depth=1" in caplog.text
@@ -174,7 +173,7 @@ def test_context_detector_cache_hit_eviction_and_unknown_frame_path() -> None:
     ContextDetector._cache["manual:1"] = first
     ContextDetector._cache["manual:2"] = second
     ContextDetector.set_cache_size(1)
-    assert ContextDetector._cache == {}
+    assert list(ContextDetector._cache) == ["manual:2"]
 
     ContextDetector.set_cache_size(1)
     ContextDetector._clear_cache()
@@ -185,3 +184,77 @@ def test_context_detector_cache_hit_eviction_and_unknown_frame_path() -> None:
     unknown = ContextDetector._get_caller_info_uncached(depth=10_000)
     assert unknown.filename == "<unknown>"
     assert unknown.function_name == "<unknown>"
+
+
+def test_context_detector_keys_cache_by_call_site_with_lru_eviction() -> None:
+    ContextDetector.enable_cache()
+    ContextDetector._clear_cache()
+    ContextDetector.reset_cache_stats()
+    ContextDetector.set_cache_size(2)
+
+    def _site_a():
+        return ContextDetector.get_caller_info(depth=2)
+
+    def _site_b():
+        return ContextDetector.get_caller_info(depth=2)
+
+    def _site_c():
+        return ContextDetector.get_caller_info(depth=2)
+
+    first_a, first_b = _site_a(), _site_b()
+    assert first_a.function_name == "_site_a"
+    assert first_b.function_name == "_site_b"
+    assert _site_a() is first_a
+
+    first_c = _site_c()
+    stats = ContextDetector.get_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 3
+    assert stats["evictions"] == 1
+    assert stats["size"] == 2
+    # `_site_b` was least recently used, so it is resolved again.
+    assert _site_b() is not first_b
+    assert _site_c() is first_c
+
+    ContextDetector.set_cache_size(1000)
+    ContextDetector._clear_cache()
+    ContextDetector.reset_cache_stats()
+
+
+def test_log_context_snapshots_are_copy_on_write_and_task_local() -> None:
+    import asyncio
+
+    assert not current_ambient_context()
+    with log_context(request_id="r-1", tenant="acme") as outer:
+        assert current_ambient_context() is outer
+        assert outer.record_fields == (("request_id", "r-1"),)
+        assert outer.context == {"tenant": "acme"}
+        with log_context(request_id="r-2") as inner:
+            assert inner.record_fields == (("request_id", "r-2"),)
+            assert inner.context is not outer.context
+        assert current_ambient_context() is outer
+        assert dict(outer.fields) == {"request_id": "r-1", "tenant": "acme"}
+
+    async def _task(request_id: str) -> str:
+        with log_context(request_id=request_id):
+            await asyncio.sleep(0)
+            return dict(current_ambient_context().record_fields)["request_id"]
+
+    async def _run() -> list:
+        return await asyncio.gather(_task("a"), _task("b"))
+
+    assert asyncio.run(_run()) == ["a", "b"]
+    assert not current_ambient_context()
+
+
+def test_set_current_context_publishes_metadata_as_ambient_snapshot() -> None:
+    ContextManager.set_current_context(
+        create_context(ContextType.REQUEST, {"correlation_id": "c-9", "k": 1})
+    )
+    try:
+        snapshot = current_ambient_context()
+        assert snapshot.record_fields == (("correlation_id", "c-9"),)
+        assert snapshot.context == {"k": 1}
+    finally:
+        ContextManager.clear_current_context()
+    assert not current_ambient_context()
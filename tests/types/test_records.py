@@ -9,15 +9,26 @@ Notes:
  - Validates test records behavior, edge cases, and regression safety.
 """
 
+import pickle
+import threading
+import time
+
 import pytest
 
+from hydra_logger.types import records
 from hydra_logger.types.records import (
+    AUTO_CONTEXT_STRATEGY,
+    WITHHELD_MESSAGE,
+    CompactLogRecord,
+    LazyMessage,
     LogRecord,
     LogRecordBatch,
     LogRecordFactory,
     RecordCreationStrategy,
     create_log_record,
     extract_filename,
+    get_record_creation_strategy,
+    render_message,
 )
 
 
@@ -114,12 +125,51 @@ def test_log_record_batch_lifecycle() -> None:
     assert not batch.is_full()
 
 
+@pytest.fixture
+def fake_frames(monkeypatch):
+    """Install a fake `sys._getframe` that walks from `top` (depth 1)."""
+    records.LogRecordFactory.clear_caller_cache()
+
+    def _install(top):
+        def _getframe(depth=0):
+            frame = top
+            for _ in range(depth - 1):
+                if frame is None:
+                    break
+                frame = getattr(frame, "f_back", None)
+            if frame is None:
+                raise ValueError("call stack is not deep enough")
+            return frame
+
+        monkeypatch.setattr(records, "_getframe", _getframe)
+
+    yield _install
+    records.LogRecordFactory.clear_caller_cache()
+
+
+class _FakeCode:
+    def __init__(self, filename, name, qualname=None):
+        self.co_filename = filename
+        self.co_name = name
+        self.co_qualname = qualname or name
+
+
+class _FakeFrame:
+    def __init__(self, code, lineno, back=None):
+        self.f_code = code
+        self.f_lineno = lineno
+        self.f_back = back
+
+
+def _factory_frame(back):
+    return _FakeFrame(_FakeCode("/tmp/wrapper.py", "factory"), 1, back=back)
+
+
 def test_auto_context_creation_logs_when_inspection_fails(monkeypatch, caplog) -> None:
-    import inspect
+    def _explode(_depth=0):
+        raise RuntimeError("no frames")
 
-    monkeypatch.setattr(
-        inspect, "currentframe", lambda: (_ for _ in ()).throw(Exception())
-    )
+    monkeypatch.setattr(records, "_getframe", _explode)
     with caplog.at_level("ERROR", logger="hydra_logger.types.records"):
         record = LogRecordFactory.create_with_auto_context("INFO", "hello")
     assert record.message == "hello"
@@ -128,102 +178,44 @@ def test_auto_context_creation_logs_when_inspection_fails(monkeypatch, caplog) -
     )
 
 
-def test_auto_context_creation_handles_missing_frame(monkeypatch) -> None:
-    import inspect
-
-    monkeypatch.setattr(inspect, "currentframe", lambda: None)
+def test_auto_context_creation_handles_missing_frame(fake_frames) -> None:
+    fake_frames(_factory_frame(None))
     record = LogRecordFactory.create_with_auto_context("INFO", "hello")
     assert record.file_name is None
     assert record.function_name is None
     assert record.line_number is None
 
 
-def test_auto_context_skips_empty_filename_frames(monkeypatch) -> None:
-    import inspect
-
-    class _FakeCode:
-        co_filename = ""
-        co_name = "hidden"
-        co_varnames = ()
-
-    class _FakeFrame:
-        def __init__(self):
-            self.f_code = _FakeCode()
-            self.f_back = None
-            self.f_lineno = 1
-            self.f_globals = {}
-            self.f_locals = {}
-
-    class _TopFrame:
-        def __init__(self):
-            self.f_back = _FakeFrame()
-
-    monkeypatch.setattr(inspect, "currentframe", lambda: _TopFrame())
+def test_auto_context_skips_empty_filename_frames(fake_frames) -> None:
+    fake_frames(_factory_frame(_FakeFrame(_FakeCode("", "hidden"), 1)))
     record = LogRecordFactory.create_with_auto_context("INFO", "hello")
     assert record.file_name is None
     assert record.function_name is None
 
 
-def test_auto_context_skips_invalid_frame_objects(monkeypatch) -> None:
-    import inspect
-
+def test_auto_context_skips_invalid_frame_objects(fake_frames) -> None:
     class _BadFrame:
         def __init__(self):
             self.f_back = None
 
-    class _TopFrame:
-        def __init__(self):
-            self.f_back = _BadFrame()
-
-    monkeypatch.setattr(inspect, "currentframe", lambda: _TopFrame())
+    fake_frames(_factory_frame(_BadFrame()))
     record = LogRecordFactory.create_with_auto_context("INFO", "hello")
     assert record.message == "hello"
 
 
-def test_auto_context_extracts_user_frame_details(monkeypatch) -> None:
-    import inspect
-
-    class _FakeCode:
-        def __init__(self, filename, name, varnames=()):
-            self.co_filename = filename
-            self.co_name = name
-            self.co_varnames = varnames
-
-    class _FakeFrame:
-        def __init__(self, code, lineno, back=None):
-            self.f_code = code
-            self.f_lineno = lineno
-            self.f_back = back
-            self.f_globals = {"__name__": "user_module"}
-            self.f_locals = {}
-
-    user_frame = _FakeFrame(_FakeCode("/opt/app/user_service.py", "process"), 321)
-    top_frame = _FakeFrame(_FakeCode("/tmp/wrapper.py", "wrapper"), 1, back=user_frame)
-    monkeypatch.setattr(inspect, "currentframe", lambda: top_frame)
+def test_auto_context_extracts_user_frame_qualname(fake_frames) -> None:
+    user_frame = _FakeFrame(
+        _FakeCode("/opt/app/user_service.py", "process", "Service.process"), 321
+    )
+    fake_frames(_factory_frame(user_frame))
 
     record = LogRecordFactory.create_with_auto_context("INFO", "hello")
     assert record.file_name == "user_service.py"
-    assert record.function_name == "process"
+    assert record.function_name == "Service.process"
     assert record.line_number == 321
 
 
-def test_auto_context_does_not_skip_repo_root_hyphen_path(monkeypatch) -> None:
-    import inspect
-
-    class _FakeCode:
-        def __init__(self, filename, name, varnames=()):
-            self.co_filename = filename
-            self.co_name = name
-            self.co_varnames = varnames
-
-    class _FakeFrame:
-        def __init__(self, code, lineno, back=None):
-            self.f_code = code
-            self.f_lineno = lineno
-            self.f_back = back
-            self.f_globals = {"__name__": "user_module"}
-            self.f_locals = {}
-
+def test_auto_context_does_not_skip_repo_root_hyphen_path(fake_frames) -> None:
     user_frame = _FakeFrame(
         _FakeCode(
             "/home/dev/projects/hydra-logger/examples/tutorials/t04_extensions_plugins.py",
@@ -239,10 +231,7 @@ def test_auto_context_does_not_skip_repo_root_hyphen_path(monkeypatch) -> None:
         300,
         back=user_frame,
     )
-    top_frame = _FakeFrame(
-        _FakeCode("/tmp/wrapper.py", "wrapper"), 1, back=internal_frame
-    )
-    monkeypatch.setattr(inspect, "currentframe", lambda: top_frame)
+    fake_frames(_factory_frame(internal_frame))
 
     record = LogRecordFactory.create_with_auto_context("INFO", "hello")
     assert record.file_name == "t04_extensions_plugins.py"
@@ -250,6 +239,45 @@ def test_auto_context_does_not_skip_repo_root_hyphen_path(monkeypatch) -> None:
     assert record.line_number == 55
 
 
+def test_auto_context_caches_entry_depth_and_reports_caller_qualname() -> None:
+    LogRecordFactory.clear_caller_cache()
+
+    class _Service:
+        def handle(self):
+            return AUTO_CONTEXT_STRATEGY.create_record("INFO", "hello")
+
+    first = _Service().handle()
+    second = _Service().handle()
+
+    assert first.file_name == "test_records.py"
+    assert first.function_name.endswith("_Service.handle")
+    assert (second.function_name, second.file_name) == (
+        first.function_name,
+        first.file_name,
+    )
+    assert records._ENTRY_DEPTHS and records._CODE_INFO_CACHE
+
+    LogRecordFactory.clear_caller_cache()
+    assert not records._ENTRY_DEPTHS and not records._CODE_INFO_CACHE
+
+
+def test_caller_code_caches_are_bounded_lru(monkeypatch) -> None:
+    LogRecordFactory.clear_caller_cache()
+    monkeypatch.setattr(records, "_CODE_CACHE_SIZE", 4)
+    codes = [compile(f"x = {i}", f"<cell-{i}>", "exec") for i in range(10)]
+    keep = codes[0]
+    for code in codes:
+        records._describe_code(code)
+        records._is_internal_code(code)
+        records._describe_code(keep)  # recently used: survives eviction
+
+    assert len(records._CODE_INFO_CACHE) == 4
+    assert len(records._INTERNAL_CODE_CACHE) == 4
+    assert keep in records._CODE_INFO_CACHE
+    assert codes[1] not in records._CODE_INFO_CACHE
+    LogRecordFactory.clear_caller_cache()
+
+
 def test_enhanced_function_name_handles_self_cls_special_and_failure_paths() -> None:
     class _Code:
         def __init__(self, name, varnames):
@@ -362,3 +390,131 @@ def test_enhanced_function_name_covers_co_varnames_self_and_cls_paths() -> None:
         LogRecordFactory._get_enhanced_function_name(frame_cls_varnames)
         == "_Builder.create"
     )
+
+
+def test_compact_log_record_is_slotted_and_matches_log_record_api() -> None:
+    compact = CompactLogRecord(
+        timestamp=1.0, level_name="WARNING", message="hi", level=30, layer="api"
+    )
+    classic = LogRecord(
+        timestamp=1.0, level_name="WARNING", message="hi", level=30, layer="api"
+    )
+
+    assert not hasattr(compact, "__dict__")
+    assert compact._extra is None and compact._context is None
+    assert compact.to_dict() == classic.to_dict()
+    assert str(compact) == str(classic)
+    assert compact == classic
+    assert CompactLogRecord(message="").message == ""
+
+    compact.extra = {"k": "v"}
+    assert compact.to_dict()["extra"] == {"k": "v"}
+
+
+def test_compact_log_record_slots_follow_fields() -> None:
+    slots = set(CompactLogRecord.__slots__)
+    for name in CompactLogRecord.FIELDS:
+        assert name in slots or f"_{name}" in slots
+    assert len(slots) == len(CompactLogRecord.FIELDS) + 1
+    values = CompactLogRecord(*range(len(CompactLogRecord.FIELDS) - 2))
+    assert [getattr(values, n) for n in CompactLogRecord.FIELDS[:-2]] == list(
+        range(len(CompactLogRecord.FIELDS) - 2)
+    )
+
+
+def test_compact_log_record_extra_is_mutable_and_pickles() -> None:
+    compact = CompactLogRecord(
+        timestamp=1.0,
+        level_name="ERROR",
+        level=40,
+        message=LazyMessage("user %s failed", ("ada",)),
+        request_id="r-1",
+    )
+    compact.extra["k"] = 1
+    compact.context["span"] = "s-1"
+    assert CompactLogRecord().extra is not CompactLogRecord().extra
+
+    clone = pickle.loads(pickle.dumps(compact))
+
+    assert type(clone) is CompactLogRecord
+    assert clone == compact
+    assert clone.message == "user ada failed"
+    assert (clone.extra, clone.context) == ({"k": 1}, {"span": "s-1"})
+    clone.extra["k"] = 2
+    assert compact.extra == {"k": 1}
+
+
+def test_compact_strategy_builds_compact_records_without_mutating_kwargs() -> None:
+    strategy = get_record_creation_strategy("minimal", compact=True)
+    kwargs = {"layer": "db", "extra": {"a": 1}}
+    record = strategy.create_record("INFO", "hello", **kwargs)
+
+    assert isinstance(record, CompactLogRecord)
+    assert record.layer == "db"
+    assert record.extra == {"a": 1}
+    assert kwargs == {"layer": "db", "extra": {"a": 1}}
+    assert isinstance(
+        get_record_creation_strategy("balanced").create_record("INFO", "x"), LogRecord
+    )
+    assert get_record_creation_strategy("convenient", compact=True).record_cls is (
+        CompactLogRecord
+    )
+
+
+def test_compact_record_concurrent_readers_only_see_transformed_message() -> None:
+    def _template() -> str:
+        time.sleep(0.005)
+        return "secret=%s"
+
+    def _redact(text: str) -> str:
+        time.sleep(0.005)
+        return text.replace("abc", "***")
+
+    for _ in range(20):
+        record = CompactLogRecord(message=LazyMessage(_template, ("abc",)))
+        assert record.defer_message_transform(_redact)
+        seen = []
+        readers = [
+            threading.Thread(target=lambda: seen.append(record.message))
+            for _ in range(4)
+        ]
+        for reader in readers:
+            reader.start()
+        for reader in readers:
+            reader.join()
+        assert seen == ["secret=***"] * 4
+
+
+def test_compact_record_withholds_message_when_deferred_transform_fails() -> None:
+    def _fail(text: str) -> str:
+        raise RuntimeError("redactor down")
+
+    record = CompactLogRecord(message=LazyMessage("secret=%s", ("abc",)))
+    assert record.defer_message_transform(_fail)
+    with pytest.raises(RuntimeError, match="redactor down"):
+        record.message
+    assert record.message == WITHHELD_MESSAGE
+
+
+def test_render_message_supports_args_mappings_callables_and_bad_templates() -> None:
+    assert render_message("a %s %d", ("x", 2)) == "a x 2"
+    assert render_message("%(k)s", ({"k": "v"},)) == "v"
+    assert render_message(lambda: "called") == "called"
+    assert render_message("no placeholder", ("extra",)) == "no placeholder ('extra',)"
+
+
+def test_compact_record_renders_lazy_message_once_with_deferred_transforms() -> None:
+    calls = []
+
+    def _template() -> str:
+        calls.append(1)
+        return "secret=%s"
+
+    record = CompactLogRecord(message=LazyMessage(_template, ("abc",)))
+    assert record.defer_message_transform(lambda text: text.replace("abc", "***"))
+    assert calls == []
+
+    assert record.message == "secret=***"
+    assert record.message == "secret=***"
+    assert calls == [1]
+    assert record.defer_message_transform(str.upper) is False
@@ -0,0 +1,106 @@
+"""
+Role: Tests for the long-lived O_APPEND descriptor used by async file handlers.
+Used By:
+ - Pytest discovery and CI.
+Depends On:
+ - hydra_logger
+Notes:
+ - Covers one open across many writes, reopen on inode change (logrotate),
+   truncation detection, explicit reopen, and recovery from a bad descriptor
+   without duplicating a partially written batch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+
+from hydra_logger.handlers.file_handler import AsyncFileHandler
+from hydra_logger.utils.append_file import AppendOnlyFile
+
+
+def test_append_file_keeps_one_descriptor_across_writes(tmp_path: Path) -> None:
+    path = tmp_path / "nested" / "app.log"
+    append = AppendOnlyFile(str(path), check_interval=60.0)
+    for index in range(50):
+        append.write(f"{index}\n".encode())
+    assert path.read_text().splitlines()[-1] == "49"
+    stats = append.stats()
+    assert (stats["open"], stats["opens"], stats["reopens"]) == (True, 1, 0)
+    append.close()
+    assert append.is_open is False
+
+
+def test_append_file_follows_rotation_and_detects_truncation(tmp_path: Path) -> None:
+    path = tmp_path / "app.log"
+    append = AppendOnlyFile(str(path), check_interval=0.0)
+    append.write(b"before\n")
+    os.rename(path, tmp_path / "app.log.1")
+    append.write(b"after\n")
+    assert path.read_bytes() == b"after\n"
+    assert (tmp_path / "app.log.1").read_bytes() == b"before\n"
+
+    os.truncate(path, 0)
+    append.write(b"again\n")
+    assert path.read_bytes() == b"again\n"
+    stats = append.stats()
+    assert (stats["inode_changes"], stats["truncations"]) == (1, 1)
+    append.close()
+
+
+def test_append_file_reopen_api_truncate_once_and_bad_descriptor(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "app.log"
+    path.write_bytes(b"stale\n")
+    append = AppendOnlyFile(str(path), truncate=True, check_interval=60.0)
+    append.write(b"one\n")
+    append.reopen()
+    append.write(b"two\n")
+    os.close(append._fd)  # simulate a descriptor broken underneath us
+    append.write(b"three\n")
+    assert path.read_bytes() == b"one\ntwo\nthree\n"
+    stats = append.stats()
+    assert (stats["opens"], stats["reopens"], stats["write_errors"]) == (3, 2, 1)
+    append.close()
+
+
+def test_append_file_retry_writes_only_the_unwritten_tail(
+    tmp_path: Path, monkeypatch
+) -> None:
+    path = tmp_path / "app.log"
+    append = AppendOnlyFile(str(path), check_interval=60.0)
+    real_write = os.write
+    calls = []
+
+    def flaky_write(fd: int, data) -> int:  # type: ignore[no-untyped-def]
+        calls.append(bytes(data))
+        if len(calls) == 1:
+            return real_write(fd, bytes(data)[:4])
+        if len(calls) == 2:
+            raise OSError("disk hiccup")
+        return real_write(fd, data)
+
+    monkeypatch.setattr(os, "write", flaky_write)
+    assert append.write(b"one\ntwo\n") == 8
+    monkeypatch.undo()
+    append.close()
+    assert path.read_bytes() == b"one\ntwo\n"
+    assert calls[-1] == b"two\n"
+    assert append.stats()["write_errors"] == 1
+
+
+def test_async_file_handler_opens_log_file_once(tmp_path: Path) -> None:
+    async def _run() -> None:
+        handler = AsyncFileHandler(str(tmp_path / "app.log"), use_threading=True)
+        for index in range(20):
+            await handler._direct_memory_to_file_write([f"line-{index}\n"])
+        assert handler.get_stats()["file"]["opens"] == 1
+        handler.reopen()
+        await handler._direct_memory_to_file_write(["tail\n"])
+        assert handler.get_stats()["file"]["opens"] == 2
+        await handler.aclose()
+
+    asyncio.run(_run())
+    assert (tmp_path / "app.log").read_text().endswith("line-19\ntail\n")
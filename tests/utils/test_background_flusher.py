@@ -0,0 +1,132 @@
+"""
+Role: Tests for the shared background flusher of sync buffered handlers.
+Used By:
+ - Pytest discovery and CI.
+Depends On:
+ - hydra_logger
+Notes:
+ - Covers quiet handlers reaching their sink within `max_buffer_age` and
+   `flush_interval` without another emit, deadline reporting, concurrent
+   emitters racing the flusher, and unregistering on close.
+"""
+
+from __future__ import annotations
+
+import io
+import math
+import threading
+import time
+from pathlib import Path
+
+from hydra_logger.handlers.console_handler import SyncConsoleHandler
+from hydra_logger.handlers.file_handler import SyncFileHandler
+from hydra_logger.types.records import LogRecord
+from hydra_logger.utils.background_flusher import (
+    BackgroundFlusher,
+    get_background_flusher,
+)
+
+
+def _record(message: str) -> LogRecord:
+    return LogRecord(level_name="INFO", level=20, message=message, logger_name="t")
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> bool:  # type: ignore[no-untyped-def]
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_quiet_file_handler_flushes_within_max_buffer_age(tmp_path: Path) -> None:
+    path = tmp_path / "quiet.log"
+    handler = SyncFileHandler(
+        str(path), buffer_size=10_000, flush_interval=60.0, max_buffer_age=0.05
+    )
+    try:
+        handler.emit(_record("last words"))
+        assert path.read_text() == ""
+        assert _wait_for(lambda: "last words" in path.read_text())
+        assert handler.get_stats()["buffered_messages"] == 0
+        assert get_background_flusher().stats()["alive"] is True
+    finally:
+        handler.close()
+
+
+def test_background_flush_enforces_flush_interval_for_console() -> None:
+    stream = io.StringIO()
+    handler = SyncConsoleHandler(
+        stream=stream, buffer_size=10_000, flush_interval=0.05, background_flush=True
+    )
+    try:
+        handler.emit(_record("console line"))
+        assert stream.getvalue() == ""
+        assert _wait_for(lambda: "console line" in stream.getvalue())
+        assert handler.get_stats()["background_flush"] is True
+    finally:
+        handler.close()
+
+
+def test_flush_if_stale_reports_remaining_time(tmp_path: Path) -> None:
+    handler = SyncFileHandler(
+        str(tmp_path / "deadline.log"), buffer_size=100, flush_interval=30.0
+    )
+    try:
+        assert handler._flush_if_stale() == math.inf
+        handler.emit(_record("pending"))
+        remaining = handler._flush_if_stale()
+        assert 0.0 < remaining <= 30.0
+        handler._last_flush -= 31.0
+        assert handler._flush_if_stale() == 0.0
+        assert handler._flush_if_stale() == math.inf
+    finally:
+        handler.close()
+
+
+def test_concurrent_emitters_and_flusher_lose_no_lines(tmp_path: Path) -> None:
+    path = tmp_path / "busy.log"
+    handler = SyncFileHandler(
+        str(path), buffer_size=64, flush_interval=60.0, max_buffer_age=0.001
+    )
+
+    def _emit(worker: int) -> None:
+        for index in range(500):
+            handler.emit(_record(f"w{worker}-{index}"))
+
+    threads = [threading.Thread(target=_emit, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    handler.close()
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == 2000
+    assert handler.get_stats()["messages_processed"] == 2000
+
+
+def test_flusher_counts_errors_and_forgets_closed_handlers() -> None:
+    flusher = BackgroundFlusher()
+    flushed = threading.Event()
+
+    class _Broken:
+        def _flush_if_stale(self) -> float:
+            raise RuntimeError("boom")
+
+    class _Stale:
+        def _flush_if_stale(self) -> float:
+            flushed.set()
+            return math.inf
+
+    broken, stale = _Broken(), _Stale()
+    flusher.register(broken)
+    flusher.register(stale)
+    flusher.wake()
+    assert flushed.wait(2.0)
+    assert _wait_for(lambda: flusher.stats()["errors"] >= 1)
+
+    flusher.unregister(broken)
+    flusher.unregister(stale)
+    assert flusher.stats()["handlers"] == 0
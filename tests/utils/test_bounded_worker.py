@@ -0,0 +1,59 @@
+"""
+Role: Tests for the shared bounded batch worker.
+Used By:
+ - Pytest discovery and CI.
+Depends On:
+ - hydra_logger
+Notes:
+ - Covers `submit_many`, `drop_oldest` overflow with SLO drop accounting, and
+   a fresh buffer and thread after `reset`.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from hydra_logger.utils import slo_metrics
+from hydra_logger.utils.bounded_worker import BoundedWorker
+
+
+def test_bounded_worker_drop_oldest_keeps_newest_payloads() -> None:
+    batches = []
+    taken = threading.Event()
+    release = threading.Event()
+
+    def process(batch):  # type: ignore[no-untyped-def]
+        taken.set()
+        release.wait(1.0)
+        batches.append(list(batch))
+
+    before = slo_metrics.snapshot()["dropped_logs"]
+    worker = BoundedWorker(
+        process,
+        max_size=2,
+        overflow_policy="drop_oldest",
+        drop_reason="test_worker_full",
+    )
+    assert worker.submit("a") is True
+    assert taken.wait(1.0)
+    assert worker.submit_many(["b", "c", "d"]) == 3
+    release.set()
+    assert worker.stop(timeout=1.0) is True
+    assert batches == [["a"], ["c", "d"]]
+    stats = worker.stats()
+    assert (stats["submitted"], stats["processed"], stats["dropped"]) == (4, 3, 1)
+    assert slo_metrics.snapshot()["dropped_logs"] == before + 1  # type: ignore[operator]
+
+
+def test_bounded_worker_reset_starts_a_fresh_thread() -> None:
+    seen = []
+    worker = BoundedWorker(seen.extend)
+    worker.submit(1)
+    assert worker.stop(timeout=1.0) is True
+    assert worker.submit(2) is False
+    worker.reset()
+    assert worker.stats()["submitted"] == 0
+    assert worker.submit(3) is True
+    assert worker.flush(timeout=1.0) is True
+    assert worker.stop(timeout=1.0) is True
+    assert seen == [1, 3]
@@ -0,0 +1,309 @@
+"""
+Role: Tests for file durability policies and group-commit `fdatasync`.
+Used By:
+ - Pytest discovery and CI.
+Depends On:
+ - hydra_logger
+Notes:
+ - Covers policy parsing, concurrent committers sharing syncs, interval syncs
+   from the background flusher (including writes made during a sync), sync
+   error propagation, and the file handlers' `per_batch` / `sync_on_level` /
+   `interval` wiring.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from hydra_logger.config.models import LogDestination
+from hydra_logger.handlers import file_handler as file_module
+from hydra_logger.handlers.file_handler import AsyncFileHandler, SyncFileHandler
+from hydra_logger.types.records import LogRecord
+from hydra_logger.utils import append_file as append_module
+from hydra_logger.utils import slo_metrics
+from hydra_logger.utils.background_flusher import get_background_flusher
+from hydra_logger.utils.durability import GroupCommitter, parse_durability
+
+
+def _record(message: str, level_name: str = "INFO", level: int = 20) -> LogRecord:
+    return LogRecord(
+        level_name=level_name, level=level, message=message, logger_name="t"
+    )
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> bool:  # type: ignore[no-untyped-def]
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_parse_durability_accepts_documented_policies() -> None:
+    assert parse_durability(None).enabled is False
+    assert parse_durability("none").spec == "none"
+    assert parse_durability("per_batch").mode == "per_batch"
+    policy = parse_durability("interval:250")
+    assert (policy.mode, policy.interval, policy.spec) == (
+        "interval",
+        0.25,
+        "interval:250",
+    )
+    policy = parse_durability("sync_on_level:error")
+    assert (policy.mode, policy.level, policy.spec) == (
+        "sync_on_level",
+        40,
+        "sync_on_level:ERROR",
+    )
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        "always",
+        "interval",
+        "interval:0",
+        "interval:-5",
+        "interval:abc",
+        "per_batch:1",
+        "sync_on_level:LOUD",
+    ],
+)
+def test_parse_durability_rejects_unknown_policies(spec: str) -> None:
+    with pytest.raises(ValueError, match="durability must be"):
+        parse_durability(spec)
+
+
+def test_log_destination_validates_durability() -> None:
+    destination = LogDestination(
+        type="file", path="app.log", durability="sync_on_level:warning"
+    )
+    assert destination.durability == "sync_on_level:WARNING"
+    assert LogDestination(type="file", path="app.log").durability == "none"
+    with pytest.raises(ValueError, match="durability must be"):
+        LogDestination(type="file", path="app.log", durability="interval:0")
+
+
+def test_concurrent_commits_share_one_sync_per_window() -> None:
+    syncs = []
+
+    def slow_sync() -> None:
+        syncs.append(1)
+        time.sleep(0.02)
+
+    committer = GroupCommitter(slow_sync, name="test_fsync")
+    barrier = threading.Barrier(16)
+
+    def writer() -> None:
+        barrier.wait()
+        committer.commit(committer.mark_written())
+
+    threads = [threading.Thread(target=writer) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = committer.stats()
+    assert stats["commits"] == 16
+    assert stats["unsynced_writes"] == 0
+    assert 1 <= stats["syncs"] == len(syncs) < 16
+    names = [s["name"] for s in slo_metrics.snapshot()["flush_latency_recent"]]
+    assert "test_fsync" in names
+
+
+def test_commit_of_synced_ticket_does_not_sync_again() -> None:
+    syncs = []
+    committer = GroupCommitter(lambda: syncs.append(1))
+    ticket = committer.mark_written()
+    committer.commit(ticket)
+    committer.commit(ticket)
+    committer.commit(0)
+    assert len(syncs) == 1
+
+
+def test_commit_propagates_sync_errors_and_retries_later() -> None:
+    failures = [OSError("disk gone")]
+
+    def flaky_sync() -> None:
+        if failures:
+            raise failures.pop()
+
+    committer = GroupCommitter(flaky_sync)
+    ticket = committer.mark_written()
+    with pytest.raises(OSError, match="disk gone"):
+        committer.commit(ticket)
+    assert committer.stats()["unsynced_writes"] == 1
+    committer.commit(ticket)
+    assert committer.stats() == {
+        "syncs": 1,
+        "commits": 2,
+        "sync_errors": 1,
+        "unsynced_writes": 0,
+    }
+
+
+def test_interval_committer_syncs_from_background_flusher() -> None:
+    syncs = []
+    committer = GroupCommitter(lambda: syncs.append(1), interval=0.05)
+    try:
+        committer.mark_written()
+        committer.mark_written()
+        assert _wait_for(lambda: committer.stats()["unsynced_writes"] == 0)
+        assert len(syncs) == 1
+    finally:
+        committer.close()
+
+
+def test_interval_committer_syncs_writes_made_during_a_sync() -> None:
+    syncing = threading.Event()
+    release = threading.Event()
+    syncs = []
+
+    def slow_sync() -> None:
+        syncs.append(1)
+        syncing.set()
+        release.wait(1.0)
+
+    committer = GroupCommitter(slow_sync, interval=0.05)
+    try:
+        committer.mark_written()
+        assert syncing.wait(1.0)
+        committer.mark_written()
+        release.set()
+        assert _wait_for(lambda: committer.stats()["unsynced_writes"] == 0)
+        assert len(syncs) == 2
+    finally:
+        committer.close()
+
+
+def test_sync_file_handler_per_batch_syncs_each_flush(
+    tmp_path: Path, monkeypatch
+) -> None:
+    synced = []
+    monkeypatch.setattr(file_module, "fdatasync", synced.append)
+    handler = SyncFileHandler(
+        str(tmp_path / "app.log"), buffer_size=2, durability="per_batch"
+    )
+    try:
+        handler.emit(_record("one"))
+        assert synced == []
+        handler.emit(_record("two"))
+        assert len(synced) == 1
+        handler.emit_batch([_record("three"), _record("four")])
+        assert len(synced) == 2
+        stats = handler.get_stats()
+        assert stats["durability"] == "per_batch"
+        assert stats["fsync"]["unsynced_writes"] == 0
+    finally:
+        handler.close()
+    assert (tmp_path / "app.log").read_text().count("\n") == 4
+
+
+def test_sync_file_handler_sync_on_level_flushes_and_syncs_errors(
+    tmp_path: Path, monkeypatch
+) -> None:
+    synced = []
+    monkeypatch.setattr(file_module, "fdatasync", synced.append)
+    path = tmp_path / "app.log"
+    handler = SyncFileHandler(
+        str(path),
+        buffer_size=1000,
+        flush_interval=60.0,
+        durability="sync_on_level:ERROR",
+    )
+    try:
+        handler.emit(_record("routine"))
+        handler.emit(_record("warned", "WARNING", 30))
+        assert path.read_text() == ""
+        assert synced == []
+        handler.emit(_record("boom", "ERROR", 40))
+        assert synced and "routine" in path.read_text()
+        assert "boom" in path.read_text()
+    finally:
+        handler.close()
+
+
+def test_sync_file_handler_close_syncs_unsynced_writes(
+    tmp_path: Path, monkeypatch
+) -> None:
+    synced = []
+    monkeypatch.setattr(file_module, "fdatasync", synced.append)
+    handler = SyncFileHandler(
+        str(tmp_path / "app.log"), flush_interval=60.0, durability="interval:60000"
+    )
+    handler.emit(_record("pending"))
+    handler.close()
+    assert len(synced) == 1
+
+
+def test_async_file_handler_per_batch_syncs_written_payloads(
+    tmp_path: Path, monkeypatch
+) -> None:
+    synced = []
+    monkeypatch.setattr(append_module, "fdatasync", synced.append)
+    path = tmp_path / "async.log"
+
+    async def scenario() -> AsyncFileHandler:
+        handler = AsyncFileHandler(str(path), durability="sync_on_level:ERROR")
+        await handler.emit_async(_record("hello"))
+        await handler.aclose()
+        return handler
+
+    handler = asyncio.run(scenario())
+    assert "hello" in path.read_text()
+    assert synced
+    stats = handler.get_stats()
+    assert stats["durability"] == "sync_on_level:ERROR"
+    assert stats["fsync"]["unsynced_writes"] == 0
+
+
+def test_async_file_handler_close_async_syncs_and_unregisters(
+    tmp_path: Path, monkeypatch
+) -> None:
+    synced = []
+    monkeypatch.setattr(append_module, "fdatasync", synced.append)
+    path = tmp_path / "async.log"
+
+    # Created outside a loop, so emit() writes directly and leaves it unsynced.
+    handler = AsyncFileHandler(str(path), durability="interval:60000")
+    handler.emit(_record("pending"))
+    assert "pending" in path.read_text()
+    assert synced == []
+
+    asyncio.run(handler.close_async())
+    assert synced
+    assert handler.get_stats()["fsync"]["unsynced_writes"] == 0
+    assert handler._committer not in get_background_flusher()._handlers
+
+
+def test_async_file_handler_worker_syncs_off_scheduler_without_file_lock(
+    tmp_path: Path, monkeypatch
+) -> None:
+    seen = []
+    path = tmp_path / "async.log"
+
+    async def scenario() -> None:
+        handler = AsyncFileHandler(str(path), durability="per_batch")
+
+        def record_sync(fd: int) -> None:
+            seen.append(
+                (threading.current_thread().name, handler._file_lock.locked())
+            )
+
+        monkeypatch.setattr(append_module, "fdatasync", record_sync)
+        await handler._direct_memory_to_file_write(["one\n", "two\n"])
+        await handler.aclose()
+
+    asyncio.run(scenario())
+    assert path.read_text() == "one\ntwo\n"
+    assert seen
+    for thread_name, file_locked in seen:
+        assert not thread_name.startswith("hydra-logger-io-")
+        assert file_locked is False
@@ -0,0 +1,166 @@
+"""
+Role: Tests for hydra_logger.utils.fork_safety child-process resets.
+Used By:
+ - Pytest discovery and CI.
+Depends On:
+ - hydra_logger
+Notes:
+ - Most resets are exercised by calling `_after_fork_child` directly; one test
+   forks for real to check the registered hook runs in the child.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+from pathlib import Path
+
+import pytest
+
+from hydra_logger.core.logger_management import LoggerManager
+from hydra_logger.handlers.batched_http_handler import BatchedHTTPHandler
+from hydra_logger.handlers.file_handler import AsyncFileHandler, SyncFileHandler
+from hydra_logger.types.records import LogRecord
+from hydra_logger.utils import fork_safety, io_scheduler, slo_metrics
+
+
+class _Resettable:
+    def __init__(self) -> None:
+        self.resets = 0
+
+    def _after_fork_child(self) -> None:
+        self.resets += 1
+
+
+class _Broken:
+    def _after_fork_child(self) -> None:
+        raise RuntimeError("boom")
+
+
+def _record(message: str) -> LogRecord:
+    return LogRecord(level=20, level_name="INFO", message=message)
+
+
+def test_registry_resets_objects_and_isolates_failures() -> None:
+    ok, broken = _Resettable(), _Broken()
+    fork_safety.register_fork_safe(broken)
+    fork_safety.register_fork_safe(ok)
+    before = fork_safety.fork_generation()
+    try:
+        fork_safety._run_after_fork_child()
+        assert ok.resets == 1
+        assert fork_safety.fork_generation() == before + 1
+    finally:
+        fork_safety._fork_generation = before
+        fork_safety._registry.discard(broken)
+        fork_safety._registry.discard(ok)
+
+
+def test_registry_does_not_keep_objects_alive() -> None:
+    obj = _Resettable()
+    fork_safety.register_fork_safe(obj)
+    assert obj in fork_safety._registry
+    del obj
+    gc.collect()
+    assert not any(isinstance(o, _Resettable) for o in fork_safety._registry)
+
+
+def test_discard_inherited_stream_swallows_pending_bytes(tmp_path: Path) -> None:
+    path = tmp_path / "out.log"
+    stream = open(path, "w", encoding="utf-8")
+    stream.write("pending line\n")
+    fork_safety.discard_inherited_stream(stream)
+    stream.close()
+    assert path.read_text(encoding="utf-8") == ""
+
+
+def test_sync_file_handler_drops_buffer_and_reopens_without_truncating(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "app.log"
+    path.write_text("existing\n", encoding="utf-8")
+    handler = SyncFileHandler(
+        filename=str(path), mode="a", buffer_size=100, flush_interval=3600.0
+    )
+    handler._mode = "w"
+    handler.emit(_record("buffered-in-parent"))
+    old_handle = handler._file_handle
+    handler._after_fork_child()
+    assert len(handler._buffer) == 0
+    assert handler._file_handle is not old_handle
+    handler.emit(_record("child line"))
+    handler.close()
+    old_handle.close()
+    content = path.read_text(encoding="utf-8")
+    assert content.startswith("existing\n")
+    assert "child line" in content
+    assert "buffered-in-parent" not in content
+
+
+def test_batched_http_handler_forgets_parent_batch_and_session() -> None:
+    handler = BatchedHTTPHandler(
+        "http://example.test/ingest", connection_probe=False, batch_size=10
+    )
+    handler._buf.append({"message": "parent"})
+    handler._session = object()
+    handler._connected = True
+    old_lock = handler._lock
+    handler._after_fork_child()
+    assert handler._buf == []
+    assert handler._session is None
+    assert handler._connected is False
+    assert handler._lock is not old_lock
+
+
+def test_async_file_handler_recreates_queue_and_locks(tmp_path: Path) -> None:
+    handler = AsyncFileHandler(filename=str(tmp_path / "a.log"), use_threading=True)
+    handler._memory_buffer.append("parent")
+    old_queue, old_lock = handler._message_queue, handler._file_lock
+    handler._running = True
+    handler._after_fork_child()
+    assert handler._memory_buffer == []
+    assert handler._message_queue is not old_queue
+    assert handler._file_lock is not old_lock
+    assert handler._worker_tasks == []
+    assert handler._running is False
+
+
+def test_io_scheduler_is_rebuilt_after_fork() -> None:
+    parent = io_scheduler.get_io_scheduler()
+    io_scheduler._reset_after_fork()
+    try:
+        assert io_scheduler.get_io_scheduler() is not parent
+    finally:
+        io_scheduler._scheduler = parent
+
+
+def test_logger_manager_recreates_registry_locks() -> None:
+    manager = LoggerManager()
+    old_global = manager._global_lock
+    old_global.acquire()
+    try:
+        manager._after_fork_child()
+        assert manager._global_lock is not old_global
+        assert manager._global_lock.acquire(blocking=False)
+        manager._global_lock.release()
+    finally:
+        old_global.release()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_real_fork_runs_hooks_in_child_only() -> None:
+    slo_metrics.reset_metrics()
+    slo_metrics.record_dropped_log("parent")
+    before = fork_safety.fork_generation()
+    pid = os.fork()
+    if pid == 0:
+        ok = (
+            fork_safety.fork_generation() == before + 1
+            and slo_metrics.snapshot()["dropped_logs"] == 0
+        )
+        os._exit(0 if ok else 1)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert fork_safety.fork_generation() == before
+    assert slo_metrics.snapshot()["dropped_logs"] == 1
+    slo_metrics.reset_metrics()
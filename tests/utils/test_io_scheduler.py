@@ -0,0 +1,90 @@
+"""
+Role: Tests for the process-wide file I/O scheduler.
+Used By:
+ - Pytest discovery and CI.
+Depends On:
+ - hydra_logger
+Notes:
+ - Covers per-file order, round-robin fairness, write coalescing, error
+   delivery, and that many async file handlers share one bounded pool.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from pathlib import Path
+
+import pytest
+
+from hydra_logger.handlers.file_handler import AsyncFileHandler
+from hydra_logger.utils import io_scheduler
+from hydra_logger.utils.io_scheduler import FileIOScheduler
+
+
+def test_scheduler_keeps_file_order_rotates_files_and_coalesces() -> None:
+    scheduler = FileIOScheduler(max_workers=1)
+    calls: list[tuple[str, list[str]]] = []
+    gate = threading.Event()
+    taken = threading.Event()
+
+    def _writer(key: str):  # type: ignore[no-untyped-def]
+        def _write(messages: list[str]) -> None:
+            if messages == ["a1"]:
+                taken.set()
+                gate.wait(1.0)
+            calls.append((key, list(messages)))
+
+        return _write
+
+    write_a, write_b = _writer("a"), _writer("b")
+    first = scheduler.submit("a", ["a1"], write_a)
+    assert taken.wait(1.0)
+    later = [scheduler.submit("a", [m], write_a) for m in ("a2", "a3")]
+    other = scheduler.submit("b", ["b1"], write_b)
+    gate.set()
+    for future in (first, *later, other):
+        future.result(timeout=1.0)
+
+    assert calls == [("a", ["a1"]), ("b", ["b1"]), ("a", ["a2", "a3"])]
+    stats = scheduler.stats()
+    assert (stats["threads"], stats["writes"], stats["coalesced"]) == (1, 3, 1)
+    scheduler.shutdown()
+    with pytest.raises(RuntimeError):
+        scheduler.submit("a", ["late"], write_a)
+
+
+def test_scheduler_delivers_write_errors_to_the_future() -> None:
+    scheduler = FileIOScheduler(max_workers=2)
+
+    def _fail(_messages: list[str]) -> None:
+        raise OSError("disk full")
+
+    with pytest.raises(OSError):
+        scheduler.submit("x", ["m"], _fail).result(timeout=1.0)
+    assert scheduler.drain(timeout=1.0) is True
+    scheduler.shutdown()
+
+
+def test_async_file_handlers_share_one_bounded_pool(tmp_path: Path) -> None:
+    scheduler = io_scheduler.configure_io_scheduler(max_workers=2)
+
+    async def _run() -> None:
+        handlers = [
+            AsyncFileHandler(str(tmp_path / f"f{index}.log"), use_threading=True)
+            for index in range(20)
+        ]
+        await asyncio.gather(
+            *(
+                handler._direct_memory_to_file_write([f"line-{index}\n"])
+                for index, handler in enumerate(handlers)
+            )
+        )
+        for handler in handlers:
+            await handler.aclose()
+
+    asyncio.run(_run())
+    assert scheduler.stats()["threads"] <= 2
+    assert scheduler.stats()["submitted"] == 20
+    assert (tmp_path / "f7.log").read_text() == "line-7\n"
+    io_scheduler.configure_io_scheduler()
@@ -0,0 +1,116 @@
+"""
+Role: Tests for the shared-memory ring and the ring handler's drop accounting.
+Used By:
+ - Pytest discovery and CI.
+Depends On:
+ - hydra_logger
+Notes:
+ - Single-process checks of framing, wraparound, backpressure, and slo_metrics drops.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from hydra_logger.handlers.shared_ring_handler import (
+    SharedRingHandler,
+    decode_record,
+    encode_record,
+)
+from hydra_logger.types.records import BoundFields, CompactLogRecord, LogRecord
+from hydra_logger.utils import slo_metrics
+from hydra_logger.utils.shared_ring import SharedRingBuffer
+
+
+def test_ring_round_trips_frames_across_wraparound() -> None:
+    ring = SharedRingBuffer(64)
+    seen = []
+    for i in range(50):
+        payload = f"frame-{i}".encode()
+        assert ring.put(payload)
+        seen.extend(ring.drain())
+    assert seen == [f"frame-{i}".encode() for i in range(50)]
+    assert ring.drain() == []
+    assert ring.stats()["frames_written"] == 50
+
+
+def test_ring_drops_when_full_or_oversized_or_closed() -> None:
+    ring = SharedRingBuffer(32)
+    assert ring.put(b"x" * 20)
+    assert not ring.put(b"y" * 20)
+    assert not ring.put(b"z" * 64)
+    ring.drain()
+    ring.close()
+    assert not ring.put(b"late")
+    assert ring.closed
+    assert ring.stats()["frames_dropped"] == 3
+
+
+def test_ring_blocking_put_waits_for_consumer() -> None:
+    ring = SharedRingBuffer(32)
+    assert ring.put(b"x" * 20)
+    drained = []
+
+    def consume() -> None:
+        time.sleep(0.05)
+        drained.extend(ring.drain())
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    assert ring.put(b"y" * 20, timeout=5.0)
+    consumer.join()
+    assert drained == [b"x" * 20]
+    assert ring.drain() == [b"y" * 20]
+
+
+def test_ring_rejects_capacity_smaller_than_a_frame_header() -> None:
+    with pytest.raises(ValueError):
+        SharedRingBuffer(4)
+
+
+def test_encode_decode_preserves_record_fields() -> None:
+    record = LogRecord(
+        level=40,
+        level_name="ERROR",
+        message="boom",
+        layer="api",
+        line_number=7,
+        request_id="req-1",
+        extra=BoundFields({"user": "u1"}),
+    )
+    decoded = decode_record(encode_record(record))
+    assert isinstance(decoded, CompactLogRecord)
+    assert (decoded.level, decoded.message, decoded.layer) == (40, "boom", "api")
+    assert decoded.line_number == 7
+    assert decoded.request_id == "req-1"
+    assert dict(decoded.extra) == {"user": "u1"}
+
+
+def test_encode_falls_back_to_repr_for_unpicklable_extra() -> None:
+    lock = threading.Lock()
+    record = CompactLogRecord(message="m", extra={"lock": lock})
+    decoded = decode_record(encode_record(record))
+    assert decoded.extra["lock"] == repr(lock)
+
+
+def test_ring_handler_reports_drops_to_slo_metrics() -> None:
+    slo_metrics.reset_metrics()
+    handler = SharedRingHandler(SharedRingBuffer(4096))
+    for i in range(200):
+        handler.emit(CompactLogRecord(message=f"message {i}" * 4))
+    stats = handler.get_stats()
+    assert stats["enqueued"] > 0
+    assert stats["dropped"] == 200 - stats["enqueued"]
+    assert stats["ring"]["frames_dropped"] == stats["dropped"]
+    snap = slo_metrics.snapshot()
+    assert snap["dropped_logs"] == stats["dropped"]
+    assert snap["queue_saturation_events"] == stats["dropped"]
+    slo_metrics.reset_metrics()
+
+
+def test_ring_handler_rejects_unknown_overflow_policy() -> None:
+    with pytest.raises(ValueError):
+        SharedRingHandler(SharedRingBuffer(4096), overflow_policy="drop_oldest")
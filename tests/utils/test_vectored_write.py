@@ -0,0 +1,87 @@
+"""
+Role: Tests for vectored writes of buffered byte chunks.
+Used By:
+ - Pytest discovery and CI.
+Depends On:
+ - hydra_logger
+Notes:
+ - Covers IOV_MAX slicing, resuming after short writev/write calls, and the
+   joined fallback without writev or a descriptor.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+from pathlib import Path
+
+import pytest
+
+from hydra_logger.utils import vectored_write
+from hydra_logger.utils.vectored_write import write_chunks, writev_all
+
+pytestmark = pytest.mark.skipif(
+    not vectored_write.HAS_WRITEV, reason="os.writev is not available"
+)
+
+
+def test_writev_all_slices_by_iov_max_and_resumes_short_writes(
+    monkeypatch, tmp_path: Path
+) -> None:
+    chunks = [f"line-{i}\n".encode() for i in range(10)]
+    real_writev, real_write = os.writev, os.write
+    slice_sizes: list[int] = []
+
+    def _short_writev(fd: int, buffers) -> int:  # type: ignore[no-untyped-def]
+        slice_sizes.append(len(buffers))
+        # Stop three bytes into the second chunk of every slice.
+        data = b"".join(buffers)
+        cut = min(len(data), len(buffers[0]) + 3)
+        return real_writev(fd, [data[:cut]])
+
+    def _short_write(fd: int, data) -> int:  # type: ignore[no-untyped-def]
+        return real_write(fd, bytes(data[:2]))
+
+    monkeypatch.setattr(vectored_write, "IOV_MAX", 4)
+    monkeypatch.setattr(vectored_write.os, "writev", _short_writev)
+    monkeypatch.setattr(vectored_write.os, "write", _short_write)
+
+    path = tmp_path / "vectored.log"
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        written = writev_all(fd, chunks)
+    finally:
+        os.close(fd)
+
+    assert path.read_bytes() == b"".join(chunks)
+    assert written == len(b"".join(chunks))
+    assert max(slice_sizes) == 4
+
+
+def test_write_chunks_uses_descriptor_and_counts_bytes(tmp_path: Path) -> None:
+    path = tmp_path / "raw.log"
+    chunks = [b"a\n", b"", "é\n".encode("utf-8")]
+    with open(path, "ab", buffering=0) as raw:
+        assert write_chunks(raw, chunks) == 5
+        assert write_chunks(raw, []) == 0
+    assert path.read_bytes() == b"a\n\xc3\xa9\n"
+
+
+def test_write_chunks_joins_without_writev_or_fileno(monkeypatch) -> None:
+    no_fd = io.BytesIO()
+    assert write_chunks(no_fd, [b"x", b"y"]) == 2
+    assert no_fd.getvalue() == b"xy"
+
+    monkeypatch.setattr(vectored_write, "HAS_WRITEV", False)
+    calls: list[bytes] = []
+
+    class _Raw:
+        def fileno(self) -> int:
+            raise AssertionError("descriptor must not be used")
+
+        def write(self, data) -> int:  # type: ignore[no-untyped-def]
+            calls.append(bytes(data))
+            return len(data)
+
+    assert write_chunks(_Raw(), [b"p", b"q"]) == 2
+    assert calls == [b"pq"]